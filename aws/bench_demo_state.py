@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INCIDENTS = int(os.environ.get('STATE_BENCH_INCIDENTS', 2000))
+DEFAULT_WORKERS = int(os.environ.get('STATE_BENCH_WORKERS', 8))
+ACTIVE_SCAN_EVERY = 100
+
+
+def load_handler(name, lambda_dir):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPT_DIR, lambda_dir, 'handler.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def replay_incident(state, index, run_id, timings):
+    incident_id = f"PBENCH{index:06d}"
+
+    def timed(op, fn, *args):
+        started = time.perf_counter()
+        result = fn(*args)
+        timings.setdefault(op, []).append(time.perf_counter() - started)
+        return result
+
+    if not timed('get', state.get, incident_id):
+        timed('create', state.create, incident_id, {
+            'state': 'triggered',
+            'scenario_id': f"BENCH-{index % 20:03d}",
+            'run_id': run_id,
+            'responders': [{'id': 'PBENCHU', 'name': 'Bench User'}],
+            'timeline': [],
+        })
+    timed('get', state.get, incident_id)
+    timed('update', state.update, incident_id, {'state': 'acknowledged', 'acknowledged_by': 'PBENCHU'})
+    steps = [{'seq': seq, 'action': 'add_note', 'status': 'scheduled'} for seq in range(random.randint(3, 7))]
+    timed('append_steps', state.append_steps, incident_id, steps)
+    actions = {}
+    for step in steps:
+        timed('get', state.get, incident_id)
+        timed('mark_step', state.mark_step, incident_id, step['seq'], 'done')
+        actions['PBENCHU'] = actions.get('PBENCHU', 0) + 1
+        timed('update', state.update, incident_id, {'responder_actions': actions})
+    if index % ACTIVE_SCAN_EVERY == 0:
+        timed('get_active_demos', state.get_active_demos)
+    timed('update', state.update, incident_id, {'state': 'resolved', 'resolver_id': 'PBENCHU'})
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def run_backend(orchestrator, kind, backend, incidents, workers):
+    state = orchestrator.DemoState(backend)
+    run_id = f"bench-{kind}"
+    timings = {}
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda i: replay_incident(state, i, run_id, timings), range(incidents)))
+    elapsed = time.perf_counter() - started
+
+    tracked = len(state.find(run_id=run_id))
+    total_ops = sum(len(samples) for samples in timings.values())
+    print(f"{kind}: {incidents} webhook sequences, {total_ops} ops in {elapsed:.2f}s "
+          f"({total_ops / elapsed:,.0f} ops/s, {tracked} tracked)", flush=True)
+    for op in sorted(timings):
+        samples = timings[op]
+        print(f"  {op:<18} n={len(samples):<7} p50={percentile(samples, 0.5) * 1000:>7.3f}ms "
+              f"p99={percentile(samples, 0.99) * 1000:>7.3f}ms")
+    return total_ops / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay webhook state-machine sequences against DemoState storage backends")
+    parser.add_argument("-n", "--incidents", type=int, default=DEFAULT_INCIDENTS)
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("-b", "--backends", default="memory,sqlite",
+                        help="comma separated: memory, sqlite, dynamodb")
+    parser.add_argument("--sqlite-path", help="SQLite database file (default: a temporary file)")
+    parser.add_argument("--table", default=os.environ.get('DEMO_STATE_TABLE', 'demo-incident-state'),
+                        help="DynamoDB table for the dynamodb backend")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, SCRIPT_DIR)
+    random.seed(args.seed)
+    orchestrator = load_handler('orchestrator_handler', 'lambda-demo-orchestrator')
+    from shared import DynamoDBStateBackend, MemoryStateBackend, SQLiteStateBackend
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in [b.strip() for b in args.backends.split(',') if b.strip()]:
+            if kind == 'memory':
+                backend = MemoryStateBackend()
+            elif kind == 'sqlite':
+                backend = SQLiteStateBackend(args.sqlite_path or os.path.join(tmp, 'demo-state.db'))
+            elif kind == 'dynamodb':
+                backend = DynamoDBStateBackend(args.table)
+            else:
+                parser.error(f"unknown backend: {kind}")
+            results.append((kind, run_backend(orchestrator, kind, backend, args.incidents, args.workers)))
+
+    if len(results) > 1:
+        baseline = results[0][1]
+        for kind, rate in results[1:]:
+            print(f"{kind}: {rate / baseline:.2f}x the throughput of {results[0][0]}")
+
+
+if __name__ == "__main__":
+    main()
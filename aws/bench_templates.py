@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+import os
+import sys
+import random
+import argparse
+import importlib.util
+from timeit import Timer
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MESSAGES = int(os.environ.get('TEMPLATE_BENCH_MESSAGES', 20000))
+DEFAULT_REPEAT = int(os.environ.get('TEMPLATE_BENCH_REPEAT', 5))
+INCIDENT = {
+    "id": "PBENCH1",
+    "title": "[DEMO] Database connection pool exhausted",
+    "created_at": "2026-01-01T00:00:00Z",
+}
+
+
+def load_handler(name, lambda_dir):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(SCRIPT_DIR, lambda_dir, 'handler.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class BenchUsers:
+    def __init__(self, people):
+        self.people = people
+
+    def others(self, responders):
+        names = {r.get("name") for r in responders}
+        return [p for p in self.people if p["name"] not in names]
+
+
+def legacy_format_message(lifecycle, template, responders, incident, users):
+    age = lifecycle.get_incident_age_minutes(incident)
+    other_users = users.others(responders) or responders
+    other = random.choice(other_users) if other_users else {"name": "team"}
+    other_name = other.get("name", "team").split()[0]
+    return template.format(
+        other_name=other_name,
+        name=other_name,
+        component=random.choice(lifecycle.COMPONENTS),
+        service=random.choice(lifecycle.SERVICES),
+        team=random.choice(lifecycle.TEAMS),
+        change=random.choice(lifecycle.CHANGES),
+        detail=random.choice(lifecycle.DETAILS),
+        dependency=random.choice(lifecycle.COMPONENTS),
+        metric="latency",
+        timestamp=f"{int(age)}m ago",
+        minutes=int(age),
+        root_cause=random.choice(lifecycle.ROOT_CAUSES)[:50],
+        cause=random.choice(lifecycle.ROOT_CAUSES),
+        high=random.randint(5, 15),
+        low=random.randint(0, 2),
+        count=random.randint(10, 100),
+        ms=random.randint(500, 5000),
+        table="users",
+        scenario=lifecycle.get_scenario_type(incident),
+    )
+
+
+def legacy_conversation_message(library, category, used_messages):
+    messages = library.get(category, library["general"])
+    available = [m for m in messages if m not in used_messages]
+    if not available:
+        available = messages
+    message = random.choice(available)
+    used_messages.add(message)
+    return message
+
+
+def chat_tables(lifecycle):
+    tables = [
+        lifecycle.ACK_MESSAGES, lifecycle.INVESTIGATION_MESSAGES, lifecycle.COLLABORATION_MESSAGES,
+        lifecycle.PROGRESS_MESSAGES, lifecycle.RESOLUTION_MESSAGES, lifecycle.STATUS_UPDATE_MESSAGES,
+    ]
+    tables.extend(m for phases in lifecycle.SCENARIO_CONVERSATIONS.values() for m in phases.values() if m)
+    pools = [
+        lifecycle.ACK_TEMPLATES, lifecycle.INVESTIGATION_TEMPLATES, lifecycle.COLLABORATION_TEMPLATES,
+        lifecycle.PROGRESS_TEMPLATES, lifecycle.RESOLUTION_TEMPLATES, lifecycle.STATUS_UPDATE_TEMPLATES,
+    ]
+    pools.extend(p for phases in lifecycle.SCENARIO_TEMPLATES.values() for p in phases.values())
+    return tables, pools
+
+
+def measure(label, fn, messages, repeat):
+    best = min(Timer(fn).repeat(repeat=repeat, number=1))
+    rate = messages / best if best else float('inf')
+    print(f"  {label:<38} {best * 1000:>9.1f}ms  {rate:>12,.0f} msg/s", flush=True)
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmark chat message rendering: eager str.format vs precompiled templates")
+    parser.add_argument("-n", "--messages", type=int, default=DEFAULT_MESSAGES)
+    parser.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, SCRIPT_DIR)
+    random.seed(args.seed)
+    lifecycle = load_handler('lifecycle_handler', 'lambda-lifecycle')
+    controller = load_handler('controller_handler', 'lambda-demo-controller')
+
+    responders = [{"name": "Jordan Lee"}, {"name": "Sam Patel"}]
+    users = BenchUsers(responders + [{"name": f"Responder {i}"} for i in range(20)])
+    tables, pools = chat_tables(lifecycle)
+    n = args.messages
+
+    def legacy_lifecycle():
+        for i in range(n):
+            template = random.choice(tables[i % len(tables)])[0]
+            legacy_format_message(lifecycle, template, responders, INCIDENT, users)
+
+    def compiled_lifecycle():
+        for i in range(n):
+            lifecycle.format_message(pools[i % len(pools)].draw(), responders, INCIDENT, users)
+
+    categories = list(controller.CONVERSATION_LIBRARY)
+
+    def legacy_controller():
+        used = set()
+        for i in range(n):
+            if i % 12 == 0:
+                used = set()
+            legacy_conversation_message(controller.CONVERSATION_LIBRARY, categories[i % len(categories)], used)
+
+    def compiled_controller():
+        used = set()
+        for i in range(n):
+            if i % 12 == 0:
+                used = set()
+            controller.get_conversation_message(categories[i % len(categories)], used)
+
+    print(f"Rendering {n} messages, best of {args.repeat}:")
+    results = []
+    for name, legacy, compiled in [
+        ("lifecycle", legacy_lifecycle, compiled_lifecycle),
+        ("demo-controller", legacy_controller, compiled_controller),
+    ]:
+        before = measure(f"{name} (eager format)", legacy, n, args.repeat)
+        after = measure(f"{name} (compiled templates)", compiled, n, args.repeat)
+        results.append((name, after / before if before else 0))
+    for name, speedup in results:
+        print(f"{name}: {speedup:.2f}x throughput")
+
+
+if __name__ == "__main__":
+    main()
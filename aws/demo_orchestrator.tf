@@ -26,6 +26,38 @@ resource "aws_dynamodb_table" "demo_state" {
   }
 }
 
+resource "aws_sqs_queue" "demo_webhooks_dlq" {
+  name                      = "demo-orchestrator-webhooks-dlq.fifo"
+  fifo_queue                = true
+  message_retention_seconds = 1209600
+
+  tags = {
+    Name        = "demo-orchestrator-webhooks-dlq"
+    Environment = "demo"
+    ManagedBy   = "terraform"
+  }
+}
+
+resource "aws_sqs_queue" "demo_webhooks" {
+  name                       = "demo-orchestrator-webhooks.fifo"
+  fifo_queue                 = true
+  deduplication_scope        = "messageGroup"
+  fifo_throughput_limit      = "perMessageGroupId"
+  visibility_timeout_seconds = 360
+  message_retention_seconds  = 86400
+
+  redrive_policy = jsonencode({
+    deadLetterTargetArn = aws_sqs_queue.demo_webhooks_dlq.arn
+    maxReceiveCount     = 5
+  })
+
+  tags = {
+    Name        = "demo-orchestrator-webhooks"
+    Environment = "demo"
+    ManagedBy   = "terraform"
+  }
+}
+
 resource "aws_iam_role" "demo_orchestrator" {
   name = "demo-orchestrator-lambda-role"
 
@@ -71,6 +103,19 @@ resource "aws_iam_role_policy" "demo_orchestrator_policy" {
         ]
         Resource = aws_dynamodb_table.demo_state.arn
       },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:GetItem",
+          "dynamodb:PutItem",
+          "dynamodb:UpdateItem",
+          "dynamodb:Query"
+        ]
+        Resource = [
+          aws_dynamodb_table.incident_mirror.arn,
+          "${aws_dynamodb_table.incident_mirror.arn}/index/*"
+        ]
+      },
       {
         Effect = "Allow"
         Action = [
@@ -87,6 +132,17 @@ resource "aws_iam_role_policy" "demo_orchestrator_policy" {
         ]
         Resource = aws_iam_role.scheduler_role.arn
       },
+      {
+        Effect = "Allow"
+        Action = [
+          "sqs:SendMessage",
+          "sqs:ReceiveMessage",
+          "sqs:DeleteMessage",
+          "sqs:ChangeMessageVisibility",
+          "sqs:GetQueueAttributes"
+        ]
+        Resource = aws_sqs_queue.demo_webhooks.arn
+      },
       {
         Effect = "Allow"
         Action = [
@@ -130,7 +186,10 @@ resource "aws_iam_role_policy" "scheduler_invoke_policy" {
       {
         Effect   = "Allow"
         Action   = "lambda:InvokeFunction"
-        Resource = aws_lambda_function.demo_orchestrator.arn
+        Resource = [
+          aws_lambda_function.demo_orchestrator.arn,
+          aws_lambda_function.demo_controller.arn
+        ]
       }
     ]
   })
@@ -143,6 +202,7 @@ resource "aws_lambda_function" "demo_orchestrator" {
   handler          = "handler.lambda_handler"
   source_code_hash = data.archive_file.demo_orchestrator.output_base64sha256
   runtime          = "python3.11"
+  layers           = [aws_lambda_layer_version.shared_runtime.arn]
   timeout          = 60
   memory_size      = 256
 
@@ -154,6 +214,9 @@ resource "aws_lambda_function" "demo_orchestrator" {
       SELF_LAMBDA_ARN      = "arn:aws:lambda:${data.aws_region.current.name}:${data.aws_caller_identity.current.account_id}:function:demo-simulator-orchestrator-v2"
       SCHEDULER_ROLE_ARN   = aws_iam_role.scheduler_role.arn
       WEBHOOK_SECRET       = var.webhook_secret
+      WEBHOOK_QUEUE_URL    = var.webhook_ingest_mode == "queue" ? aws_sqs_queue.demo_webhooks.url : ""
+      INCIDENT_MIRROR_TABLE = aws_dynamodb_table.incident_mirror.name
+      PD_HEDGE_ENABLED     = tostring(var.pagerduty_read_hedging)
       DATADOG_API_KEY      = var.datadog_api_key
       DATADOG_SITE         = var.datadog_site
       GRAFANA_API_KEY      = var.grafana_api_key
@@ -176,6 +239,37 @@ resource "aws_lambda_function" "demo_orchestrator" {
   }
 }
 
+resource "aws_lambda_event_source_mapping" "demo_webhooks" {
+  event_source_arn        = aws_sqs_queue.demo_webhooks.arn
+  function_name           = aws_lambda_function.demo_orchestrator.arn
+  batch_size              = 10
+  function_response_types = ["ReportBatchItemFailures"]
+}
+
+resource "aws_cloudwatch_event_rule" "incident_mirror_reconcile" {
+  name                = "demo-incident-mirror-reconcile"
+  description         = "Reconcile the webhook-fed incident mirror against the PagerDuty REST API"
+  schedule_expression = "rate(5 minutes)"
+}
+
+resource "aws_cloudwatch_event_target" "incident_mirror_reconcile" {
+  rule      = aws_cloudwatch_event_rule.incident_mirror_reconcile.name
+  target_id = "incident-mirror-reconcile"
+  arn       = aws_lambda_function.demo_orchestrator.arn
+
+  input = jsonencode({
+    source = "mirror-reconcile"
+  })
+}
+
+resource "aws_lambda_permission" "incident_mirror_reconcile" {
+  statement_id  = "AllowMirrorReconcile"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.demo_orchestrator.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.incident_mirror_reconcile.arn
+}
+
 data "aws_region" "current" {}
 data "aws_caller_identity" "current" {}
 
@@ -186,6 +280,17 @@ variable "webhook_secret" {
   sensitive   = true
 }
 
+variable "webhook_ingest_mode" {
+  description = "How PagerDuty webhooks are ingested: 'queue' acknowledges with 202 and processes them from the FIFO queue, 'inline' processes them in the request"
+  type        = string
+  default     = "queue"
+
+  validation {
+    condition     = contains(["queue", "inline"], var.webhook_ingest_mode)
+    error_message = "webhook_ingest_mode must be 'queue' or 'inline'."
+  }
+}
+
 output "demo_state_table" {
   description = "DynamoDB table for demo state"
   value       = aws_dynamodb_table.demo_state.name
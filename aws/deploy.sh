@@ -12,41 +12,62 @@ if ! command -v terraform &> /dev/null; then
     exit 1
 fi
 
-echo "Copying shared module to Lambda directories..."
-LAMBDA_DIRS=("lambda-orchestrator" "lambda-lifecycle" "lambda-metrics" "lambda-notifier" "lambda-reset" "lambda-user-activity" "lambda-health-check" "lambda-demo-controller")
+clean_vendored() {
+    local dir="$1"
+    rm -rf "$dir/shared"
+    for info in "$dir"/*.dist-info; do
+        [ -f "$info/RECORD" ] || continue
+        for top in $(cut -d, -f1 "$info/RECORD" | cut -d/ -f1 | grep -v -e '^\.\.' -e '\.dist-info$' | sort -u || true); do
+            rm -rf "${dir:?}/$top"
+        done
+    done
+    if [ -f "$dir/requirements.txt" ]; then
+        for pkg in $(awk 1 "$dir/requirements.txt" | sed -e 's/#.*//' -e 's/[<>=!~;[ ].*//' | tr 'A-Z-' 'a-z_'); do
+            rm -rf "${dir:?}/$pkg"
+        done
+    fi
+    rm -rf "$dir"/*.dist-info "$dir"/*.egg-info
+}
+
+echo "Removing vendored shared module and dependencies from Lambda directories..."
+LAMBDA_DIRS=("lambda-orchestrator" "lambda-lifecycle" "lambda-metrics" "lambda-notifier" "lambda-reset" "lambda-user-activity" "lambda-health-check" "lambda-demo-controller" "lambda-demo-orchestrator" "lambda-package" "lambda-sweep")
 for dir in "${LAMBDA_DIRS[@]}"; do
     if [ -d "$dir" ]; then
-        rm -rf "$dir/shared"
-        cp -r shared "$dir/shared"
-        echo "  Copied shared/ to $dir/"
+        clean_vendored "$dir"
+        echo "  Cleaned $dir/"
     fi
 done
 
+echo "Building shared runtime layer..."
+LAYER_DIR="build/shared-layer/python"
+rm -rf build/shared-layer
+mkdir -p "$LAYER_DIR"
+cp -r shared "$LAYER_DIR/shared"
+awk 1 lambda-*/requirements.txt | grep -v '^boto3' | sort -u > build/layer-requirements.txt
+pip install -r build/layer-requirements.txt -t "$LAYER_DIR" --quiet --upgrade
+find build/shared-layer -name '__pycache__' -type d -prune -exec rm -rf {} +
+echo "  Built $LAYER_DIR"
+
 echo "Copying scenarios.json to demo-controller..."
 if [ -f "../docs/demo-scenarios/src/data/scenarios.json" ]; then
     cp "../docs/demo-scenarios/src/data/scenarios.json" "lambda-demo-controller/scenarios.json"
     echo "  Copied scenarios.json to lambda-demo-controller/"
 fi
 
-echo "Installing Python dependencies for Lambda functions..."
-LAMBDAS_WITH_DEPS=("lambda-orchestrator" "lambda-lifecycle" "lambda-metrics" "lambda-demo-controller")
-for dir in "${LAMBDAS_WITH_DEPS[@]}"; do
-    if [ -d "$dir" ]; then
-        if [ -f "$dir/requirements.txt" ]; then
-            echo "  Installing deps for $dir..."
-            pip install -r "$dir/requirements.txt" -t "$dir" --quiet --upgrade
-        elif [ -f "lambda-orchestrator/requirements.txt" ]; then
-            echo "  Installing shared deps for $dir..."
-            pip install -r lambda-orchestrator/requirements.txt -t "$dir" --quiet --upgrade
-        fi
-    fi
-done
+echo "Copying stage handlers to sweep..."
+cp lambda-lifecycle/handler.py lambda-sweep/lifecycle_stage.py
+cp lambda-notifier/handler.py lambda-sweep/notifier_stage.py
+cp lambda-user-activity/handler.py lambda-sweep/user_activity_stage.py
+echo "  Copied lifecycle, notifier and user-activity handlers to lambda-sweep/"
+
+echo "Verifying bundle sizes and handler import time..."
+python3 verify_bundles.py "${LAMBDA_DIRS[@]}"
 
 echo "Initializing Terraform..."
 terraform init -upgrade
 
 echo "Removing stale Lambda zip files to force re-packaging..."
-rm -f lambda-*.zip
+rm -f lambda-*.zip shared-layer.zip
 echo "  Cleaned stale zip files"
 
 echo ""
@@ -2,17 +2,22 @@
 import os
 import json
 import time
+import uuid
 import random
 import logging
-from datetime import datetime, timezone
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
 from typing import Optional, Dict, Any, List
 from enum import Enum
-import boto3
 
 from shared import (
     PagerDutyClient, SlackClient, SlackNotifier,
-    DEMO_USERS, PAGERDUTY_TO_SLACK_USER_MAP,
-    CONALL_EMAIL, CONALL_SLACK_USER_ID, CONALL_SLACK_USER_ID_PERSONAL
+    demo_directory, aws_client, aws_resource,
+    RUN_ID_FIELD, new_run_id, scenario_dedup_prefix, demo_dedup_key, find_scoped_incidents, teardown,
+    Shuffler, CONALL_EMAIL, CONALL_SLACK_USER_ID, CONALL_SLACK_USER_ID_PERSONAL,
+    Deadline, current_deadline, set_deadline, hedge_stats,
 )
 
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +30,24 @@ DEFAULT_ACTION_DELAY_MIN = int(os.environ.get('ACTION_DELAY_MIN', 15))
 DEFAULT_ACTION_DELAY_MAX = int(os.environ.get('ACTION_DELAY_MAX', 30))
 SSM_RECENT_SCENARIOS_PARAM = os.environ.get('SSM_RECENT_SCENARIOS_PARAM', '/demo-simulator/recent-scenarios')
 RECENT_SCENARIO_LIMIT = 10
+SESSIONS_TABLE = os.environ.get('DEMO_SESSIONS_TABLE', '')
+SESSION_TTL_HOURS = int(os.environ.get('SESSION_TTL_HOURS', 24))
+SESSIONS_STATUS_INDEX = 'status-index'
+CHATTER_LIVE = 'live'
+CHATTER_SCHEDULED = 'scheduled'
+DEFAULT_CHATTER_MODE = os.environ.get('DEMO_CHATTER_MODE', CHATTER_LIVE)
+SELF_LAMBDA_ARN = os.environ.get('SELF_LAMBDA_ARN', '')
+SCHEDULER_ROLE_ARN = os.environ.get('SCHEDULER_ROLE_ARN', '')
+DEADLINE_RESERVE_SECONDS = int(os.environ.get('DEADLINE_RESERVE_SECONDS', 15))
+SETUP_PHASE_SECONDS = int(os.environ.get('SETUP_PHASE_SECONDS', 150))
+ACTION_PHASE_SECONDS = int(os.environ.get('ACTION_PHASE_SECONDS', 15))
+RESOLVE_PHASE_SECONDS = int(os.environ.get('RESOLVE_PHASE_SECONDS', 30))
+CHECKPOINT_RESUME_DELAY = int(os.environ.get('CHECKPOINT_RESUME_DELAY', 30))
+MAX_CHECKPOINT_RESUMES = int(os.environ.get('MAX_CHECKPOINT_RESUMES', 5))
+PHASE_START = 'start'
+PHASE_INVESTIGATE = 'investigate'
+PHASE_RESOLVE = 'resolve'
+PHASE_PLAYLIST = 'playlist'
 
 SERVICE_TO_ROUTING_KEY = {
     "Platform - DBRE": os.getenv("ROUTING_KEY_DBRE", ""),
@@ -109,6 +132,8 @@ CONVERSATION_LIBRARY = {
     ],
 }
 
+CONVERSATION_POOLS = {category: Shuffler(messages) for category, messages in CONVERSATION_LIBRARY.items()}
+
 ACTION_TYPES = [
     "status_update",
     "add_note",
@@ -130,25 +155,177 @@ class DemoState(Enum):
     PROGRESSING = "progressing"
     RESOLVING = "resolving"
     COMPLETED = "completed"
+    FAILED = "failed"
     PAUSED = "paused"
 
 
-_demo_state = {
-    "state": DemoState.IDLE.value,
-    "scenario_id": None,
-    "incident_id": None,
-    "dedup_key": None,
-    "channel_id": None,
-    "current_step": 0,
-    "total_steps": 0,
-    "paused": False,
-    "started_at": None,
-    "actions_taken": [],
-    "responders": [],
-}
+FINISHED_STATES = {DemoState.COMPLETED.value, DemoState.FAILED.value}
+
+
+class DecimalEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj) if obj % 1 else int(obj)
+        return super().default(obj)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class SessionStore:
+    def __init__(self, table_name: str = None):
+        self.table_name = SESSIONS_TABLE if table_name is None else table_name
+        self._table = None
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = aws_resource('dynamodb').Table(self.table_name)
+        return self._table
+
+    def _update(self, session_id: str, updates: Dict[str, Any]) -> bool:
+        updates = {k: v for k, v in updates.items() if k != 'session_id'}
+        if not self.table_name:
+            with self._lock:
+                item = self._memory.setdefault(session_id, {'session_id': session_id})
+                item.update(json.loads(json.dumps(updates, cls=DecimalEncoder)))
+            return True
+        try:
+            self.table.update_item(
+                Key={'session_id': session_id},
+                UpdateExpression='SET ' + ', '.join(f'#{k} = :{k}' for k in updates),
+                ExpressionAttributeNames={f'#{k}': k for k in updates},
+                ExpressionAttributeValues=json.loads(json.dumps({f':{k}': v for k, v in updates.items()}), parse_float=Decimal),
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error updating session {session_id}: {e}")
+            return False
+
+    def create(self, state: Dict[str, Any]) -> bool:
+        expires = datetime.now(timezone.utc) + timedelta(hours=SESSION_TTL_HOURS)
+        return self._update(state["session_id"], {**state, "created_at": _now(), "updated_at": _now(),
+                                                   "ttl": int(expires.timestamp())})
+
+    def save(self, state: Dict[str, Any]) -> bool:
+        fields = {k: v for k, v in state.items() if k != "paused"}
+        return self._update(state["session_id"], {**fields, "updated_at": _now()})
+
+    def set_paused(self, session_id: str, paused: bool) -> bool:
+        updates = {"paused": paused, "updated_at": _now()}
+        if paused:
+            updates["state"] = DemoState.PAUSED.value
+        return self._update(session_id, updates)
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        if not self.table_name:
+            with self._lock:
+                item = self._memory.get(session_id)
+                return json.loads(json.dumps(item)) if item else None
+        try:
+            item = self.table.get_item(Key={'session_id': session_id}).get('Item')
+            return json.loads(json.dumps(item, cls=DecimalEncoder)) if item else None
+        except Exception as e:
+            logger.error(f"Error getting session {session_id}: {e}")
+            return None
+
+    def _read_all(self, operation, **kwargs) -> List[Dict[str, Any]]:
+        items = []
+        while True:
+            response = operation(**kwargs)
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                return items
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def list(self, active_only: bool = True, **filters) -> List[Dict[str, Any]]:
+        if not self.table_name:
+            with self._lock:
+                items = json.loads(json.dumps(list(self._memory.values())))
+        else:
+            if "state" in filters:
+                states = [filters["state"]]
+            elif active_only:
+                states = [s.value for s in DemoState if s.value not in FINISHED_STATES]
+            else:
+                states = None
+            items = []
+            try:
+                if states is None:
+                    items = self._read_all(self.table.scan)
+                for state in states or []:
+                    items.extend(self._read_all(
+                        self.table.query,
+                        IndexName=SESSIONS_STATUS_INDEX,
+                        KeyConditionExpression='#state = :state',
+                        ExpressionAttributeNames={'#state': 'state'},
+                        ExpressionAttributeValues={':state': state},
+                    ))
+            except Exception as e:
+                logger.error(f"Error listing sessions: {e}")
+            items = json.loads(json.dumps(items, cls=DecimalEncoder))
+        items = [i for i in items if all(i.get(k) == v for k, v in filters.items())]
+        if active_only:
+            items = [i for i in items if i.get("state") not in FINISHED_STATES]
+        return sorted(items, key=lambda i: i.get("created_at", ""))
+
+
+_sessions = SessionStore()
+
+
+def new_demo_state(session_id: str = None, presenter: str = None, parent_session_id: str = None,
+                   chatter_mode: str = None) -> Dict[str, Any]:
+    return {
+        "session_id": session_id or uuid.uuid4().hex,
+        "parent_session_id": parent_session_id,
+        "presenter": presenter,
+        "chatter_mode": chatter_mode or DEFAULT_CHATTER_MODE,
+        "state": DemoState.IDLE.value,
+        "run_id": None,
+        "scenario_id": None,
+        "incident_id": None,
+        "dedup_key": None,
+        "channel_id": None,
+        "current_step": 0,
+        "total_steps": 0,
+        "paused": False,
+        "started_at": None,
+        "actions_taken": [],
+        "responders": [],
+        "created_incidents": [],
+        "created_channels": [],
+        "checkpoint": None,
+        "checkpoint_resumes": 0,
+        "awaiting_children": False,
+    }
+
+
+def open_session(session_id: str = None, presenter: str = None, parent_session_id: str = None,
+                 chatter_mode: str = None) -> Dict[str, Any]:
+    state = new_demo_state(session_id, presenter, parent_session_id, chatter_mode)
+    _sessions.create(state)
+    return state
+
+
+def _set_phase(state: Dict[str, Any], phase: DemoState) -> None:
+    state["state"] = phase.value
+    _sessions.save(state)
+
+
+def _is_paused(state: Dict[str, Any]) -> bool:
+    for session_id in (state.get("session_id"), state.get("parent_session_id")):
+        if session_id and (_sessions.get(session_id) or {}).get("paused"):
+            return True
+    return False
 
 
 DEFAULT_INTER_SCENARIO_DELAY = int(os.environ.get('INTER_SCENARIO_DELAY', 30))
+DEFAULT_PLAYLIST_CONCURRENCY = int(os.environ.get('PLAYLIST_CONCURRENCY', 2))
+PLAYLIST_PROGRESS_FIELDS = ("playlist", "playlist_key", "requested_scenarios", "valid_scenarios", "skipped_scenarios",
+                            "started_at", "total", "passed", "failed", "checkpointed", "scenario_results")
 
 PLAYLISTS = {
     "quick_overview": {
@@ -227,10 +404,11 @@ def determine_responder_count() -> int:
 
 
 def select_responders(count: int, primary_email: str = None) -> List[Dict]:
-    available = [u for u in DEMO_USERS if u.get('email') != CONALL_EMAIL]
+    directory = demo_directory()
+    available = [u for u in directory.demo_users() if u.email != CONALL_EMAIL]
     if primary_email:
-        primary = next((u for u in available if u.get('email') == primary_email), None)
-        if primary:
+        primary = directory.by_email(primary_email)
+        if primary and primary in available:
             available.remove(primary)
             selected = [primary]
             if count > 1:
@@ -259,36 +437,44 @@ def get_conversation_category(scenario: Dict) -> str:
 
 
 def get_conversation_message(category: str, used_messages: set) -> str:
-    messages = CONVERSATION_LIBRARY.get(category, CONVERSATION_LIBRARY["general"])
-    available = [m for m in messages if m not in used_messages]
-    if not available:
-        available = messages
-    message = random.choice(available)
+    pool = CONVERSATION_POOLS.get(category, CONVERSATION_POOLS["general"])
+    for _ in range(len(pool)):
+        message = pool.draw()
+        if message not in used_messages:
+            break
     used_messages.add(message)
     return message
 
 
-def reset_demo_incidents(pd: PagerDutyClient) -> Dict[str, Any]:
-    logger.info("Resetting all [DEMO] incidents...")
-    results = {"resolved": [], "failed": []}
-    
-    demo_incidents = pd.get_demo_incidents(statuses=['triggered', 'acknowledged'])
-    logger.info(f"Found {len(demo_incidents)} [DEMO] incidents to resolve")
-    
-    for incident in demo_incidents:
-        incident_id = incident['id']
-        result = pd.resolve_incident(incident_id, CONALL_EMAIL)
-        if result.get('success'):
-            results["resolved"].append(incident_id)
-            logger.info(f"Resolved demo incident {incident_id}")
-        else:
-            results["failed"].append(incident_id)
-            logger.error(f"Failed to resolve incident {incident_id}: {result}")
-    
+def _tracked_resources(run_id: str) -> Dict[str, List[str]]:
+    incidents, channels = [], []
+    for state in _sessions.list(active_only=False, run_id=run_id):
+        if state.get("state") != DemoState.COMPLETED.value:
+            incidents.extend(state.get("created_incidents", []))
+        channels.extend(state.get("created_channels", []))
+    return {"incidents": incidents, "channels": channels}
+
+
+def reset_demo_incidents(pd: PagerDutyClient, scenario_id: str = None, run_id: str = None,
+                         slack: SlackClient = None) -> Dict[str, Any]:
+    scope = ", ".join(f"{k}={v}" for k, v in (("run_id", run_id), ("scenario_id", scenario_id)) if v)
+    logger.info(f"Resetting [DEMO] incidents for {scope or 'all runs'}...")
+
+    incident_ids = [i['id'] for i in find_scoped_incidents(pd, run_id, scenario_id)]
+    channel_ids = []
+    if run_id and not scenario_id:
+        tracked = _tracked_resources(run_id)
+        incident_ids = list(dict.fromkeys(incident_ids + tracked["incidents"]))
+        channel_ids = tracked["channels"]
+    logger.info(f"Found {len(incident_ids)} [DEMO] incidents and {len(channel_ids)} channels to tear down")
+
+    results = teardown(pd, incident_ids, slack, channel_ids, CONALL_EMAIL)
+    for incident_id in results["failed"]:
+        logger.error(f"Failed to resolve incident {incident_id}")
     return results
 
 
-def trigger_scenario(pd: PagerDutyClient, scenario: Dict) -> Dict[str, Any]:
+def trigger_scenario(pd: PagerDutyClient, scenario: Dict, run_id: str = None) -> Dict[str, Any]:
     payload = scenario.get("payload", {})
     inner_payload = payload.get("payload", payload)
     
@@ -303,12 +489,14 @@ def trigger_scenario(pd: PagerDutyClient, scenario: Dict) -> Dict[str, Any]:
     severity = inner_payload.get("severity", scenario.get("severity", "warning"))
     source = inner_payload.get("source", "demo-controller")
     
-    dedup_key = f"demo-{scenario['id']}-{int(time.time())}"
+    dedup_key = demo_dedup_key(scenario['id'], run_id)
     
     custom_details = inner_payload.get("custom_details", {}).copy()
     custom_details["scenario_id"] = scenario["id"]
     custom_details["scenario_name"] = scenario.get("name", "")
     custom_details["triggered_by"] = "demo-controller"
+    if run_id:
+        custom_details[RUN_ID_FIELD] = run_id
     custom_details["features_demonstrated"] = scenario.get("features_demonstrated", [])
     
     result = pd.trigger_incident(
@@ -324,6 +512,7 @@ def trigger_scenario(pd: PagerDutyClient, scenario: Dict) -> Dict[str, Any]:
         "success": result.get("success", False),
         "scenario_id": scenario["id"],
         "scenario_name": scenario.get("name"),
+        "run_id": run_id,
         "dedup_key": dedup_key,
         "routing_key": routing_key,
         "pd_service": pd_service,
@@ -335,6 +524,9 @@ def wait_for_incident(pd: PagerDutyClient, dedup_key: str, timeout_seconds: int
     start = time.time()
     while time.time() - start < timeout_seconds:
         incidents = pd.list_recent_incidents(minutes=5)
+        for inc in incidents:
+            if inc.get("incident_key") == dedup_key:
+                return inc
         for inc in incidents:
             title = inc.get("title", "")
             if dedup_key in title or "[DEMO]" in title:
@@ -426,128 +618,390 @@ def invite_responders_to_slack_channel(slack: SlackClient, channel_id: str, resp
     return {"invited": invited, "failed": failed}
 
 
-def perform_action(pd: PagerDutyClient, slack: SlackClient, incident_id: str, channel_id: str,
-                   responder: Dict, action_type: str, scenario: Dict, used_messages: set) -> Dict[str, Any]:
+def plan_action(pd: PagerDutyClient, responder: Dict, action_type: str, scenario: Dict, used_messages: set) -> Dict[str, Any]:
     category = get_conversation_category(scenario)
-    result = {"action": action_type, "user": responder['name'], "success": False}
+    name = responder['name']
+    step = {"action": action_type, "user": name, "email": responder['email'], "slack_text": None}
 
     if action_type == "status_update":
-        message = get_conversation_message(category, used_messages)
-        pd_result = pd.post_status_update(incident_id, message, responder['email'])
-        result["success"] = pd_result.get('success', False)
-        result["message"] = message
-        if channel_id:
-            slack.post_as_user(f":mega: *{responder['name']}* posted status update:\n_{message}_", responder, channel_id)
+        step["message"] = get_conversation_message(category, used_messages)
+        step["slack_text"] = f":mega: *{name}* posted status update:\n_{step['message']}_"
 
     elif action_type == "add_note":
-        message = get_conversation_message(category, used_messages)
-        pd_result = pd.add_note(incident_id, message, responder['email'])
-        result["success"] = pd_result.get('success', False)
-        result["message"] = message
-        if channel_id:
-            slack.post_as_user(f":memo: *{responder['name']}*: {message}", responder, channel_id)
+        step["message"] = get_conversation_message(category, used_messages)
+        step["slack_text"] = f":memo: *{name}*: {step['message']}"
 
     elif action_type == "run_automation":
         automations = pd.list_automation_actions()
         if automations:
             action = random.choice(automations)
-            pd_result = pd.run_automation_action(action['id'], incident_id, responder['email'])
-            result["success"] = pd_result.get('success', False)
-            result["automation"] = action.get('name', action['id'])
-            if channel_id:
-                slack.post_as_user(f":robot_face: *{responder['name']}* triggered automation: {action.get('name', 'Unknown')}", responder, channel_id)
+            step["automation_id"] = action['id']
+            step["automation"] = action.get('name', action['id'])
+            step["slack_text"] = f":robot_face: *{name}* triggered automation: {action.get('name', 'Unknown')}"
         else:
-            message = "Ran diagnostic automation - results in notes"
-            pd.add_note(incident_id, message, responder['email'])
-            result["success"] = True
-            result["message"] = message
+            step["message"] = "Ran diagnostic automation - results in notes"
 
     elif action_type == "trigger_workflow":
         workflows = pd.list_workflows()
         if workflows:
             workflow = random.choice(workflows)
-            pd_result = pd.trigger_workflow(workflow['id'], incident_id, responder['email'])
-            result["success"] = pd_result.get('success', False)
-            result["workflow"] = workflow.get('name', workflow['id'])
-            if channel_id:
-                slack.post_as_user(f":gear: *{responder['name']}* triggered workflow: {workflow.get('name', 'Unknown')}", responder, channel_id)
+            step["workflow_id"] = workflow['id']
+            step["workflow"] = workflow.get('name', workflow['id'])
+            step["slack_text"] = f":gear: *{name}* triggered workflow: {workflow.get('name', 'Unknown')}"
         else:
-            result["success"] = True
-            result["message"] = "No workflows available"
+            step["message"] = "No workflows available"
 
     elif action_type == "change_priority":
         priorities = pd.list_priorities()
         if priorities:
             priority = random.choice(priorities)
-            pd_result = pd.change_priority(incident_id, priority['id'], responder['email'])
+            step["priority_id"] = priority['id']
+            step["priority"] = priority.get('name', priority['id'])
+            step["slack_text"] = f":arrow_up_down: *{name}* changed priority to {priority.get('name', 'Unknown')}"
+
+    elif action_type == "change_urgency":
+        step["urgency"] = random.choice(["high", "low"])
+        step["slack_text"] = f":bell: *{name}* changed urgency to {step['urgency']}"
+
+    elif action_type == "add_subscriber":
+        manager = random.choice(demo_directory().others([responder]))
+        step["subscriber_id"] = manager['id']
+        step["subscriber"] = manager['name']
+        step["slack_text"] = f":eyes: *{name}* added {manager['name']} as subscriber for visibility"
+
+    elif action_type == "escalate":
+        step["slack_text"] = f":arrow_double_up: *{name}* escalated the incident"
+
+    return step
+
+
+def apply_action(pd: PagerDutyClient, incident_id: str, step: Dict[str, Any]) -> Dict[str, Any]:
+    action_type = step["action"]
+    email = step["email"]
+    result = {"action": action_type, "user": step["user"], "success": False}
+
+    if action_type == "status_update":
+        pd_result = pd.post_status_update(incident_id, step["message"], email)
+        result["success"] = pd_result.get('success', False)
+        result["message"] = step["message"]
+
+    elif action_type == "add_note":
+        pd_result = pd.add_note(incident_id, step["message"], email)
+        result["success"] = pd_result.get('success', False)
+        result["message"] = step["message"]
+
+    elif action_type == "run_automation":
+        if step.get("automation_id"):
+            pd_result = pd.run_automation_action(step["automation_id"], incident_id, email)
             result["success"] = pd_result.get('success', False)
-            result["priority"] = priority.get('name', priority['id'])
-            if channel_id:
-                slack.post_as_user(f":arrow_up_down: *{responder['name']}* changed priority to {priority.get('name', 'Unknown')}", responder, channel_id)
+            result["automation"] = step["automation"]
+        else:
+            pd.add_note(incident_id, step["message"], email)
+            result["success"] = True
+            result["message"] = step["message"]
+
+    elif action_type == "trigger_workflow":
+        if step.get("workflow_id"):
+            pd_result = pd.trigger_workflow(step["workflow_id"], incident_id, email)
+            result["success"] = pd_result.get('success', False)
+            result["workflow"] = step["workflow"]
+        else:
+            result["success"] = True
+            result["message"] = step["message"]
+
+    elif action_type == "change_priority":
+        if step.get("priority_id"):
+            pd_result = pd.change_priority(incident_id, step["priority_id"], email)
+            result["success"] = pd_result.get('success', False)
+            result["priority"] = step["priority"]
         else:
             result["success"] = True
 
     elif action_type == "change_urgency":
-        urgency = random.choice(["high", "low"])
-        pd_result = pd.update_urgency(incident_id, urgency, responder['email'])
+        pd_result = pd.update_urgency(incident_id, step["urgency"], email)
         result["success"] = pd_result.get('success', False)
-        result["urgency"] = urgency
-        if channel_id:
-            slack.post_as_user(f":bell: *{responder['name']}* changed urgency to {urgency}", responder, channel_id)
+        result["urgency"] = step["urgency"]
 
     elif action_type == "add_subscriber":
-        manager = random.choice([u for u in DEMO_USERS if u != responder])
-        pd_result = pd.add_subscriber(incident_id, manager['id'], 'user', responder['email'])
+        pd_result = pd.add_subscriber(incident_id, step["subscriber_id"], 'user', email)
         result["success"] = pd_result.get('success', False)
-        result["subscriber"] = manager['name']
-        if channel_id:
-            slack.post_as_user(f":eyes: *{responder['name']}* added {manager['name']} as subscriber for visibility", responder, channel_id)
+        result["subscriber"] = step["subscriber"]
 
     elif action_type == "escalate":
-        pd_result = pd.escalate_incident(incident_id, 2, responder['email'])
+        pd_result = pd.escalate_incident(incident_id, 2, email)
         result["success"] = pd_result.get('success', False)
-        if channel_id:
-            slack.post_as_user(f":arrow_double_up: *{responder['name']}* escalated the incident", responder, channel_id)
 
     return result
 
 
-def run_responder_actions(pd: PagerDutyClient, slack: SlackClient, incident_id: str, channel_id: str,
-                          responders: List[Dict], scenario: Dict, delay_func) -> List[Dict]:
-    actions_taken = []
+def perform_action(pd: PagerDutyClient, slack: SlackClient, incident_id: str, channel_id: str,
+                   responder: Dict, action_type: str, scenario: Dict, used_messages: set) -> Dict[str, Any]:
+    step = plan_action(pd, responder, action_type, scenario, used_messages)
+    result = apply_action(pd, incident_id, step)
+    if channel_id and step["slack_text"]:
+        slack.post_as_user(step["slack_text"], responder, channel_id)
+    return result
+
+
+def plan_responder_actions(pd: PagerDutyClient, responders: List[Dict], scenario: Dict) -> List[tuple]:
     used_messages = set()
-    responder_actions = {r['id']: [] for r in responders}
-    
+    responder_actions = {r['id']: 0 for r in responders}
+    planned = []
+
     total_actions = random.randint(3, 7)
     actions_per_responder = max(1, total_actions // len(responders))
-    
+
     for i in range(total_actions):
-        available_responders = [r for r in responders if len(responder_actions[r['id']]) < actions_per_responder + 1]
+        available_responders = [r for r in responders if responder_actions[r['id']] < actions_per_responder + 1]
         if not available_responders:
             available_responders = responders
-        
+
         responder = random.choice(available_responders)
-        action_type = random.choice(ACTION_TYPES)
-        
-        if i == 0:
-            action_type = "add_note"
-        
-        time.sleep(delay_func())
-        
-        result = perform_action(pd, slack, incident_id, channel_id, responder, action_type, scenario, used_messages)
-        actions_taken.append(result)
-        responder_actions[responder['id']].append(result)
-        
-        logger.info(f"Action {i+1}/{total_actions}: {result.get('action')} by {result.get('user')} - success={result.get('success')}")
-    
+        action_type = "add_note" if i == 0 else random.choice(ACTION_TYPES)
+        planned.append((responder, plan_action(pd, responder, action_type, scenario, used_messages)))
+        responder_actions[responder['id']] += 1
+
     for responder in responders:
         if not responder_actions[responder['id']]:
-            time.sleep(delay_func())
-            result = perform_action(pd, slack, incident_id, channel_id, responder, "add_note", scenario, used_messages)
-            actions_taken.append(result)
-            logger.info(f"Ensuring action by {responder['name']}: {result.get('action')} - success={result.get('success')}")
-    
-    return actions_taken
+            planned.append((responder, plan_action(pd, responder, "add_note", scenario, used_messages)))
+
+    return planned
+
+
+def run_responder_actions(pd: PagerDutyClient, slack: SlackClient, incident_id: str, channel_id: str,
+                          responders: List[Dict], scenario: Dict, delay_func,
+                          planned: List[tuple] = None) -> tuple:
+    actions_taken = []
+    if planned is None:
+        planned = plan_responder_actions(pd, responders, scenario)
+
+    for i, (responder, step) in enumerate(planned):
+        delay = delay_func()
+        if not _has_time(delay + ACTION_PHASE_SECONDS):
+            logger.warning(f"Deadline near, deferring {len(planned) - i}/{len(planned)} responder actions")
+            return actions_taken, [[_user_dict(r), pending] for r, pending in planned[i:]]
+        time.sleep(delay)
+
+        result = apply_action(pd, incident_id, step)
+        if channel_id and step["slack_text"]:
+            slack.post_as_user(step["slack_text"], responder, channel_id)
+        actions_taken.append(result)
+
+        logger.info(f"Action {i+1}/{len(planned)}: {result.get('action')} by {result.get('user')} - success={result.get('success')}")
+
+    return actions_taken, []
+
+
+def _scheduler_configured() -> bool:
+    return bool(SELF_LAMBDA_ARN and SCHEDULER_ROLE_ARN)
+
+
+def schedule_pd_step(session_id: str, incident_id: str, index: int, step: Dict[str, Any], run_at: int,
+                     version: int = 1) -> bool:
+    pd_step = {**{k: v for k, v in step.items() if k != "slack_text"}, "seq": index, "plan_version": version}
+    schedule_name = f"demo-ctl-{session_id[:16]}-v{version}-{index:02d}-{step['action']}"[:64].replace("_", "-")
+    try:
+        aws_client('scheduler').create_schedule(
+            Name=schedule_name,
+            ScheduleExpression=f"at({datetime.fromtimestamp(run_at, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')})",
+            FlexibleTimeWindow={'Mode': 'OFF'},
+            Target={
+                'Arn': SELF_LAMBDA_ARN,
+                'RoleArn': SCHEDULER_ROLE_ARN,
+                'Input': json.dumps({
+                    'action': 'scheduled_step',
+                    'session_id': session_id,
+                    'incident_id': incident_id,
+                    'step': pd_step,
+                }),
+            },
+            ActionAfterCompletion='DELETE',
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Error scheduling {step['action']} for {incident_id}: {e}")
+        return False
+
+
+def _has_time(seconds: float) -> bool:
+    return current_deadline().fits(seconds, DEADLINE_RESERVE_SECONDS)
+
+
+def _user_dict(user: Any) -> Dict[str, Any]:
+    return user.to_dict() if hasattr(user, 'to_dict') else dict(user)
+
+
+def schedule_checkpoint_resume(session_id: str, attempt: int) -> bool:
+    run_at = int(time.time()) + CHECKPOINT_RESUME_DELAY
+    scheduler = aws_client('scheduler')
+    try:
+        scheduler.create_schedule(
+            Name=f"demo-ctl-{session_id[:16]}-resume-{attempt:02d}",
+            ScheduleExpression=f"at({datetime.fromtimestamp(run_at, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')})",
+            FlexibleTimeWindow={'Mode': 'OFF'},
+            Target={
+                'Arn': SELF_LAMBDA_ARN,
+                'RoleArn': SCHEDULER_ROLE_ARN,
+                'Input': json.dumps({'action': 'resume_checkpoint', 'session_id': session_id}),
+            },
+            ActionAfterCompletion='DELETE',
+        )
+        return True
+    except scheduler.exceptions.ConflictException:
+        logger.info(f"Checkpoint resume {attempt} for {session_id} is already scheduled")
+        return True
+    except Exception as e:
+        logger.error(f"Error scheduling checkpoint resume for {session_id}: {e}")
+        return False
+
+
+def checkpoint_session(state: Dict[str, Any], results: Dict[str, Any], phase: str, **carry) -> Dict[str, Any]:
+    resumes = state.get("checkpoint_resumes", 0)
+    if resumes >= MAX_CHECKPOINT_RESUMES:
+        logger.error(f"Session {state['session_id']} ran out of time at {phase} after {resumes} resumes")
+        _set_phase(state, DemoState.FAILED)
+        results.update({"error": f"Out of time at {phase} after {resumes} resumes", "success": False})
+        return results
+
+    remaining = current_deadline().remaining()
+    state["checkpoint"] = {"phase": phase, "created_at": _now(), **carry}
+    _sessions.save(state)
+    scheduled = _scheduler_configured() and schedule_checkpoint_resume(state["session_id"], resumes + 1)
+    logger.warning(f"Session {state['session_id']} checkpointed at {phase} with {remaining:.0f}s left, "
+                   f"resume {'scheduled' if scheduled else 'pending resume_checkpoint'}")
+    results.update({"status": "checkpointed", "checkpoint": phase, "resume_scheduled": scheduled})
+    return results
+
+
+def _schedule_timeline(slack: SlackClient, state: Dict[str, Any], incident_id: str, channel_id: Optional[str],
+                       steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    version = state.get("plan_version", 1)
+    run_at = int(time.time())
+    timeline = []
+    scheduled_messages = []
+    for planned in steps:
+        step = planned["step"]
+        run_at += planned["delay"]
+        entry = {"at": datetime.fromtimestamp(run_at, timezone.utc).isoformat(),
+                 "action": step["action"], "user": step["user"], "slack_scheduled": False}
+        if channel_id and step["slack_text"]:
+            posted = slack.schedule_as_user(step["slack_text"], planned["responder"], run_at, channel_id)
+            entry["slack_scheduled"] = posted.get('ok', False)
+            if posted.get('ok'):
+                scheduled_messages.append({"channel": channel_id, "id": posted.get("scheduled_message_id")})
+            else:
+                logger.error(f"Failed to schedule Slack message for {step['action']}: {posted.get('error')}")
+        entry["pd_scheduled"] = schedule_pd_step(state["session_id"], incident_id, planned["seq"], step, run_at, version)
+        timeline.append(entry)
+
+    state["scheduled_messages"] = scheduled_messages
+    state["scheduled_until"] = datetime.fromtimestamp(run_at, timezone.utc).isoformat()
+    return timeline
+
+
+def replan_scheduled_timeline(state: Dict[str, Any]) -> Dict[str, Any]:
+    remaining = (state.get("scheduled_steps") or [])[state.get("current_step", 0):]
+    if not remaining or not state.get("incident_id"):
+        return {"replanned": 0, "success": True}
+    state["plan_version"] = state.get("plan_version", 1) + 1
+    timeline = _schedule_timeline(SlackClient(), state, state["incident_id"], state.get("channel_id"), remaining)
+    _set_phase(state, DemoState.INVESTIGATING)
+    logger.info(f"Replanned {len(timeline)} remaining steps for {state['incident_id']} as plan "
+                f"v{state['plan_version']} ending {state['scheduled_until']}")
+    return {
+        "replanned": len(timeline),
+        "plan_version": state["plan_version"],
+        "scheduled_until": state["scheduled_until"],
+        "success": all(e["pd_scheduled"] for e in timeline),
+    }
+
+
+def schedule_demo_timeline(pd: PagerDutyClient, slack: SlackClient, state: Dict[str, Any], incident_id: str,
+                           channel_id: str, responders: List[Dict], scenario: Dict, trigger_result: Dict,
+                           delay_func) -> Dict[str, Any]:
+    planned = plan_responder_actions(pd, responders, scenario)
+    resolver = select_resolver(responders)
+    note = resolution_note(scenario)
+    planned.append((resolver, {
+        "action": "resolve",
+        "user": resolver['name'],
+        "email": resolver['email'],
+        "note": note,
+        "routing_key": trigger_result.get("routing_key"),
+        "dedup_key": trigger_result.get("dedup_key"),
+        "slack_text": f":tada: *{resolver['name']}*: {note}\n\n:white_check_mark: Incident resolved!",
+    }))
+
+    steps = [{"seq": index, "delay": delay_func(), "responder": _user_dict(responder), "step": step}
+             for index, (responder, step) in enumerate(planned)]
+    state["plan_version"] = 1
+    state["scheduled_steps"] = steps
+    timeline = _schedule_timeline(slack, state, incident_id, channel_id, steps)
+    state["resolver"] = resolver['name']
+    state["total_steps"] = len(timeline)
+    _sessions.save(state)
+
+    logger.info(f"Scheduled {len(timeline)} steps for {incident_id} over {sum(s['delay'] for s in steps)}s "
+                f"({len(state['scheduled_messages'])} Slack messages)")
+    return {
+        "timeline": timeline,
+        "resolver": resolver['name'],
+        "scheduled_until": state["scheduled_until"],
+        "success": all(e["pd_scheduled"] for e in timeline),
+    }
+
+
+def resume_from_checkpoint(session_id: str) -> Dict[str, Any]:
+    state = _sessions.get(session_id) if session_id else None
+    if not state:
+        return {"error": f"Session {session_id} not found", "success": False}
+    checkpoint = state.get("checkpoint")
+    if not checkpoint:
+        return {"error": f"Session {session_id} has no checkpoint", "success": False}
+    if _is_paused(state):
+        logger.info(f"Session {session_id} paused, leaving {checkpoint['phase']} checkpoint for resume_demo")
+        return {"status": "paused", "session_id": session_id, "checkpoint": checkpoint["phase"], "success": True}
+
+    state["checkpoint"] = None
+    state["checkpoint_resumes"] = state.get("checkpoint_resumes", 0) + 1
+    _sessions.save(state)
+    logger.info(f"Resuming session {session_id} from {checkpoint['phase']} checkpoint")
+
+    if checkpoint["phase"] == PHASE_PLAYLIST:
+        return run_playlist(scenario_ids=checkpoint["scenario_ids"], action_delay=checkpoint.get("action_delay"),
+                            inter_scenario_delay=checkpoint.get("inter_scenario_delay"),
+                            concurrency=checkpoint.get("concurrency"), session_id=session_id,
+                            run_id=state.get("run_id"), session=state, progress=checkpoint.get("progress"))
+    result = run_demo_flow(checkpoint["scenario_id"], checkpoint.get("action_delay"), state=state,
+                           run_id=state.get("run_id"), checkpoint=checkpoint)
+    _settle_playlist(state.get("parent_session_id"))
+    return result
+
+
+def run_scheduled_step(session_id: str, incident_id: str, step: Dict[str, Any]) -> Dict[str, Any]:
+    state = _sessions.get(session_id) if session_id else None
+    if state and _is_paused(state):
+        logger.info(f"Session {session_id} paused, skipping scheduled {step.get('action')}")
+        return {"action": step.get("action"), "skipped": "paused", "success": True}
+    if state and step.get("plan_version", 1) != state.get("plan_version", 1):
+        logger.info(f"Session {session_id} replanned, skipping {step.get('action')} from plan v{step.get('plan_version', 1)}")
+        return {"action": step.get("action"), "skipped": "superseded", "success": True}
+
+    pd = PagerDutyClient()
+    if step.get("action") == "resolve":
+        result = resolve_incident(pd, None, incident_id, None, {"name": step["user"], "email": step["email"]},
+                                  None, step, note=step.get("note"))
+        if state:
+            _set_phase(state, DemoState.COMPLETED if result.get("success") else DemoState.FAILED)
+            _settle_playlist(state.get("parent_session_id"))
+        return result
+
+    result = apply_action(pd, incident_id, step)
+    if state:
+        state["current_step"] = step["seq"] + 1 if "seq" in step else state.get("current_step", 0) + 1
+        _sessions.save({"session_id": session_id, "current_step": state["current_step"]})
+    logger.info(f"Scheduled action {result.get('action')} by {result.get('user')} - success={result.get('success')}")
+    return result
 
 
 def acknowledge_incident(pd: PagerDutyClient, slack: SlackClient, incident_id: str, channel_id: str, responder: Dict) -> Dict[str, Any]:
@@ -562,15 +1016,17 @@ def acknowledge_incident(pd: PagerDutyClient, slack: SlackClient, incident_id: s
     }
 
 
-def resolve_incident(pd: PagerDutyClient, slack: SlackClient, incident_id: str, channel_id: str,
-                     responder: Dict, scenario: Dict, trigger_result: Dict) -> Dict[str, Any]:
+def resolution_note(scenario: Dict) -> str:
     orchestration_trace = scenario.get("orchestration_trace", [])
-
     if orchestration_trace:
-        last_stage = orchestration_trace[-1] if orchestration_trace else {}
-        note = f"[Resolution] {last_stage.get('result', last_stage.get('action', 'Issue resolved.'))}"
-    else:
-        note = "Root cause identified and fixed. Incident resolved."
+        last_stage = orchestration_trace[-1]
+        return f"[Resolution] {last_stage.get('result', last_stage.get('action', 'Issue resolved.'))}"
+    return "Root cause identified and fixed. Incident resolved."
+
+
+def resolve_incident(pd: PagerDutyClient, slack: SlackClient, incident_id: str, channel_id: str,
+                     responder: Dict, scenario: Dict, trigger_result: Dict, note: str = None) -> Dict[str, Any]:
+    note = note or resolution_note(scenario)
 
     pd.add_note(incident_id, note, responder['email'])
 
@@ -600,89 +1056,71 @@ def resolve_incident(pd: PagerDutyClient, slack: SlackClient, incident_id: str,
     }
 
 
-def run_demo_flow(scenario_id: str, action_delay: int = None) -> Dict[str, Any]:
-    global _demo_state
-
-    pd = PagerDutyClient()
-    slack = SlackClient()
-
-    slack_health = slack.verify_token()
-    if not slack_health.get('ok'):
-        logger.error(f"SLACK TOKEN INVALID: {slack_health.get('error', 'unknown')} - all Slack operations will fail")
-    else:
-        logger.info(f"Slack token valid: team={slack_health.get('team')}, user={slack_health.get('user')}")
+def _start_demo_incident(pd: PagerDutyClient, slack: SlackClient, state: Dict[str, Any], results: Dict[str, Any],
+                         scenario: Dict, run_id: str, delay_func) -> tuple:
+    scenario_id = scenario["id"]
+    state["run_id"] = run_id
+    state["scenario_id"] = scenario_id
+    state["created_incidents"] = []
+    state["created_channels"] = []
+    state["started_at"] = _now()
+    _set_phase(state, DemoState.RESETTING)
 
-    delay_func = lambda: action_delay if action_delay else get_random_delay()
-
-    results = {
-        "scenario_id": scenario_id,
-        "steps": [],
-        "success": False,
-        "incident_id": None,
-        "channel_id": None,
-        "responders": [],
-    }
-
-    scenarios_data = load_scenarios()
-    scenario = get_scenario_by_id(scenario_id, scenarios_data)
-
-    if not scenario:
-        logger.error(f"Scenario {scenario_id} not found")
-        return {"error": f"Scenario {scenario_id} not found", "success": False}
-
-    _demo_state["state"] = DemoState.RESETTING.value
-    _demo_state["scenario_id"] = scenario_id
-    _demo_state["started_at"] = datetime.now(timezone.utc).isoformat()
-
-    reset_result = reset_demo_incidents(pd)
+    reset_result = reset_demo_incidents(pd, scenario_id, run_id)
     results["steps"].append({"step": "reset", "result": reset_result})
     logger.info(f"Reset complete: {len(reset_result['resolved'])} incidents resolved")
 
-    if _demo_state.get("paused"):
-        return {"status": "paused", "steps": results["steps"]}
+    if _is_paused(state):
+        return None, {"status": "paused", "steps": results["steps"]}
 
-    time.sleep(5)
+    if reset_result["resolved"]:
+        time.sleep(5)
 
-    _demo_state["state"] = DemoState.TRIGGERING.value
-    trigger_result = trigger_scenario(pd, scenario)
+    _set_phase(state, DemoState.TRIGGERING)
+    trigger_result = trigger_scenario(pd, scenario, run_id)
     results["steps"].append({"step": "trigger", "result": trigger_result})
 
     if not trigger_result.get("success"):
         logger.error(f"Failed to trigger scenario: {trigger_result}")
-        return {"error": "Failed to trigger scenario", "steps": results["steps"], "success": False}
+        _set_phase(state, DemoState.FAILED)
+        return None, {"error": "Failed to trigger scenario", "steps": results["steps"], "success": False}
 
-    _demo_state["dedup_key"] = trigger_result["dedup_key"]
+    state["dedup_key"] = trigger_result["dedup_key"]
     logger.info(f"Triggered scenario {scenario_id}, waiting for incident...")
 
     time.sleep(delay_func())
 
-    _demo_state["state"] = DemoState.WAITING_ACK.value
+    _set_phase(state, DemoState.WAITING_ACK)
     incident = wait_for_incident(pd, trigger_result["dedup_key"])
 
     if not incident:
         logger.warning("Incident not found after trigger, checking for any recent demo incidents...")
         recent = pd.list_recent_incidents(minutes=5)
-        demo_incidents = [i for i in recent if "[DEMO]" in i.get("title", "")]
+        prefix = scenario_dedup_prefix(scenario_id)
+        demo_incidents = [i for i in recent if "[DEMO]" in i.get("title", "")
+                          and (i.get("incident_key") or prefix).startswith(prefix)]
         if demo_incidents:
             incident = demo_incidents[0]
 
     if not incident:
         logger.error("Failed to find triggered incident")
-        return {"error": "Incident not found", "steps": results["steps"], "success": False}
+        _set_phase(state, DemoState.FAILED)
+        return None, {"error": "Incident not found", "steps": results["steps"], "success": False}
 
     incident_id = incident["id"]
-    _demo_state["incident_id"] = incident_id
+    state["incident_id"] = incident_id
+    state["created_incidents"].append(incident_id)
     results["incident_id"] = incident_id
     logger.info(f"Found incident {incident_id}")
 
     responder_count = determine_responder_count()
     responders = select_responders(responder_count)
-    _demo_state["responders"] = [r['name'] for r in responders]
+    state["responders"] = [r['name'] for r in responders]
     results["responders"] = [r['name'] for r in responders]
     logger.info(f"Selected {len(responders)} responders: {[r['name'] for r in responders]}")
 
-    if _demo_state.get("paused"):
-        return {"status": "paused", "incident_id": incident_id, "steps": results["steps"]}
+    if _is_paused(state):
+        return None, {"status": "paused", "incident_id": incident_id, "steps": results["steps"]}
 
     primary_responder = responders[0]
     ack_result = acknowledge_incident(pd, slack, incident_id, None, primary_responder)
@@ -694,7 +1132,9 @@ def run_demo_flow(scenario_id: str, action_delay: int = None) -> Dict[str, Any]:
     channel_result = wait_for_incident_channel(pd, slack, incident, timeout_seconds=90, poll_interval=5)
     results["steps"].append({"step": "wait_for_channel", "result": channel_result})
     channel_id = channel_result.get("channel_id")
-    _demo_state["channel_id"] = channel_id
+    state["channel_id"] = channel_id
+    if channel_id:
+        state["created_channels"].append(channel_id)
     results["channel_id"] = channel_id
 
     if channel_id:
@@ -719,7 +1159,7 @@ def run_demo_flow(scenario_id: str, action_delay: int = None) -> Dict[str, Any]:
 
         if channel_id:
             for resp in additional:
-                slack_id = resp.get('slack_id') or PAGERDUTY_TO_SLACK_USER_MAP.get(resp.get('email'))
+                slack_id = resp.get('slack_id') or demo_directory().slack_id_for_email(resp.get('email'))
                 if slack_id:
                     inv_result = slack.invite_user_to_channel(channel_id, slack_id)
                     if inv_result.get('ok') or inv_result.get('error') == 'already_in_channel':
@@ -730,28 +1170,124 @@ def run_demo_flow(scenario_id: str, action_delay: int = None) -> Dict[str, Any]:
             names = ", ".join([r['name'] for r in additional])
             slack.post_as_user(f":busts_in_silhouette: *{primary_responder['name']}* requested help from {names}", primary_responder, channel_id)
 
-    if _demo_state.get("paused"):
-        return {"status": "paused", "incident_id": incident_id, "channel_id": channel_id, "steps": results["steps"]}
+    return (responders, trigger_result), None
 
-    time.sleep(delay_func())
 
-    _demo_state["state"] = DemoState.INVESTIGATING.value
+def run_demo_flow(scenario_id: str, action_delay: int = None, state: Dict[str, Any] = None,
+                  handoff: threading.Event = None, run_id: str = None,
+                  session_id: str = None, presenter: str = None, chatter_mode: str = None,
+                  checkpoint: Dict[str, Any] = None) -> Dict[str, Any]:
+    if state is None:
+        state = open_session(session_id, presenter, chatter_mode=chatter_mode)
+    run_id = run_id or new_run_id()
+    chatter_mode = state.get("chatter_mode") or DEFAULT_CHATTER_MODE
+    if chatter_mode == CHATTER_SCHEDULED and not _scheduler_configured():
+        logger.warning("Scheduled chatter requested but SELF_LAMBDA_ARN/SCHEDULER_ROLE_ARN are not set, running live")
+        chatter_mode = CHATTER_LIVE
+
+    pd = PagerDutyClient()
+    slack = SlackClient()
+
+    slack_health = slack.verify_token()
+    if not slack_health.get('ok'):
+        logger.error(f"SLACK TOKEN INVALID: {slack_health.get('error', 'unknown')} - all Slack operations will fail")
+    else:
+        logger.info(f"Slack token valid: team={slack_health.get('team')}, user={slack_health.get('user')}")
+
+    delay_func = lambda: action_delay if action_delay else get_random_delay()
+
+    results = {
+        "scenario_id": scenario_id,
+        "session_id": state["session_id"],
+        "run_id": run_id,
+        "steps": [],
+        "success": False,
+        "incident_id": None,
+        "channel_id": None,
+        "responders": [],
+    }
+
+    scenarios_data = load_scenarios()
+    scenario = get_scenario_by_id(scenario_id, scenarios_data)
 
-    actions = run_responder_actions(pd, slack, incident_id, channel_id, responders, scenario, delay_func)
-    results["steps"].append({"step": "responder_actions", "result": {"actions": actions, "count": len(actions)}})
+    if not scenario:
+        logger.error(f"Scenario {scenario_id} not found")
+        _set_phase(state, DemoState.FAILED)
+        return {"error": f"Scenario {scenario_id} not found", "session_id": state["session_id"], "success": False}
+
+    phase = (checkpoint or {}).get("phase", PHASE_START)
+    if phase == PHASE_START:
+        if not _has_time(SETUP_PHASE_SECONDS):
+            return checkpoint_session(state, results, PHASE_START, scenario_id=scenario_id, action_delay=action_delay)
+        setup, failure = _start_demo_incident(pd, slack, state, results, scenario, run_id, delay_func)
+        if failure:
+            return failure
+        responders, trigger_result = setup
+    else:
+        responders, trigger_result = checkpoint["responders"], checkpoint["trigger_result"]
+        results.update({"incident_id": state["incident_id"], "channel_id": state.get("channel_id"),
+                        "responders": [r['name'] for r in responders]})
+        results["steps"].append({"step": "resume", "result": {"phase": phase, "checkpointed_at": checkpoint.get("created_at")}})
+        logger.info(f"Resuming scenario {scenario_id} at {phase} for incident {state['incident_id']}")
+
+    incident_id = state["incident_id"]
+    channel_id = state.get("channel_id")
+    carry = {
+        "scenario_id": scenario_id,
+        "action_delay": action_delay,
+        "responders": [_user_dict(r) for r in responders],
+        "trigger_result": {k: trigger_result.get(k) for k in ("routing_key", "dedup_key")},
+    }
 
-    if _demo_state.get("paused"):
+    if _is_paused(state):
         return {"status": "paused", "incident_id": incident_id, "channel_id": channel_id, "steps": results["steps"]}
 
-    _demo_state["state"] = DemoState.RESOLVING.value
+    if phase != PHASE_RESOLVE:
+        remaining = checkpoint.get("remaining_actions") if checkpoint else None
+        if remaining is None:
+            delay = delay_func()
+            if not _has_time(delay + ACTION_PHASE_SECONDS):
+                return checkpoint_session(state, results, PHASE_INVESTIGATE, **carry)
+            time.sleep(delay)
+
+        _set_phase(state, DemoState.INVESTIGATING)
+
+        if chatter_mode == CHATTER_SCHEDULED and remaining is None:
+            schedule_result = schedule_demo_timeline(pd, slack, state, incident_id, channel_id, responders,
+                                                     scenario, trigger_result, delay_func)
+            results["steps"].append({"step": "schedule_timeline", "result": schedule_result})
+            results["success"] = schedule_result["success"]
+            results["resolver"] = schedule_result["resolver"]
+            results["scheduled_until"] = schedule_result["scheduled_until"]
+            if not schedule_result["success"]:
+                _set_phase(state, DemoState.FAILED)
+            logger.info(f"Demo flow for scenario {scenario_id} handed off to scheduled timeline "
+                        f"ending {schedule_result['scheduled_until']}")
+            return results
+
+        actions, remaining = run_responder_actions(pd, slack, incident_id, channel_id, responders, scenario,
+                                                   delay_func, planned=remaining)
+        results["steps"].append({"step": "responder_actions", "result": {"actions": actions, "count": len(actions)}})
+        if remaining:
+            return checkpoint_session(state, results, PHASE_INVESTIGATE, remaining_actions=remaining, **carry)
+
+        if _is_paused(state):
+            return {"status": "paused", "incident_id": incident_id, "channel_id": channel_id, "steps": results["steps"]}
+
+    _set_phase(state, DemoState.RESOLVING)
+    if handoff is not None:
+        handoff.set()
 
     resolver = select_resolver(responders)
-    time.sleep(delay_func())
+    delay = delay_func()
+    if not _has_time(delay + RESOLVE_PHASE_SECONDS):
+        return checkpoint_session(state, results, PHASE_RESOLVE, **carry)
+    time.sleep(delay)
 
     resolve_result = resolve_incident(pd, slack, incident_id, channel_id, resolver, scenario, trigger_result)
     results["steps"].append({"step": "resolve", "result": resolve_result})
 
-    _demo_state["state"] = DemoState.COMPLETED.value
+    _set_phase(state, DemoState.COMPLETED)
     results["success"] = True
     results["resolver"] = resolver['name']
 
@@ -759,22 +1295,58 @@ def run_demo_flow(scenario_id: str, action_delay: int = None) -> Dict[str, Any]:
     return results
 
 
-def pause_demo() -> Dict[str, Any]:
-    global _demo_state
-    _demo_state["paused"] = True
-    _demo_state["state"] = DemoState.PAUSED.value
-    return {"status": "paused", "state": _demo_state}
-
+def _session_family(session_id: str) -> List[Dict[str, Any]]:
+    return _sessions.list(active_only=True, parent_session_id=session_id)
 
-def resume_demo() -> Dict[str, Any]:
-    global _demo_state
-    _demo_state["paused"] = False
-    return {"status": "resumed", "state": _demo_state}
 
-
-def get_demo_status() -> Dict[str, Any]:
-    global _demo_state
-    return {"state": _demo_state}
+def pause_demo(session_id: str = None) -> Dict[str, Any]:
+    if session_id:
+        if not _sessions.get(session_id):
+            return {"error": f"Session {session_id} not found"}
+        targets = [session_id] + [c["session_id"] for c in _session_family(session_id)]
+    else:
+        targets = [s["session_id"] for s in _sessions.list()]
+    cancelled = 0
+    slack = None
+    for target in targets:
+        _sessions.set_paused(target, True)
+        pending = (_sessions.get(target) or {}).get("scheduled_messages") or []
+        if pending:
+            slack = slack or SlackClient()
+            cancelled += sum(1 for m in pending if slack.delete_scheduled_message(m["channel"], m["id"]).get("ok"))
+            _sessions.save({"session_id": target, "scheduled_messages": []})
+    return {"status": "paused", "sessions": targets, "scheduled_messages_cancelled": cancelled}
+
+
+def resume_demo(session_id: str = None) -> Dict[str, Any]:
+    if session_id:
+        if not _sessions.get(session_id):
+            return {"error": f"Session {session_id} not found"}
+        targets = [session_id] + [c["session_id"] for c in _session_family(session_id)]
+    else:
+        targets = [s["session_id"] for s in _sessions.list() if s.get("paused")]
+    checkpoints = []
+    replanned = []
+    for target in targets:
+        state = _sessions.get(target) or {}
+        _sessions.set_paused(target, False)
+        if state.get("checkpoint"):
+            scheduled = _scheduler_configured() and schedule_checkpoint_resume(
+                target, state.get("checkpoint_resumes", 0) + 1)
+            checkpoints.append({"session_id": target, "checkpoint": state["checkpoint"]["phase"],
+                                "resume_scheduled": scheduled})
+        elif state.get("paused") and state.get("scheduled_steps") and state.get("state") not in FINISHED_STATES:
+            replanned.append({"session_id": target, **replan_scheduled_timeline(state)})
+    return {"status": "resumed", "sessions": targets, "checkpoints": checkpoints, "timelines": replanned}
+
+
+def get_demo_status(session_id: str = None) -> Dict[str, Any]:
+    if not session_id:
+        return {"sessions": _sessions.list(), "hedging": hedge_stats()}
+    session = _sessions.get(session_id)
+    if not session:
+        return {"error": f"Session {session_id} not found"}
+    return {"session": session, "children": _sessions.list(active_only=False, parent_session_id=session_id)}
 
 
 def list_available_scenarios() -> List[Dict]:
@@ -792,10 +1364,130 @@ def list_available_scenarios() -> List[Dict]:
     ]
 
 
-def run_playlist(playlist_key: str = None, scenario_ids: List[str] = None,
-                 action_delay: int = None, inter_scenario_delay: int = None) -> Dict[str, Any]:
-    global _demo_state
+def _settle_playlist(session_id: Optional[str]) -> None:
+    parent = _sessions.get(session_id) if session_id else None
+    if not parent or not parent.get("awaiting_children") or parent.get("state") in FINISHED_STATES:
+        return
+    children = _sessions.list(active_only=False, parent_session_id=session_id)
+    if any(c.get("state") not in FINISHED_STATES for c in children):
+        return
+    parent["awaiting_children"] = False
+    completed = all(c.get("state") == DemoState.COMPLETED.value for c in children)
+    _set_phase(parent, DemoState.COMPLETED if completed else DemoState.FAILED)
+    logger.info(f"Playlist session {session_id} settled after its checkpointed scenarios: {parent['state']}")
+
+
+def _record_scenario_result(playlist_results: Dict[str, Any], sid: str, result: Dict[str, Any]) -> None:
+    scenario_success = result.get("success", False)
+    playlist_results["scenario_results"].append({
+        "scenario_id": sid,
+        "index": len(playlist_results["scenario_results"]) + 1,
+        "success": scenario_success,
+        "incident_id": result.get("incident_id"),
+        "resolver": result.get("resolver"),
+        "error": result.get("error"),
+        "status": result.get("status"),
+    })
+    if scenario_success:
+        playlist_results["passed"] += 1
+    elif result.get("status") == "checkpointed":
+        playlist_results["checkpointed"] += 1
+    else:
+        playlist_results["failed"] += 1
+
+
+def _checkpoint_playlist(playlist_results: Dict[str, Any], session: Dict[str, Any], remaining: List[str],
+                         action_delay: Optional[int], inter_scenario_delay: int, concurrency: int) -> None:
+    logger.info(f"Playlist out of time with {len(remaining)} scenarios left: {remaining}")
+    progress = {k: playlist_results[k] for k in PLAYLIST_PROGRESS_FIELDS}
+    checkpoint_session(session, playlist_results, PHASE_PLAYLIST, scenario_ids=remaining, action_delay=action_delay,
+                       inter_scenario_delay=inter_scenario_delay, concurrency=concurrency, progress=progress)
+    status = "checkpointed" if playlist_results.get("status") == "checkpointed" else "skipped_out_of_time"
+    playlist_results["scenario_results"].extend({"scenario_id": sid, "status": status} for sid in remaining)
+
+
+def _run_playlist_sequential(valid_ids: List[str], action_delay: Optional[int], inter_scenario_delay: int,
+                             playlist_results: Dict[str, Any], session: Dict[str, Any]) -> None:
+    run_id = playlist_results["run_id"]
+    for idx, sid in enumerate(valid_ids):
+        if _is_paused(session):
+            logger.info(f"Playlist paused before scenario {idx + 1}/{len(valid_ids)}: {sid}")
+            playlist_results["scenario_results"].append({"scenario_id": sid, "status": "skipped_paused"})
+            break
+
+        if not _has_time(SETUP_PHASE_SECONDS):
+            _checkpoint_playlist(playlist_results, session, valid_ids[idx:], action_delay, inter_scenario_delay, 1)
+            break
+
+        logger.info(f"Playlist scenario {idx + 1}/{len(valid_ids)}: {sid}")
+
+        state = open_session(presenter=session.get("presenter"), parent_session_id=session["session_id"],
+                             chatter_mode=session.get("chatter_mode"))
+        result = run_demo_flow(sid, action_delay, state=state, run_id=run_id)
+        _record_scenario_result(playlist_results, sid, result)
 
+        if idx < len(valid_ids) - 1 and not _is_paused(session) and _has_time(inter_scenario_delay + SETUP_PHASE_SECONDS):
+            logger.info(f"Waiting {inter_scenario_delay}s before next scenario...")
+            time.sleep(inter_scenario_delay)
+
+
+def _run_pipelined_flow(sid: str, action_delay: Optional[int], state: Dict[str, Any], run_id: str,
+                        handoff: threading.Event, slots: threading.Semaphore) -> Dict[str, Any]:
+    try:
+        return run_demo_flow(sid, action_delay, state=state, handoff=handoff, run_id=run_id)
+    except Exception as e:
+        logger.exception(f"Playlist scenario {sid} raised: {e}")
+        _set_phase(state, DemoState.FAILED)
+        return {"scenario_id": sid, "success": False, "error": str(e)}
+    finally:
+        handoff.set()
+        slots.release()
+
+
+def _run_playlist_pipelined(valid_ids: List[str], action_delay: Optional[int], concurrency: int,
+                            playlist_results: Dict[str, Any], session: Dict[str, Any],
+                            inter_scenario_delay: int = None) -> None:
+    slots = threading.Semaphore(concurrency)
+    handoff = None
+    submitted = []
+    paused_at = None
+    checkpointed = []
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for idx, sid in enumerate(valid_ids):
+            if handoff is not None:
+                handoff.wait()
+            slots.acquire()
+            if _is_paused(session):
+                slots.release()
+                logger.info(f"Playlist paused before scenario {idx + 1}/{len(valid_ids)}: {sid}")
+                paused_at = sid
+                break
+            if not _has_time(SETUP_PHASE_SECONDS):
+                slots.release()
+                checkpointed = valid_ids[idx:]
+                break
+
+            logger.info(f"Playlist scenario {idx + 1}/{len(valid_ids)}: {sid} (pipelined, concurrency={concurrency})")
+            state = open_session(presenter=session.get("presenter"), parent_session_id=session["session_id"],
+                                 chatter_mode=session.get("chatter_mode"))
+            handoff = threading.Event()
+            future = pool.submit(_run_pipelined_flow, sid, action_delay, state, playlist_results["run_id"], handoff, slots)
+            submitted.append((idx, sid, future))
+
+    for idx, sid, future in submitted:
+        _record_scenario_result(playlist_results, sid, future.result())
+    if paused_at:
+        playlist_results["scenario_results"].append({"scenario_id": paused_at, "status": "skipped_paused"})
+    if checkpointed:
+        _checkpoint_playlist(playlist_results, session, checkpointed, action_delay, inter_scenario_delay, concurrency)
+
+
+def run_playlist(playlist_key: str = None, scenario_ids: List[str] = None,
+                 action_delay: int = None, inter_scenario_delay: int = None,
+                 concurrency: int = None, session_id: str = None, presenter: str = None,
+                 chatter_mode: str = None, run_id: str = None, session: Dict[str, Any] = None,
+                 progress: Dict[str, Any] = None) -> Dict[str, Any]:
     if not scenario_ids:
         if not playlist_key or playlist_key not in PLAYLISTS:
             return {"error": f"Unknown playlist: {playlist_key}. Use list_playlists to see available options.", "success": False}
@@ -807,6 +1499,9 @@ def run_playlist(playlist_key: str = None, scenario_ids: List[str] = None,
 
     if inter_scenario_delay is None:
         inter_scenario_delay = DEFAULT_INTER_SCENARIO_DELAY
+    if concurrency is None:
+        concurrency = DEFAULT_PLAYLIST_CONCURRENCY
+    concurrency = max(1, int(concurrency))
 
     scenarios_data = load_scenarios()
     valid_ids = []
@@ -826,6 +1521,8 @@ def run_playlist(playlist_key: str = None, scenario_ids: List[str] = None,
     playlist_results = {
         "playlist": playlist_name,
         "playlist_key": playlist_key,
+        "session_id": None,
+        "run_id": run_id or new_run_id(),
         "requested_scenarios": scenario_ids,
         "valid_scenarios": valid_ids,
         "skipped_scenarios": [s for s in scenario_ids if s not in valid_ids],
@@ -834,45 +1531,46 @@ def run_playlist(playlist_key: str = None, scenario_ids: List[str] = None,
         "started_at": datetime.now(timezone.utc).isoformat(),
         "completed_at": None,
         "total": len(valid_ids),
+        "concurrency": concurrency,
         "passed": 0,
         "failed": 0,
+        "checkpointed": 0,
     }
+    if progress:
+        playlist_results.update({k: progress[k] for k in PLAYLIST_PROGRESS_FIELDS if k in progress})
+        logger.info(f"Resuming playlist '{playlist_results['playlist']}' with {len(valid_ids)} of "
+                    f"{playlist_results['total']} scenarios left: {valid_ids}")
+    else:
+        logger.info(f"Starting playlist '{playlist_name}' with {len(valid_ids)} scenarios: {valid_ids}")
 
-    logger.info(f"Starting playlist '{playlist_name}' with {len(valid_ids)} scenarios: {valid_ids}")
-
-    for idx, sid in enumerate(valid_ids):
-        if _demo_state.get("paused"):
-            logger.info(f"Playlist paused before scenario {idx + 1}/{len(valid_ids)}: {sid}")
-            playlist_results["scenario_results"].append({"scenario_id": sid, "status": "skipped_paused"})
-            break
-
-        logger.info(f"Playlist scenario {idx + 1}/{len(valid_ids)}: {sid}")
-
-        result = run_demo_flow(sid, action_delay)
-        scenario_success = result.get("success", False)
-
-        playlist_results["scenario_results"].append({
-            "scenario_id": sid,
-            "index": idx + 1,
-            "success": scenario_success,
-            "incident_id": result.get("incident_id"),
-            "resolver": result.get("resolver"),
-            "error": result.get("error"),
-        })
-
-        if scenario_success:
-            playlist_results["passed"] += 1
-        else:
-            playlist_results["failed"] += 1
+    if session is None:
+        session = open_session(session_id, presenter, chatter_mode=chatter_mode)
+    session["run_id"] = playlist_results["run_id"]
+    playlist_results["session_id"] = session["session_id"]
+    _set_phase(session, DemoState.PROGRESSING)
 
-        if idx < len(valid_ids) - 1 and not _demo_state.get("paused"):
-            logger.info(f"Waiting {inter_scenario_delay}s before next scenario...")
-            time.sleep(inter_scenario_delay)
+    if concurrency > 1:
+        _run_playlist_pipelined(valid_ids, action_delay, concurrency, playlist_results, session, inter_scenario_delay)
+    else:
+        _run_playlist_sequential(valid_ids, action_delay, inter_scenario_delay, playlist_results, session)
 
     playlist_results["completed_at"] = datetime.now(timezone.utc).isoformat()
-    playlist_results["success"] = playlist_results["failed"] == 0 and playlist_results["passed"] == len(valid_ids)
-
-    logger.info(f"Playlist '{playlist_name}' complete: {playlist_results['passed']}/{len(valid_ids)} passed")
+    total = playlist_results["total"]
+    playlist_results["success"] = playlist_results["failed"] == 0 and playlist_results["passed"] == total
+    if playlist_results.get("status") == "checkpointed":
+        logger.info(f"Playlist '{playlist_results['playlist']}' checkpointed: {playlist_results['passed']}/{total} passed so far")
+        return playlist_results
+    if playlist_results["failed"] == 0 and playlist_results["checkpointed"]:
+        session["awaiting_children"] = True
+        _sessions.save(session)
+        playlist_results["status"] = "pending"
+        logger.info(f"Playlist '{playlist_results['playlist']}' waiting on {playlist_results['checkpointed']} "
+                    f"checkpointed scenarios: {playlist_results['passed']}/{total} passed so far")
+        _settle_playlist(session["session_id"])
+        return playlist_results
+    _set_phase(session, DemoState.COMPLETED if playlist_results["success"] else DemoState.FAILED)
+
+    logger.info(f"Playlist '{playlist_results['playlist']}' complete: {playlist_results['passed']}/{total} passed")
     return playlist_results
 
 
@@ -891,7 +1589,7 @@ def list_playlists() -> List[Dict]:
 
 def _get_recent_scenarios() -> List[str]:
     try:
-        ssm = boto3.client("ssm")
+        ssm = aws_client("ssm")
         resp = ssm.get_parameter(Name=SSM_RECENT_SCENARIOS_PARAM)
         return json.loads(resp["Parameter"]["Value"])
     except ssm.exceptions.ParameterNotFound:
@@ -903,7 +1601,7 @@ def _get_recent_scenarios() -> List[str]:
 
 def _save_recent_scenarios(recent: List[str]) -> None:
     try:
-        ssm = boto3.client("ssm")
+        ssm = aws_client("ssm")
         ssm.put_parameter(
             Name=SSM_RECENT_SCENARIOS_PARAM,
             Value=json.dumps(recent[-RECENT_SCENARIO_LIMIT:]),
@@ -914,7 +1612,8 @@ def _save_recent_scenarios(recent: List[str]) -> None:
         logger.warning(f"Failed to save recent scenarios to SSM: {e}")
 
 
-def run_random_scenario(action_delay: int = None) -> Dict[str, Any]:
+def run_random_scenario(action_delay: int = None, session_id: str = None, presenter: str = None,
+                        chatter_mode: str = None) -> Dict[str, Any]:
     scenarios_data = load_scenarios()
     enabled = [s for s in scenarios_data.get("scenarios", []) if s.get("enabled", True)]
     if not enabled:
@@ -929,13 +1628,24 @@ def run_random_scenario(action_delay: int = None) -> Dict[str, Any]:
     logger.info(f"Randomly selected scenario: {scenario['id']} - {scenario.get('name', '')} (skipped {len(recent)} recent)")
     recent.append(scenario["id"])
     _save_recent_scenarios(recent)
-    return run_demo_flow(scenario["id"], action_delay)
+    return run_demo_flow(scenario["id"], action_delay, session_id=session_id, presenter=presenter,
+                         chatter_mode=chatter_mode)
+
+
+def _status_code(result: Dict[str, Any]) -> int:
+    if result.get("status") in ("checkpointed", "pending"):
+        return 202
+    return 200 if result.get("success") else 500
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     logger.info(f"Demo Controller invoked with event: {json.dumps(event)}")
+    set_deadline(Deadline.from_context(context))
     
     action = event.get("action", "run")
+    session_id = event.get("session_id")
+    presenter = event.get("presenter")
+    chatter_mode = event.get("chatter_mode")
     
     if action == "run":
         scenario_id = event.get("scenario_id")
@@ -945,23 +1655,36 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 "body": json.dumps({"error": "scenario_id is required"})
             }
         delay = event.get("action_delay")
-        result = run_demo_flow(scenario_id, delay)
+        result = run_demo_flow(scenario_id, delay, session_id=session_id, presenter=presenter,
+                               chatter_mode=chatter_mode)
         return {
-            "statusCode": 200 if result.get("success") else 500,
+            "statusCode": _status_code(result),
             "body": json.dumps(result)
         }
     
+    elif action == "scheduled_step":
+        result = run_scheduled_step(session_id, event.get("incident_id"), event.get("step") or {})
+        return {"statusCode": 200 if result.get("success") else 500, "body": json.dumps(result)}
+
+    elif action == "resume_checkpoint":
+        result = resume_from_checkpoint(session_id)
+        return {"statusCode": _status_code(result), "body": json.dumps(result)}
+
     elif action == "pause":
-        result = pause_demo()
-        return {"statusCode": 200, "body": json.dumps(result)}
+        result = pause_demo(session_id)
+        return {"statusCode": 404 if result.get("error") else 200, "body": json.dumps(result)}
     
     elif action == "resume":
-        result = resume_demo()
-        return {"statusCode": 200, "body": json.dumps(result)}
+        result = resume_demo(session_id)
+        return {"statusCode": 404 if result.get("error") else 200, "body": json.dumps(result)}
     
     elif action == "status":
-        result = get_demo_status()
-        return {"statusCode": 200, "body": json.dumps(result)}
+        result = get_demo_status(session_id)
+        return {"statusCode": 404 if result.get("error") else 200, "body": json.dumps(result)}
+
+    elif action == "list_sessions":
+        sessions = _sessions.list(active_only=not event.get("include_finished", False))
+        return {"statusCode": 200, "body": json.dumps({"sessions": sessions})}
     
     elif action == "list_scenarios":
         scenarios = list_available_scenarios()
@@ -969,7 +1692,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     
     elif action == "reset":
         pd = PagerDutyClient()
-        result = reset_demo_incidents(pd)
+        run_id = event.get("run_id")
+        if session_id and not run_id:
+            run_id = (_sessions.get(session_id) or {}).get("run_id")
+        slack = SlackClient() if run_id and event.get("archive_channels", True) else None
+        result = reset_demo_incidents(pd, event.get("scenario_id"), run_id, slack)
         return {"statusCode": 200, "body": json.dumps(result)}
 
     elif action == "run_playlist":
@@ -982,9 +1709,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             }
         delay = event.get("action_delay")
         inter_delay = event.get("inter_scenario_delay")
-        result = run_playlist(playlist_key, scenario_ids, delay, inter_delay)
+        concurrency = event.get("concurrency")
+        result = run_playlist(playlist_key, scenario_ids, delay, inter_delay, concurrency, session_id, presenter,
+                              chatter_mode)
         return {
-            "statusCode": 200 if result.get("success") else 500,
+            "statusCode": _status_code(result),
             "body": json.dumps(result)
         }
 
@@ -994,9 +1723,9 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     elif action == "run_random":
         delay = event.get("action_delay")
-        result = run_random_scenario(delay)
+        result = run_random_scenario(delay, session_id, presenter, chatter_mode)
         return {
-            "statusCode": 200 if result.get("success") else 500,
+            "statusCode": _status_code(result),
             "body": json.dumps(result)
         }
 
@@ -4,12 +4,21 @@ import logging
 import random
 import hashlib
 import hmac
-import boto3
-import requests
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from typing import Optional, Dict, Any, List
 
+from shared import (
+    PagerDutyClient, SlackClient, DEMO_USERS, PAGERDUTY_EVENTS_URL,
+    CONALL_SLACK_USER_ID, CONALL_SLACK_USER_ID_PERSONAL,
+    demo_directory, get_conversation_message, aws_client,
+    RUN_ID_FIELD, new_run_id, demo_dedup_key, find_scoped_incidents, teardown, incident_mirror,
+    http_session, circuit_breaker, Deadline, current_deadline, set_deadline, hedge_stats,
+    state_backend_from_env,
+)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -19,25 +28,19 @@ class DecimalEncoder(json.JSONEncoder):
             return float(obj) if obj % 1 else int(obj)
         return super().default(obj)
 
-PAGERDUTY_API_URL = 'https://api.pagerduty.com'
-PAGERDUTY_EVENTS_URL = 'https://events.pagerduty.com/v2/enqueue'
-
-CONALL_EMAIL = 'clynch@pagerduty.com'
-CONALL_SLACK_USER_ID = 'U0A9KAMT0BF'
-CONALL_SLACK_USER_ID_PERSONAL = 'U0A9GBYT999'
 CONALL_PD_USER_ID = 'PSLR7NC'
 
-DEMO_USERS = [
-    {'id': 'PG6UTES', 'email': 'jbeam@losandesgaa.onmicrosoft.com', 'name': 'Jim Beam', 'slack_id': 'U0AA1LZSYHX'},
-    {'id': 'PR0E7IK', 'email': 'jdaniels@losandesgaa.onmicrosoft.com', 'name': 'Jack Daniels', 'slack_id': 'U0A9GC08EV9'},
-    {'id': 'PCX6T22', 'email': 'jcasker@losandesgaa.onmicrosoft.com', 'name': 'Jameson Casker', 'slack_id': 'U0AA1LYLH2M'},
-    {'id': 'PVOXRAP', 'email': 'jcuervo@losandesgaa.onmicrosoft.com', 'name': 'Jose Cuervo', 'slack_id': 'U0A9LN3QVC6'},
-    {'id': 'PNRT76X', 'email': 'gtonic@losandesgaa.onmicrosoft.com', 'name': 'Ginny Tonic', 'slack_id': 'U0A9KANFCLV'},
-    {'id': 'PYKISPC', 'email': 'aguiness@losandesgaa.onmicrosoft.com', 'name': 'Arthur Guinness', 'slack_id': 'U0A9SBF3MTN'},
-]
-
 PAUSE_TIMEOUT_MINUTES = 15
 
+ACK_DELAY = (15, 45)
+ACTION_DELAY = (60, 180)
+RESOLVE_DELAY = (120, 300)
+RESUME_DELAY = (30, 90)
+SCHEDULE_BATCH_WORKERS = int(os.environ.get('SCHEDULE_BATCH_WORKERS', 8))
+WEBHOOK_QUEUE_URL = os.environ.get('WEBHOOK_QUEUE_URL', '')
+WEBHOOK_BATCH_WORKERS = int(os.environ.get('WEBHOOK_BATCH_WORKERS', 8))
+WEBHOOK_RESERVE_SECONDS = float(os.environ.get('WEBHOOK_RESERVE_SECONDS', 10))
+
 ACTION_TYPES = [
     ('add_note', 30),
     ('status_update', 15),
@@ -50,42 +53,18 @@ ACTION_TYPES = [
     ('add_task', 10),
 ]
 
-CONVERSATION_LIBRARY = {
-    'investigating': [
-        "Looking into this now, checking the logs...",
-        "I'm on it. Pulling up the monitoring dashboards.",
-        "Investigating the root cause, one moment.",
-        "Checking the recent deployments to see if anything changed.",
-    ],
-    'found_issue': [
-        "Found something - there's a spike in the error logs around the time this started.",
-        "I think I see the issue. The connection pool is exhausted.",
-        "Looks like a memory leak is causing the degradation.",
-        "Found it - there's a deadlock in the database queries.",
-    ],
-    'working_fix': [
-        "Working on a fix now, should have something shortly.",
-        "Deploying a hotfix to address this.",
-        "Running the remediation playbook.",
-        "Scaling up the instances to handle the load.",
-    ],
-    'resolved': [
-        "Fix deployed, monitoring for stability. Looks good so far.",
-        "Issue resolved. Root cause was identified and addressed.",
-        "All systems back to normal. Will follow up with a post-incident review.",
-        "Resolved! The automated remediation worked. Incident closed.",
-    ],
-}
-
-dynamodb = boto3.resource('dynamodb')
-scheduler = boto3.client('scheduler')
 TABLE_NAME = os.environ.get('DEMO_STATE_TABLE', 'demo-incident-state')
 
 
+@functools.lru_cache(maxsize=None)
+def demo_state_backend():
+    return state_backend_from_env(TABLE_NAME)
+
+
 class DemoState:
-    def __init__(self):
-        self.table = dynamodb.Table(TABLE_NAME)
-    
+    def __init__(self, backend=None):
+        self.backend = backend or demo_state_backend()
+
     def create(self, incident_id: str, data: Dict) -> Dict:
         item = {
             'incident_id': incident_id,
@@ -93,344 +72,65 @@ class DemoState:
             'ttl': int((datetime.now(timezone.utc) + timedelta(hours=24)).timestamp()),
             **data
         }
-        self.table.put_item(Item=json.loads(json.dumps(item), parse_float=Decimal))
+        self.backend.put(item)
         return item
     
     def get(self, incident_id: str) -> Optional[Dict]:
         try:
-            response = self.table.get_item(Key={'incident_id': incident_id})
-            return response.get('Item')
+            return self.backend.get(incident_id)
         except Exception as e:
             logger.error(f"Error getting demo state: {e}")
             return None
     
     def update(self, incident_id: str, updates: Dict) -> bool:
         try:
-            update_expr = 'SET ' + ', '.join([f'#{k} = :{k}' for k in updates.keys()])
-            expr_names = {f'#{k}': k for k in updates.keys()}
-            expr_values = {f':{k}': v for k, v in updates.items()}
-            self.table.update_item(
-                Key={'incident_id': incident_id},
-                UpdateExpression=update_expr,
-                ExpressionAttributeNames=expr_names,
-                ExpressionAttributeValues=json.loads(json.dumps(expr_values), parse_float=Decimal)
-            )
+            self.backend.update(incident_id, updates)
             return True
         except Exception as e:
             logger.error(f"Error updating demo state: {e}")
             return False
     
-    def delete(self, incident_id: str) -> bool:
+    def mark_step(self, incident_id: str, seq: int, status: str) -> bool:
         try:
-            self.table.delete_item(Key={'incident_id': incident_id})
+            self.backend.set_in_list(incident_id, 'timeline', seq,
+                                     {'status': status, 'updated_at': datetime.now(timezone.utc).isoformat()})
             return True
         except Exception as e:
-            logger.error(f"Error deleting demo state: {e}")
+            logger.error(f"Error marking step {seq} of {incident_id}: {e}")
             return False
-    
-    def get_active_demos(self) -> List[Dict]:
-        try:
-            response = self.table.scan(
-                FilterExpression='#state <> :resolved',
-                ExpressionAttributeNames={'#state': 'state'},
-                ExpressionAttributeValues={':resolved': 'resolved'}
-            )
-            return response.get('Items', [])
-        except Exception as e:
-            logger.error(f"Error scanning demos: {e}")
-            return []
 
-
-class PagerDutyClient:
-    def __init__(self, token: str = None):
-        self.token = token or os.environ.get('PAGERDUTY_TOKEN', '')
-        self.headers = {
-            'Authorization': f'Token token={self.token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-    
-    def get_incident(self, incident_id: str) -> Optional[Dict]:
+    def append_steps(self, incident_id: str, steps: List[Dict]) -> bool:
         try:
-            print(f"PD_GET_INCIDENT: Fetching {incident_id}")
-            resp = requests.get(f'{PAGERDUTY_API_URL}/incidents/{incident_id}', headers=self.headers, timeout=10)
-            print(f"PD_GET_INCIDENT: Response status={resp.status_code}")
-            if resp.ok:
-                return resp.json().get('incident')
-            else:
-                print(f"PD_GET_INCIDENT: Error response - {resp.status_code} {resp.text[:200]}")
-        except Exception as e:
-            logger.error(f"Error getting incident: {e}")
-            print(f"PD_GET_INCIDENT: Exception - {e}")
-        return None
-    
-    def acknowledge_incident(self, incident_id: str, user_email: str) -> bool:
-        try:
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json={'incident': {'type': 'incident_reference', 'status': 'acknowledged'}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error acknowledging incident: {e}")
-            return False
-    
-    def resolve_incident(self, incident_id: str, user_email: str, resolution: str = None) -> bool:
-        try:
-            body = {'incident': {'type': 'incident_reference', 'status': 'resolved'}}
-            if resolution:
-                body['incident']['resolution'] = resolution
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json=body,
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error resolving incident: {e}")
-            return False
-    
-    def add_note(self, incident_id: str, user_email: str, content: str) -> bool:
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}/notes',
-                headers={**self.headers, 'From': user_email},
-                json={'note': {'content': content}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error adding note: {e}")
-            return False
-    
-    def add_responders(self, incident_id: str, requester_email: str, responder_ids: List[str], message: str = None) -> bool:
-        try:
-            responders = [{'responder_request_target': {'id': rid, 'type': 'user_reference'}} for rid in responder_ids]
-            body = {'requester_id': self._get_user_id_by_email(requester_email), 'responder_request_targets': responders}
-            if message:
-                body['message'] = message
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}/responder_requests',
-                headers={**self.headers, 'From': requester_email},
-                json=body,
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error adding responders: {e}")
-            return False
-    
-    def post_status_update(self, incident_id: str, user_email: str, message: str) -> bool:
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}/status_updates',
-                headers={**self.headers, 'From': user_email},
-                json={'message': message},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error posting status update: {e}")
-            return False
-    
-    def change_priority(self, incident_id: str, user_email: str, priority_id: str) -> bool:
-        try:
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json={'incident': {'type': 'incident_reference', 'priority': {'id': priority_id, 'type': 'priority_reference'}}},
-                timeout=10
-            )
-            return resp.ok
+            self.backend.append(incident_id, 'timeline', steps)
+            return True
         except Exception as e:
-            logger.error(f"Error changing priority: {e}")
+            logger.error(f"Error appending steps to {incident_id}: {e}")
             return False
-    
-    def get_demo_incidents(self, statuses: List[str] = None) -> List[Dict]:
-        if statuses is None:
-            statuses = ['triggered', 'acknowledged']
-        params = '&'.join([f'statuses[]={s}' for s in statuses])
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/incidents?{params}&limit=100', headers=self.headers, timeout=10)
-            if resp.ok:
-                incidents = resp.json().get('incidents', [])
-                return [i for i in incidents if i.get('title', '').startswith('[DEMO]')]
-        except Exception as e:
-            logger.error(f"Error getting demo incidents: {e}")
-        return []
-    
-    def _get_user_id_by_email(self, email: str) -> str:
-        for user in DEMO_USERS:
-            if user['email'] == email:
-                return user['id']
-        return ''
-
-
-class SlackClient:
-    def __init__(self, token: str = None):
-        self.token = token or os.environ.get('SLACK_BOT_TOKEN', '')
-        self.headers = {
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
-        }
-        self._profile_cache = {}
 
-    def get_user_profile(self, slack_user_id: str) -> Dict:
-        if slack_user_id in self._profile_cache:
-            return self._profile_cache[slack_user_id]
-        try:
-            resp = requests.get(
-                'https://slack.com/api/users.info',
-                headers=self.headers,
-                params={'user': slack_user_id},
-                timeout=10
-            )
-            if resp.ok:
-                data = resp.json()
-                if data.get('ok'):
-                    user = data.get('user', {})
-                    profile = user.get('profile', {})
-                    result = {
-                        'name': profile.get('display_name') or profile.get('real_name') or user.get('name', ''),
-                        'icon_url': profile.get('image_72', '')
-                    }
-                    self._profile_cache[slack_user_id] = result
-                    return result
-        except Exception as e:
-            logger.error(f"Error getting user profile: {e}")
-        return {'name': '', 'icon_url': ''}
-
-    def post_message(self, channel_id: str, text: str, username: str = None, icon_url: str = None) -> bool:
+    def delete(self, incident_id: str) -> bool:
         try:
-            body = {'channel': channel_id, 'text': text}
-            if username:
-                body['username'] = username
-            if icon_url:
-                body['icon_url'] = icon_url
-            resp = requests.post('https://slack.com/api/chat.postMessage', headers=self.headers, json=body, timeout=10)
-            return resp.ok and resp.json().get('ok')
+            self.backend.delete(incident_id)
+            return True
         except Exception as e:
-            logger.error(f"Error posting message: {e}")
+            logger.error(f"Error deleting demo state: {e}")
             return False
-
-    def post_as_user(self, channel_id: str, text: str, user: Dict) -> bool:
-        slack_id = user.get('slack_id', '')
-        if slack_id:
-            profile = self.get_user_profile(slack_id)
-            return self.post_message(channel_id, text, username=profile.get('name') or user.get('name'), icon_url=profile.get('icon_url'))
-        return self.post_message(channel_id, text, username=user.get('name'))
     
-    def invite_users_to_channel(self, channel_id: str, user_ids: List[str]) -> int:
-        success_count = 0
-        for user_id in user_ids:
-            if not user_id:
-                continue
-            try:
-                resp = requests.post(
-                    'https://slack.com/api/conversations.invite',
-                    headers=self.headers,
-                    json={'channel': channel_id, 'users': user_id},
-                    timeout=10
-                )
-                data = resp.json()
-                if data.get('ok'):
-                    logger.info(f"Invited user {user_id} to channel {channel_id}")
-                    success_count += 1
-                elif data.get('error') == 'already_in_channel':
-                    logger.info(f"User {user_id} already in channel {channel_id}")
-                    success_count += 1
-                elif data.get('error') == 'cant_invite_self':
-                    logger.info(f"Bot is {user_id}, skipping self-invite")
-                    success_count += 1
-                else:
-                    logger.warning(f"Failed to invite {user_id} to {channel_id}: {data.get('error')}")
-            except Exception as e:
-                logger.error(f"Error inviting user {user_id}: {e}")
-        logger.info(f"Invited {success_count}/{len(user_ids)} users to channel {channel_id}")
-        return success_count
-
-    def join_channel(self, channel_id: str) -> bool:
-        try:
-            resp = requests.post(
-                'https://slack.com/api/conversations.join',
-                headers=self.headers,
-                json={'channel': channel_id},
-                timeout=10
-            )
-            data = resp.json()
-            if data.get('ok'):
-                logger.info(f"Bot joined channel {channel_id}")
-                return True
-            logger.error(f"Failed to join channel: {data.get('error')}")
-            return False
-        except Exception as e:
-            logger.error(f"Error joining channel: {e}")
-            return False
-
-    def find_channel_by_pattern(self, pattern: str) -> Optional[str]:
+    def get_active_demos(self) -> List[Dict]:
         try:
-            print(f"SLACK_SEARCH: Using token prefix: {self.token[:20]}..." if self.token else "SLACK_SEARCH: NO TOKEN!")
-            team_id = os.environ.get('SLACK_TEAM_ID', '')
-            params = {'types': 'public_channel,private_channel', 'limit': 200}
-            if team_id:
-                params['team_id'] = team_id
-            resp = requests.get(
-                'https://slack.com/api/conversations.list',
-                headers=self.headers,
-                params=params,
-                timeout=10
-            )
-            if resp.ok:
-                data = resp.json()
-                if not data.get('ok'):
-                    print(f"SLACK_SEARCH: API error response - {data.get('error')}")
-                    return None
-                channels = data.get('channels', [])
-                print(f"SLACK_SEARCH: Looking for pattern '{pattern}' in {len(channels)} channels")
-                if channels:
-                    print(f"SLACK_SEARCH: First 5 channel names: {[ch['name'] for ch in channels[:5]]}")
-                matching = [ch['name'] for ch in channels if pattern.lower() in ch.get('name', '').lower()]
-                print(f"SLACK_SEARCH: Matching channels: {matching[:5]}")
-                for ch in channels:
-                    if pattern.lower() in ch.get('name', '').lower():
-                        print(f"SLACK_SEARCH: Found match - {ch['name']} ({ch['id']})")
-                        return ch['id']
-            else:
-                print(f"SLACK_SEARCH: HTTP error - {resp.status_code} {resp.text[:200]}")
+            return self.backend.scan(exclude={'state': 'resolved'})
         except Exception as e:
-            logger.error(f"Error finding channel: {e}")
-        return None
+            logger.error(f"Error scanning demos: {e}")
+            return []
 
-    def create_channel(self, name: str) -> Optional[str]:
+    def find(self, run_id: str = None, scenario_id: str = None) -> List[Dict]:
+        filters = {k: v for k, v in (('run_id', run_id), ('scenario_id', scenario_id)) if v}
+        if not filters:
+            return []
         try:
-            clean_name = name.lower().replace(' ', '-')[:80]
-            clean_name = ''.join(c for c in clean_name if c.isalnum() or c == '-')
-            clean_name = clean_name.strip('-')
-
-            resp = requests.post(
-                'https://slack.com/api/conversations.create',
-                headers=self.headers,
-                json={'name': clean_name, 'is_private': False},
-                timeout=10
-            )
-            data = resp.json()
-            if data.get('ok'):
-                channel_id = data['channel']['id']
-                logger.info(f"Created Slack channel {clean_name} ({channel_id})")
-                return channel_id
-            elif data.get('error') == 'name_taken':
-                existing = self.find_channel_by_pattern(clean_name)
-                if existing:
-                    logger.info(f"Channel {clean_name} already exists: {existing}")
-                    return existing
-            logger.error(f"Failed to create channel {clean_name}: {data.get('error')}")
-            return None
+            return self.backend.scan(where=filters)
         except Exception as e:
-            logger.error(f"Error creating channel: {e}")
-            return None
+            logger.error(f"Error scanning demos for {filters}: {e}")
+            return []
 
 
 def determine_responder_count() -> int:
@@ -446,11 +146,13 @@ def determine_responder_count() -> int:
 
 
 def select_responders(primary_user_id: str, count: int) -> List[Dict]:
-    available = [u for u in DEMO_USERS if u['id'] != primary_user_id]
+    directory = demo_directory()
+    demo_users = directory.demo_users()
+    available = directory.others([primary_user_id], pool=demo_users)
     additional_count = min(count - 1, len(available))
     additional = random.sample(available, additional_count) if additional_count > 0 else []
-    primary = next((u for u in DEMO_USERS if u['id'] == primary_user_id), DEMO_USERS[0])
-    return [primary] + additional
+    primary = directory.by_id(primary_user_id) or demo_users[0]
+    return [u.to_dict() for u in [primary] + additional]
 
 
 def select_action() -> str:
@@ -464,37 +166,121 @@ def select_action() -> str:
     return 'add_note'
 
 
-def get_conversation_message(category: str) -> str:
-    messages = CONVERSATION_LIBRARY.get(category, CONVERSATION_LIBRARY['investigating'])
-    return random.choice(messages)
 
-
-def schedule_action(incident_id: str, action: str, delay_seconds: int, user_id: str = None):
-    schedule_name = f"demo-{incident_id}-{action}-{int(datetime.now().timestamp())}"
+def create_schedule(schedule_name: str, run_at: datetime, payload: Dict) -> bool:
     try:
-        scheduler.create_schedule(
-            Name=schedule_name,
-            ScheduleExpression=f"at({(datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)).strftime('%Y-%m-%dT%H:%M:%S')})",
+        aws_client('scheduler').create_schedule(
+            Name=schedule_name[:64],
+            ScheduleExpression=f"at({run_at.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')})",
             FlexibleTimeWindow={'Mode': 'OFF'},
             Target={
                 'Arn': os.environ.get('SELF_LAMBDA_ARN', ''),
                 'RoleArn': os.environ.get('SCHEDULER_ROLE_ARN', ''),
-                'Input': json.dumps({
-                    'source': 'scheduler',
-                    'action': action,
-                    'incident_id': incident_id,
-                    'user_id': user_id
-                })
+                'Input': json.dumps({'source': 'scheduler', **payload})
             },
             ActionAfterCompletion='DELETE'
         )
-        logger.info(f"Scheduled {action} for {incident_id} in {delay_seconds}s")
         return True
     except Exception as e:
-        logger.error(f"Error scheduling action: {e}")
+        logger.error(f"Error scheduling {schedule_name}: {e}")
         return False
 
 
+def schedule_action(incident_id: str, action: str, delay_seconds: int, user_id: str = None):
+    schedule_name = f"demo-{incident_id}-{action}-{int(datetime.now().timestamp())}"
+    run_at = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+    scheduled = create_schedule(schedule_name, run_at, {'action': action, 'incident_id': incident_id, 'user_id': user_id})
+    if scheduled:
+        logger.info(f"Scheduled {action} for {incident_id} in {delay_seconds}s")
+    return scheduled
+
+
+def plan_step(seq: int, action: str, user_id: str, run_at: datetime, action_type: str = None) -> Dict:
+    return {
+        'seq': seq,
+        'action': action,
+        'user_id': user_id,
+        'action_type': action_type,
+        'run_at': run_at.isoformat(),
+        'status': 'planned',
+    }
+
+
+def plan_timeline(responders: List[Dict], start: datetime = None) -> List[Dict]:
+    start = start or datetime.now(timezone.utc)
+    offset = random.randint(*ACK_DELAY)
+    steps = [plan_step(0, 'acknowledge', responders[0]['id'], start + timedelta(seconds=offset))]
+    for responder in [responders[0]] + random.sample(responders[1:], len(responders) - 1):
+        offset += random.randint(*ACTION_DELAY)
+        steps.append(plan_step(len(steps), 'responder_action', responder['id'],
+                               start + timedelta(seconds=offset), select_action()))
+    offset += random.randint(*RESOLVE_DELAY)
+    steps.append(plan_step(len(steps), 'resolve', random.choice(responders)['id'], start + timedelta(seconds=offset)))
+    return steps
+
+
+def _schedule_step(incident_id: str, step: Dict, plan_version: int) -> bool:
+    seq = int(step['seq'])
+    return create_schedule(
+        f"demo-{incident_id}-p{plan_version}-{seq:02d}-{step['action']}",
+        datetime.fromisoformat(step['run_at']),
+        {
+            'action': step['action'],
+            'incident_id': incident_id,
+            'user_id': step.get('user_id'),
+            'action_type': step.get('action_type'),
+            'seq': seq,
+            'plan_version': plan_version,
+        },
+    )
+
+
+def enqueue_timeline(incident_id: str, steps: List[Dict], plan_version: int) -> int:
+    if not steps:
+        return 0
+    with ThreadPoolExecutor(max_workers=max(1, min(SCHEDULE_BATCH_WORKERS, len(steps)))) as pool:
+        results = list(pool.map(lambda step: _schedule_step(incident_id, step, plan_version), steps))
+    for step, scheduled in zip(steps, results):
+        step['status'] = 'scheduled' if scheduled else 'unscheduled'
+    return sum(results)
+
+
+def replan_remaining(incident_id: str, demo: Dict, state: DemoState) -> int:
+    timeline = demo.get('timeline') or []
+    remaining = [step for step in timeline if step.get('status') != 'done']
+    if not remaining:
+        return 0
+    plan_version = int(demo.get('plan_version', 1)) + 1
+    earliest = min(datetime.fromisoformat(step['run_at']) for step in remaining)
+    shift = datetime.now(timezone.utc) + timedelta(seconds=random.randint(*RESUME_DELAY)) - earliest
+    if shift > timedelta(0):
+        for step in remaining:
+            step['run_at'] = (datetime.fromisoformat(step['run_at']) + shift).isoformat()
+    scheduled = enqueue_timeline(incident_id, remaining, plan_version)
+    state.update(incident_id, {'timeline': timeline, 'plan_version': plan_version})
+    logger.info(f"Re-planned {len(remaining)} steps for {incident_id} as plan v{plan_version}")
+    return scheduled
+
+
+def extend_plan(incident_id: str, demo: Dict, state: DemoState, responder: Dict) -> bool:
+    timeline = demo.get('timeline')
+    if not timeline:
+        return False
+    now = datetime.now(timezone.utc)
+    run_at = now + timedelta(seconds=random.randint(*ACTION_DELAY))
+    resolve_at = next((datetime.fromisoformat(s['run_at']) for s in timeline
+                       if s['action'] == 'resolve' and s.get('status') != 'done'), None)
+    if resolve_at is not None and run_at > resolve_at - timedelta(seconds=30):
+        if resolve_at - now < timedelta(seconds=60):
+            logger.info(f"Resolution of {incident_id} is imminent, not planning a step for {responder['id']}")
+            return False
+        run_at = now + (resolve_at - now) / 2
+    step = plan_step(len(timeline), 'responder_action', responder['id'], run_at, select_action())
+    enqueue_timeline(incident_id, [step], int(demo.get('plan_version', 1)))
+    timeline.append(step)
+    return state.append_steps(incident_id, [step])
+
+
 def verify_webhook_signature(body: str, signature: str, secret: str) -> bool:
     if not secret:
         return True
@@ -528,13 +314,18 @@ def handle_webhook(event: Dict) -> Dict:
     except json.JSONDecodeError:
         return {'statusCode': 400, 'body': json.dumps({'error': 'Invalid JSON'})}
 
-    event_data = payload.get('event', {})
-    event_type = event_data.get('event_type', '')
-    print(f"WEBHOOK EVENT: type={event_type}")
+    event_type = payload.get('event', {}).get('event_type', '')
+    if WEBHOOK_QUEUE_URL and event_type != 'pagey.ping':
+        incident_id, _, _ = extract_incident(payload.get('event', {}))
+        if enqueue_webhook(body, incident_id, webhook_id):
+            return {'statusCode': 202, 'body': json.dumps({'message': 'Accepted', 'event_type': event_type})}
+        logger.warning(f"Falling back to inline processing for {event_type} on {incident_id}")
 
-    if event_type == 'pagey.ping':
-        return {'statusCode': 200, 'body': json.dumps({'message': 'pong'})}
+    return process_webhook_payload(payload)
 
+
+def extract_incident(event_data: Dict) -> tuple:
+    event_type = event_data.get('event_type', '')
     incident_data = event_data.get('data', {})
     if incident_data.get('type') != 'incident':
         incident_data = event_data.get('data', {}).get('incident', {})
@@ -549,11 +340,39 @@ def handle_webhook(event: Dict) -> Dict:
             incident_id = incident_ref.get('id', '')
         title = incident_ref.get('title', '') or incident_ref.get('summary', '')
 
+    return incident_id, title, incident_data
+
+
+def enqueue_webhook(body: str, incident_id: str, webhook_id: str = None) -> bool:
+    try:
+        aws_client('sqs').send_message(
+            QueueUrl=WEBHOOK_QUEUE_URL,
+            MessageBody=body,
+            MessageGroupId=incident_id or 'no-incident',
+            MessageDeduplicationId=hashlib.sha256(f"{webhook_id}:{body}".encode()).hexdigest()
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Error enqueueing webhook for {incident_id}: {e}")
+        return False
+
+
+def process_webhook_payload(payload: Dict) -> Dict:
+    event_data = payload.get('event', {})
+    event_type = event_data.get('event_type', '')
+    print(f"WEBHOOK EVENT: type={event_type}")
+
+    if event_type == 'pagey.ping':
+        return {'statusCode': 200, 'body': json.dumps({'message': 'pong'})}
+
+    incident_id, title, incident_data = extract_incident(event_data)
     print(f"WEBHOOK INCIDENT: id={incident_id}, title={title[:50] if title else 'NONE'}")
 
     if not incident_id:
         return {'statusCode': 200, 'body': json.dumps({'message': 'No incident ID'})}
 
+    incident_mirror().apply_webhook(event_data)
+
     if event_type.startswith('incident.workflow.'):
         pass
     elif '[DEMO]' not in title:
@@ -581,6 +400,31 @@ def handle_webhook(event: Dict) -> Dict:
     return {'statusCode': 200, 'body': json.dumps({'message': 'Processed', 'event_type': event_type})}
 
 
+def _process_webhook_group(records: List[Dict]) -> List[str]:
+    for i, record in enumerate(records):
+        if current_deadline().expired(WEBHOOK_RESERVE_SECONDS):
+            logger.warning(f"Deadline near, returning {len(records) - i} queued webhooks for redelivery")
+            return [r['messageId'] for r in records[i:]]
+        try:
+            process_webhook_payload(json.loads(record['body']))
+        except Exception as e:
+            group = record.get('attributes', {}).get('MessageGroupId')
+            logger.error(f"Error processing queued webhook {record['messageId']} for {group}, "
+                         f"retrying {len(records) - i} messages: {e}")
+            return [r['messageId'] for r in records[i:]]
+    return []
+
+
+def handle_webhook_batch(records: List[Dict]) -> Dict:
+    groups: Dict[str, List[Dict]] = {}
+    for record in records:
+        groups.setdefault(record.get('attributes', {}).get('MessageGroupId', 'no-incident'), []).append(record)
+    with ThreadPoolExecutor(max_workers=max(1, min(WEBHOOK_BATCH_WORKERS, len(groups)))) as pool:
+        failed = [message_id for ids in pool.map(_process_webhook_group, groups.values()) for message_id in ids]
+    logger.info(f"Processed {len(records) - len(failed)}/{len(records)} queued webhooks across {len(groups)} incidents")
+    return {'batchItemFailures': [{'itemIdentifier': message_id} for message_id in failed]}
+
+
 def on_incident_triggered(incident_id: str, incident_data: Dict, state: DemoState):
     logger.info(f"Incident triggered: {incident_id}")
     
@@ -603,6 +447,7 @@ def on_incident_triggered(incident_id: str, incident_data: Dict, state: DemoStat
     demo_data = {
         'state': 'triggered',
         'scenario_id': custom_details.get('scenario_id', 'unknown'),
+        'run_id': custom_details.get(RUN_ID_FIELD),
         'scenario_name': custom_details.get('scenario_name', incident_data.get('title', '')),
         'service_id': service.get('id', ''),
         'service_name': service.get('summary', ''),
@@ -613,15 +458,16 @@ def on_incident_triggered(incident_id: str, incident_data: Dict, state: DemoStat
         'slack_channel_id': None,
         'acknowledged_at': None,
         'resolver_id': None,
+        'plan_version': 1,
     }
-    
-    state.create(incident_id, demo_data)
-    logger.info(f"Created demo state for {incident_id} with {len(responders)} responders")
 
-    primary_email = responders[0]['email']
-    delay = random.randint(15, 45)
-    schedule_action(incident_id, 'acknowledge', delay, responders[0]['id'])
-    logger.info(f"Scheduled acknowledgment in {delay}s by {primary_email}")
+    timeline = plan_timeline(responders)
+    scheduled = enqueue_timeline(incident_id, timeline, 1)
+    demo_data['timeline'] = timeline
+
+    state.create(incident_id, demo_data)
+    logger.info(f"Created demo state for {incident_id} with {len(responders)} responders, "
+                f"scheduled {scheduled}/{len(timeline)} planned steps ending {timeline[-1]['run_at']}")
 
 
 def on_incident_acknowledged(incident_id: str, incident_data: Dict, state: DemoState):
@@ -646,9 +492,12 @@ def on_incident_acknowledged(incident_id: str, incident_data: Dict, state: DemoS
         pd = PagerDutyClient()
         additional_ids = [r['id'] for r in responders[1:]]
         primary_email = responders[0]['email']
-        pd.add_responders(incident_id, primary_email, additional_ids, "Requesting additional support for this incident")
+        pd.add_responders(incident_id, additional_ids, primary_email, "Requesting additional support for this incident")
         logger.info(f"Added {len(additional_ids)} responders to {incident_id}")
 
+    if demo.get('timeline'):
+        return
+
     delay = random.randint(60, 180)
     schedule_action(incident_id, 'responder_action', delay, responders[0]['id'])
 
@@ -664,11 +513,11 @@ def on_responder_added(incident_id: str, event_data: Dict, state: DemoState):
     if slack_channel:
         responder = event_data.get('data', {}).get('responder', {})
         responder_id = responder.get('id', '')
-        user = next((u for u in DEMO_USERS if u['id'] == responder_id), None)
+        user = demo_directory().by_id(responder_id)
         if user:
             slack = SlackClient()
             slack.invite_users_to_channel(slack_channel, [user['slack_id']])
-            slack.post_as_user(slack_channel, "I've joined to help with this incident.", user)
+            slack.post_as_user("I've joined to help with this incident.", user, slack_channel)
 
 
 def on_workflow_completed(incident_id: str, event_data: Dict, state: DemoState):
@@ -716,7 +565,7 @@ def on_workflow_completed(incident_id: str, event_data: Dict, state: DemoState):
 
 
 def invite_to_slack_channel(channel_id: str, demo: Dict, slack: SlackClient):
-    if not slack.join_channel(channel_id):
+    if not slack.join_channel(channel_id).get('ok'):
         logger.warning(f"Bot could not join channel {channel_id}, attempting invite anyway")
 
     user_ids = [CONALL_SLACK_USER_ID, CONALL_SLACK_USER_ID_PERSONAL]
@@ -727,7 +576,7 @@ def invite_to_slack_channel(channel_id: str, demo: Dict, slack: SlackClient):
     slack.invite_users_to_channel(channel_id, user_ids)
     responders = demo.get('responders', [])
     if responders:
-        slack.post_as_user(channel_id, "Team assembled for incident response. Let's investigate.", responders[0])
+        slack.post_as_user("Team assembled for incident response. Let's investigate.", responders[0], channel_id)
     logger.info(f"Invited {len(user_ids)} users to channel {channel_id}")
 
 
@@ -737,6 +586,10 @@ def on_action_completed(incident_id: str, action_type: str, state: DemoState):
     demo = state.get(incident_id)
     if not demo or demo.get('paused'):
         return
+
+    if demo.get('timeline'):
+        logger.info(f"Action {action_type} on {incident_id} confirmed against plan v{demo.get('plan_version')}")
+        return
     
     responder_actions = demo.get('responder_actions', {})
     all_acted = all(ra.get('acted') for ra in responder_actions.values())
@@ -766,9 +619,9 @@ def on_incident_resolved(incident_id: str, state: DemoState):
         responders = demo.get('responders', [])
         resolver = random.choice(responders) if responders else None
         if resolver:
-            slack.post_as_user(slack_channel, get_conversation_message('resolved'), resolver)
+            slack.post_as_user(get_conversation_message('resolved'), resolver, slack_channel)
         else:
-            slack.post_message(slack_channel, get_conversation_message('resolved'))
+            slack.post_message(get_conversation_message('resolved'), slack_channel)
 
     state.update(incident_id, {'state': 'resolved'})
 
@@ -777,6 +630,7 @@ def handle_scheduled_action(event: Dict) -> Dict:
     action = event.get('action')
     incident_id = event.get('incident_id')
     user_id = event.get('user_id')
+    seq = event.get('seq')
     
     logger.info(f"Handling scheduled action: {action} for {incident_id}")
     
@@ -786,6 +640,10 @@ def handle_scheduled_action(event: Dict) -> Dict:
     if not demo:
         logger.warning(f"No demo state for {incident_id}")
         return {'statusCode': 200, 'body': json.dumps({'message': 'No demo state'})}
+
+    if seq is not None and event.get('plan_version') != demo.get('plan_version'):
+        logger.info(f"Ignoring step {seq} of superseded plan v{event.get('plan_version')} for {incident_id}")
+        return {'statusCode': 200, 'body': json.dumps({'message': 'Superseded plan'})}
     
     if demo.get('paused'):
         pause_started = demo.get('pause_started_at')
@@ -796,6 +654,8 @@ def handle_scheduled_action(event: Dict) -> Dict:
                 action = 'resolve'
             else:
                 logger.info(f"Demo {incident_id} is paused, skipping action")
+                if seq is not None:
+                    state.mark_step(incident_id, seq, 'skipped_paused')
                 return {'statusCode': 200, 'body': json.dumps({'message': 'Demo paused'})}
     
     if demo.get('state') == 'resolved':
@@ -806,27 +666,33 @@ def handle_scheduled_action(event: Dict) -> Dict:
     slack = SlackClient()
     slack_channel = demo.get('slack_channel_id')
     
-    user = next((u for u in DEMO_USERS if u['id'] == user_id), DEMO_USERS[0])
+    user = demo_directory().by_id(user_id) or demo_directory().demo_users()[0]
     user_email = user['email']
     
     if action == 'acknowledge':
         pd.acknowledge_incident(incident_id, user_email)
         if slack_channel:
-            slack.post_as_user(slack_channel, get_conversation_message('investigating'), user)
+            slack.post_as_user(get_conversation_message('investigating'), user, slack_channel)
 
     elif action == 'responder_action':
-        action_type = select_action()
+        action_type = event.get('action_type') or select_action()
         perform_responder_action(incident_id, user, action_type, pd, slack, slack_channel, demo, state)
 
     elif action == 'resolve':
         responders = demo.get('responders', [])
-        resolver = random.choice(responders) if responders else user
+        if seq is not None and user_id:
+            resolver = user
+        else:
+            resolver = random.choice(responders) if responders else user
         resolution = f"Issue resolved by {resolver['name']}. Root cause identified and addressed."
         pd.resolve_incident(incident_id, resolver['email'], resolution)
         if slack_channel:
-            slack.post_as_user(slack_channel, get_conversation_message('resolved'), resolver)
+            slack.post_as_user(get_conversation_message('resolved'), resolver, slack_channel)
         state.update(incident_id, {'state': 'resolved', 'resolver_id': resolver['id']})
 
+    if seq is not None:
+        state.mark_step(incident_id, seq, 'done')
+
     return {'statusCode': 200, 'body': json.dumps({'message': f'Executed {action}'})}
 
 
@@ -836,35 +702,35 @@ def perform_responder_action(incident_id: str, user: Dict, action_type: str, pd:
 
     if action_type == 'add_note':
         content = get_conversation_message('found_issue')
-        pd.add_note(incident_id, user_email, content)
+        pd.add_note(incident_id, content, user_email)
         if slack_channel:
-            slack.post_as_user(slack_channel, content, user)
+            slack.post_as_user(content, user, slack_channel)
 
     elif action_type == 'status_update':
         message = get_conversation_message('working_fix')
-        pd.post_status_update(incident_id, user_email, message)
+        pd.post_status_update(incident_id, message, user_email)
         if slack_channel:
-            slack.post_as_user(slack_channel, f"Status update: {message}", user)
+            slack.post_as_user(f"Status update: {message}", user, slack_channel)
 
     elif action_type == 'add_responder':
         current_responders = demo.get('responders', [])
-        current_ids = [r['id'] for r in current_responders]
-        available = [u for u in DEMO_USERS if u['id'] not in current_ids]
+        available = demo_directory().others(current_responders, pool=demo_directory().demo_users())
         if available:
-            new_responder = random.choice(available)
-            pd.add_responders(incident_id, user_email, [new_responder['id']], "Need additional expertise")
+            new_responder = random.choice(available).to_dict()
+            pd.add_responders(incident_id, [new_responder['id']], user_email, "Need additional expertise")
             current_responders.append(new_responder)
             responder_actions = demo.get('responder_actions', {})
             responder_actions[new_responder['id']] = {'acted': False, 'action': None}
             state.update(incident_id, {'responders': current_responders, 'responder_actions': responder_actions})
+            extend_plan(incident_id, demo, state, new_responder)
             if slack_channel:
-                slack.post_as_user(slack_channel, f"Requesting help from {new_responder['name']}", user)
+                slack.post_as_user(f"Requesting help from {new_responder['name']}", user, slack_channel)
 
     else:
         content = get_conversation_message('investigating')
-        pd.add_note(incident_id, user_email, f"[{action_type}] {content}")
+        pd.add_note(incident_id, f"[{action_type}] {content}", user_email)
         if slack_channel:
-            slack.post_as_user(slack_channel, content, user)
+            slack.post_as_user(content, user, slack_channel)
 
     responder_actions = demo.get('responder_actions', {})
     if user['id'] in responder_actions:
@@ -917,7 +783,7 @@ def trigger_datadog(scenario: Dict) -> Dict:
     }
 
     try:
-        resp = requests.post(
+        resp = http_session().post(
             f'https://api.{site}/api/v1/series',
             headers={'DD-API-KEY': api_key, 'Content-Type': 'application/json'},
             json=series_payload,
@@ -950,7 +816,7 @@ def trigger_grafana(scenario: Dict) -> Dict:
     }
 
     try:
-        resp = requests.post(
+        resp = http_session().post(
             f'{url}/api/annotations',
             headers={'Authorization': f'Bearer {api_key}', 'Content-Type': 'application/json'},
             json=annotation,
@@ -981,7 +847,7 @@ def trigger_newrelic(scenario: Dict) -> Dict:
 
     try:
         url = f'https://insights-collector.newrelic.com/v1/accounts/{account_id}/events' if account_id else 'https://insights-collector.newrelic.com/v1/events'
-        resp = requests.post(
+        resp = http_session().post(
             url,
             headers={'Api-Key': api_key, 'Content-Type': 'application/json'},
             json=event,
@@ -996,11 +862,12 @@ def trigger_newrelic(scenario: Dict) -> Dict:
 
 def trigger_cloudwatch(scenario: Dict) -> Dict:
     try:
-        cloudwatch = boto3.client('cloudwatch')
+        cloudwatch = aws_client('cloudwatch')
         metric_name = scenario.get('metric_name', 'DemoIncidentMetric')
         namespace = os.environ.get('CLOUDWATCH_NAMESPACE', 'PagerDutyDemo')
 
-        cloudwatch.put_metric_data(
+        circuit_breaker('cloudwatch').call(
+            cloudwatch.put_metric_data,
             Namespace=namespace,
             MetricData=[{
                 'MetricName': metric_name,
@@ -1026,7 +893,7 @@ def trigger_pagerduty_events(scenario: Dict) -> Dict:
     payload = {
         'routing_key': routing_key,
         'event_action': 'trigger',
-        'dedup_key': f"demo-{scenario.get('id', 'unknown')}-{int(datetime.now().timestamp())}",
+        'dedup_key': demo_dedup_key(scenario.get('id', 'unknown'), scenario.get('run_id')),
         'payload': {
             'summary': f"[DEMO] {scenario.get('title', 'Demo Incident')}",
             'severity': scenario.get('severity', 'error'),
@@ -1035,7 +902,8 @@ def trigger_pagerduty_events(scenario: Dict) -> Dict:
                 'scenario_id': scenario.get('id'),
                 'scenario_name': scenario.get('title'),
                 'description': scenario.get('description', ''),
-                'triggered_by': 'Demo Picker UI'
+                'triggered_by': 'Demo Picker UI',
+                RUN_ID_FIELD: scenario.get('run_id'),
             }
         }
     }
@@ -1044,7 +912,7 @@ def trigger_pagerduty_events(scenario: Dict) -> Dict:
         payload['payload']['custom_details']['service_key'] = scenario.get('service_key')
 
     try:
-        resp = requests.post(
+        resp = http_session().post(
             PAGERDUTY_EVENTS_URL,
             json=payload,
             timeout=15
@@ -1064,7 +932,9 @@ def handle_trigger(body: Dict) -> Dict:
     if not scenario:
         return {'success': False, 'error': 'No scenario provided'}
 
-    result = {'integration': integration, 'fallback_used': False}
+    run_id = body.get('run_id') or new_run_id()
+    scenario = {**scenario, 'run_id': run_id}
+    result = {'integration': integration, 'fallback_used': False, 'run_id': run_id}
 
     if use_fallback:
         trigger_result = trigger_pagerduty_events(scenario)
@@ -1120,16 +990,30 @@ def handle_api_request(event: Dict) -> Dict:
     pd = PagerDutyClient()
     
     if '/cleanup' in path and method == 'POST':
-        demos = pd.get_demo_incidents(['triggered', 'acknowledged'])
-        resolved = 0
-        for inc in demos:
-            if pd.resolve_incident(inc['id'], DEMO_USERS[0]['email'], 'Cleanup before new demo'):
-                state.delete(inc['id'])
-                resolved += 1
+        run_id = body.get('run_id')
+        scenario_id = body.get('scenario_id')
+        incident_ids = [inc['id'] for inc in find_scoped_incidents(pd, run_id, scenario_id)]
+        channel_ids = []
+        if run_id or scenario_id:
+            tracked = state.find(run_id, scenario_id)
+            incident_ids = list(dict.fromkeys(incident_ids + [d['incident_id'] for d in tracked if d.get('state') != 'resolved']))
+            channel_ids = [d['slack_channel_id'] for d in tracked if d.get('slack_channel_id')]
+        slack = SlackClient() if channel_ids and body.get('archive_channels', True) else None
+        result = teardown(pd, incident_ids, slack, channel_ids if slack else [], DEMO_USERS[0]['email'], 'Cleanup before new demo')
+        for incident_id in result['resolved']:
+            state.delete(incident_id)
+        resolved = len(result['resolved'])
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({'message': f'Resolved {resolved} demo incidents', 'resolved': resolved})
+            'body': json.dumps({
+                'message': f'Resolved {resolved} demo incidents',
+                'resolved': resolved,
+                'failed': len(result['failed']),
+                'channels_archived': len(result['channels_archived']),
+                'run_id': run_id,
+                'scenario_id': scenario_id,
+            })
         }
     
     elif '/pause' in path and method == 'POST':
@@ -1151,15 +1035,20 @@ def handle_api_request(event: Dict) -> Dict:
             demo = state.get(incident_id)
             if demo:
                 state.update(incident_id, {'paused': False, 'pause_started_at': None})
-                delay = random.randint(30, 90)
-                not_acted = [rid for rid, ra in demo.get('responder_actions', {}).items() if not ra.get('acted')]
-                if not_acted:
-                    schedule_action(incident_id, 'responder_action', delay, random.choice(not_acted))
+                if demo.get('timeline'):
+                    replan_remaining(incident_id, demo, state)
+                else:
+                    delay = random.randint(30, 90)
+                    not_acted = [rid for rid, ra in demo.get('responder_actions', {}).items() if not ra.get('acted')]
+                    if not_acted:
+                        schedule_action(incident_id, 'responder_action', delay, random.choice(not_acted))
             return {'statusCode': 200, 'headers': cors_headers, 'body': json.dumps({'message': 'Demo resumed'})}
         else:
             active = state.get_active_demos()
             for demo in active:
                 state.update(demo['incident_id'], {'paused': False, 'pause_started_at': None})
+                if demo.get('paused') and demo.get('timeline'):
+                    replan_remaining(demo['incident_id'], demo, state)
             return {'statusCode': 200, 'headers': cors_headers, 'body': json.dumps({'message': f'Resumed {len(active)} demos'})}
     
     elif '/status' in path and method == 'GET':
@@ -1187,16 +1076,24 @@ def handle_api_request(event: Dict) -> Dict:
         return {'statusCode': 200, 'headers': cors_headers, 'body': json.dumps({'integrations': integrations})}
 
     elif '/health' in path:
-        return {'statusCode': 200, 'headers': cors_headers, 'body': json.dumps({'status': 'healthy', 'timestamp': datetime.now(timezone.utc).isoformat()})}
+        return {'statusCode': 200, 'headers': cors_headers, 'body': json.dumps({'status': 'healthy', 'timestamp': datetime.now(timezone.utc).isoformat(), 'hedging': hedge_stats()})}
 
     return {'statusCode': 404, 'headers': cors_headers, 'body': json.dumps({'error': 'Not found'})}
 
 
 def lambda_handler(event: Dict, context: Any) -> Dict:
     logger.info(f"Event received: {json.dumps(event)[:500]}")
+    set_deadline(Deadline.from_context(context))
     
     if event.get('source') == 'scheduler':
         return handle_scheduled_action(event)
+
+    if event.get('source') == 'mirror-reconcile':
+        return incident_mirror().reconcile(PagerDutyClient())
+
+    records = event.get('Records') or []
+    if records and records[0].get('eventSource') == 'aws:sqs':
+        return handle_webhook_batch(records)
     
     headers = event.get('headers', {})
     if headers.get('x-pagerduty-signature') or 'webhook' in event.get('rawPath', '').lower():
@@ -8,14 +8,16 @@ from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
 
 from shared import (
-    PagerDutyClient, SlackClient,
-    DEMO_USERS, PAGERDUTY_TO_SLACK_USER_MAP, CONALL_SLACK_USER_ID,
-    CONALL_SLACK_USER_ID_PERSONAL
+    PagerDutyClient, SlackClient, IncidentSnapshot, UserDirectory,
+    DEMO_USERS, CONALL_SLACK_USER_ID, CONALL_SLACK_USER_ID_PERSONAL,
+    CompiledTemplate, Shuffler, compile_pool, SlackPostingPipeline, SweepContext
 )
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+FLUSH_RESERVE_SECONDS = float(os.environ.get('LIFECYCLE_FLUSH_RESERVE_SECONDS', 10))
+
 ROLE_EMOJIS = {
     "sre": ":firefighter:",
     "engineer": ":male-technologist:",
@@ -196,6 +198,29 @@ SCENARIO_CONVERSATIONS = {
 }
 
 
+ACK_TEMPLATES = compile_pool(ACK_MESSAGES)
+INVESTIGATION_TEMPLATES = compile_pool(INVESTIGATION_MESSAGES)
+COLLABORATION_TEMPLATES = compile_pool(COLLABORATION_MESSAGES)
+PROGRESS_TEMPLATES = compile_pool(PROGRESS_MESSAGES)
+RESOLUTION_TEMPLATES = compile_pool(RESOLUTION_MESSAGES)
+ESCALATION_TEMPLATES = compile_pool(ESCALATION_MESSAGES)
+SNOOZE_TEMPLATES = compile_pool(SNOOZE_MESSAGES)
+STATUS_UPDATE_TEMPLATES = compile_pool(STATUS_UPDATE_MESSAGES)
+ADD_RESPONDERS_TEMPLATES = compile_pool(ADD_RESPONDERS_MESSAGES)
+RBA_ACTION_TEMPLATES = compile_pool(RBA_ACTION_MESSAGES)
+SCENARIO_TEMPLATES = {
+    scenario_type: {phase: compile_pool(messages) for phase, messages in phases.items() if messages}
+    for scenario_type, phases in SCENARIO_CONVERSATIONS.items()
+}
+
+ROOT_CAUSE_POOL = Shuffler(ROOT_CAUSES)
+COMPONENT_POOL = Shuffler(COMPONENTS)
+SERVICE_POOL = Shuffler(SERVICES)
+TEAM_POOL = Shuffler(TEAMS)
+CHANGE_POOL = Shuffler(CHANGES)
+DETAIL_POOL = Shuffler(DETAILS)
+
+
 def get_incident_age_minutes(incident: Dict) -> float:
     created_at = incident.get("created_at", "")
     if not created_at:
@@ -225,25 +250,24 @@ def get_user_emoji(user: Dict) -> str:
     return ROLE_EMOJIS["default"]
 
 
-def pick_responders(pd_client: PagerDutyClient, incident: Dict, count: int = 2) -> List[Dict]:
+def pick_responders(pd_client: PagerDutyClient, incident: Dict, users: UserDirectory, count: int = 2) -> List[Dict]:
     incident_responders = pd_client.get_incident_responders(incident)
-    all_users = pd_client.list_users()
     
     responders = []
     for ir in incident_responders:
-        full_user = next((u for u in all_users if u.get("id") == ir.get("id")), None)
+        full_user = users.by_id(ir.get("id"))
         if full_user:
             responders.append(full_user)
         else:
             responders.append({"name": ir.get("name", "Unknown"), "job_title": "", "role": "user"})
     
-    if len(responders) < count and all_users:
-        remaining = [u for u in all_users if u not in responders]
+    if len(responders) < count and users:
+        remaining = users.others(responders)
         if remaining:
             responders.extend(random.sample(remaining, min(count - len(responders), len(remaining))))
     
-    if not responders and all_users:
-        responders = random.sample(all_users, min(count, len(all_users)))
+    if not responders and users:
+        responders = random.sample(users.all(), min(count, len(users)))
     
     if not responders:
         responders = [random.choice(DEMO_USERS)]
@@ -251,41 +275,61 @@ def pick_responders(pd_client: PagerDutyClient, incident: Dict, count: int = 2)
     return responders
 
 
-def format_message(template: str, responders: List[Dict], incident: Dict, all_users: List[Dict]) -> str:
-    age = get_incident_age_minutes(incident)
-    other_users = [u for u in all_users if u not in responders] or responders
+def _other_name(context: Dict) -> str:
+    responders = context.get("responders") or []
+    users = context.get("users")
+    other_users = (users.others(responders) if users else None) or responders
     other = random.choice(other_users) if other_users else {"name": "team"}
-    other_name = other.get("name", "team").split()[0]
-
-    return template.format(
-        other_name=other_name,
-        name=other_name,
-        component=random.choice(COMPONENTS),
-        service=random.choice(SERVICES),
-        team=random.choice(TEAMS),
-        change=random.choice(CHANGES),
-        detail=random.choice(DETAILS),
-        dependency=random.choice(COMPONENTS),
-        metric="latency",
-        timestamp=f"{int(age)}m ago",
-        minutes=int(age),
-        root_cause=random.choice(ROOT_CAUSES)[:50],
-        cause=random.choice(ROOT_CAUSES),
-        high=random.randint(5, 15),
-        low=random.randint(0, 2),
-    )
-
-
-def post_conversation(slack: SlackClient, channel_id: str, messages: List[tuple], responders: List[Dict], incident: Dict, all_users: List[Dict]):
-    for i, (template, emoji) in enumerate(messages):
+    return other.get("name", "team").split()[0]
+
+
+def _incident_minutes(context: Dict) -> int:
+    return int(get_incident_age_minutes(context["incident"]))
+
+
+MESSAGE_FIELDS = {
+    "other_name": _other_name,
+    "name": _other_name,
+    "component": COMPONENT_POOL,
+    "dependency": COMPONENT_POOL,
+    "service": SERVICE_POOL,
+    "team": TEAM_POOL,
+    "change": CHANGE_POOL,
+    "detail": DETAIL_POOL,
+    "cause": ROOT_CAUSE_POOL,
+    "root_cause": lambda context: ROOT_CAUSE_POOL.draw()[:50],
+    "metric": lambda context: "latency",
+    "table": lambda context: "users",
+    "timestamp": lambda context: f"{_incident_minutes(context)}m ago",
+    "minutes": _incident_minutes,
+    "high": lambda context: random.randint(5, 15),
+    "low": lambda context: random.randint(0, 2),
+    "count": lambda context: random.randint(10, 100),
+    "ms": lambda context: random.randint(500, 5000),
+    "scenario": lambda context: get_scenario_type(context["incident"]),
+}
+
+
+def render_message(template: CompiledTemplate, incident: Dict, responders: List[Dict] = None,
+                   users: UserDirectory = None, **values) -> str:
+    context = {"incident": incident, "responders": responders, "users": users}
+    return template.render(MESSAGE_FIELDS, context, **values)
+
+
+def format_message(template: CompiledTemplate, responders: List[Dict], incident: Dict, users: UserDirectory) -> str:
+    return render_message(template, incident, responders, users)
+
+
+def post_conversation(chat: SlackPostingPipeline, channel_id: str, messages: List[CompiledTemplate], responders: List[Dict], incident: Dict, users: UserDirectory):
+    for i, template in enumerate(messages):
         responder = responders[i % len(responders)]
-        text = format_message(template, responders, incident, all_users)
+        text = format_message(template, responders, incident, users)
         user_emoji = get_user_emoji(responder)
         job_title = responder.get("job_title") or responder.get("role", "")
         title_display = f" ({job_title})" if job_title else ""
         full_text = f"{user_emoji} *{responder['name']}*{title_display}\n{text}"
-        slack.post_message(full_text, channel_id)
-        logger.info(f"Posted to {channel_id}: {responder['name']}: {text[:50]}...")
+        chat.post_message(full_text, channel_id)
+        logger.info(f"Queued for {channel_id}: {responder['name']}: {text[:50]}...")
 
 
 def check_for_real_scenario(pd: PagerDutyClient, all_incidents: List[Dict]) -> Optional[Dict]:
@@ -296,26 +340,23 @@ def check_for_real_scenario(pd: PagerDutyClient, all_incidents: List[Dict]) -> O
     return None
 
 
-def pause_fake_activity(pd: PagerDutyClient, slack: SlackClient) -> Dict[str, Any]:
+def pause_fake_activity(pd: PagerDutyClient, slack: SlackClient, snapshot: IncidentSnapshot) -> Dict[str, Any]:
     logger.info("REAL SCENARIO DETECTED - Pausing fake activity")
     results = {"resolved_demo_incidents": [], "notified": False}
 
-    demo_incidents = pd.list_incidents(["triggered", "acknowledged"])
-    for incident in demo_incidents:
-        title = incident.get("title", "")
-        if "[DEMO]" in title:
-            result = pd.resolve_incident(incident["id"])
-            if result.get("success"):
-                results["resolved_demo_incidents"].append(incident["id"])
-                logger.info(f"Resolved demo incident {incident['id']} for real scenario")
+    for incident in snapshot.demo():
+        result = pd.resolve_incident(incident["id"])
+        if result.get("success"):
+            results["resolved_demo_incidents"].append(incident["id"])
+            logger.info(f"Resolved demo incident {incident['id']} for real scenario")
 
     return results
 
 
-def select_resolver(responders: List[Dict], all_users: List[Dict]) -> Dict:
+def select_resolver(responders: List[Dict], users: UserDirectory) -> Dict:
     if random.random() < 0.5:
         return responders[0] if responders else {"name": "On-Call Engineer"}
-    other_users = [u for u in all_users if u not in responders]
+    other_users = users.others(responders)
     if other_users:
         return random.choice(other_users)
     return responders[-1] if len(responders) > 1 else responders[0] if responders else {"name": "On-Call Engineer"}
@@ -332,19 +373,16 @@ def get_scenario_type(incident: Dict) -> str:
     return "default"
 
 
-def get_scenario_messages(incident: Dict, phase: str) -> List[tuple]:
-    scenario_type = get_scenario_type(incident)
-    if scenario_type in SCENARIO_CONVERSATIONS:
-        return SCENARIO_CONVERSATIONS[scenario_type].get(phase, [])
-    return []
+def get_scenario_messages(incident: Dict, phase: str) -> Optional[Shuffler]:
+    return SCENARIO_TEMPLATES.get(get_scenario_type(incident), {}).get(phase)
 
 
-def get_slack_user_ids_for_responders(responders: List[Dict]) -> List[str]:
+def get_slack_user_ids_for_responders(responders: List[Dict], users: UserDirectory) -> List[str]:
     slack_ids = []
     for responder in responders:
-        email = responder.get("email", "")
-        if email and email in PAGERDUTY_TO_SLACK_USER_MAP:
-            slack_ids.append(PAGERDUTY_TO_SLACK_USER_MAP[email])
+        slack_id = responder.get("slack_id") or users.slack_id_for_email(responder.get("email", ""))
+        if slack_id:
+            slack_ids.append(slack_id)
     return slack_ids
 
 
@@ -360,8 +398,8 @@ def select_action_count() -> int:
         return 4
 
 
-def get_responder_actions(pd: PagerDutyClient, slack: SlackClient, incident: Dict,
-                          responders: List[Dict], all_users: List[Dict],
+def get_responder_actions(pd: PagerDutyClient, slack: SlackClient, chat: SlackPostingPipeline, incident: Dict,
+                          responders: List[Dict], users: UserDirectory,
                           channel_id: Optional[str]) -> Dict[str, Any]:
     action_count = select_action_count()
     actions_taken = {"count": action_count, "actions": [], "escalated": False, "snoozed": False, "reassigned": False, "responders_added": False, "status_updated": False, "rba_triggered": False}
@@ -372,11 +410,11 @@ def get_responder_actions(pd: PagerDutyClient, slack: SlackClient, incident: Dic
         if result.get("success"):
             actions_taken["escalated"] = True
             actions_taken["actions"].append("escalate")
-            msg = random.choice(ESCALATION_MESSAGES)[0].format(team=random.choice(TEAMS))
+            msg = render_message(ESCALATION_TEMPLATES.draw(), incident, responders, users)
             pd.add_note(incident_id, f"[Automated] {msg}")
             if channel_id:
-                post_conversation(slack, channel_id, [random.choice(ESCALATION_MESSAGES)],
-                                responders, incident, all_users)
+                post_conversation(chat, channel_id, [ESCALATION_TEMPLATES.draw()],
+                                responders, incident, users)
         return actions_taken
 
     available_actions = ["investigate", "collaborate", "progress", "snooze", "escalate", "reassign", "add_responders", "status_update", "trigger_rba"]
@@ -388,76 +426,52 @@ def get_responder_actions(pd: PagerDutyClient, slack: SlackClient, incident: Dic
 
     for action in selected_actions:
         if action == "investigate":
-            scenario_msgs = get_scenario_messages(incident, "investigation")
-            if scenario_msgs:
-                msg_template = random.choice(scenario_msgs)
-            else:
-                msg_template = random.choice(INVESTIGATION_MESSAGES)
-            msg = msg_template[0].format(
-                timestamp=f"{int(get_incident_age_minutes(incident))}m ago",
-                component=random.choice(COMPONENTS),
-                minutes=int(get_incident_age_minutes(incident)),
-                service=random.choice(SERVICES),
-                count=random.randint(10, 100),
-                ms=random.randint(500, 5000),
-                table="users",
-            )
+            msg_template = (get_scenario_messages(incident, "investigation") or INVESTIGATION_TEMPLATES).draw()
+            msg = render_message(msg_template, incident, responders, users)
             pd.add_note(incident_id, f"[Automated] {msg}")
             if channel_id:
-                post_conversation(slack, channel_id, [msg_template], responders, incident, all_users)
+                post_conversation(chat, channel_id, [msg_template], responders, incident, users)
             actions_taken["actions"].append("investigate")
 
         elif action == "collaborate":
-            msg_template = random.choice(COLLABORATION_MESSAGES)
+            msg_template = COLLABORATION_TEMPLATES.draw()
             if channel_id:
-                post_conversation(slack, channel_id, [msg_template], responders, incident, all_users)
+                post_conversation(chat, channel_id, [msg_template], responders, incident, users)
             actions_taken["actions"].append("collaborate")
 
         elif action == "progress":
-            scenario_msgs = get_scenario_messages(incident, "progress")
-            if scenario_msgs:
-                msg_template = random.choice(scenario_msgs)
-            else:
-                msg_template = random.choice(PROGRESS_MESSAGES)
-            msg = msg_template[0].format(
-                component=random.choice(COMPONENTS),
-                detail=random.choice(DETAILS),
-                root_cause=random.choice(ROOT_CAUSES)[:50],
-                high=random.randint(5, 15),
-                low=random.randint(0, 2),
-                table="users",
-                minutes=random.randint(2, 10),
-            )
+            msg_template = (get_scenario_messages(incident, "progress") or PROGRESS_TEMPLATES).draw()
+            msg = render_message(msg_template, incident, responders, users, minutes=random.randint(2, 10))
             pd.add_note(incident_id, f"[Automated] {msg}")
             if channel_id:
-                post_conversation(slack, channel_id, [msg_template], responders, incident, all_users)
+                post_conversation(chat, channel_id, [msg_template], responders, incident, users)
             actions_taken["actions"].append("progress")
 
         elif action == "snooze":
             result = pd.snooze_incident(incident_id, duration_seconds=600)
             if result.get("success"):
                 actions_taken["snoozed"] = True
-                msg = random.choice(SNOOZE_MESSAGES)[0].format(team=random.choice(TEAMS))
+                msg = render_message(SNOOZE_TEMPLATES.draw(), incident, responders, users)
                 pd.add_note(incident_id, f"[Automated] {msg}")
                 if channel_id:
-                    post_conversation(slack, channel_id, [random.choice(SNOOZE_MESSAGES)],
-                                    responders, incident, all_users)
+                    post_conversation(chat, channel_id, [SNOOZE_TEMPLATES.draw()],
+                                    responders, incident, users)
             actions_taken["actions"].append("snooze")
 
         elif action == "escalate":
             result = pd.escalate_incident(incident_id, escalation_level=2)
             if result.get("success"):
                 actions_taken["escalated"] = True
-                msg = random.choice(ESCALATION_MESSAGES)[0].format(team=random.choice(TEAMS))
+                msg = render_message(ESCALATION_TEMPLATES.draw(), incident, responders, users)
                 pd.add_note(incident_id, f"[Automated] {msg}")
                 if channel_id:
-                    post_conversation(slack, channel_id, [random.choice(ESCALATION_MESSAGES)],
-                                    responders, incident, all_users)
+                    post_conversation(chat, channel_id, [ESCALATION_TEMPLATES.draw()],
+                                    responders, incident, users)
             actions_taken["actions"].append("escalate")
 
         elif action == "reassign":
-            if all_users and len(all_users) > 1:
-                other_users = [u for u in all_users if u not in responders]
+            if len(users) > 1:
+                other_users = users.others(responders)
                 if other_users:
                     new_assignee = random.choice(other_users)
                     result = pd.reassign_incident(incident_id, new_assignee["id"])
@@ -468,63 +482,52 @@ def get_responder_actions(pd: PagerDutyClient, slack: SlackClient, incident: Dic
             actions_taken["actions"].append("reassign")
 
         elif action == "add_responders":
-            other_users = [u for u in all_users if u not in responders and u.get("id")]
+            other_users = users.others(responders)
             if other_users:
                 new_responders = random.sample(other_users, min(2, len(other_users)))
                 new_responder_ids = [u["id"] for u in new_responders]
-                msg_template = random.choice(ADD_RESPONDERS_MESSAGES)
-                msg = msg_template[0].format(
-                    team=random.choice(TEAMS),
-                    name=new_responders[0]["name"] if new_responders else "team",
-                    component=random.choice(COMPONENTS),
-                )
+                msg_template = ADD_RESPONDERS_TEMPLATES.draw()
+                msg = render_message(msg_template, incident, responders, users,
+                                     name=new_responders[0]["name"] if new_responders else "team")
                 result = pd.add_responders(incident_id, new_responder_ids)
                 if result.get("success"):
                     actions_taken["responders_added"] = True
                     pd.add_note(incident_id, f"[Automated] {msg}")
                     if channel_id:
-                        post_conversation(slack, channel_id, [msg_template], responders, incident, all_users)
-                        slack_ids = get_slack_user_ids_for_responders(new_responders)
+                        post_conversation(chat, channel_id, [msg_template], responders, incident, users)
+                        slack_ids = get_slack_user_ids_for_responders(new_responders, users)
                         if slack_ids:
                             slack.invite_users_to_channel(channel_id, slack_ids)
             actions_taken["actions"].append("add_responders")
 
         elif action == "status_update":
-            msg_template = random.choice(STATUS_UPDATE_MESSAGES)
-            msg = msg_template[0].format(
-                component=random.choice(COMPONENTS),
-                team=random.choice(TEAMS),
-                minutes=int(get_incident_age_minutes(incident)),
-            )
+            msg_template = STATUS_UPDATE_TEMPLATES.draw()
+            msg = render_message(msg_template, incident, responders, users)
             requester_email = responders[0].get("email") if responders else None
             result = pd.post_status_update(incident_id, msg, requester_email)
             if result.get("success"):
                 actions_taken["status_updated"] = True
                 if channel_id:
-                    post_conversation(slack, channel_id, [msg_template], responders, incident, all_users)
+                    post_conversation(chat, channel_id, [msg_template], responders, incident, users)
             actions_taken["actions"].append("status_update")
 
         elif action == "trigger_rba":
-            scenario_type = get_scenario_type(incident)
-            msg_template = random.choice(RBA_ACTION_MESSAGES)
-            msg = msg_template[0].format(
-                component=random.choice(COMPONENTS),
-                scenario=scenario_type,
-            )
+            msg_template = RBA_ACTION_TEMPLATES.draw()
+            msg = render_message(msg_template, incident, responders, users)
             pd.add_note(incident_id, f"[Automated - RBA] {msg}")
             actions_taken["rba_triggered"] = True
             if channel_id:
-                post_conversation(slack, channel_id, [msg_template], responders, incident, all_users)
+                post_conversation(chat, channel_id, [msg_template], responders, incident, users)
             actions_taken["actions"].append("trigger_rba")
 
     return actions_taken
 
 
 def ensure_all_responders_participate(
-    slack: SlackClient,
+    chat: SlackPostingPipeline,
     incident: Dict,
     responders: List[Dict],
-    all_users: List[Dict],
+    users: UserDirectory,
     channel_id: Optional[str],
     responders_who_acted: set = None
 ) -> set:
@@ -540,32 +543,32 @@ def ensure_all_responders_participate(
             action_type = random.choice(["investigate", "collaborate", "progress"])
             scenario_msgs = get_scenario_messages(incident, action_type if action_type != "investigate" else "investigation")
             if scenario_msgs:
-                msg_template = random.choice(scenario_msgs)
+                msg_template = scenario_msgs.draw()
             elif action_type == "investigate":
-                msg_template = random.choice(INVESTIGATION_MESSAGES)
+                msg_template = INVESTIGATION_TEMPLATES.draw()
             elif action_type == "collaborate":
-                msg_template = random.choice(COLLABORATION_MESSAGES)
+                msg_template = COLLABORATION_TEMPLATES.draw()
             else:
-                msg_template = random.choice(PROGRESS_MESSAGES)
+                msg_template = PROGRESS_TEMPLATES.draw()
 
-            text = format_message(msg_template[0], responders, incident, all_users)
+            text = format_message(msg_template, responders, incident, users)
             emoji = get_user_emoji(responder)
             job_title = responder.get("job_title") or responder.get("role", "")
             title_display = f" ({job_title})" if job_title else ""
             full_text = f"{emoji} *{responder['name']}*{title_display}\n{text}"
-            slack.post_message(full_text, channel_id)
+            chat.post_message(full_text, channel_id)
             responders_who_acted.add(responder_id)
             logger.info(f"Ensured responder {responder['name']} participated in incident conversation")
 
     return responders_who_acted
 
 
-def process_incidents() -> Dict[str, Any]:
-    pd = PagerDutyClient()
-    slack = SlackClient()
+def process_incidents(ctx: SweepContext = None) -> Dict[str, Any]:
+    ctx = ctx or SweepContext(PagerDutyClient(), SlackClient())
+    pd, slack, chat = ctx.pd, ctx.slack, ctx.chat
 
-    all_users = pd.list_users()
-    logger.info(f"Using {len(all_users)} PagerDuty users for simulation")
+    users = ctx.users
+    logger.info(f"Using {len(users)} PagerDuty users for simulation")
 
     results = {
         "acknowledged": [],
@@ -580,20 +583,20 @@ def process_incidents() -> Dict[str, Any]:
         "demo_paused": [],
         "dm_sent": [],
         "actions_taken": [],
+        "slack_delivery": {},
     }
 
-    all_open = pd.list_incidents(["triggered", "acknowledged"])
+    snapshot = ctx.snapshot
 
-    real_scenario = check_for_real_scenario(pd, all_open)
+    real_scenario = check_for_real_scenario(pd, snapshot.non_demo())
     if real_scenario:
         results["real_scenario_detected"] = True
-        pause_results = pause_fake_activity(pd, slack)
+        pause_results = pause_fake_activity(pd, slack, snapshot)
         results["demo_paused"] = pause_results["resolved_demo_incidents"]
         logger.info(f"Real scenario active: {real_scenario.get('title')} - paused {len(results['demo_paused'])} demo incidents")
         return results
 
-    triggered = pd.list_incidents(["triggered"])
-    for incident in triggered:
+    for incident in snapshot.triggered:
         age = get_incident_age_minutes(incident)
         incident_id = incident["id"]
         title = incident.get("title", "Unknown")
@@ -602,34 +605,36 @@ def process_incidents() -> Dict[str, Any]:
             results["skipped"].append({"id": incident_id, "reason": "not a demo incident"})
             continue
 
+        if ctx.out_of_time(FLUSH_RESERVE_SECONDS):
+            results["skipped"].append({"id": incident_id, "reason": "out of time"})
+            continue
+
         if age >= 2:
             result = pd.acknowledge_incident(incident_id)
             if result.get("success"):
                 results["acknowledged"].append(incident_id)
 
                 channel_name = get_incident_channel_name(incident)
-                channel_id = slack.find_channel_by_pattern(f"^{channel_name[:20]}")
+                channel_id = ctx.find_channel(f"^{channel_name[:20]}")
 
                 if channel_id:
                     observer_ids = [CONALL_SLACK_USER_ID, CONALL_SLACK_USER_ID_PERSONAL]
                     slack.invite_users_to_channel(channel_id, observer_ids)
-                    responders = pick_responders(pd, incident, 2)
-                    slack_user_ids = get_slack_user_ids_for_responders(responders)
+                    responders = pick_responders(pd, incident, users, 2)
+                    slack_user_ids = get_slack_user_ids_for_responders(responders, users)
                     if slack_user_ids:
                         slack.invite_users_to_channel(channel_id, slack_user_ids)
                         logger.info(f"Auto-invited {len(slack_user_ids)} responders to channel {channel_name}")
-                    ack_msg = random.choice(ACK_MESSAGES)
-                    post_conversation(slack, channel_id, [ack_msg], responders, incident, all_users)
+                    post_conversation(chat, channel_id, [ACK_TEMPLATES.draw()], responders, incident, users)
                     results["slack_posted"].append({"channel": channel_name, "type": "ack"})
 
-                msg = random.choice(ACK_MESSAGES)[0]
+                msg = render_message(ACK_TEMPLATES.draw(), incident)
                 pd.add_note(incident_id, f"[Automated] {msg}")
                 logger.info(f"Acknowledged incident {incident_id} (age: {age:.1f}m)")
         else:
             results["skipped"].append({"id": incident_id, "reason": f"too new ({age:.1f}m)"})
 
-    acknowledged = pd.list_incidents(["acknowledged"])
-    for incident in acknowledged:
+    for incident in snapshot.acknowledged:
         age = get_incident_age_minutes(incident)
         incident_id = incident["id"]
         title = incident.get("title", "Unknown")
@@ -638,40 +643,40 @@ def process_incidents() -> Dict[str, Any]:
             results["skipped"].append({"id": incident_id, "reason": "not a demo incident"})
             continue
 
+        if ctx.out_of_time(FLUSH_RESERVE_SECONDS):
+            results["skipped"].append({"id": incident_id, "reason": "out of time"})
+            continue
+
         channel_name = get_incident_channel_name(incident)
-        channel_id = slack.find_channel_by_pattern(f"^{channel_name[:20]}")
-        responders = pick_responders(pd, incident, 3)
+        channel_id = ctx.find_channel(f"^{channel_name[:20]}")
+        responders = pick_responders(pd, incident, users, 3)
 
         if age >= 20:
             result = pd.resolve_incident(incident_id)
             if result.get("success"):
                 results["resolved"].append(incident_id)
+                ctx.resolved.add(incident_id)
 
                 if channel_id:
-                    resolver = select_resolver(responders, all_users)
-                    scenario_msgs = get_scenario_messages(incident, "resolution")
-                    if scenario_msgs:
-                        resolution_template = random.choice(scenario_msgs)
-                    else:
-                        resolution_template = random.choice(RESOLUTION_MESSAGES)
+                    resolver = select_resolver(responders, users)
+                    resolution_template = (get_scenario_messages(incident, "resolution") or RESOLUTION_TEMPLATES).draw()
                     resolution_msgs = [
-                        random.choice(PROGRESS_MESSAGES),
+                        PROGRESS_TEMPLATES.draw(),
                         resolution_template,
                     ]
-                    ensure_all_responders_participate(slack, incident, responders, all_users, channel_id)
-                    post_conversation(slack, channel_id, resolution_msgs, [resolver], incident, all_users)
+                    ensure_all_responders_participate(chat, incident, responders, users, channel_id)
+                    post_conversation(chat, channel_id, resolution_msgs, [resolver], incident, users)
                     results["slack_posted"].append({"channel": channel_name, "type": "resolution"})
 
-                cause = random.choice(ROOT_CAUSES)
-                msg = random.choice(RESOLUTION_MESSAGES)[0].format(cause=cause)
+                msg = render_message(RESOLUTION_TEMPLATES.draw(), incident, responders, users)
                 pd.add_note(incident_id, f"[Automated] {msg}")
                 logger.info(f"Resolved incident {incident_id} (age: {age:.1f}m)")
 
         elif age >= 5:
-            action_results = get_responder_actions(pd, slack, incident, responders, all_users, channel_id)
+            action_results = get_responder_actions(pd, slack, chat, incident, responders, users, channel_id)
 
             if channel_id and random.random() < 0.3:
-                ensure_all_responders_participate(slack, incident, responders, all_users, channel_id)
+                ensure_all_responders_participate(chat, incident, responders, users, channel_id)
 
             results["actions_taken"].append({
                 "incident_id": incident_id,
@@ -692,13 +697,14 @@ def process_incidents() -> Dict[str, Any]:
         else:
             results["skipped"].append({"id": incident_id, "reason": f"waiting ({age:.1f}m)"})
 
+    results["slack_delivery"] = chat.flush()
     return results
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     logger.info("Lifecycle Lambda invoked")
     
-    results = process_incidents()
+    results = process_incidents(SweepContext.for_invocation(PagerDutyClient(), SlackClient(), event, context))
     
     logger.info(f"Results: {results}")
     
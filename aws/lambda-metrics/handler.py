@@ -2,10 +2,9 @@ import json
 import os
 import random
 import time
-import requests
 from datetime import datetime
 
-from shared import PagerDutyClient, SlackClient
+from shared import PagerDutyClient, SlackClient, http_session, Deadline, set_deadline
 
 DATADOG_API_KEY = os.environ.get('DATADOG_API_KEY', '')
 DATADOG_SITE = os.environ.get('DATADOG_SITE', 'us5.datadoghq.com')
@@ -85,7 +84,7 @@ class DatadogClient:
         }
 
         try:
-            resp = requests.post(self.metrics_url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(self.metrics_url, json=payload, headers=headers, timeout=10)
             return {'status': 'success' if resp.ok else 'error', 'code': resp.status_code}
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
@@ -100,7 +99,7 @@ class DatadogClient:
         }
 
         try:
-            resp = requests.post(self.logs_url, json=logs, headers=headers, timeout=10)
+            resp = http_session().post(self.logs_url, json=logs, headers=headers, timeout=10)
             return {'status': 'success' if resp.ok else 'error', 'code': resp.status_code}
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
@@ -124,7 +123,7 @@ class NewRelicClient:
         }
 
         try:
-            resp = requests.post(self.metrics_url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(self.metrics_url, json=payload, headers=headers, timeout=10)
             return {'status': 'success' if resp.ok else 'error', 'code': resp.status_code}
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
@@ -139,7 +138,7 @@ class NewRelicClient:
         }
 
         try:
-            resp = requests.post(self.logs_url, json=logs, headers=headers, timeout=10)
+            resp = http_session().post(self.logs_url, json=logs, headers=headers, timeout=10)
             return {'status': 'success' if resp.ok else 'error', 'code': resp.status_code}
         except Exception as e:
             return {'status': 'error', 'message': str(e)}
@@ -287,6 +286,7 @@ def trigger_incident_for_spike(spike: dict, pd_client: PagerDutyClient, slack_cl
 
 
 def lambda_handler(event, context):
+    set_deadline(Deadline.from_context(context))
     spike_probability = float(event.get('spike_probability', 0.05))
     force_spike = event.get('force_spike', False)
     trigger_pagerduty = event.get('trigger_pagerduty', False)
@@ -5,7 +5,7 @@ import logging
 import re
 from typing import Optional, Dict, Any, List
 
-from shared import PagerDutyClient, SlackClient, CONALL_SLACK_USER_ID, SLACK_WORKSPACE_ID
+from shared import PagerDutyClient, SlackClient, CONALL_SLACK_USER_ID, SLACK_WORKSPACE_ID, SweepContext
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,13 +22,15 @@ def extract_incident_number(channel_name: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
-def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-    global _notified_channels
-    
-    logger.info("Demo Scenario Notifier Lambda invoked")
-    
-    slack = SlackClient()
-    pd = PagerDutyClient()
+def find_incident_by_number(incidents: List[Dict], incident_num: str) -> Optional[Dict]:
+    for inc in incidents:
+        if str(inc.get("incident_number")) == incident_num:
+            return inc
+    return None
+
+
+def notify_new_channels(ctx: SweepContext) -> Dict[str, Any]:
+    slack = ctx.slack
     
     results = {
         "channels_checked": 0,
@@ -36,7 +38,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         "skipped": [],
     }
     
-    recent_channels = slack.get_recent_channels(minutes=10)
+    recent_channels = ctx.recent_channels(minutes=10)
     results["channels_checked"] = len(recent_channels)
     logger.info(f"Found {len(recent_channels)} recently created channels")
     
@@ -54,15 +56,12 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         
         incident_num = extract_incident_number(channel_name)
         incident_info = ""
-        if incident_num:
-            incidents = pd.list_recent_incidents(minutes=30)
-            for inc in incidents:
-                if str(inc.get("incident_number")) == incident_num:
-                    title = inc.get("title", "Unknown")
-                    service = inc.get("service", {}).get("summary", "Unknown Service")
-                    status = inc.get("status", "unknown")
-                    incident_info = f"\n*Incident:* {title}\n*Service:* {service}\n*Status:* {status.upper()}"
-                    break
+        inc = find_incident_by_number(ctx.snapshot.incidents, incident_num) if incident_num else None
+        if inc:
+            title = inc.get("title", "Unknown")
+            service = inc.get("service", {}).get("summary", "Unknown Service")
+            status = inc.get("status", "unknown")
+            incident_info = f"\n*Incident:* {title}\n*Service:* {service}\n*Status:* {status.upper()}"
         
         channel_link = f"https://pdtlosandes.slack.com/archives/{channel_id}"
         
@@ -84,6 +83,14 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             logger.error(f"Failed to send DM: {result}")
             results["skipped"].append({"channel": channel_name, "reason": f"dm_failed: {result.get('error')}"})
     
+    return results
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    logger.info("Demo Scenario Notifier Lambda invoked")
+    
+    results = notify_new_channels(SweepContext.for_invocation(PagerDutyClient(), SlackClient(), event, context))
+    
     logger.info(f"Results: {results}")
     
     return {
@@ -6,7 +6,7 @@ import logging
 import time
 from typing import Optional, Dict, Any, List
 
-from shared import PagerDutyClient
+from shared import PagerDutyClient, Deadline, set_deadline
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -238,6 +238,7 @@ def spawn_incident(scenario_id: Optional[str] = None, probability: float = 1.0)
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    set_deadline(Deadline.from_context(context))
     action = event.get("action")
     
     if action == "list_scenarios":
@@ -4,32 +4,23 @@ import logging
 import random
 import hashlib
 import hmac
-import boto3
+import functools
 import requests
 from datetime import datetime, timezone, timedelta
-from decimal import Decimal
 from typing import Optional, Dict, Any, List
 
+from shared import (
+    PagerDutyClient, SlackClient, DEMO_USERS, PAGERDUTY_EVENTS_URL,
+    CONALL_SLACK_USER_ID, CONALL_SLACK_USER_ID_PERSONAL,
+    demo_directory, get_conversation_message, aws_client,
+    RUN_ID_FIELD, new_run_id, demo_dedup_key, find_scoped_incidents, teardown, state_backend_from_env,
+)
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-PAGERDUTY_API_URL = 'https://api.pagerduty.com'
-PAGERDUTY_EVENTS_URL = 'https://events.pagerduty.com/v2/enqueue'
-
-CONALL_EMAIL = 'clynch@pagerduty.com'
-CONALL_SLACK_USER_ID = 'U0A9KAMT0BF'
-CONALL_SLACK_USER_ID_PERSONAL = 'U0A9GBYT999'
 CONALL_PD_USER_ID = 'PSLR7NC'
 
-DEMO_USERS = [
-    {'id': 'PG6UTES', 'email': 'jbeam@losandesgaa.onmicrosoft.com', 'name': 'Jim Beam', 'slack_id': 'U0AA1LZSYHX'},
-    {'id': 'PR0E7IK', 'email': 'jdaniels@losandesgaa.onmicrosoft.com', 'name': 'Jack Daniels', 'slack_id': 'U0A9GC08EV9'},
-    {'id': 'PCX6T22', 'email': 'jcasker@losandesgaa.onmicrosoft.com', 'name': 'Jameson Casker', 'slack_id': 'U0AA1LYLH2M'},
-    {'id': 'PVOXRAP', 'email': 'jcuervo@losandesgaa.onmicrosoft.com', 'name': 'Jose Cuervo', 'slack_id': 'U0A9LN3QVC6'},
-    {'id': 'PNRT76X', 'email': 'gtonic@losandesgaa.onmicrosoft.com', 'name': 'Ginny Tonic', 'slack_id': 'U0A9KANFCLV'},
-    {'id': 'PYKISPC', 'email': 'aguiness@losandesgaa.onmicrosoft.com', 'name': 'Arthur Guinness', 'slack_id': 'U0A9SBF3MTN'},
-]
-
 PAUSE_TIMEOUT_MINUTES = 15
 
 ACTION_TYPES = [
@@ -44,33 +35,6 @@ ACTION_TYPES = [
     ('add_task', 10),
 ]
 
-CONVERSATION_LIBRARY = {
-    'investigating': [
-        "Looking into this now, checking the logs...",
-        "I'm on it. Pulling up the monitoring dashboards.",
-        "Investigating the root cause, one moment.",
-        "Checking the recent deployments to see if anything changed.",
-    ],
-    'found_issue': [
-        "Found something - there's a spike in the error logs around the time this started.",
-        "I think I see the issue. The connection pool is exhausted.",
-        "Looks like a memory leak is causing the degradation.",
-        "Found it - there's a deadlock in the database queries.",
-    ],
-    'working_fix': [
-        "Working on a fix now, should have something shortly.",
-        "Deploying a hotfix to address this.",
-        "Running the remediation playbook.",
-        "Scaling up the instances to handle the load.",
-    ],
-    'resolved': [
-        "Fix deployed, monitoring for stability. Looks good so far.",
-        "Issue resolved. Root cause was identified and addressed.",
-        "All systems back to normal. Will follow up with a post-incident review.",
-        "Resolved! The automated remediation worked. Incident closed.",
-    ],
-}
-
 # PagerDuty API Configuration and Stubs
 PAGERDUTY_API_ENDPOINTS = {
     'incidents': '/incidents',
@@ -142,15 +106,18 @@ FEATURE_FLAGS = {
     'aiops': False,
 }
 
-dynamodb = boto3.resource('dynamodb')
-scheduler = boto3.client('scheduler')
 TABLE_NAME = os.environ.get('DEMO_STATE_TABLE', 'demo-incident-state')
 
 
+@functools.lru_cache(maxsize=None)
+def demo_state_backend():
+    return state_backend_from_env(TABLE_NAME)
+
+
 class DemoState:
-    def __init__(self):
-        self.table = dynamodb.Table(TABLE_NAME)
-    
+    def __init__(self, backend=None):
+        self.backend = backend or demo_state_backend()
+
     def create(self, incident_id: str, data: Dict) -> Dict:
         item = {
             'incident_id': incident_id,
@@ -158,28 +125,19 @@ class DemoState:
             'ttl': int((datetime.now(timezone.utc) + timedelta(hours=24)).timestamp()),
             **data
         }
-        self.table.put_item(Item=json.loads(json.dumps(item), parse_float=Decimal))
+        self.backend.put(item)
         return item
     
     def get(self, incident_id: str) -> Optional[Dict]:
         try:
-            response = self.table.get_item(Key={'incident_id': incident_id})
-            return response.get('Item')
+            return self.backend.get(incident_id)
         except Exception as e:
             logger.error(f"Error getting demo state: {e}")
             return None
     
     def update(self, incident_id: str, updates: Dict) -> bool:
         try:
-            update_expr = 'SET ' + ', '.join([f'#{k} = :{k}' for k in updates.keys()])
-            expr_names = {f'#{k}': k for k in updates.keys()}
-            expr_values = {f':{k}': v for k, v in updates.items()}
-            self.table.update_item(
-                Key={'incident_id': incident_id},
-                UpdateExpression=update_expr,
-                ExpressionAttributeNames=expr_names,
-                ExpressionAttributeValues=json.loads(json.dumps(expr_values), parse_float=Decimal)
-            )
+            self.backend.update(incident_id, updates)
             return True
         except Exception as e:
             logger.error(f"Error updating demo state: {e}")
@@ -187,7 +145,7 @@ class DemoState:
     
     def delete(self, incident_id: str) -> bool:
         try:
-            self.table.delete_item(Key={'incident_id': incident_id})
+            self.backend.delete(incident_id)
             return True
         except Exception as e:
             logger.error(f"Error deleting demo state: {e}")
@@ -195,710 +153,20 @@ class DemoState:
     
     def get_active_demos(self) -> List[Dict]:
         try:
-            response = self.table.scan(
-                FilterExpression='#state <> :resolved',
-                ExpressionAttributeNames={'#state': 'state'},
-                ExpressionAttributeValues={':resolved': 'resolved'}
-            )
-            return response.get('Items', [])
+            return self.backend.scan(exclude={'state': 'resolved'})
         except Exception as e:
             logger.error(f"Error scanning demos: {e}")
             return []
 
-
-class PagerDutyClient:
-    def __init__(self, token: str = None):
-        self.token = token or os.environ.get('PAGERDUTY_TOKEN', '')
-        self.headers = {
-            'Authorization': f'Token token={self.token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-    
-    def get_incident(self, incident_id: str) -> Optional[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/incidents/{incident_id}', headers=self.headers, timeout=10)
-            if resp.ok:
-                return resp.json().get('incident')
-        except Exception as e:
-            logger.error(f"Error getting incident: {e}")
-        return None
-    
-    def acknowledge_incident(self, incident_id: str, user_email: str) -> bool:
-        try:
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json={'incident': {'type': 'incident_reference', 'status': 'acknowledged'}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error acknowledging incident: {e}")
-            return False
-    
-    def resolve_incident(self, incident_id: str, user_email: str, resolution: str = None) -> bool:
-        try:
-            body = {'incident': {'type': 'incident_reference', 'status': 'resolved'}}
-            if resolution:
-                body['incident']['resolution'] = resolution
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json=body,
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error resolving incident: {e}")
-            return False
-    
-    def add_note(self, incident_id: str, user_email: str, content: str) -> bool:
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}/notes',
-                headers={**self.headers, 'From': user_email},
-                json={'note': {'content': content}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error adding note: {e}")
-            return False
-    
-    def add_responders(self, incident_id: str, requester_email: str, responder_ids: List[str], message: str = None) -> bool:
-        try:
-            responders = [{'responder_request_target': {'id': rid, 'type': 'user_reference'}} for rid in responder_ids]
-            body = {'requester_id': self._get_user_id_by_email(requester_email), 'responder_request_targets': responders}
-            if message:
-                body['message'] = message
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}/responder_requests',
-                headers={**self.headers, 'From': requester_email},
-                json=body,
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error adding responders: {e}")
-            return False
-    
-    def post_status_update(self, incident_id: str, user_email: str, message: str) -> bool:
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}/status_updates',
-                headers={**self.headers, 'From': user_email},
-                json={'message': message},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error posting status update: {e}")
-            return False
-    
-    def change_priority(self, incident_id: str, user_email: str, priority_id: str) -> bool:
-        try:
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json={'incident': {'type': 'incident_reference', 'priority': {'id': priority_id, 'type': 'priority_reference'}}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error changing priority: {e}")
-            return False
-    
-    def get_demo_incidents(self, statuses: List[str] = None) -> List[Dict]:
-        if statuses is None:
-            statuses = ['triggered', 'acknowledged']
-        params = '&'.join([f'statuses[]={s}' for s in statuses])
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/incidents?{params}&limit=100', headers=self.headers, timeout=10)
-            if resp.ok:
-                incidents = resp.json().get('incidents', [])
-                return [i for i in incidents if i.get('title', '').startswith('[DEMO]')]
-        except Exception as e:
-            logger.error(f"Error getting demo incidents: {e}")
-        return []
-    
-    def _get_user_id_by_email(self, email: str) -> str:
-        for user in DEMO_USERS:
-            if user['email'] == email:
-                return user['id']
-        return ''
-
-    def list_services(self, team_ids: List[str] = None, limit: int = 100) -> List[Dict]:
-        params = {'limit': limit}
-        if team_ids:
-            params['team_ids[]'] = team_ids
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/services', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('services', [])
-        except Exception as e:
-            logger.error(f"Error listing services: {e}")
-        return []
-
-    def get_service(self, service_id: str, include: List[str] = None) -> Optional[Dict]:
-        params = {}
-        if include:
-            params['include[]'] = include
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/services/{service_id}', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('service')
-        except Exception as e:
-            logger.error(f"Error getting service: {e}")
-        return None
-
-    def create_service(self, name: str, escalation_policy_id: str, description: str = None, alert_grouping: str = None) -> Optional[Dict]:
-        body = {
-            'service': {
-                'type': 'service',
-                'name': name,
-                'escalation_policy': {'id': escalation_policy_id, 'type': 'escalation_policy_reference'}
-            }
-        }
-        if description:
-            body['service']['description'] = description
-        if alert_grouping:
-            body['service']['alert_grouping_parameters'] = {'type': alert_grouping}
-        try:
-            resp = requests.post(f'{PAGERDUTY_API_URL}/services', headers=self.headers, json=body, timeout=10)
-            if resp.ok:
-                return resp.json().get('service')
-        except Exception as e:
-            logger.error(f"Error creating service: {e}")
-        return None
-
-    def update_service(self, service_id: str, updates: Dict) -> Optional[Dict]:
-        body = {'service': {'type': 'service', **updates}}
-        try:
-            resp = requests.put(f'{PAGERDUTY_API_URL}/services/{service_id}', headers=self.headers, json=body, timeout=10)
-            if resp.ok:
-                return resp.json().get('service')
-        except Exception as e:
-            logger.error(f"Error updating service: {e}")
-        return None
-
-    def delete_service(self, service_id: str) -> bool:
-        try:
-            resp = requests.delete(f'{PAGERDUTY_API_URL}/services/{service_id}', headers=self.headers, timeout=10)
-            return resp.status_code == 204
-        except Exception as e:
-            logger.error(f"Error deleting service: {e}")
-            return False
-
-    def list_users(self, team_ids: List[str] = None, include: List[str] = None, limit: int = 100) -> List[Dict]:
-        params = {'limit': limit}
-        if team_ids:
-            params['team_ids[]'] = team_ids
-        if include:
-            params['include[]'] = include
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/users', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('users', [])
-        except Exception as e:
-            logger.error(f"Error listing users: {e}")
-        return []
-
-    def get_user(self, user_id: str, include: List[str] = None) -> Optional[Dict]:
-        params = {}
-        if include:
-            params['include[]'] = include
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/users/{user_id}', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('user')
-        except Exception as e:
-            logger.error(f"Error getting user: {e}")
-        return None
-
-    def get_user_on_call(self, user_id: str) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/users/{user_id}/oncalls', headers=self.headers, timeout=10)
-            if resp.ok:
-                return resp.json().get('oncalls', [])
-        except Exception as e:
-            logger.error(f"Error getting user on-call: {e}")
-        return []
-
-    def list_teams(self, limit: int = 100) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/teams', headers=self.headers, params={'limit': limit}, timeout=10)
-            if resp.ok:
-                return resp.json().get('teams', [])
-        except Exception as e:
-            logger.error(f"Error listing teams: {e}")
-        return []
-
-    def get_team(self, team_id: str, include: List[str] = None) -> Optional[Dict]:
-        params = {}
-        if include:
-            params['include[]'] = include
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/teams/{team_id}', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('team')
-        except Exception as e:
-            logger.error(f"Error getting team: {e}")
-        return None
-
-    def list_schedules(self, limit: int = 100) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/schedules', headers=self.headers, params={'limit': limit}, timeout=10)
-            if resp.ok:
-                return resp.json().get('schedules', [])
-        except Exception as e:
-            logger.error(f"Error listing schedules: {e}")
-        return []
-
-    def get_schedule(self, schedule_id: str, since: str = None, until: str = None) -> Optional[Dict]:
-        params = {}
-        if since:
-            params['since'] = since
-        if until:
-            params['until'] = until
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/schedules/{schedule_id}', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('schedule')
-        except Exception as e:
-            logger.error(f"Error getting schedule: {e}")
-        return None
-
-    def get_oncalls(self, schedule_ids: List[str] = None, escalation_policy_ids: List[str] = None) -> List[Dict]:
-        params = {}
-        if schedule_ids:
-            params['schedule_ids[]'] = schedule_ids
-        if escalation_policy_ids:
-            params['escalation_policy_ids[]'] = escalation_policy_ids
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/oncalls', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('oncalls', [])
-        except Exception as e:
-            logger.error(f"Error getting oncalls: {e}")
-        return []
-
-    def list_escalation_policies(self, team_ids: List[str] = None, limit: int = 100) -> List[Dict]:
-        params = {'limit': limit}
-        if team_ids:
-            params['team_ids[]'] = team_ids
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/escalation_policies', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('escalation_policies', [])
-        except Exception as e:
-            logger.error(f"Error listing escalation policies: {e}")
-        return []
-
-    def get_escalation_policy(self, policy_id: str, include: List[str] = None) -> Optional[Dict]:
-        params = {}
-        if include:
-            params['include[]'] = include
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/escalation_policies/{policy_id}', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('escalation_policy')
-        except Exception as e:
-            logger.error(f"Error getting escalation policy: {e}")
-        return None
-
-    def list_priorities(self) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/priorities', headers=self.headers, timeout=10)
-            if resp.ok:
-                return resp.json().get('priorities', [])
-        except Exception as e:
-            logger.error(f"Error listing priorities: {e}")
-        return []
-
-    def snooze_incident(self, incident_id: str, user_email: str, duration_seconds: int) -> bool:
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}/snooze',
-                headers={**self.headers, 'From': user_email},
-                json={'duration': duration_seconds},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error snoozing incident: {e}")
-            return False
-
-    def merge_incidents(self, parent_incident_id: str, user_email: str, incident_ids: List[str]) -> bool:
-        try:
-            source_incidents = [{'id': iid, 'type': 'incident_reference'} for iid in incident_ids]
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{parent_incident_id}/merge',
-                headers={**self.headers, 'From': user_email},
-                json={'source_incidents': source_incidents},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error merging incidents: {e}")
-            return False
-
-    def reassign_incident(self, incident_id: str, user_email: str, assignee_ids: List[str]) -> bool:
-        try:
-            assignments = [{'assignee': {'id': aid, 'type': 'user_reference'}} for aid in assignee_ids]
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json={'incident': {'type': 'incident_reference', 'assignments': assignments}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error reassigning incident: {e}")
-            return False
-
-    def run_response_play(self, incident_id: str, user_email: str, response_play_id: str) -> bool:
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/response_plays/{response_play_id}/run',
-                headers={**self.headers, 'From': user_email},
-                json={'incident': {'id': incident_id, 'type': 'incident_reference'}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error running response play: {e}")
-            return False
-
-    def list_response_plays(self, limit: int = 100) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/response_plays', headers=self.headers, params={'limit': limit}, timeout=10)
-            if resp.ok:
-                return resp.json().get('response_plays', [])
-        except Exception as e:
-            logger.error(f"Error listing response plays: {e}")
-        return []
-
-    def list_incident_workflows(self, limit: int = 100) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/incident_workflows', headers=self.headers, params={'limit': limit}, timeout=10)
-            if resp.ok:
-                return resp.json().get('incident_workflows', [])
-        except Exception as e:
-            logger.error(f"Error listing incident workflows: {e}")
-        return []
-
-    def trigger_incident_workflow(self, workflow_id: str, incident_id: str) -> bool:
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/incident_workflows/{workflow_id}/instances',
-                headers=self.headers,
-                json={'incident_workflow_instance': {'incident': {'id': incident_id, 'type': 'incident_reference'}}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error triggering incident workflow: {e}")
-            return False
-
-    def list_business_services(self, limit: int = 100) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/business_services', headers=self.headers, params={'limit': limit}, timeout=10)
-            if resp.ok:
-                return resp.json().get('business_services', [])
-        except Exception as e:
-            logger.error(f"Error listing business services: {e}")
-        return []
-
-    def get_business_service(self, service_id: str) -> Optional[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/business_services/{service_id}', headers=self.headers, timeout=10)
-            if resp.ok:
-                return resp.json().get('business_service')
-        except Exception as e:
-            logger.error(f"Error getting business service: {e}")
-        return None
-
-    def update_business_service_impact(self, service_id: str, status: str, message: str = None) -> bool:
-        try:
-            body = {'impactor': {'type': 'incident_reference', 'status': status}}
-            if message:
-                body['impactor']['message'] = message
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/business_services/{service_id}/impactors',
-                headers=self.headers,
-                json=body,
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error updating business service impact: {e}")
-            return False
-
-    def list_maintenance_windows(self, service_ids: List[str] = None, filter_: str = 'ongoing') -> List[Dict]:
-        params = {'filter': filter_}
-        if service_ids:
-            params['service_ids[]'] = service_ids
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/maintenance_windows', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json().get('maintenance_windows', [])
-        except Exception as e:
-            logger.error(f"Error listing maintenance windows: {e}")
-        return []
-
-    def create_maintenance_window(self, service_ids: List[str], start_time: str, end_time: str, description: str = None) -> Optional[Dict]:
-        services = [{'id': sid, 'type': 'service_reference'} for sid in service_ids]
-        body = {
-            'maintenance_window': {
-                'type': 'maintenance_window',
-                'start_time': start_time,
-                'end_time': end_time,
-                'services': services
-            }
-        }
-        if description:
-            body['maintenance_window']['description'] = description
-        try:
-            resp = requests.post(f'{PAGERDUTY_API_URL}/maintenance_windows', headers=self.headers, json=body, timeout=10)
-            if resp.ok:
-                return resp.json().get('maintenance_window')
-        except Exception as e:
-            logger.error(f"Error creating maintenance window: {e}")
-        return None
-
-    def get_incident_alerts(self, incident_id: str) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/incidents/{incident_id}/alerts', headers=self.headers, timeout=10)
-            if resp.ok:
-                return resp.json().get('alerts', [])
-        except Exception as e:
-            logger.error(f"Error getting incident alerts: {e}")
-        return []
-
-    def update_incident_alert(self, incident_id: str, alert_id: str, status: str) -> bool:
-        try:
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}/alerts/{alert_id}',
-                headers=self.headers,
-                json={'alert': {'type': 'alert', 'status': status}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error updating incident alert: {e}")
-            return False
-
-    def get_incident_timeline(self, incident_id: str) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/incidents/{incident_id}/log_entries', headers=self.headers, timeout=10)
-            if resp.ok:
-                return resp.json().get('log_entries', [])
-        except Exception as e:
-            logger.error(f"Error getting incident timeline: {e}")
-        return []
-
-    def list_tags(self, limit: int = 100) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/tags', headers=self.headers, params={'limit': limit}, timeout=10)
-            if resp.ok:
-                return resp.json().get('tags', [])
-        except Exception as e:
-            logger.error(f"Error listing tags: {e}")
-        return []
-
-    def add_tags_to_entity(self, entity_type: str, entity_id: str, tag_ids: List[str]) -> bool:
-        tags = [{'id': tid, 'type': 'tag_reference'} for tid in tag_ids]
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/{entity_type}/{entity_id}/tags',
-                headers=self.headers,
-                json={'tags': tags},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error adding tags: {e}")
-            return False
-
-    def get_analytics_incident_metrics(self, since: str, until: str, service_ids: List[str] = None) -> Optional[Dict]:
-        params = {'since': since, 'until': until}
-        if service_ids:
-            params['service_ids[]'] = service_ids
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/analytics/metrics/incidents/all', headers=self.headers, params=params, timeout=10)
-            if resp.ok:
-                return resp.json()
-        except Exception as e:
-            logger.error(f"Error getting analytics: {e}")
-        return None
-
-    def send_event(self, routing_key: str, event_action: str, dedup_key: str, payload: Dict) -> bool:
-        body = {
-            'routing_key': routing_key,
-            'event_action': event_action,
-            'dedup_key': dedup_key,
-            'payload': payload
-        }
-        try:
-            resp = requests.post('https://events.pagerduty.com/v2/enqueue', json=body, timeout=10)
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error sending event: {e}")
-            return False
-
-    def create_change_event(self, routing_key: str, summary: str, source: str, custom_details: Dict = None) -> bool:
-        body = {
-            'routing_key': routing_key,
-            'payload': {
-                'summary': summary,
-                'source': source,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
-        }
-        if custom_details:
-            body['payload']['custom_details'] = custom_details
-        try:
-            resp = requests.post('https://events.pagerduty.com/v2/change/enqueue', json=body, timeout=10)
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error creating change event: {e}")
-            return False
-
-    def list_custom_fields(self) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/incidents/custom_fields', headers=self.headers, timeout=10)
-            if resp.ok:
-                return resp.json().get('fields', [])
-        except Exception as e:
-            logger.error(f"Error listing custom fields: {e}")
-        return []
-
-    def update_incident_custom_fields(self, incident_id: str, user_email: str, custom_fields: List[Dict]) -> bool:
-        try:
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json={'incident': {'type': 'incident_reference', 'custom_fields': custom_fields}},
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error updating custom fields: {e}")
-            return False
-
-    def list_automation_actions(self, limit: int = 100) -> List[Dict]:
-        try:
-            resp = requests.get(f'{PAGERDUTY_API_URL}/automation_actions/actions', headers=self.headers, params={'limit': limit}, timeout=10)
-            if resp.ok:
-                return resp.json().get('actions', [])
-        except Exception as e:
-            logger.error(f"Error listing automation actions: {e}")
-        return []
-
-    def invoke_automation_action(self, action_id: str, incident_id: str = None) -> Optional[Dict]:
-        body = {}
-        if incident_id:
-            body = {'incident': {'id': incident_id, 'type': 'incident_reference'}}
-        try:
-            resp = requests.post(
-                f'{PAGERDUTY_API_URL}/automation_actions/actions/{action_id}/invocations',
-                headers=self.headers,
-                json=body,
-                timeout=10
-            )
-            if resp.ok:
-                return resp.json()
-        except Exception as e:
-            logger.error(f"Error invoking automation action: {e}")
-        return None
-
-    def get_current_oncall_user(self, escalation_policy_id: str) -> Optional[Dict]:
-        oncalls = self.get_oncalls(escalation_policy_ids=[escalation_policy_id])
-        for oncall in oncalls:
-            if oncall.get('escalation_level') == 1:
-                return oncall.get('user')
-        return None
-
-    def escalate_incident(self, incident_id: str, user_email: str, escalation_level: int = None) -> bool:
-        try:
-            body = {'incident': {'type': 'incident_reference', 'escalation_level': escalation_level or 2}}
-            resp = requests.put(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers={**self.headers, 'From': user_email},
-                json=body,
-                timeout=10
-            )
-            return resp.ok
-        except Exception as e:
-            logger.error(f"Error escalating incident: {e}")
-            return False
-
-
-class SlackClient:
-    def __init__(self, token: str = None):
-        self.token = token or os.environ.get('SLACK_BOT_TOKEN', '')
-        self.headers = {
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
-        }
-    
-    def post_message(self, channel_id: str, text: str, username: str = None) -> bool:
-        try:
-            body = {'channel': channel_id, 'text': text}
-            if username:
-                body['username'] = username
-            resp = requests.post('https://slack.com/api/chat.postMessage', headers=self.headers, json=body, timeout=10)
-            return resp.ok and resp.json().get('ok')
-        except Exception as e:
-            logger.error(f"Error posting message: {e}")
-            return False
-    
-    def invite_users_to_channel(self, channel_id: str, user_ids: List[str]) -> int:
-        success_count = 0
-        for user_id in user_ids:
-            if not user_id:
-                continue
-            try:
-                resp = requests.post(
-                    'https://slack.com/api/conversations.invite',
-                    headers=self.headers,
-                    json={'channel': channel_id, 'users': user_id},
-                    timeout=10
-                )
-                data = resp.json()
-                if data.get('ok'):
-                    logger.info(f"Invited user {user_id} to channel {channel_id}")
-                    success_count += 1
-                elif data.get('error') == 'already_in_channel':
-                    logger.info(f"User {user_id} already in channel {channel_id}")
-                    success_count += 1
-                elif data.get('error') == 'cant_invite_self':
-                    logger.info(f"Bot is {user_id}, skipping self-invite")
-                    success_count += 1
-                else:
-                    logger.warning(f"Failed to invite {user_id} to {channel_id}: {data.get('error')}")
-            except Exception as e:
-                logger.error(f"Error inviting user {user_id}: {e}")
-        logger.info(f"Invited {success_count}/{len(user_ids)} users to channel {channel_id}")
-        return success_count
-    
-    def find_channel_by_pattern(self, pattern: str) -> Optional[str]:
+    def find(self, run_id: str = None, scenario_id: str = None) -> List[Dict]:
+        filters = {k: v for k, v in (('run_id', run_id), ('scenario_id', scenario_id)) if v}
+        if not filters:
+            return []
         try:
-            resp = requests.get(
-                'https://slack.com/api/conversations.list',
-                headers=self.headers,
-                params={'types': 'public_channel,private_channel', 'limit': 200},
-                timeout=10
-            )
-            if resp.ok:
-                channels = resp.json().get('channels', [])
-                for ch in channels:
-                    if pattern.lower() in ch.get('name', '').lower():
-                        return ch['id']
+            return self.backend.scan(where=filters)
         except Exception as e:
-            logger.error(f"Error finding channel: {e}")
-        return None
+            logger.error(f"Error scanning demos for {filters}: {e}")
+            return []
 
 
 def determine_responder_count() -> int:
@@ -914,11 +182,13 @@ def determine_responder_count() -> int:
 
 
 def select_responders(primary_user_id: str, count: int) -> List[Dict]:
-    available = [u for u in DEMO_USERS if u['id'] != primary_user_id]
+    directory = demo_directory()
+    demo_users = directory.demo_users()
+    available = directory.others([primary_user_id], pool=demo_users)
     additional_count = min(count - 1, len(available))
     additional = random.sample(available, additional_count) if additional_count > 0 else []
-    primary = next((u for u in DEMO_USERS if u['id'] == primary_user_id), DEMO_USERS[0])
-    return [primary] + additional
+    primary = directory.by_id(primary_user_id) or demo_users[0]
+    return [u.to_dict() for u in [primary] + additional]
 
 
 def select_action() -> str:
@@ -932,15 +202,11 @@ def select_action() -> str:
     return 'add_note'
 
 
-def get_conversation_message(category: str) -> str:
-    messages = CONVERSATION_LIBRARY.get(category, CONVERSATION_LIBRARY['investigating'])
-    return random.choice(messages)
-
 
 def schedule_action(incident_id: str, action: str, delay_seconds: int, user_id: str = None):
     schedule_name = f"demo-{incident_id}-{action}-{int(datetime.now().timestamp())}"
     try:
-        scheduler.create_schedule(
+        aws_client('scheduler').create_schedule(
             Name=schedule_name,
             ScheduleExpression=f"at({(datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)).strftime('%Y-%m-%dT%H:%M:%S')})",
             FlexibleTimeWindow={'Mode': 'OFF'},
@@ -1056,6 +322,7 @@ def on_incident_triggered(incident_id: str, incident_data: Dict, state: DemoStat
     demo_data = {
         'state': 'triggered',
         'scenario_id': custom_details.get('scenario_id', 'unknown'),
+        'run_id': custom_details.get(RUN_ID_FIELD),
         'scenario_name': custom_details.get('scenario_name', incident_data.get('title', '')),
         'service_id': service.get('id', ''),
         'service_name': service.get('summary', ''),
@@ -1100,7 +367,7 @@ def on_incident_acknowledged(incident_id: str, incident_data: Dict, state: DemoS
         pd = PagerDutyClient()
         additional_ids = [r['id'] for r in responders[1:]]
         primary_email = responders[0]['email']
-        pd.add_responders(incident_id, primary_email, additional_ids, "Requesting additional support for this incident")
+        pd.add_responders(incident_id, additional_ids, primary_email, "Requesting additional support for this incident")
         logger.info(f"Added {len(additional_ids)} responders to {incident_id}")
 
     delay = random.randint(60, 180)
@@ -1135,8 +402,9 @@ def on_incident_escalated(incident_id: str, incident_data: Dict, state: DemoStat
     })
 
     if new_assignee_id:
-        new_responder = next((u for u in DEMO_USERS if u['id'] == new_assignee_id), None)
+        new_responder = demo_directory().by_id(new_assignee_id)
         if new_responder:
+            new_responder = new_responder.to_dict()
             responders = demo.get('responders', [])
             if new_responder not in responders:
                 responders.insert(0, new_responder)
@@ -1191,10 +459,10 @@ def on_incident_delegated(incident_id: str, incident_data: Dict, state: DemoStat
         new_assignee = assignments[0].get('assignee', {})
         new_id = new_assignee.get('id')
 
-        demo_user = next((u for u in DEMO_USERS if u['id'] == new_id), None)
+        demo_user = demo_directory().by_id(new_id)
         if demo_user:
             responders = demo.get('responders', [])
-            responders = [demo_user] + [r for r in responders if r['id'] != new_id]
+            responders = [demo_user.to_dict()] + [r for r in responders if r['id'] != new_id]
             state.update(incident_id, {'responders': responders})
 
             if demo.get('state') == 'triggered':
@@ -1285,11 +553,11 @@ def on_responder_added(incident_id: str, event_data: Dict, state: DemoState):
     if slack_channel:
         responder = event_data.get('data', {}).get('responder', {})
         responder_id = responder.get('id', '')
-        user = next((u for u in DEMO_USERS if u['id'] == responder_id), None)
+        user = demo_directory().by_id(responder_id)
         if user:
             slack = SlackClient()
             slack.invite_users_to_channel(slack_channel, [user['slack_id']])
-            slack.post_message(slack_channel, f"{user['name']} has joined to help with this incident.")
+            slack.post_message(f"{user['name']} has joined to help with this incident.", slack_channel)
 
 
 def on_workflow_completed(incident_id: str, event_data: Dict, state: DemoState):
@@ -1334,7 +602,7 @@ def invite_to_slack_channel(channel_id: str, demo: Dict, slack: SlackClient):
             user_ids.append(r['slack_id'])
 
     slack.invite_users_to_channel(channel_id, user_ids)
-    slack.post_message(channel_id, "Team assembled for incident response. Let's investigate.")
+    slack.post_message("Team assembled for incident response. Let's investigate.", channel_id)
     logger.info(f"Invited {len(user_ids)} users to channel {channel_id}")
 
 
@@ -1370,7 +638,7 @@ def on_incident_resolved(incident_id: str, state: DemoState):
     slack_channel = demo.get('slack_channel_id')
     if slack_channel:
         slack = SlackClient()
-        slack.post_message(slack_channel, get_conversation_message('resolved'))
+        slack.post_message(get_conversation_message('resolved'), slack_channel)
     
     state.update(incident_id, {'state': 'resolved'})
 
@@ -1408,7 +676,7 @@ def handle_scheduled_action(event: Dict) -> Dict:
     slack = SlackClient()
     slack_channel = demo.get('slack_channel_id')
     
-    user = next((u for u in DEMO_USERS if u['id'] == user_id), DEMO_USERS[0])
+    user = demo_directory().by_id(user_id) or demo_directory().demo_users()[0]
     user_email = user['email']
     
     if action == 'acknowledge':
@@ -1416,7 +684,7 @@ def handle_scheduled_action(event: Dict) -> Dict:
         if incident and incident.get('status') == 'triggered':
             pd.acknowledge_incident(incident_id, user_email)
             if slack_channel:
-                slack.post_message(slack_channel, f"{user['name']}: {get_conversation_message('investigating')}")
+                slack.post_message(f"{user['name']}: {get_conversation_message('investigating')}", slack_channel)
         else:
             logger.info(f"Incident {incident_id} not in triggered state, skipping ack")
 
@@ -1425,9 +693,9 @@ def handle_scheduled_action(event: Dict) -> Dict:
         if incident and incident.get('status') == 'triggered':
             pd.acknowledge_incident(incident_id, user_email)
             logger.info(f"Force acknowledged {incident_id} after max escalation attempts")
-            pd.add_note(incident_id, user_email, "[Auto-Response] Incident acknowledged after escalation timeout.")
+            pd.add_note(incident_id, "[Auto-Response] Incident acknowledged after escalation timeout.", user_email)
             if slack_channel:
-                slack.post_message(slack_channel, f"[System] Incident auto-acknowledged after escalation. {user['name']} is now responding.")
+                slack.post_message(f"[System] Incident auto-acknowledged after escalation. {user['name']} is now responding.", slack_channel)
 
     elif action == 'responder_action':
         action_type = select_action()
@@ -1439,7 +707,7 @@ def handle_scheduled_action(event: Dict) -> Dict:
         resolution = f"Issue resolved by {resolver['name']}. Root cause identified and addressed."
         pd.resolve_incident(incident_id, resolver['email'], resolution)
         if slack_channel:
-            slack.post_message(slack_channel, f"{resolver['name']}: {get_conversation_message('resolved')}")
+            slack.post_message(f"{resolver['name']}: {get_conversation_message('resolved')}", slack_channel)
         state.update(incident_id, {'state': 'resolved', 'resolver_id': resolver['id']})
 
     return {'statusCode': 200, 'body': json.dumps({'message': f'Executed {action}'})}
@@ -1451,35 +719,34 @@ def perform_responder_action(incident_id: str, user: Dict, action_type: str, pd:
     
     if action_type == 'add_note':
         content = get_conversation_message('found_issue')
-        pd.add_note(incident_id, user_email, content)
+        pd.add_note(incident_id, content, user_email)
         if slack_channel:
-            slack.post_message(slack_channel, f"{user['name']}: {content}")
+            slack.post_message(f"{user['name']}: {content}", slack_channel)
     
     elif action_type == 'status_update':
         message = get_conversation_message('working_fix')
-        pd.post_status_update(incident_id, user_email, message)
+        pd.post_status_update(incident_id, message, user_email)
         if slack_channel:
-            slack.post_message(slack_channel, f"{user['name']} posted status update: {message}")
+            slack.post_message(f"{user['name']} posted status update: {message}", slack_channel)
     
     elif action_type == 'add_responder':
         current_responders = demo.get('responders', [])
-        current_ids = [r['id'] for r in current_responders]
-        available = [u for u in DEMO_USERS if u['id'] not in current_ids]
+        available = demo_directory().others(current_responders, pool=demo_directory().demo_users())
         if available:
-            new_responder = random.choice(available)
-            pd.add_responders(incident_id, user_email, [new_responder['id']], "Need additional expertise")
+            new_responder = random.choice(available).to_dict()
+            pd.add_responders(incident_id, [new_responder['id']], user_email, "Need additional expertise")
             current_responders.append(new_responder)
             responder_actions = demo.get('responder_actions', {})
             responder_actions[new_responder['id']] = {'acted': False, 'action': None}
             state.update(incident_id, {'responders': current_responders, 'responder_actions': responder_actions})
             if slack_channel:
-                slack.post_message(slack_channel, f"{user['name']} is requesting help from {new_responder['name']}")
+                slack.post_message(f"{user['name']} is requesting help from {new_responder['name']}", slack_channel)
     
     else:
         content = get_conversation_message('investigating')
-        pd.add_note(incident_id, user_email, f"[{action_type}] {content}")
+        pd.add_note(incident_id, f"[{action_type}] {content}", user_email)
         if slack_channel:
-            slack.post_message(slack_channel, f"{user['name']}: {content}")
+            slack.post_message(f"{user['name']}: {content}", slack_channel)
     
     responder_actions = demo.get('responder_actions', {})
     if user['id'] in responder_actions:
@@ -1611,7 +878,7 @@ def trigger_newrelic(scenario: Dict) -> Dict:
 
 def trigger_cloudwatch(scenario: Dict) -> Dict:
     try:
-        cloudwatch = boto3.client('cloudwatch')
+        cloudwatch = aws_client('cloudwatch')
         metric_name = scenario.get('metric_name', 'DemoIncidentMetric')
         namespace = os.environ.get('CLOUDWATCH_NAMESPACE', 'PagerDutyDemo')
 
@@ -1641,7 +908,7 @@ def trigger_pagerduty_events(scenario: Dict) -> Dict:
     payload = {
         'routing_key': routing_key,
         'event_action': 'trigger',
-        'dedup_key': f"demo-{scenario.get('id', 'unknown')}-{int(datetime.now().timestamp())}",
+        'dedup_key': demo_dedup_key(scenario.get('id', 'unknown'), scenario.get('run_id')),
         'payload': {
             'summary': f"[DEMO] {scenario.get('title', 'Demo Incident')}",
             'severity': scenario.get('severity', 'error'),
@@ -1650,7 +917,8 @@ def trigger_pagerduty_events(scenario: Dict) -> Dict:
                 'scenario_id': scenario.get('id'),
                 'scenario_name': scenario.get('title'),
                 'description': scenario.get('description', ''),
-                'triggered_by': 'Demo Picker UI'
+                'triggered_by': 'Demo Picker UI',
+                RUN_ID_FIELD: scenario.get('run_id'),
             }
         }
     }
@@ -1679,7 +947,9 @@ def handle_trigger(body: Dict) -> Dict:
     if not scenario:
         return {'success': False, 'error': 'No scenario provided'}
 
-    result = {'integration': integration, 'fallback_used': False}
+    run_id = body.get('run_id') or new_run_id()
+    scenario = {**scenario, 'run_id': run_id}
+    result = {'integration': integration, 'fallback_used': False, 'run_id': run_id}
 
     if use_fallback:
         trigger_result = trigger_pagerduty_events(scenario)
@@ -1735,16 +1005,30 @@ def handle_api_request(event: Dict) -> Dict:
     pd = PagerDutyClient()
     
     if '/cleanup' in path and method == 'POST':
-        demos = pd.get_demo_incidents(['triggered', 'acknowledged'])
-        resolved = 0
-        for inc in demos:
-            if pd.resolve_incident(inc['id'], DEMO_USERS[0]['email'], 'Cleanup before new demo'):
-                state.delete(inc['id'])
-                resolved += 1
+        run_id = body.get('run_id')
+        scenario_id = body.get('scenario_id')
+        incident_ids = [inc['id'] for inc in find_scoped_incidents(pd, run_id, scenario_id)]
+        channel_ids = []
+        if run_id or scenario_id:
+            tracked = state.find(run_id, scenario_id)
+            incident_ids = list(dict.fromkeys(incident_ids + [d['incident_id'] for d in tracked if d.get('state') != 'resolved']))
+            channel_ids = [d['slack_channel_id'] for d in tracked if d.get('slack_channel_id')]
+        slack = SlackClient() if channel_ids and body.get('archive_channels', True) else None
+        result = teardown(pd, incident_ids, slack, channel_ids if slack else [], DEMO_USERS[0]['email'], 'Cleanup before new demo')
+        for incident_id in result['resolved']:
+            state.delete(incident_id)
+        resolved = len(result['resolved'])
         return {
             'statusCode': 200,
             'headers': cors_headers,
-            'body': json.dumps({'message': f'Resolved {resolved} demo incidents', 'resolved': resolved})
+            'body': json.dumps({
+                'message': f'Resolved {resolved} demo incidents',
+                'resolved': resolved,
+                'failed': len(result['failed']),
+                'channels_archived': len(result['channels_archived']),
+                'run_id': run_id,
+                'scenario_id': scenario_id,
+            })
         }
     
     elif '/pause' in path and method == 'POST':
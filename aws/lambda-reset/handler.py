@@ -3,7 +3,7 @@ import os
 import logging
 from datetime import datetime
 
-from shared import PagerDutyClient, SlackNotifier
+from shared import PagerDutyClient, SlackNotifier, find_scoped_incidents, teardown, Deadline, set_deadline
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,29 +15,26 @@ SLACK_CHANNEL = os.environ.get('SLACK_CHANNEL', 'C0A9GCXFSBD')
 ROUTING_KEY = os.environ.get('PAGERDUTY_ROUTING_KEY', '')
 
 
-def reset_quick(pd_client: PagerDutyClient) -> dict:
-    logger.info("Starting Quick Reset...")
+def reset_quick(pd_client: PagerDutyClient, run_id: str = None, scenario_id: str = None) -> dict:
+    logger.info(f"Starting Quick Reset (run_id={run_id}, scenario_id={scenario_id})...")
     results = {
         'mode': 'quick',
+        'run_id': run_id,
+        'scenario_id': scenario_id,
         'incidents_resolved': 0,
         'incidents_failed': 0,
         'incident_ids': []
     }
     
-    incidents = pd_client.get_demo_incidents()
+    incidents = find_scoped_incidents(pd_client, run_id, scenario_id, use_mirror=True)
     logger.info(f"Found {len(incidents)} [DEMO] incidents to resolve")
     
-    for incident in incidents:
-        incident_id = incident['id']
-        response = pd_client.resolve_incident(incident_id, ADMIN_EMAIL)
-        
-        if response.get('success'):
-            results['incidents_resolved'] += 1
-            results['incident_ids'].append(incident_id)
-            logger.info(f"Resolved incident {incident_id}")
-        else:
-            results['incidents_failed'] += 1
-            logger.error(f"Failed to resolve incident {incident_id}: {response}")
+    teardown_result = teardown(pd_client, [i['id'] for i in incidents], user_email=ADMIN_EMAIL)
+    results['incidents_resolved'] = len(teardown_result['resolved'])
+    results['incidents_failed'] = len(teardown_result['failed'])
+    results['incident_ids'] = teardown_result['resolved']
+    for incident_id in teardown_result['failed']:
+        logger.error(f"Failed to resolve incident {incident_id}")
     
     return results
 
@@ -85,6 +82,7 @@ def reset_full(pd_client: PagerDutyClient, create_samples: bool = False) -> dict
 
 def lambda_handler(event, context):
     logger.info(f"Demo Reset Lambda invoked at {datetime.utcnow().isoformat()}")
+    set_deadline(Deadline.from_context(context))
     
     if not PAGERDUTY_TOKEN:
         return {
@@ -96,6 +94,8 @@ def lambda_handler(event, context):
     slack = SlackNotifier(SLACK_BOT_TOKEN, SLACK_CHANNEL)
     
     mode = event.get('mode', 'quick')
+    run_id = event.get('run_id')
+    scenario_id = event.get('scenario_id')
     create_samples = event.get('create_samples', False)
     notify_slack = event.get('notify_slack', True)
     
@@ -105,8 +105,9 @@ def lambda_handler(event, context):
         if create_samples:
             action_summary += f"\n- Sample incidents created: {results['samples_created']}"
     else:
-        results = reset_quick(pd_client)
-        action_summary = f"Quick Reset completed:\n- Resolved: {results['incidents_resolved']} [DEMO] incidents"
+        results = reset_quick(pd_client, run_id, scenario_id)
+        scope = f" (run {run_id})" if run_id else f" (scenario {scenario_id})" if scenario_id else ""
+        action_summary = f"Quick Reset completed{scope}:\n- Resolved: {results['incidents_resolved']} [DEMO] incidents"
     
     if notify_slack:
         slack_message = f"*Demo Reset ({mode.upper()})*\n{action_summary}"
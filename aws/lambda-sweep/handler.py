@@ -0,0 +1,41 @@
+import os
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Any
+
+from shared import PagerDutyClient, SlackClient, SweepContext, SweepStage, SweepRunner
+
+import lifecycle_stage
+import notifier_stage
+import user_activity_stage
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+NOTIFIER_BUDGET = float(os.environ.get('SWEEP_NOTIFIER_BUDGET', 15))
+LIFECYCLE_BUDGET = float(os.environ.get('SWEEP_LIFECYCLE_BUDGET', 60))
+USER_ACTIVITY_BUDGET = float(os.environ.get('SWEEP_USER_ACTIVITY_BUDGET', 25))
+
+
+def business_hours(now: datetime) -> bool:
+    return now.weekday() < 5 and 9 <= now.hour <= 17
+
+
+RUNNER = SweepRunner([
+    SweepStage('notifications', notifier_stage.notify_new_channels, NOTIFIER_BUDGET, every=2),
+    SweepStage('lifecycle', lifecycle_stage.process_incidents, LIFECYCLE_BUDGET, every=15),
+    SweepStage('user_activity', user_activity_stage.run_user_activity, USER_ACTIVITY_BUDGET, every=15,
+               window=business_hours),
+])
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    event = event or {}
+    ctx = SweepContext.for_invocation(PagerDutyClient(), SlackClient(), event, context)
+    report = RUNNER.run(ctx, only=event.get('stages'))
+    logger.info(f"Sweep ran {report['ran']} in {report['elapsed_seconds']}s, skipped {report['skipped']}")
+    return {
+        "statusCode": 200,
+        "body": json.dumps(report, default=str),
+    }
@@ -4,7 +4,7 @@ import random
 import logging
 from datetime import datetime
 
-from shared import PagerDutyClient, DEMO_USERS
+from shared import PagerDutyClient, DEMO_USERS, demo_directory, mirrored_incidents, SweepContext
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -84,10 +84,7 @@ DIAGNOSTIC_RESULTS = [
 
 
 def get_user_by_id(user_id: str) -> dict:
-    for user in DEMO_USERS:
-        if user['id'] == user_id:
-            return user
-    return None
+    return demo_directory().by_id(user_id)
 
 
 def perform_single_action(pd_client: PagerDutyClient, incident: dict, current_assignee: dict, action_type: str) -> dict:
@@ -123,8 +120,8 @@ def perform_single_action(pd_client: PagerDutyClient, incident: dict, current_as
         }
 
     elif action_type == 'reassign':
-        other_users = [u for u in DEMO_USERS if u['id'] != current_assignee['id']]
-        new_assignee = random.choice(other_users)
+        other_users = demo_directory().others([current_assignee])
+        new_assignee = random.choice(other_users).to_dict()
         response = pd_client.reassign_incident(incident_id, new_assignee['id'], current_assignee['email'])
         return {
             'action': 'reassign',
@@ -135,7 +132,7 @@ def perform_single_action(pd_client: PagerDutyClient, incident: dict, current_as
         }
 
     elif action_type == 'add_responders':
-        other_users = [u for u in DEMO_USERS if u['id'] != current_assignee['id']]
+        other_users = demo_directory().others([current_assignee])
         num_responders = random.randint(1, 2)
         responders = random.sample(other_users, min(num_responders, len(other_users)))
         responder_ids = [r['id'] for r in responders]
@@ -204,7 +201,7 @@ def perform_single_action(pd_client: PagerDutyClient, incident: dict, current_as
     return {'action': 'unknown', 'description': 'Unknown action type'}
 
 
-def simulate_user_activity(pd_client: PagerDutyClient) -> dict:
+def simulate_user_activity(pd_client: PagerDutyClient, incidents: list = None) -> dict:
     if random.random() < 0.15:
         idle_user = random.choice(DEMO_USERS)
         idle_reasons = [
@@ -222,7 +219,8 @@ def simulate_user_activity(pd_client: PagerDutyClient) -> dict:
             'description': f"{idle_user['name']} is {random.choice(idle_reasons)} - no action taken"
         }
 
-    incidents = pd_client.get_demo_incidents()
+    if incidents is None:
+        incidents = mirrored_incidents(pd_client, demo_only=True)
 
     if not incidents:
         return {'action': 'none', 'reason': 'No [DEMO] incidents found'}
@@ -315,6 +313,37 @@ def simulate_user_activity(pd_client: PagerDutyClient) -> dict:
     return result
 
 
+def run_user_activity(ctx: SweepContext) -> dict:
+    num_invocations = ctx.event.get('num_invocations', 1)
+    incidents = [i for i in ctx.snapshot.demo() if i['id'] not in ctx.resolved]
+    results = []
+
+    for _ in range(num_invocations):
+        if ctx.out_of_time():
+            logger.warning(f"Out of time after {len(results)}/{num_invocations} simulations")
+            break
+        result = simulate_user_activity(ctx.pd, incidents)
+        results.append(result)
+        if any(a.get('action') == 'resolve' for a in result.get('actions', [])):
+            ctx.resolved.add(result['incident_id'])
+            incidents = [i for i in incidents if i['id'] != result['incident_id']]
+        logger.info(f"Action result: {result.get('description', 'No action taken')}")
+
+    total_actions = sum(r.get('actions_performed', 0) for r in results)
+    idle_count = sum(1 for r in results if r.get('action') == 'idle')
+
+    return {
+        'message': 'User activity simulation complete',
+        'timestamp': datetime.utcnow().isoformat(),
+        'summary': {
+            'invocations': len(results),
+            'total_actions_performed': total_actions,
+            'idle_users': idle_count,
+        },
+        'results': results
+    }
+
+
 def lambda_handler(event, context):
     logger.info(f"User Activity Simulator invoked at {datetime.utcnow().isoformat()}")
 
@@ -324,29 +353,9 @@ def lambda_handler(event, context):
             'body': json.dumps({'error': 'PAGERDUTY_TOKEN not configured'})
         }
 
-    pd_client = PagerDutyClient(PAGERDUTY_TOKEN)
-
-    num_invocations = event.get('num_invocations', 1)
-    results = []
-
-    for _ in range(num_invocations):
-        result = simulate_user_activity(pd_client)
-        results.append(result)
-        logger.info(f"Action result: {result.get('description', 'No action taken')}")
-
-    total_actions = sum(r.get('actions_performed', 0) for r in results)
-    idle_count = sum(1 for r in results if r.get('action') == 'idle')
+    summary = run_user_activity(SweepContext.for_invocation(PagerDutyClient(PAGERDUTY_TOKEN), event=event, context=context))
 
     return {
         'statusCode': 200,
-        'body': json.dumps({
-            'message': 'User activity simulation complete',
-            'timestamp': datetime.utcnow().isoformat(),
-            'summary': {
-                'invocations': num_invocations,
-                'total_actions_performed': total_actions,
-                'idle_users': idle_count,
-            },
-            'results': results
-        })
+        'body': json.dumps(summary)
     }
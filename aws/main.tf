@@ -57,6 +57,24 @@ variable "demo_controller_action_delay" {
   description = "Delay in seconds between scenario phases when triggered by EventBridge"
 }
 
+variable "demo_controller_chatter_mode" {
+  type        = string
+  default     = "live"
+  description = "How the demo controller plays responder chatter: live (sleep between actions) or scheduled (chat.scheduleMessage + EventBridge Scheduler)"
+}
+
+variable "pagerduty_read_hedging" {
+  type        = bool
+  default     = false
+  description = "Hedge PagerDuty incident reads: send a second GET when the first is slower than the observed p95"
+}
+
+variable "sweep_enabled" {
+  type        = bool
+  default     = true
+  description = "Run lifecycle, user activity and channel notifications as stages of one scheduled sweep instead of three separately scheduled Lambdas"
+}
+
 variable "pagerduty_admin_token" {
   type      = string
   sensitive = true
@@ -135,6 +153,7 @@ locals {
   lifecycle_function_name = "demo-simulator-lifecycle"
   metrics_function_name   = "demo-simulator-metrics"
   notifier_function_name  = "demo-simulator-notifier"
+  sweep_function_name     = "demo-simulator-sweep"
   tags = {
     Project     = "pagerduty-demo"
     Environment = "demo"
@@ -166,6 +185,19 @@ data "archive_file" "lifecycle_zip" {
   output_path = "${path.module}/lambda-lifecycle.zip"
 }
 
+data "archive_file" "shared_layer_zip" {
+  type        = "zip"
+  source_dir  = "${path.module}/build/shared-layer"
+  output_path = "${path.module}/shared-layer.zip"
+}
+
+resource "aws_lambda_layer_version" "shared_runtime" {
+  layer_name          = "demo-simulator-shared-runtime"
+  filename            = data.archive_file.shared_layer_zip.output_path
+  source_code_hash    = data.archive_file.shared_layer_zip.output_base64sha256
+  compatible_runtimes = ["python3.11"]
+}
+
 resource "aws_iam_role" "lambda_role" {
   name = "${local.function_name}-role"
 
@@ -206,6 +238,44 @@ resource "aws_iam_role_policy" "lambda_policy" {
           "ssm:PutParameter"
         ]
         Resource = "arn:aws:ssm:*:*:parameter/demo-simulator/*"
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:GetItem",
+          "dynamodb:UpdateItem",
+          "dynamodb:Scan",
+          "dynamodb:Query"
+        ]
+        Resource = [
+          aws_dynamodb_table.demo_sessions.arn,
+          "${aws_dynamodb_table.demo_sessions.arn}/index/*"
+        ]
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "dynamodb:GetItem",
+          "dynamodb:Query"
+        ]
+        Resource = [
+          aws_dynamodb_table.incident_mirror.arn,
+          "${aws_dynamodb_table.incident_mirror.arn}/index/*"
+        ]
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "scheduler:CreateSchedule"
+        ]
+        Resource = "arn:aws:scheduler:*:*:schedule/default/demo-ctl-*"
+      },
+      {
+        Effect = "Allow"
+        Action = [
+          "iam:PassRole"
+        ]
+        Resource = aws_iam_role.scheduler_role.arn
       }
     ]
   })
@@ -216,6 +286,7 @@ resource "aws_lambda_function" "orchestrator" {
   role          = aws_iam_role.lambda_role.arn
   handler       = "handler.lambda_handler"
   runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
   timeout       = 30
   memory_size   = 256
 
@@ -241,6 +312,7 @@ resource "aws_lambda_function" "lifecycle" {
   role          = aws_iam_role.lambda_role.arn
   handler       = "handler.lambda_handler"
   runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
   timeout       = 60
   memory_size   = 256
 
@@ -253,6 +325,7 @@ resource "aws_lambda_function" "lifecycle" {
       PAGERDUTY_ADMIN_TOKEN          = var.pagerduty_admin_token
       SLACK_BOT_TOKEN                = var.slack_bot_token
       SLACK_CHANNEL_ACTIVE_INCIDENTS = var.slack_channel
+      INCIDENT_MIRROR_TABLE          = aws_dynamodb_table.incident_mirror.name
     }
   }
 
@@ -264,6 +337,7 @@ resource "aws_lambda_function" "metrics" {
   role          = aws_iam_role.lambda_role.arn
   handler       = "handler.lambda_handler"
   runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
   timeout       = 60
   memory_size   = 256
 
@@ -291,6 +365,7 @@ resource "aws_lambda_function" "notifier" {
   role          = aws_iam_role.lambda_role.arn
   handler       = "handler.lambda_handler"
   runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
   timeout       = 30
   memory_size   = 128
 
@@ -302,6 +377,7 @@ resource "aws_lambda_function" "notifier" {
       LOG_LEVEL             = "INFO"
       PAGERDUTY_ADMIN_TOKEN = var.pagerduty_admin_token
       SLACK_BOT_TOKEN       = var.slack_bot_token
+      INCIDENT_MIRROR_TABLE = aws_dynamodb_table.incident_mirror.name
     }
   }
 
@@ -379,6 +455,7 @@ resource "aws_cloudwatch_event_target" "lambda" {
 }
 
 resource "aws_cloudwatch_event_target" "lifecycle" {
+  count     = var.sweep_enabled ? 0 : 1
   rule      = aws_cloudwatch_event_rule.lifecycle_schedule.name
   target_id = "lifecycle"
   arn       = aws_lambda_function.lifecycle.arn
@@ -395,6 +472,7 @@ resource "aws_cloudwatch_event_target" "metrics" {
 }
 
 resource "aws_cloudwatch_event_target" "notifier" {
+  count     = var.sweep_enabled ? 0 : 1
   rule      = aws_cloudwatch_event_rule.notifier_schedule.name
   target_id = "notifier"
   arn       = aws_lambda_function.notifier.arn
@@ -488,6 +566,7 @@ resource "aws_lambda_function" "user_activity" {
   role          = aws_iam_role.lambda_role.arn
   handler       = "handler.lambda_handler"
   runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
   timeout       = 30
   memory_size   = 128
 
@@ -496,10 +575,11 @@ resource "aws_lambda_function" "user_activity" {
 
   environment {
     variables = {
-      LOG_LEVEL       = "INFO"
-      PAGERDUTY_TOKEN = var.pagerduty_admin_token
-      SLACK_BOT_TOKEN = var.slack_bot_token
-      SLACK_CHANNEL   = var.slack_channel
+      LOG_LEVEL             = "INFO"
+      PAGERDUTY_TOKEN       = var.pagerduty_admin_token
+      SLACK_BOT_TOKEN       = var.slack_bot_token
+      SLACK_CHANNEL         = var.slack_channel
+      INCIDENT_MIRROR_TABLE = aws_dynamodb_table.incident_mirror.name
     }
   }
 
@@ -511,6 +591,7 @@ resource "aws_lambda_function" "health_check" {
   role          = aws_iam_role.lambda_role.arn
   handler       = "handler.lambda_handler"
   runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
   timeout       = 60
   memory_size   = 128
 
@@ -542,6 +623,7 @@ resource "aws_lambda_function" "reset" {
   role          = aws_iam_role.lambda_role.arn
   handler       = "handler.lambda_handler"
   runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
   timeout       = 120
   memory_size   = 256
 
@@ -556,6 +638,7 @@ resource "aws_lambda_function" "reset" {
       SLACK_BOT_TOKEN       = var.slack_bot_token
       SLACK_CHANNEL         = var.slack_channel
       PAGERDUTY_ROUTING_KEY = var.routing_key_k8s
+      INCIDENT_MIRROR_TABLE = aws_dynamodb_table.incident_mirror.name
     }
   }
 
@@ -580,6 +663,82 @@ resource "aws_cloudwatch_log_group" "reset_logs" {
   tags              = local.tags
 }
 
+resource "aws_dynamodb_table" "demo_sessions" {
+  name         = "demo-simulator-sessions"
+  billing_mode = "PAY_PER_REQUEST"
+  hash_key     = "session_id"
+
+  attribute {
+    name = "session_id"
+    type = "S"
+  }
+
+  attribute {
+    name = "state"
+    type = "S"
+  }
+
+  global_secondary_index {
+    name            = "status-index"
+    hash_key        = "state"
+    projection_type = "ALL"
+  }
+
+  ttl {
+    attribute_name = "ttl"
+    enabled        = true
+  }
+
+  tags = local.tags
+}
+
+resource "aws_dynamodb_table" "incident_mirror" {
+  name         = "demo-simulator-incident-mirror"
+  billing_mode = "PAY_PER_REQUEST"
+  hash_key     = "incident_id"
+
+  attribute {
+    name = "incident_id"
+    type = "S"
+  }
+
+  attribute {
+    name = "status"
+    type = "S"
+  }
+
+  attribute {
+    name = "demo_status"
+    type = "S"
+  }
+
+  attribute {
+    name = "created_at"
+    type = "S"
+  }
+
+  global_secondary_index {
+    name            = "status-index"
+    hash_key        = "status"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+
+  global_secondary_index {
+    name            = "demo-status-index"
+    hash_key        = "demo_status"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+
+  ttl {
+    attribute_name = "ttl"
+    enabled        = true
+  }
+
+  tags = local.tags
+}
+
 data "archive_file" "demo_controller_zip" {
   type        = "zip"
   source_dir  = "${path.module}/lambda-demo-controller"
@@ -591,6 +750,7 @@ resource "aws_lambda_function" "demo_controller" {
   role          = aws_iam_role.lambda_role.arn
   handler       = "handler.lambda_handler"
   runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
   timeout       = 900
   memory_size   = 512
 
@@ -613,6 +773,11 @@ resource "aws_lambda_function" "demo_controller" {
       ACTION_DELAY_MAX             = "60"
       SCENARIOS_FILE               = "/var/task/scenarios.json"
       SSM_RECENT_SCENARIOS_PARAM   = aws_ssm_parameter.recent_scenarios.name
+      DEMO_SESSIONS_TABLE          = aws_dynamodb_table.demo_sessions.name
+      DEMO_CHATTER_MODE            = var.demo_controller_chatter_mode
+      PD_HEDGE_ENABLED             = tostring(var.pagerduty_read_hedging)
+      SELF_LAMBDA_ARN              = "arn:aws:lambda:${data.aws_region.current.name}:${data.aws_caller_identity.current.account_id}:function:demo-simulator-controller"
+      SCHEDULER_ROLE_ARN           = aws_iam_role.scheduler_role.arn
     }
   }
 
@@ -679,6 +844,7 @@ resource "aws_cloudwatch_event_rule" "health_check_schedule" {
 }
 
 resource "aws_cloudwatch_event_target" "user_activity" {
+  count     = var.sweep_enabled ? 0 : 1
   rule      = aws_cloudwatch_event_rule.user_activity_schedule.name
   target_id = "user-activity"
   arn       = aws_lambda_function.user_activity.arn
@@ -714,6 +880,76 @@ resource "aws_lambda_permission" "health_check_eventbridge" {
   source_arn    = aws_cloudwatch_event_rule.health_check_schedule.arn
 }
 
+data "archive_file" "sweep_zip" {
+  type        = "zip"
+  source_dir  = "${path.module}/lambda-sweep"
+  output_path = "${path.module}/lambda-sweep.zip"
+}
+
+resource "aws_lambda_function" "sweep" {
+  function_name = local.sweep_function_name
+  role          = aws_iam_role.lambda_role.arn
+  handler       = "handler.lambda_handler"
+  runtime       = "python3.11"
+  layers        = [aws_lambda_layer_version.shared_runtime.arn]
+  timeout       = 120
+  memory_size   = 256
+
+  filename         = data.archive_file.sweep_zip.output_path
+  source_code_hash = data.archive_file.sweep_zip.output_base64sha256
+
+  environment {
+    variables = {
+      LOG_LEVEL                      = "INFO"
+      PAGERDUTY_ADMIN_TOKEN          = var.pagerduty_admin_token
+      SLACK_BOT_TOKEN                = var.slack_bot_token
+      SLACK_CHANNEL                  = var.slack_channel
+      SLACK_CHANNEL_ACTIVE_INCIDENTS = var.slack_channel
+      INCIDENT_MIRROR_TABLE          = aws_dynamodb_table.incident_mirror.name
+      SWEEP_TICK_MINUTES             = "2"
+      PD_HEDGE_ENABLED               = tostring(var.pagerduty_read_hedging)
+    }
+  }
+
+  tags = local.tags
+}
+
+resource "aws_cloudwatch_log_group" "sweep_logs" {
+  name              = "/aws/lambda/${local.sweep_function_name}"
+  retention_in_days = 7
+
+  tags = local.tags
+}
+
+resource "aws_cloudwatch_event_rule" "sweep_schedule" {
+  count               = var.sweep_enabled ? 1 : 0
+  name                = "${local.sweep_function_name}-schedule"
+  description         = "Run the lifecycle, user activity and notification sweep stages"
+  schedule_expression = "rate(2 minutes)"
+
+  tags = local.tags
+}
+
+resource "aws_cloudwatch_event_target" "sweep" {
+  count     = var.sweep_enabled ? 1 : 0
+  rule      = aws_cloudwatch_event_rule.sweep_schedule[0].name
+  target_id = "sweep"
+  arn       = aws_lambda_function.sweep.arn
+}
+
+resource "aws_lambda_permission" "sweep_eventbridge" {
+  count         = var.sweep_enabled ? 1 : 0
+  statement_id  = "AllowEventBridge"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.sweep.function_name
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.sweep_schedule[0].arn
+}
+
+output "sweep_function_arn" {
+  value = aws_lambda_function.sweep.arn
+}
+
 output "lambda_function_arn" {
   value = aws_lambda_function.orchestrator.arn
 }
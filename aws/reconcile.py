@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+REQUEST_TIMEOUT = (5, int(os.environ.get('SETUP_REQUEST_TIMEOUT', 30)))
+
+CREATE = 'create'
+UPDATE = 'update'
+NOOP = 'noop'
+UNMANAGED = 'unmanaged'
+
+SYMBOLS = {CREATE: '+', UPDATE: '~', NOOP: '=', UNMANAGED: '?'}
+
+
+class Change:
+    __slots__ = ('action', 'name', 'desired', 'existing', 'drift')
+
+    def __init__(self, action, name, desired=None, existing=None, drift=()):
+        self.action = action
+        self.name = name
+        self.desired = desired
+        self.existing = existing
+        self.drift = list(drift)
+
+    def __repr__(self):
+        return f"Change({self.action!r}, {self.name!r})"
+
+
+def _is_scalar(value):
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def drift(desired, existing, path=''):
+    if isinstance(desired, dict):
+        if not isinstance(existing, dict):
+            return [path or '.']
+        paths = []
+        for key, value in desired.items():
+            paths.extend(drift(value, existing.get(key), f'{path}.{key}' if path else key))
+        return paths
+    if isinstance(desired, (list, tuple)):
+        if not isinstance(existing, (list, tuple)) or len(desired) != len(existing):
+            return [path]
+        if all(_is_scalar(v) for v in desired) and all(_is_scalar(v) for v in existing):
+            return [] if sorted(map(str, desired)) == sorted(map(str, existing)) else [path]
+        paths = []
+        for i, (want, have) in enumerate(zip(desired, existing)):
+            paths.extend(drift(want, have, f'{path}[{i}]'))
+        return paths
+    if isinstance(desired, bool) or isinstance(existing, bool):
+        return [] if desired == existing else [path]
+    if isinstance(desired, (int, float)) and isinstance(existing, (int, float)):
+        return [] if float(desired) == float(existing) else [path]
+    return [] if desired == existing else [path]
+
+
+def plan(desired, existing):
+    changes = []
+    for name, spec in desired.items():
+        current = existing.get(name)
+        if current is None:
+            changes.append(Change(CREATE, name, spec))
+            continue
+        paths = drift(spec, current)
+        changes.append(Change(UPDATE if paths else NOOP, name, spec, current, paths))
+    for name, current in existing.items():
+        if name not in desired:
+            changes.append(Change(UNMANAGED, name, existing=current))
+    return changes
+
+
+def print_plan(label, changes):
+    counts = {action: sum(1 for c in changes if c.action == action) for action in SYMBOLS}
+    print(f"Plan for {label}: {counts[CREATE]} to create, {counts[UPDATE]} to update, "
+          f"{counts[NOOP]} unchanged, {counts[UNMANAGED]} not managed (left in place)", flush=True)
+    for c in changes:
+        detail = f" ({', '.join(c.drift[:5])}{', ...' if len(c.drift) > 5 else ''})" if c.drift else ''
+        print(f"  {SYMBOLS[c.action]} {c.name}{detail}", flush=True)
+
+
+def apply(changes, create, update, max_workers=4):
+    pending = [c for c in changes if c.action in (CREATE, UPDATE)]
+    if not pending:
+        return []
+
+    def run(change):
+        try:
+            if change.action == CREATE:
+                return change, create(change.name, change.desired)
+            return change, update(change.name, change.desired, change.existing)
+        except Exception as e:
+            print(f"  {change.action} '{change.name}' failed: {e}", flush=True)
+            return change, {'error': str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as pool:
+        return list(pool.map(run, pending))
+
+
+def reconcile(label, desired, existing, create, update, max_workers=4, dry_run=False):
+    changes = plan(desired, existing)
+    print_plan(label, changes)
+    if dry_run:
+        return []
+    return apply(changes, create, update, max_workers)
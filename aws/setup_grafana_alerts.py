@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 import os
 import json
+import argparse
 import requests
 
+from reconcile import REQUEST_TIMEOUT, drift, reconcile
+
 GRAFANA_URL = os.environ.get('GRAFANA_URL', 'https://conalllynch88.grafana.net')
 GRAFANA_API_KEY = os.environ.get('GRAFANA_API_KEY')
 PAGERDUTY_CONTACT_POINT_UID = os.environ.get('PAGERDUTY_CONTACT_POINT_UID', 'cfbcjz992b474a')
+MAX_WORKERS = int(os.environ.get('GRAFANA_MAX_WORKERS', 1))
+RULE_GROUP = 'demo-alerts'
 
 if not GRAFANA_API_KEY:
     raise ValueError("GRAFANA_API_KEY environment variable required")
@@ -16,23 +21,32 @@ headers = {
 }
 
 def get_folders():
-    response = requests.get(f'{GRAFANA_URL}/api/folders', headers=headers)
+    response = requests.get(f'{GRAFANA_URL}/api/folders', headers=headers, timeout=REQUEST_TIMEOUT)
     return response.json()
 
 def create_folder(title, uid):
     response = requests.post(
         f'{GRAFANA_URL}/api/folders',
         headers=headers,
-        json={'title': title, 'uid': uid}
+        json={'title': title, 'uid': uid},
+        timeout=REQUEST_TIMEOUT
     )
     print(f"Create folder '{title}': {response.status_code}")
     return response.json() if response.ok else None
 
 def get_datasources():
-    response = requests.get(f'{GRAFANA_URL}/api/datasources', headers=headers)
+    response = requests.get(f'{GRAFANA_URL}/api/datasources', headers=headers, timeout=REQUEST_TIMEOUT)
     return response.json()
 
-def update_notification_policy():
+def get_notification_policy():
+    response = requests.get(f'{GRAFANA_URL}/api/v1/provisioning/policies', headers=headers, timeout=REQUEST_TIMEOUT)
+    return response.json() if response.ok else {}
+
+def get_alert_rules():
+    response = requests.get(f'{GRAFANA_URL}/api/v1/provisioning/alert-rules', headers=headers, timeout=REQUEST_TIMEOUT)
+    return response.json() if response.ok else []
+
+def update_notification_policy(dry_run=False):
     policy = {
         "receiver": "PagerDuty",
         "group_by": ["grafana_folder", "alertname"],
@@ -44,20 +58,28 @@ def update_notification_policy():
             }
         ]
     }
+    changed = drift(policy, get_notification_policy())
+    if not changed:
+        print("Notification policy unchanged")
+        return True
+    print(f"Notification policy drift: {', '.join(changed)}")
+    if dry_run:
+        return True
     response = requests.put(
         f'{GRAFANA_URL}/api/v1/provisioning/policies',
         headers=headers,
-        json=policy
+        json=policy,
+        timeout=REQUEST_TIMEOUT
     )
     print(f"Update notification policy: {response.status_code}")
     if not response.ok:
         print(f"  Error: {response.text}")
     return response.ok
 
-def create_alert_rule(folder_uid, title, condition_query, threshold):
-    rule = {
+def alert_rule(folder_uid, title, condition_query, threshold):
+    return {
         "title": title,
-        "ruleGroup": "demo-alerts",
+        "ruleGroup": RULE_GROUP,
         "folderUID": folder_uid,
         "noDataState": "OK",
         "execErrState": "Error",
@@ -102,18 +124,36 @@ def create_alert_rule(folder_uid, title, condition_query, threshold):
             }
         ]
     }
-    
+
+def create_alert_rule(rule):
     response = requests.post(
         f'{GRAFANA_URL}/api/v1/provisioning/alert-rules',
         headers={**headers, 'X-Disable-Provenance': 'true'},
-        json=rule
+        json=rule,
+        timeout=REQUEST_TIMEOUT
+    )
+    print(f"Create alert rule '{rule['title']}': {response.status_code}")
+    if not response.ok:
+        print(f"  Error: {response.text}")
+    return response.ok
+
+def update_alert_rule(uid, rule):
+    response = requests.put(
+        f'{GRAFANA_URL}/api/v1/provisioning/alert-rules/{uid}',
+        headers={**headers, 'X-Disable-Provenance': 'true'},
+        json={**rule, 'uid': uid},
+        timeout=REQUEST_TIMEOUT
     )
-    print(f"Create alert rule '{title}': {response.status_code}")
+    print(f"Update alert rule '{rule['title']}': {response.status_code}")
     if not response.ok:
         print(f"  Error: {response.text}")
     return response.ok
 
 def main():
+    parser = argparse.ArgumentParser(description="Reconcile Grafana Cloud alert rules routed to PagerDuty")
+    parser.add_argument('--dry-run', action='store_true', help="Print the plan without applying changes")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Setting up Grafana Cloud Alerts -> PagerDuty")
     print("=" * 60)
@@ -127,7 +167,10 @@ def main():
             print(f"Found existing folder: {f['title']} (uid: {f['uid']})")
             break
     
-    if not demo_folder:
+    if not demo_folder and args.dry_run:
+        print("Would create Demo Alerts folder")
+        demo_folder = {'uid': 'demo-alerts'}
+    elif not demo_folder:
         print("Creating Demo Alerts folder...")
         demo_folder = create_folder('Demo Alerts', 'demo-alerts')
     
@@ -138,7 +181,7 @@ def main():
     folder_uid = demo_folder.get('uid', 'demo-alerts')
     
     print("\n--- Step 2: Update Notification Policy ---")
-    update_notification_policy()
+    update_notification_policy(dry_run=args.dry_run)
     
     print("\n--- Step 3: Check Datasources ---")
     datasources = get_datasources()
@@ -146,15 +189,24 @@ def main():
     for ds in datasources:
         print(f"  - {ds.get('name')} ({ds.get('type')})")
     
-    print("\n--- Step 4: Create Demo Alert Rules ---")
+    print("\n--- Step 4: Reconcile Demo Alert Rules ---")
     alerts = [
         ("[DEMO] API Response Time High", "api.response_time", 500),
         ("[DEMO] Error Rate Critical", "api.error_rate", 5),
         ("[DEMO] Database Connections Exhausted", "database.connections", 90),
     ]
 
-    for title, metric, threshold in alerts:
-        create_alert_rule(folder_uid, title, metric, threshold)
+    desired = {title: alert_rule(folder_uid, title, metric, threshold) for title, metric, threshold in alerts}
+    existing = {
+        rule['title']: rule for rule in get_alert_rules()
+        if rule.get('folderUID') == folder_uid and rule.get('ruleGroup') == RULE_GROUP
+    }
+    reconcile(
+        "Grafana alert rules", desired, existing,
+        create=lambda title, rule: create_alert_rule(rule),
+        update=lambda title, rule, current: update_alert_rule(current['uid'], rule),
+        max_workers=MAX_WORKERS, dry_run=args.dry_run,
+    )
     
     print("\n" + "=" * 60)
     print("Grafana alerting setup complete!")
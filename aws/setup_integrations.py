@@ -7,9 +7,12 @@ This creates monitors/alerts that trigger PagerDuty when metrics exceed threshol
 import os
 import sys
 import json
+import argparse
 import requests
 from typing import Optional
 
+from reconcile import REQUEST_TIMEOUT, reconcile
+
 DATADOG_API_KEY = os.environ.get("DATADOG_API_KEY")
 DATADOG_APP_KEY = os.environ.get("DATADOG_APP_KEY")
 DATADOG_SITE = os.environ.get("DATADOG_SITE", "us5.datadoghq.com")
@@ -19,6 +22,15 @@ NEWRELIC_ACCOUNT_ID = os.environ.get("NEWRELIC_ACCOUNT_ID")
 
 PAGERDUTY_ROUTING_KEY = os.environ.get("PAGERDUTY_ROUTING_KEY")
 
+DATADOG_MAX_WORKERS = int(os.environ.get("DATADOG_MAX_WORKERS", 4))
+NEWRELIC_MAX_WORKERS = int(os.environ.get("NEWRELIC_MAX_WORKERS", 4))
+NEWRELIC_POLICY_NAME = "[DEMO] Demo Simulator Alerts"
+NEWRELIC_DESTINATION_NAME = "Demo Simulator PagerDuty"
+NEWRELIC_CHANNEL_NAME = "Demo Simulator Alerts"
+DATADOG_PD_SERVICE_NAME = "demo-simulator-alerts"
+DATADOG_PD_SUBDOMAIN = "demo-simulator"
+DATADOG_MONITOR_TYPE_ALIASES = {"query alert": "metric alert"}
+
 
 class DatadogSetup:
     def __init__(self, api_key: str, app_key: str, site: str):
@@ -31,24 +43,50 @@ class DatadogSetup:
             "Content-Type": "application/json"
         }
     
+    def get_pagerduty_integration(self) -> Optional[dict]:
+        url = f"{self.base_url}/api/v1/integration/pagerduty"
+        resp = requests.get(url, headers=self.headers, timeout=REQUEST_TIMEOUT)
+        if resp.status_code == 404:
+            return None
+        if not resp.ok:
+            print(f"  Error reading PagerDuty integration: {resp.status_code} {resp.text}")
+            return None
+        current = resp.json()
+        return {
+            "subdomain": current.get("subdomain"),
+            "services": [{"service_name": svc.get("service_name")} for svc in current.get("services", [])
+                         if svc.get("service_name") == DATADOG_PD_SERVICE_NAME],
+        }
+
     def create_pagerduty_integration(self, routing_key: str) -> dict:
         url = f"{self.base_url}/api/v1/integration/pagerduty"
         payload = {
             "services": [
                 {
-                    "service_name": "demo-simulator-alerts",
+                    "service_name": DATADOG_PD_SERVICE_NAME,
                     "service_key": routing_key
                 }
             ],
-            "subdomain": "demo-simulator"
+            "subdomain": DATADOG_PD_SUBDOMAIN
         }
-        resp = requests.put(url, headers=self.headers, json=payload)
+        resp = requests.put(url, headers=self.headers, json=payload, timeout=REQUEST_TIMEOUT)
         print(f"Datadog PagerDuty integration: {resp.status_code}")
         return resp.json() if resp.status_code == 200 else {"error": resp.text}
+
+    def setup_pagerduty_integration(self, routing_key: str, dry_run: bool = False):
+        name = "PagerDuty integration"
+        desired = {name: {"subdomain": DATADOG_PD_SUBDOMAIN, "services": [{"service_name": DATADOG_PD_SERVICE_NAME}]}}
+        current = self.get_pagerduty_integration()
+        results = reconcile(
+            "Datadog PagerDuty integration", desired, {name: current} if current else {},
+            create=lambda name, payload: self.create_pagerduty_integration(routing_key),
+            update=lambda name, payload, current: self.create_pagerduty_integration(routing_key),
+            max_workers=1, dry_run=dry_run,
+        )
+        return [result for _, result in results]
     
-    def create_monitor(self, name: str, query: str, message: str, thresholds: dict) -> dict:
-        url = f"{self.base_url}/api/v1/monitor"
-        payload = {
+    def monitor_payload(self, name: str, query: str, message: str, thresholds: dict) -> dict:
+        return {
             "name": f"[DEMO] {name}",
             "type": "metric alert",
             "query": query,
@@ -65,35 +103,21 @@ class DatadogSetup:
                 "evaluation_delay": 0
             }
         }
-        resp = requests.post(url, headers=self.headers, json=payload)
-        print(f"Datadog monitor '{name}': {resp.status_code}")
+
+    def create_monitor(self, payload: dict) -> dict:
+        url = f"{self.base_url}/api/v1/monitor"
+        resp = requests.post(url, headers=self.headers, json=payload, timeout=REQUEST_TIMEOUT)
+        print(f"Datadog monitor '{payload['name']}': {resp.status_code}")
         if resp.status_code in [200, 201]:
             return resp.json()
         else:
             print(f"  Error: {resp.text}")
             return {"error": resp.text}
 
-    def update_monitor(self, monitor_id: int, name: str, query: str, message: str, thresholds: dict) -> dict:
+    def update_monitor(self, monitor_id: int, payload: dict) -> dict:
         url = f"{self.base_url}/api/v1/monitor/{monitor_id}"
-        payload = {
-            "name": f"[DEMO] {name}",
-            "type": "metric alert",
-            "query": query,
-            "message": message,
-            "tags": ["demo:true", "env:demo-simulator"],
-            "priority": 3,
-            "options": {
-                "thresholds": thresholds,
-                "notify_no_data": False,
-                "renotify_interval": 0,
-                "include_tags": True,
-                "notify_audit": False,
-                "new_host_delay": 0,
-                "evaluation_delay": 0
-            }
-        }
-        resp = requests.put(url, headers=self.headers, json=payload)
-        print(f"Datadog monitor '{name}' update: {resp.status_code}")
+        resp = requests.put(url, headers=self.headers, json=payload, timeout=REQUEST_TIMEOUT)
+        print(f"Datadog monitor '{payload['name']}' update: {resp.status_code}")
         if resp.status_code == 200:
             return resp.json()
         else:
@@ -102,13 +126,16 @@ class DatadogSetup:
 
     def get_existing_monitors(self) -> dict:
         url = f"{self.base_url}/api/v1/monitor"
-        resp = requests.get(url, headers=self.headers)
+        resp = requests.get(url, headers=self.headers, params={"name": "[DEMO]"}, timeout=REQUEST_TIMEOUT)
         if resp.ok:
             monitors = resp.json()
-            return {m['name']: m['id'] for m in monitors if '[DEMO]' in m.get('name', '')}
+            for m in monitors:
+                m['type'] = DATADOG_MONITOR_TYPE_ALIASES.get(m.get('type'), m.get('type'))
+            return {m['name']: m for m in monitors if '[DEMO]' in m.get('name', '')}
+        print(f"  Error listing monitors: {resp.status_code} {resp.text}")
         return {}
 
-    def setup_monitors(self):
+    def setup_monitors(self, dry_run: bool = False):
         existing = self.get_existing_monitors()
         print(f"Found {len(existing)} existing DEMO monitors")
 
@@ -145,15 +172,17 @@ class DatadogSetup:
             }
         ]
 
-        results = []
+        desired = {}
         for m in monitors:
-            full_name = f"[DEMO] {m['name']}"
-            if full_name in existing:
-                result = self.update_monitor(existing[full_name], m["name"], m["query"], m["message"], m["thresholds"])
-            else:
-                result = self.create_monitor(m["name"], m["query"], m["message"], m["thresholds"])
-            results.append(result)
-        return results
+            payload = self.monitor_payload(m["name"], m["query"], m["message"], m["thresholds"])
+            desired[payload["name"]] = payload
+        results = reconcile(
+            "Datadog monitors", desired, existing,
+            create=lambda name, payload: self.create_monitor(payload),
+            update=lambda name, payload, current: self.update_monitor(current["id"], payload),
+            max_workers=DATADOG_MAX_WORKERS, dry_run=dry_run,
+        )
+        return [result for _, result in results]
 
 
 class NewRelicSetup:
@@ -170,7 +199,7 @@ class NewRelicSetup:
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
-        resp = requests.post(self.graphql_url, headers=self.headers, json=payload)
+        resp = requests.post(self.graphql_url, headers=self.headers, json=payload, timeout=REQUEST_TIMEOUT)
         return resp.json()
     
     def create_alert_policy(self, name: str) -> Optional[int]:
@@ -193,7 +222,87 @@ class NewRelicSetup:
             return result["data"]["alertsPolicyCreate"]["id"]
         return None
 
-    def create_nrql_condition(self, policy_id: int, name: str, nrql: str, threshold: float) -> dict:
+    def find_alert_policy(self, name: str) -> Optional[str]:
+        query = """
+        query($accountId: Int!, $name: String!) {
+            actor {
+                account(id: $accountId) {
+                    alerts {
+                        policiesSearch(searchCriteria: {name: $name}) {
+                            policies {
+                                id
+                                name
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+        result = self.graphql_query(query, {"accountId": int(self.account_id), "name": name})
+        account = ((result.get("data") or {}).get("actor") or {}).get("account") or {}
+        policies = ((account.get("alerts") or {}).get("policiesSearch") or {}).get("policies") or []
+        for policy in policies:
+            if policy.get("name") == name:
+                return policy["id"]
+        return None
+
+    def get_nrql_conditions(self, policy_id: str) -> dict:
+        query = """
+        query($accountId: Int!, $policyId: ID!, $cursor: String) {
+            actor {
+                account(id: $accountId) {
+                    alerts {
+                        nrqlConditionsSearch(searchCriteria: {policyId: $policyId}, cursor: $cursor) {
+                            nextCursor
+                            nrqlConditions {
+                                id
+                                name
+                                enabled
+                                nrql { query }
+                                signal { aggregationWindow aggregationMethod aggregationDelay }
+                                terms { threshold thresholdOccurrences thresholdDuration operator priority }
+                                violationTimeLimitSeconds
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+        conditions = {}
+        cursor = None
+        while True:
+            result = self.graphql_query(query, {"accountId": int(self.account_id), "policyId": str(policy_id), "cursor": cursor})
+            account = ((result.get("data") or {}).get("actor") or {}).get("account") or {}
+            page = (account.get("alerts") or {}).get("nrqlConditionsSearch") or {}
+            for condition in page.get("nrqlConditions") or []:
+                conditions[condition["name"]] = condition
+            cursor = page.get("nextCursor")
+            if not cursor:
+                return conditions
+
+    def nrql_condition(self, name: str, nrql: str, threshold: float) -> dict:
+        return {
+            "name": f"[DEMO] {name}",
+            "enabled": True,
+            "nrql": {"query": nrql},
+            "signal": {
+                "aggregationWindow": 60,
+                "aggregationMethod": "EVENT_FLOW",
+                "aggregationDelay": 120
+            },
+            "terms": [{
+                "threshold": threshold,
+                "thresholdOccurrences": "AT_LEAST_ONCE",
+                "thresholdDuration": 300,
+                "operator": "ABOVE",
+                "priority": "CRITICAL"
+            }],
+            "violationTimeLimitSeconds": 86400
+        }
+
+    def create_nrql_condition(self, policy_id: int, condition: dict) -> dict:
         query = """
         mutation($accountId: Int!, $policyId: ID!, $condition: AlertsNrqlConditionStaticInput!) {
             alertsNrqlConditionStaticCreate(
@@ -209,29 +318,59 @@ class NewRelicSetup:
         variables = {
             "accountId": int(self.account_id),
             "policyId": str(policy_id),
-            "condition": {
-                "name": f"[DEMO] {name}",
-                "enabled": True,
-                "nrql": {"query": nrql},
-                "signal": {
-                    "aggregationWindow": 60,
-                    "aggregationMethod": "EVENT_FLOW",
-                    "aggregationDelay": 120
-                },
-                "terms": [{
-                    "threshold": threshold,
-                    "thresholdOccurrences": "AT_LEAST_ONCE",
-                    "thresholdDuration": 300,
-                    "operator": "ABOVE",
-                    "priority": "CRITICAL"
-                }],
-                "violationTimeLimitSeconds": 86400
+            "condition": condition
+        }
+        result = self.graphql_query(query, variables)
+        print(f"New Relic condition '{condition['name']}': {json.dumps(result, indent=2)}")
+        return result
+
+    def update_nrql_condition(self, condition_id: str, condition: dict) -> dict:
+        query = """
+        mutation($accountId: Int!, $id: ID!, $condition: AlertsNrqlConditionUpdateStaticInput!) {
+            alertsNrqlConditionStaticUpdate(
+                accountId: $accountId,
+                id: $id,
+                condition: $condition
+            ) {
+                id
+                name
             }
         }
+        """
+        variables = {
+            "accountId": int(self.account_id),
+            "id": str(condition_id),
+            "condition": condition
+        }
         result = self.graphql_query(query, variables)
-        print(f"New Relic condition '{name}': {json.dumps(result, indent=2)}")
+        print(f"New Relic condition '{condition['name']}' update: {json.dumps(result, indent=2)}")
         return result
-    
+
+    def find_notification_target(self, kind: str, name: str) -> Optional[dict]:
+        query = """
+        query($accountId: Int!, $name: String!) {
+            actor {
+                account(id: $accountId) {
+                    aiNotifications {
+                        destinations(filters: {name: $name}) {
+                            entities { id name type }
+                        }
+                        channels(filters: {name: $name}) {
+                            entities { id name type destinationId }
+                        }
+                    }
+                }
+            }
+        }
+        """
+        result = self.graphql_query(query, {"accountId": int(self.account_id), "name": name})
+        account = ((result.get("data") or {}).get("actor") or {}).get("account") or {}
+        entities = ((account.get("aiNotifications") or {}).get(kind) or {}).get("entities") or []
+        for entity in entities:
+            if entity.get("name") == name and entity.get("type") == "PAGERDUTY_SERVICE_INTEGRATION":
+                return entity
+        return None
+
     def create_pagerduty_destination(self, routing_key: str) -> Optional[str]:
         query = """
         mutation($accountId: Int!, $destination: AiNotificationsDestinationInput!) {
@@ -250,7 +389,7 @@ class NewRelicSetup:
             "accountId": int(self.account_id),
             "destination": {
                 "type": "PAGERDUTY_SERVICE_INTEGRATION",
-                "name": "Demo Simulator PagerDuty",
+                "name": NEWRELIC_DESTINATION_NAME,
                 "properties": [{
                     "key": "routingKey",
                     "value": routing_key
@@ -284,7 +423,7 @@ class NewRelicSetup:
             "accountId": int(self.account_id),
             "channel": {
                 "type": "PAGERDUTY_SERVICE_INTEGRATION",
-                "name": "Demo Simulator Alerts",
+                "name": NEWRELIC_CHANNEL_NAME,
                 "destinationId": destination_id,
                 "product": "IINT",
                 "properties": []
@@ -294,12 +433,18 @@ class NewRelicSetup:
         print(f"New Relic notification channel: {json.dumps(result, indent=2)}")
         return result
     
-    def setup_alerts(self, routing_key: str):
-        policy_id = self.create_alert_policy("[DEMO] Demo Simulator Alerts")
-        if not policy_id:
-            print("Failed to create alert policy")
-            return
-        
+    def setup_alerts(self, routing_key: str, dry_run: bool = False):
+        policy_id = self.find_alert_policy(NEWRELIC_POLICY_NAME)
+        if policy_id:
+            print(f"Found existing policy '{NEWRELIC_POLICY_NAME}' ({policy_id})")
+        elif dry_run:
+            print(f"Would create policy '{NEWRELIC_POLICY_NAME}'")
+        else:
+            policy_id = self.create_alert_policy(NEWRELIC_POLICY_NAME)
+            if not policy_id:
+                print("Failed to create alert policy")
+                return
+
         conditions = [
             {
                 "name": "API Response Time High",
@@ -322,16 +467,38 @@ class NewRelicSetup:
                 "threshold": 85
             }
         ]
-        
+
+        desired = {}
         for c in conditions:
-            self.create_nrql_condition(policy_id, c["name"], c["nrql"], c["threshold"])
-        
-        dest_id = self.create_pagerduty_destination(routing_key)
+            condition = self.nrql_condition(c["name"], c["nrql"], c["threshold"])
+            desired[condition["name"]] = condition
+        existing = self.get_nrql_conditions(policy_id) if policy_id else {}
+        reconcile(
+            "New Relic NRQL conditions", desired, existing,
+            create=lambda name, condition: self.create_nrql_condition(policy_id, condition),
+            update=lambda name, condition, current: self.update_nrql_condition(current["id"], condition),
+            max_workers=NEWRELIC_MAX_WORKERS, dry_run=dry_run,
+        )
+
+        destination = self.find_notification_target("destinations", NEWRELIC_DESTINATION_NAME)
+        channel = self.find_notification_target("channels", NEWRELIC_CHANNEL_NAME)
+        if channel:
+            print(f"Found existing notification channel '{channel['name']}' ({channel['id']})")
+            return
+        if dry_run:
+            print("Would create PagerDuty destination and notification channel"
+                  if not destination else "Would create notification channel")
+            return
+        dest_id = destination["id"] if destination else self.create_pagerduty_destination(routing_key)
         if dest_id:
             self.create_notification_channel(dest_id, policy_id)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Reconcile Datadog and New Relic alerting with PagerDuty")
+    parser.add_argument("--dry-run", action="store_true", help="Print the plan without applying changes")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Setting up Datadog and New Relic integrations with PagerDuty")
     print("=" * 60)
@@ -343,8 +510,8 @@ def main():
     else:
         print("\n--- Datadog Setup ---")
         dd = DatadogSetup(DATADOG_API_KEY, DATADOG_APP_KEY, DATADOG_SITE)
-        dd.create_pagerduty_integration(PAGERDUTY_ROUTING_KEY)
-        dd.setup_monitors()
+        dd.setup_pagerduty_integration(PAGERDUTY_ROUTING_KEY, dry_run=args.dry_run)
+        dd.setup_monitors(dry_run=args.dry_run)
     
     if not NEWRELIC_API_KEY:
         print("\nWARNING: NEWRELIC_API_KEY not set. Skipping New Relic setup.")
@@ -353,7 +520,7 @@ def main():
     else:
         print("\n--- New Relic Setup ---")
         nr = NewRelicSetup(NEWRELIC_API_KEY, NEWRELIC_ACCOUNT_ID)
-        nr.setup_alerts(PAGERDUTY_ROUTING_KEY)
+        nr.setup_alerts(PAGERDUTY_ROUTING_KEY, dry_run=args.dry_run)
     
     print("\n" + "=" * 60)
     print("Setup complete!")
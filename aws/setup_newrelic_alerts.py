@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 import os
 import json
+import argparse
 import requests
 
+from reconcile import REQUEST_TIMEOUT, reconcile
+
 NEW_RELIC_API_KEY = os.environ.get('NEW_RELIC_API_KEY')
 NEW_RELIC_ACCOUNT_ID = os.environ.get('NEW_RELIC_ACCOUNT_ID', '7637293')
 PAGERDUTY_ROUTING_KEY = os.environ.get('PAGERDUTY_ROUTING_KEY')
 GRAPHQL_ENDPOINT = 'https://api.newrelic.com/graphql'
+MAX_WORKERS = int(os.environ.get('NEW_RELIC_MAX_WORKERS', 4))
+WORKFLOW_NAME = 'Demo Alert -> PagerDuty'
 
 if not NEW_RELIC_API_KEY:
     raise ValueError("NEW_RELIC_API_KEY environment variable required")
@@ -22,7 +27,7 @@ def graphql_query(query, variables=None):
     payload = {'query': query}
     if variables:
         payload['variables'] = variables
-    response = requests.post(GRAPHQL_ENDPOINT, headers=headers, json=payload)
+    response = requests.post(GRAPHQL_ENDPOINT, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
     return response.json()
 
 def create_alert_policy():
@@ -142,14 +147,14 @@ def get_existing_workflows():
     }
     '''
     result = graphql_query(query, {'accountId': NEW_RELIC_ACCOUNT_ID})
-    print(f"Workflows: {json.dumps(result, indent=2)}")
-    return result
+    entities = result.get('data', {}).get('actor', {}).get('account', {}).get('aiWorkflows', {}).get('workflows', {}).get('entities', [])
+    return entities
 
 def create_workflow(channel_id, policy_id):
     query = '''
-    mutation($accountId: Int!, $channelId: ID!, $policyId: String!) {
+    mutation($accountId: Int!, $channelId: ID!, $policyId: String!, $name: String!) {
         aiWorkflowsCreateWorkflow(accountId: $accountId, createWorkflowData: {
-            name: "Demo Alert -> PagerDuty",
+            name: $name,
             workflowEnabled: true,
             destinationsEnabled: true,
             mutingRulesHandling: DONT_NOTIFY_FULLY_MUTED_ISSUES,
@@ -180,35 +185,39 @@ def create_workflow(channel_id, policy_id):
     result = graphql_query(query, {
         'accountId': NEW_RELIC_ACCOUNT_ID,
         'channelId': channel_id,
-        'policyId': str(policy_id)
+        'policyId': str(policy_id),
+        'name': WORKFLOW_NAME
     })
     print(f"Create workflow result: {json.dumps(result, indent=2)}")
     return result
 
-def create_nrql_condition(policy_id, name, nrql, threshold):
+def nrql_condition(name, nrql, threshold):
+    return {
+        'name': name,
+        'enabled': True,
+        'nrql': {'query': nrql},
+        'signal': {
+            'aggregationWindow': 60,
+            'aggregationMethod': 'EVENT_FLOW',
+            'aggregationDelay': 120
+        },
+        'terms': [{
+            'threshold': float(threshold),
+            'thresholdOccurrences': 'AT_LEAST_ONCE',
+            'thresholdDuration': 60,
+            'operator': 'ABOVE',
+            'priority': 'CRITICAL'
+        }],
+        'violationTimeLimitSeconds': 86400
+    }
+
+def create_nrql_condition(policy_id, condition):
     query = '''
-    mutation($accountId: Int!, $policyId: ID!, $name: String!, $nrql: String!, $threshold: Float!) {
+    mutation($accountId: Int!, $policyId: ID!, $condition: AlertsNrqlConditionStaticInput!) {
         alertsNrqlConditionStaticCreate(
             accountId: $accountId, 
             policyId: $policyId, 
-            condition: {
-                name: $name,
-                enabled: true,
-                nrql: { query: $nrql },
-                signal: {
-                    aggregationWindow: 60,
-                    aggregationMethod: EVENT_FLOW,
-                    aggregationDelay: 120
-                },
-                terms: [{
-                    threshold: $threshold,
-                    thresholdOccurrences: AT_LEAST_ONCE,
-                    thresholdDuration: 60,
-                    operator: ABOVE,
-                    priority: CRITICAL
-                }],
-                violationTimeLimitSeconds: 86400
-            }
+            condition: $condition
         ) {
             id
             name
@@ -218,13 +227,66 @@ def create_nrql_condition(policy_id, name, nrql, threshold):
     result = graphql_query(query, {
         'accountId': NEW_RELIC_ACCOUNT_ID,
         'policyId': str(policy_id),
-        'name': name,
-        'nrql': nrql,
-        'threshold': float(threshold)
+        'condition': condition
+    })
+    print(f"Create condition '{condition['name']}' result: {json.dumps(result, indent=2)}")
+    return result
+
+def update_nrql_condition(condition_id, condition):
+    query = '''
+    mutation($accountId: Int!, $id: ID!, $condition: AlertsNrqlConditionUpdateStaticInput!) {
+        alertsNrqlConditionStaticUpdate(
+            accountId: $accountId,
+            id: $id,
+            condition: $condition
+        ) {
+            id
+            name
+        }
+    }
+    '''
+    result = graphql_query(query, {
+        'accountId': NEW_RELIC_ACCOUNT_ID,
+        'id': str(condition_id),
+        'condition': condition
     })
-    print(f"Create condition '{name}' result: {json.dumps(result, indent=2)}")
+    print(f"Update condition '{condition['name']}' result: {json.dumps(result, indent=2)}")
     return result
 
+def get_nrql_conditions(policy_id):
+    query = '''
+    query($accountId: Int!, $policyId: ID!, $cursor: String) {
+        actor {
+            account(id: $accountId) {
+                alerts {
+                    nrqlConditionsSearch(searchCriteria: {policyId: $policyId}, cursor: $cursor) {
+                        nextCursor
+                        nrqlConditions {
+                            id
+                            name
+                            enabled
+                            nrql { query }
+                            signal { aggregationWindow aggregationMethod aggregationDelay }
+                            terms { threshold thresholdOccurrences thresholdDuration operator priority }
+                            violationTimeLimitSeconds
+                        }
+                    }
+                }
+            }
+        }
+    }
+    '''
+    conditions = {}
+    cursor = None
+    while True:
+        result = graphql_query(query, {'accountId': NEW_RELIC_ACCOUNT_ID, 'policyId': str(policy_id), 'cursor': cursor})
+        page = result.get('data', {}).get('actor', {}).get('account', {}).get('alerts', {}).get('nrqlConditionsSearch', {})
+        for condition in page.get('nrqlConditions', []):
+            conditions[condition['name']] = condition
+        cursor = page.get('nextCursor')
+        if not cursor:
+            return conditions
+
 def get_existing_policies():
     query = '''
     query($accountId: Int!) {
@@ -247,6 +309,10 @@ def get_existing_policies():
     return policies
 
 def main():
+    parser = argparse.ArgumentParser(description="Reconcile New Relic alerting with PagerDuty")
+    parser.add_argument('--dry-run', action='store_true', help="Print the plan without applying changes")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Setting up New Relic Alerts -> PagerDuty Integration")
     print("=" * 60)
@@ -271,7 +337,9 @@ def main():
             print(f"Found existing channel: {ch['name']} ({ch['id']})")
             break
     
-    if not channel_id:
+    if not channel_id and args.dry_run:
+        print("Would create notification channel")
+    elif not channel_id:
         print("Creating notification channel...")
         channel_id = create_notification_channel(dest_id, 'Demo Simulator Channel')
     
@@ -284,25 +352,37 @@ def main():
             print(f"Found existing policy: {p['name']} ({p['id']})")
             break
     
-    if not policy_id:
+    if not policy_id and args.dry_run:
+        print("Would create alert policy")
+    elif not policy_id:
         print("Creating alert policy...")
         policy_id = create_alert_policy()
     
     print("\n--- Step 4: Check existing workflows ---")
-    get_existing_workflows()
-    
-    if channel_id and policy_id:
-        print("\n--- Step 5: Create Workflow (if needed) ---")
-        create_workflow(channel_id, policy_id)
-    
-    if policy_id:
-        print("\n--- Step 6: Create NRQL Alert Conditions ---")
-        conditions = [
-            ("[DEMO] High Custom Metric", "SELECT max(demo.api.response_time) FROM Metric WHERE demo IS TRUE", 500),
-            ("[DEMO] Demo Error Rate", "SELECT count(*) FROM Log WHERE message LIKE '%error%' AND demo IS TRUE", 1),
-        ]
-        for name, nrql, threshold in conditions:
-            create_nrql_condition(policy_id, name, nrql, threshold)
+    workflows = [w for w in get_existing_workflows() if w.get('name') == WORKFLOW_NAME]
+    for w in workflows:
+        print(f"Found existing workflow: {w['name']} ({w['id']})")
+
+    if channel_id and policy_id and not workflows:
+        print("\n--- Step 5: Create Workflow ---")
+        if args.dry_run:
+            print(f"Would create workflow '{WORKFLOW_NAME}'")
+        else:
+            create_workflow(channel_id, policy_id)
+
+    print("\n--- Step 6: Reconcile NRQL Alert Conditions ---")
+    conditions = [
+        ("[DEMO] High Custom Metric", "SELECT max(demo.api.response_time) FROM Metric WHERE demo IS TRUE", 500),
+        ("[DEMO] Demo Error Rate", "SELECT count(*) FROM Log WHERE message LIKE '%error%' AND demo IS TRUE", 1),
+    ]
+    desired = {name: nrql_condition(name, nrql, threshold) for name, nrql, threshold in conditions}
+    existing = {name: c for name, c in get_nrql_conditions(policy_id).items() if '[DEMO]' in name} if policy_id else {}
+    reconcile(
+        "New Relic NRQL conditions", desired, existing,
+        create=lambda name, condition: create_nrql_condition(policy_id, condition),
+        update=lambda name, condition, current: update_nrql_condition(current['id'], condition),
+        max_workers=MAX_WORKERS, dry_run=args.dry_run or not policy_id,
+    )
     
     print("\n" + "=" * 60)
     print("Setup complete!")
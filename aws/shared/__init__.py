@@ -11,6 +11,26 @@ from .clients import (
     CONALL_SLACK_USER_ID_PERSONAL,
     SLACK_WORKSPACE_ID,
 )
+from .aws import aws_client, aws_resource
+from .breaker import CircuitBreaker, CircuitOpenError, circuit_breaker, breaker_stats
+from .cache import TTLCache, ReferenceCache
+from .conversation import RESPONDER_CONVERSATIONS, get_conversation_message
+from .deadline import Deadline, DeadlineExceeded, current_deadline, set_deadline
+from .hedge import RequestHedger, request_hedger, hedge_stats
+from .http import http_session, http_stats
+from .mirror import IncidentMirror, incident_mirror, mirrored_incidents, mirrored_recent_incidents
+from .scope import (
+    RUN_ID_FIELD, new_run_id, scenario_dedup_prefix, demo_dedup_key,
+    incident_in_scope, find_scoped_incidents, teardown,
+)
+from .slack_pipeline import SlackPostingPipeline
+from .snapshot import IncidentSnapshot, is_demo_incident
+from .state_store import (
+    DynamoDBStateBackend, MemoryStateBackend, SQLiteStateBackend, state_backend_from_env,
+)
+from .sweep import SweepContext, SweepStage, SweepRunner
+from .templates import CompiledTemplate, Shuffler, compile_template, compile_pool
+from .users import UserDirectory, UserRecord, get_user_directory, demo_directory
 
 __all__ = [
     'PagerDutyClient',
@@ -24,4 +44,52 @@ __all__ = [
     'CONALL_SLACK_USER_ID',
     'CONALL_SLACK_USER_ID_PERSONAL',
     'SLACK_WORKSPACE_ID',
+    'aws_client',
+    'aws_resource',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'circuit_breaker',
+    'breaker_stats',
+    'TTLCache',
+    'ReferenceCache',
+    'RESPONDER_CONVERSATIONS',
+    'get_conversation_message',
+    'Deadline',
+    'DeadlineExceeded',
+    'current_deadline',
+    'set_deadline',
+    'RequestHedger',
+    'request_hedger',
+    'hedge_stats',
+    'http_session',
+    'http_stats',
+    'IncidentMirror',
+    'incident_mirror',
+    'mirrored_incidents',
+    'mirrored_recent_incidents',
+    'RUN_ID_FIELD',
+    'new_run_id',
+    'scenario_dedup_prefix',
+    'demo_dedup_key',
+    'incident_in_scope',
+    'find_scoped_incidents',
+    'teardown',
+    'SlackPostingPipeline',
+    'IncidentSnapshot',
+    'is_demo_incident',
+    'DynamoDBStateBackend',
+    'MemoryStateBackend',
+    'SQLiteStateBackend',
+    'state_backend_from_env',
+    'SweepContext',
+    'SweepStage',
+    'SweepRunner',
+    'CompiledTemplate',
+    'Shuffler',
+    'compile_template',
+    'compile_pool',
+    'UserDirectory',
+    'UserRecord',
+    'get_user_directory',
+    'demo_directory',
 ]
\ No newline at end of file
@@ -0,0 +1,13 @@
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def aws_client(service_name: str):
+    import boto3
+    return boto3.client(service_name)
+
+
+@functools.lru_cache(maxsize=None)
+def aws_resource(service_name: str):
+    import boto3
+    return boto3.resource(service_name)
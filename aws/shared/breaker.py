@@ -0,0 +1,186 @@
+import os
+import time
+import logging
+import threading
+import functools
+from collections import deque
+from typing import Callable, Dict, Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from .cache import backend_from_env, MISSING
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_ENABLED = os.environ.get('CIRCUIT_BREAKER_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+CIRCUIT_FAILURE_RATE = float(os.environ.get('CIRCUIT_FAILURE_RATE', 0.5))
+CIRCUIT_MIN_CALLS = int(os.environ.get('CIRCUIT_MIN_CALLS', 5))
+CIRCUIT_WINDOW_SECONDS = float(os.environ.get('CIRCUIT_WINDOW_SECONDS', 60))
+CIRCUIT_OPEN_SECONDS = float(os.environ.get('CIRCUIT_OPEN_SECONDS', 30))
+CIRCUIT_HALF_OPEN_PROBES = int(os.environ.get('CIRCUIT_HALF_OPEN_PROBES', 1))
+CIRCUIT_SYNC_SECONDS = float(os.environ.get('CIRCUIT_SYNC_SECONDS', 5))
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+DEPENDENCY_HOSTS = [
+    ('events.pagerduty.com', 'pagerduty-events'),
+    ('pagerduty.com', 'pagerduty'),
+    ('slack.com', 'slack'),
+    ('datadoghq.com', 'datadog'),
+    ('datadoghq.eu', 'datadog'),
+    ('newrelic.com', 'newrelic'),
+    ('nr-data.net', 'newrelic'),
+    ('grafana.net', 'grafana'),
+    ('grafana.com', 'grafana'),
+]
+if urlsplit(os.environ.get('GRAFANA_URL', '')).hostname:
+    DEPENDENCY_HOSTS.append((urlsplit(os.environ['GRAFANA_URL']).hostname, 'grafana'))
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    def __init__(self, dependency: str, retry_in: float):
+        super().__init__(f"Circuit open for {dependency}, retry in {retry_in:.0f}s")
+        self.dependency = dependency
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_rate: float = None, min_calls: int = None, window_seconds: float = None,
+                 open_seconds: float = None, half_open_probes: int = None, backend=None):
+        self.name = name
+        self.failure_rate = CIRCUIT_FAILURE_RATE if failure_rate is None else failure_rate
+        self.min_calls = CIRCUIT_MIN_CALLS if min_calls is None else min_calls
+        self.window_seconds = CIRCUIT_WINDOW_SECONDS if window_seconds is None else window_seconds
+        self.open_seconds = CIRCUIT_OPEN_SECONDS if open_seconds is None else open_seconds
+        self.half_open_probes = CIRCUIT_HALF_OPEN_PROBES if half_open_probes is None else half_open_probes
+        self.backend = backend
+        self.state = CLOSED
+        self._outcomes: deque = deque()
+        self._open_until = 0.0
+        self._probes = 0
+        self._synced_at = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'failures': 0, 'rejected': 0, 'opened': 0}
+
+    def _trim(self, now: float):
+        while self._outcomes and self._outcomes[0][0] < now - self.window_seconds:
+            self._outcomes.popleft()
+
+    def _sync(self, now: float):
+        if self.backend is None or self.state != CLOSED or now - self._synced_at < CIRCUIT_SYNC_SECONDS:
+            return
+        self._synced_at = now
+        shared = self.backend.get(self.name)
+        if shared is MISSING or not shared:
+            return
+        remaining = float(shared.get('open_until', 0)) - time.time()
+        if remaining > 0:
+            self.state = OPEN
+            self._open_until = now + remaining
+            logger.warning(f"Circuit for {self.name} opened by another container for {remaining:.0f}s")
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._sync(now)
+            if self.state == OPEN:
+                if now < self._open_until:
+                    self._stats['rejected'] += 1
+                    return False
+                self.state = HALF_OPEN
+                self._probes = 0
+                logger.info(f"Circuit for {self.name} half-open, probing")
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    self._stats['rejected'] += 1
+                    return False
+                self._probes += 1
+            return True
+
+    def retry_in(self) -> float:
+        return max(0.0, self._open_until - time.monotonic())
+
+    def record(self, ok: bool):
+        now = time.monotonic()
+        with self._lock:
+            self._stats['calls'] += 1
+            if not ok:
+                self._stats['failures'] += 1
+            if self.state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                if ok:
+                    self.state = CLOSED
+                    self._outcomes.clear()
+                    logger.info(f"Circuit for {self.name} closed after successful probe")
+                else:
+                    self._trip(now)
+                return
+            self._outcomes.append((now, ok))
+            self._trim(now)
+            if self.state == CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = sum(1 for _, success in self._outcomes if not success)
+                if failures / len(self._outcomes) >= self.failure_rate:
+                    self._trip(now)
+
+    def release(self):
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+    def _trip(self, now: float):
+        self.state = OPEN
+        self._open_until = now + self.open_seconds
+        self._outcomes.clear()
+        self._stats['opened'] += 1
+        logger.warning(f"Circuit for {self.name} opened for {self.open_seconds:.0f}s")
+        if self.backend is not None:
+            self.backend.set(self.name, {'open_until': time.time() + self.open_seconds}, self.open_seconds)
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record(False)
+            raise
+        self.record(True)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'state': self.state, 'retry_in': round(self.retry_in(), 1)}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_backend():
+    return backend_from_env('circuit-breakers', 'CIRCUIT_BREAKER_BACKEND', 'CIRCUIT_BREAKER_TARGET')
+
+
+def circuit_breaker(name: str) -> CircuitBreaker:
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.get(name)
+            if breaker is None:
+                breaker = _breakers[name] = CircuitBreaker(name, backend=_shared_backend())
+    return breaker
+
+
+def dependency_for_host(host: str) -> Optional[str]:
+    host = host.split(':')[0].lower()
+    for suffix, name in DEPENDENCY_HOSTS:
+        if host == suffix or host.endswith('.' + suffix):
+            return name
+    return None
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: breaker.stats() for name, breaker in list(_breakers.items())}
@@ -0,0 +1,195 @@
+import os
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 128, ttl_seconds: float = 300):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float = None):
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str = None):
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DynamoDBCacheBackend:
+    def __init__(self, table_name: str, namespace: str):
+        import boto3
+        self.table = boto3.resource('dynamodb').Table(table_name)
+        self.namespace = namespace
+
+    def _key(self, key: str) -> str:
+        return f'{self.namespace}:{key}'
+
+    def get(self, key: str) -> Any:
+        try:
+            item = self.table.get_item(Key={'cache_key': self._key(key)}).get('Item')
+            if item and float(item.get('expires_at', 0)) > time.time():
+                return json.loads(item['value'])
+        except Exception as e:
+            logger.warning(f"Cache backend read failed for {key}: {e}")
+        return MISSING
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        expires_at = int(time.time() + ttl_seconds)
+        try:
+            self.table.put_item(Item={
+                'cache_key': self._key(key),
+                'value': json.dumps(value),
+                'expires_at': expires_at,
+                'ttl': expires_at,
+            })
+        except Exception as e:
+            logger.warning(f"Cache backend write failed for {key}: {e}")
+
+    def delete(self, key: str):
+        try:
+            self.table.delete_item(Key={'cache_key': self._key(key)})
+        except Exception as e:
+            logger.warning(f"Cache backend delete failed for {key}: {e}")
+
+
+class SSMCacheBackend:
+    MAX_VALUE_BYTES = 4096
+
+    def __init__(self, prefix: str, namespace: str):
+        import boto3
+        self.ssm = boto3.client('ssm')
+        self.prefix = f"{prefix.rstrip('/')}/{namespace}"
+
+    def get(self, key: str) -> Any:
+        try:
+            resp = self.ssm.get_parameter(Name=f'{self.prefix}/{key}')
+            envelope = json.loads(resp['Parameter']['Value'])
+            if envelope.get('expires_at', 0) > time.time():
+                return envelope.get('value')
+        except Exception as e:
+            logger.debug(f"Cache backend read missed for {key}: {e}")
+        return MISSING
+
+    def set(self, key: str, value: Any, ttl_seconds: float):
+        body = json.dumps({'expires_at': time.time() + ttl_seconds, 'value': value})
+        if len(body.encode()) > self.MAX_VALUE_BYTES:
+            logger.debug(f"Skipping SSM cache write for {key}: {len(body)} bytes exceeds parameter limit")
+            return
+        try:
+            self.ssm.put_parameter(Name=f'{self.prefix}/{key}', Value=body, Type='String', Overwrite=True)
+        except Exception as e:
+            logger.warning(f"Cache backend write failed for {key}: {e}")
+
+    def delete(self, key: str):
+        try:
+            self.ssm.delete_parameter(Name=f'{self.prefix}/{key}')
+        except Exception as e:
+            logger.debug(f"Cache backend delete failed for {key}: {e}")
+
+
+def backend_from_env(namespace: str, kind_var: str = 'SHARED_CACHE_BACKEND', target_var: str = 'SHARED_CACHE_TARGET'):
+    kind = os.environ.get(kind_var, '').lower()
+    target = os.environ.get(target_var, '')
+    if not kind or not target:
+        return None
+    try:
+        if kind == 'dynamodb':
+            return DynamoDBCacheBackend(target, namespace)
+        if kind == 'ssm':
+            return SSMCacheBackend(target, namespace)
+    except Exception as e:
+        logger.warning(f"Could not initialise {kind} cache backend: {e}")
+        return None
+    logger.warning(f"Unknown cache backend {kind!r} in {kind_var}")
+    return None
+
+
+class ReferenceCache:
+    def __init__(self, ttls: Dict[str, float], maxsize: int = 64, default_ttl: float = 900, backend=None):
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self.local = TTLCache(maxsize=maxsize, ttl_seconds=default_ttl)
+        self.backend = backend
+        self.backend_hits = 0
+        self.loads = 0
+
+    def ttl_for(self, resource: str) -> float:
+        return self.ttls.get(resource, self.default_ttl)
+
+    def get_or_load(self, resource: str, loader: Callable[[], Any]) -> Any:
+        value = self.local.get(resource, MISSING)
+        if value is not MISSING:
+            return value
+        ttl = self.ttl_for(resource)
+        if self.backend is not None:
+            value = self.backend.get(resource)
+            if value is not MISSING:
+                self.backend_hits += 1
+                self.local.set(resource, value, ttl)
+                return value
+        value = loader()
+        self.loads += 1
+        if value:
+            self.local.set(resource, value, ttl)
+            if self.backend is not None:
+                self.backend.set(resource, value, ttl)
+        return value
+
+    def invalidate(self, resource: str = None):
+        self.local.invalidate(resource)
+        if self.backend is not None:
+            for key in ([resource] if resource else list(self.ttls)):
+                self.backend.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.local.stats(), 'backend_hits': self.backend_hits, 'loads': self.loads}
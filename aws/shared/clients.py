@@ -1,11 +1,15 @@
 import os
 import logging
-import requests
+import re
 import random
 import time
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any, List
 
+from .cache import TTLCache, ReferenceCache, backend_from_env, MISSING
+from .hedge import PD_HEDGE_ENABLED, request_hedger
+from .http import http_session
+
 logger = logging.getLogger(__name__)
 
 PAGERDUTY_API_URL = 'https://api.pagerduty.com'
@@ -27,17 +31,46 @@ DEMO_USERS = [
 
 PAGERDUTY_TO_SLACK_USER_MAP = {user['email']: user['slack_id'] for user in DEMO_USERS}
 
-_cached_users = None
+REFERENCE_CACHE_TTLS = {
+    'users': int(os.environ.get('PD_CACHE_TTL_USERS', 900)),
+    'priorities': int(os.environ.get('PD_CACHE_TTL_PRIORITIES', 3600)),
+    'automation_actions': int(os.environ.get('PD_CACHE_TTL_AUTOMATION_ACTIONS', 900)),
+    'workflows': int(os.environ.get('PD_CACHE_TTL_WORKFLOWS', 900)),
+    'escalation_policies': int(os.environ.get('PD_CACHE_TTL_ESCALATION_POLICIES', 1800)),
+}
+
+_reference_cache = ReferenceCache(
+    REFERENCE_CACHE_TTLS,
+    maxsize=int(os.environ.get('PD_CACHE_MAX_ENTRIES', 32)),
+    backend=backend_from_env('pd-reference'),
+)
+
+SLACK_PROFILE_CACHE_TTL = int(os.environ.get('SLACK_PROFILE_CACHE_TTL', 3600))
+
+_profile_cache = TTLCache(
+    maxsize=int(os.environ.get('SLACK_PROFILE_CACHE_MAX_ENTRIES', 256)),
+    ttl_seconds=SLACK_PROFILE_CACHE_TTL,
+)
+_profile_backend = backend_from_env('slack-profiles')
+_profile_warmed_at = None
+_DEMO_SLACK_IDS = frozenset(user['slack_id'] for user in DEMO_USERS)
 
 
 class PagerDutyClient:
-    def __init__(self, token: str = None):
+    def __init__(self, token: str = None, hedge: bool = None):
         self.token = token or os.environ.get('PAGERDUTY_TOKEN') or os.environ.get('PAGERDUTY_ADMIN_TOKEN', '')
         self.headers = {
             'Authorization': f'Token token={self.token}',
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
+        self.hedge = PD_HEDGE_ENABLED if hedge is None else hedge
+
+    def _read(self, name: str, url: str, **kwargs):
+        request = lambda: http_session().get(url, headers=self.headers, timeout=10, **kwargs)
+        if self.hedge:
+            return request_hedger(f'pagerduty.{name}').call(request)
+        return request()
     
     def trigger_incident(
         self,
@@ -63,7 +96,7 @@ class PagerDutyClient:
         }
         logger.info(f"Triggering incident: routing_key={routing_key[:8]}..., summary={summary}")
         try:
-            response = requests.post(PAGERDUTY_EVENTS_URL, json=payload, timeout=10)
+            response = http_session().post(PAGERDUTY_EVENTS_URL, json=payload, timeout=10)
             logger.info(f"PagerDuty response: status={response.status_code}")
             if response.status_code != 202:
                 return {"success": False, "error": response.text, "status_code": response.status_code}
@@ -79,7 +112,7 @@ class PagerDutyClient:
         url = f'{PAGERDUTY_API_URL}/incidents?{params}&limit=100'
         
         try:
-            resp = requests.get(url, headers=self.headers, timeout=10)
+            resp = self._read('list_incidents', url)
             if resp.ok:
                 incidents = resp.json().get('incidents', [])
                 return [i for i in incidents if i.get('title', '').startswith('[DEMO]')]
@@ -94,11 +127,10 @@ class PagerDutyClient:
             statuses = ['triggered', 'acknowledged']
         since = (datetime.now(timezone.utc) - timedelta(minutes=minutes)).isoformat()
         try:
-            response = requests.get(
+            response = self._read(
+                'list_incidents',
                 f'{PAGERDUTY_API_URL}/incidents',
-                headers=self.headers,
                 params={'statuses[]': statuses, 'since': since},
-                timeout=10
             )
             if response.status_code == 200:
                 return response.json().get('incidents', [])
@@ -111,32 +143,44 @@ class PagerDutyClient:
             params = {}
             if include:
                 params['include[]'] = include
-            response = requests.get(
-                f'{PAGERDUTY_API_URL}/incidents/{incident_id}',
-                headers=self.headers,
-                params=params,
-                timeout=10
-            )
+            response = self._read('get_incident', f'{PAGERDUTY_API_URL}/incidents/{incident_id}', params=params)
             if response.status_code == 200:
                 return response.json().get('incident')
         except Exception as e:
             logger.error(f"Error getting incident: {e}")
         return None
-    
-    def list_users(self) -> List[Dict]:
-        global _cached_users
-        if _cached_users is not None:
-            return _cached_users
+
+    def lookup_incident(self, incident_id: str) -> Dict[str, Any]:
+        try:
+            response = self._read('get_incident', f'{PAGERDUTY_API_URL}/incidents/{incident_id}')
+            if response.status_code == 200:
+                return {'success': True, 'incident': response.json().get('incident')}
+            return {'success': response.status_code == 404, 'incident': None, 'status_code': response.status_code}
+        except Exception as e:
+            logger.error(f"Error looking up incident {incident_id}: {e}")
+            return {'success': False, 'incident': None, 'error': str(e)}
+
+    def invalidate_reference_data(self, resource: str = None):
+        _reference_cache.invalidate(resource)
+
+    def reference_cache_stats(self) -> Dict[str, Any]:
+        return _reference_cache.stats()
+
+    def list_users(self, refresh: bool = False) -> List[Dict]:
+        if refresh:
+            _reference_cache.invalidate('users')
+        return _reference_cache.get_or_load('users', self._fetch_users)
+
+    def _fetch_users(self) -> List[Dict]:
         try:
-            response = requests.get(
+            response = http_session().get(
                 f'{PAGERDUTY_API_URL}/users',
                 headers=self.headers,
                 params={'limit': 100},
                 timeout=10
             )
             if response.status_code == 200:
-                users = response.json().get('users', [])
-                _cached_users = [
+                users = [
                     {
                         'id': u.get('id'),
                         'name': u.get('name'),
@@ -144,16 +188,16 @@ class PagerDutyClient:
                         'role': u.get('role', 'user'),
                         'job_title': u.get('job_title', ''),
                     }
-                    for u in users
+                    for u in response.json().get('users', [])
                 ]
-                logger.info(f"Fetched {len(_cached_users)} PagerDuty users")
-                return _cached_users
+                logger.info(f"Fetched {len(users)} PagerDuty users")
+                return users
             logger.error(f"Failed to list users: {response.status_code}")
         except Exception as e:
             logger.error(f"Error listing users: {e}")
         return []
     
-    def resolve_incident(self, incident_id: str, user_email: str = None) -> dict:
+    def resolve_incident(self, incident_id: str, user_email: str = None, resolution: str = None) -> dict:
         url = f'{PAGERDUTY_API_URL}/incidents/{incident_id}'
         payload = {
             'incident': {
@@ -161,18 +205,47 @@ class PagerDutyClient:
                 'status': 'resolved'
             }
         }
+        if resolution:
+            payload['incident']['resolution'] = resolution
         headers = {**self.headers}
         if user_email:
             headers['From'] = user_email
         
         try:
-            resp = requests.put(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().put(url, json=payload, headers=headers, timeout=10)
             if not resp.ok:
                 logger.error(f"resolve_incident failed: incident={incident_id}, user={user_email}, status={resp.status_code}, body={resp.text[:200]}")
             return {'success': resp.ok, 'status_code': resp.status_code}
         except Exception as e:
             logger.error(f"resolve_incident exception: incident={incident_id}, error={e}")
             return {'success': False, 'error': str(e)}
+
+    def resolve_incidents(self, incident_ids: List[str], user_email: str = None, resolution: str = None,
+                          batch_size: int = 100) -> dict:
+        headers = {**self.headers}
+        if user_email:
+            headers['From'] = user_email
+        resolved, failed = [], []
+        incident_ids = list(dict.fromkeys(i for i in incident_ids if i))
+        for start in range(0, len(incident_ids), batch_size):
+            batch = incident_ids[start:start + batch_size]
+            incidents = []
+            for incident_id in batch:
+                incident = {'id': incident_id, 'type': 'incident_reference', 'status': 'resolved'}
+                if resolution:
+                    incident['resolution'] = resolution
+                incidents.append(incident)
+            try:
+                resp = http_session().put(f'{PAGERDUTY_API_URL}/incidents', json={'incidents': incidents},
+                                          headers=headers, timeout=30)
+                if resp.ok:
+                    resolved.extend(batch)
+                    continue
+                logger.error(f"resolve_incidents failed: count={len(batch)}, status={resp.status_code}, body={resp.text[:200]}")
+            except Exception as e:
+                logger.error(f"resolve_incidents exception: count={len(batch)}, error={e}")
+            failed.extend(batch)
+        return {'success': not failed, 'resolved': resolved, 'failed': failed}
     
     def acknowledge_incident(self, incident_id: str, user_email: str = None) -> dict:
         url = f'{PAGERDUTY_API_URL}/incidents/{incident_id}'
@@ -187,7 +260,7 @@ class PagerDutyClient:
             headers['From'] = user_email
         
         try:
-            resp = requests.put(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().put(url, json=payload, headers=headers, timeout=10)
             return {'success': resp.ok, 'status_code': resp.status_code}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -200,7 +273,7 @@ class PagerDutyClient:
             headers['From'] = user_email
         
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(url, json=payload, headers=headers, timeout=10)
             return {'success': resp.ok, 'status_code': resp.status_code}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -209,7 +282,7 @@ class PagerDutyClient:
         url = f'{PAGERDUTY_API_URL}/maintenance_windows?filter={filter_type}'
         
         try:
-            resp = requests.get(url, headers=self.headers, timeout=10)
+            resp = http_session().get(url, headers=self.headers, timeout=10)
             if resp.ok:
                 return resp.json().get('maintenance_windows', [])
             return []
@@ -221,7 +294,7 @@ class PagerDutyClient:
         url = f'{PAGERDUTY_API_URL}/maintenance_windows/{window_id}'
         
         try:
-            resp = requests.delete(url, headers=self.headers, timeout=10)
+            resp = http_session().delete(url, headers=self.headers, timeout=10)
             return {'success': resp.status_code in [200, 204], 'status_code': resp.status_code}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -234,7 +307,7 @@ class PagerDutyClient:
             headers['From'] = user_email
         
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(url, json=payload, headers=headers, timeout=10)
             return {'success': resp.ok, 'status_code': resp.status_code}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -252,7 +325,7 @@ class PagerDutyClient:
             headers['From'] = user_email
         
         try:
-            resp = requests.put(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().put(url, json=payload, headers=headers, timeout=10)
             return {'success': resp.ok, 'status_code': resp.status_code}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -270,16 +343,19 @@ class PagerDutyClient:
             headers['From'] = user_email
 
         try:
-            resp = requests.put(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().put(url, json=payload, headers=headers, timeout=10)
             return {'success': resp.ok, 'status_code': resp.status_code}
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
-    def add_responders(self, incident_id: str, responder_ids: list, user_email: str = None) -> dict:
+    def add_responders(self, incident_id: str, responder_ids: list, user_email: str = None,
+                       message: str = None) -> dict:
+        from .users import demo_directory
         url = f'{PAGERDUTY_API_URL}/incidents/{incident_id}/responder_requests'
+        requester = demo_directory().by_email(user_email) if user_email else None
         payload = {
-            'requester_id': user_email or 'unknown',
-            'message': 'Requesting assistance with this incident',
+            'requester_id': requester.id if requester else (user_email or 'unknown'),
+            'message': message or 'Requesting assistance with this incident',
             'responder_request_targets': [
                 {'responder_request_target': {'id': rid, 'type': 'user_reference'}}
                 for rid in responder_ids
@@ -290,7 +366,7 @@ class PagerDutyClient:
             headers['From'] = user_email
 
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(url, json=payload, headers=headers, timeout=10)
             return {'success': resp.ok, 'status_code': resp.status_code}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -308,7 +384,7 @@ class PagerDutyClient:
             headers['From'] = user_email
 
         try:
-            resp = requests.put(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().put(url, json=payload, headers=headers, timeout=10)
             return {'success': resp.ok, 'status_code': resp.status_code}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -317,26 +393,29 @@ class PagerDutyClient:
         users = demo_users or DEMO_USERS
         assignments = incident.get('assignments', [])
         if assignments:
-            assignee_ref = assignments[0].get('assignee', {})
-            assignee_id = assignee_ref.get('id')
-            for user in users:
-                if user['id'] == assignee_id:
-                    return user
+            assignee_id = assignments[0].get('assignee', {}).get('id')
+            if demo_users:
+                match = next((u for u in users if u['id'] == assignee_id), None)
+            else:
+                from .users import demo_directory
+                match = demo_directory().by_id(assignee_id)
+            if match:
+                return match
         return random.choice(users)
     
     def get_incident_responders(self, incident: Dict) -> List[Dict]:
+        from .users import demo_directory
+        directory = demo_directory()
         responders = []
         for assignment in incident.get('assignments', []):
             assignee = assignment.get('assignee', {})
             if assignee.get('type') == 'user_reference':
                 user_id = assignee.get('id')
-                user_name = assignee.get('summary', 'Unknown')
-                for user in DEMO_USERS:
-                    if user['id'] == user_id:
-                        responders.append(user)
-                        break
+                user = directory.by_id(user_id)
+                if user:
+                    responders.append(user)
                 else:
-                    responders.append({'id': user_id, 'name': user_name, 'email': '', 'slack_id': ''})
+                    responders.append({'id': user_id, 'name': assignee.get('summary', 'Unknown'), 'email': '', 'slack_id': ''})
         return responders
 
     def trigger_sample_incident(self, routing_key: str, title: str, severity: str = 'warning') -> dict:
@@ -359,7 +438,7 @@ class PagerDutyClient:
             'limit': limit,
         }
         try:
-            response = requests.get(
+            response = http_session().get(
                 f'{PAGERDUTY_API_URL}/incidents',
                 headers=self.headers,
                 params=params,
@@ -372,9 +451,39 @@ class PagerDutyClient:
             logger.error(f"Error listing incidents: {e}")
         return []
 
+    def list_all_incidents(self, statuses: List[str], sort_by: str = 'created_at:asc',
+                           page_size: int = 100, max_pages: int = 10) -> List[Dict]:
+        incidents = []
+        offset = 0
+        for _ in range(max_pages):
+            params = {
+                'statuses[]': statuses,
+                'sort_by': sort_by,
+                'limit': page_size,
+                'offset': offset,
+            }
+            try:
+                response = self._read('list_incidents', f'{PAGERDUTY_API_URL}/incidents', params=params)
+                if response.status_code != 200:
+                    logger.error(f"Failed to list incidents page at offset {offset}: {response.status_code} {response.text}")
+                    break
+                data = response.json()
+            except Exception as e:
+                logger.error(f"Error listing incidents page at offset {offset}: {e}")
+                break
+            page = data.get('incidents', [])
+            incidents.extend(page)
+            if not data.get('more') or not page:
+                break
+            offset += len(page)
+        return incidents
+
     def list_escalation_policies(self) -> List[Dict]:
+        return _reference_cache.get_or_load('escalation_policies', self._fetch_escalation_policies)
+
+    def _fetch_escalation_policies(self) -> List[Dict]:
         try:
-            response = requests.get(
+            response = http_session().get(
                 f'{PAGERDUTY_API_URL}/escalation_policies',
                 headers=self.headers,
                 params={'limit': 100},
@@ -399,7 +508,7 @@ class PagerDutyClient:
         if user_email:
             headers['From'] = user_email
         try:
-            resp = requests.put(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().put(url, json=payload, headers=headers, timeout=10)
             if resp.ok:
                 logger.info(f"Escalated incident {incident_id} to level {escalation_level}")
             return {'success': resp.ok, 'status_code': resp.status_code}
@@ -407,8 +516,11 @@ class PagerDutyClient:
             return {'success': False, 'error': str(e)}
 
     def list_priorities(self) -> List[Dict]:
+        return _reference_cache.get_or_load('priorities', self._fetch_priorities)
+
+    def _fetch_priorities(self) -> List[Dict]:
         try:
-            response = requests.get(
+            response = http_session().get(
                 f'{PAGERDUTY_API_URL}/priorities',
                 headers=self.headers,
                 timeout=10
@@ -420,8 +532,11 @@ class PagerDutyClient:
         return []
 
     def list_automation_actions(self) -> List[Dict]:
+        return _reference_cache.get_or_load('automation_actions', self._fetch_automation_actions)
+
+    def _fetch_automation_actions(self) -> List[Dict]:
         try:
-            response = requests.get(
+            response = http_session().get(
                 f'{PAGERDUTY_API_URL}/automation_actions/actions',
                 headers=self.headers,
                 timeout=10
@@ -433,8 +548,11 @@ class PagerDutyClient:
         return []
 
     def list_workflows(self) -> List[Dict]:
+        return _reference_cache.get_or_load('workflows', self._fetch_workflows)
+
+    def _fetch_workflows(self) -> List[Dict]:
         try:
-            response = requests.get(
+            response = http_session().get(
                 f'{PAGERDUTY_API_URL}/incident_workflows',
                 headers=self.headers,
                 timeout=10
@@ -450,13 +568,8 @@ class PagerDutyClient:
         headers = {**self.headers}
         if user_email:
             headers['From'] = user_email
-        payload = {
-            'status_update': {
-                'message': message
-            }
-        }
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(url, json={'message': message}, headers=headers, timeout=10)
             if resp.ok:
                 logger.info(f"Posted status update to incident {incident_id}")
             return {'success': resp.ok, 'status_code': resp.status_code}
@@ -475,7 +588,7 @@ class PagerDutyClient:
             }
         }
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(url, json=payload, headers=headers, timeout=10)
             if resp.ok:
                 logger.info(f"Invoked automation action {action_id} on incident {incident_id}")
             return {'success': resp.ok, 'status_code': resp.status_code, 'data': resp.json() if resp.ok else None}
@@ -494,7 +607,7 @@ class PagerDutyClient:
             }
         }
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(url, json=payload, headers=headers, timeout=10)
             if resp.ok:
                 logger.info(f"Triggered workflow {workflow_id} on incident {incident_id}")
             return {'success': resp.ok, 'status_code': resp.status_code, 'data': resp.json() if resp.ok else None}
@@ -517,7 +630,7 @@ class PagerDutyClient:
             }
         }
         try:
-            resp = requests.put(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().put(url, json=payload, headers=headers, timeout=10)
             if resp.ok:
                 logger.info(f"Updated custom fields on incident {incident_id}")
             return {'success': resp.ok, 'status_code': resp.status_code}
@@ -536,7 +649,7 @@ class PagerDutyClient:
             }
         }
         try:
-            resp = requests.put(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().put(url, json=payload, headers=headers, timeout=10)
             if resp.ok:
                 logger.info(f"Updated incident type to {incident_type} on {incident_id}")
             return {'success': resp.ok, 'status_code': resp.status_code}
@@ -550,7 +663,7 @@ class PagerDutyClient:
             'dedup_key': dedup_key
         }
         try:
-            resp = requests.post(PAGERDUTY_EVENTS_URL, json=payload, timeout=10)
+            resp = http_session().post(PAGERDUTY_EVENTS_URL, json=payload, timeout=10)
             if resp.status_code == 202:
                 logger.info(f"Resolved incident via Events API, dedup_key={dedup_key[:20]}...")
             return {'success': resp.status_code == 202, 'status_code': resp.status_code}
@@ -566,7 +679,7 @@ class PagerDutyClient:
             'subscribers': [{'subscriber_id': subscriber_id, 'subscriber_type': subscriber_type}]
         }
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(url, json=payload, headers=headers, timeout=10)
             if resp.ok:
                 logger.info(f"Added subscriber {subscriber_id} to incident {incident_id}")
             return {'success': resp.ok, 'status_code': resp.status_code}
@@ -582,7 +695,7 @@ class PagerDutyClient:
             'status_update': {'message': message}
         }
         try:
-            resp = requests.post(url, json=payload, headers=headers, timeout=10)
+            resp = http_session().post(url, json=payload, headers=headers, timeout=10)
             if resp.ok:
                 logger.info(f"Sent subscriber notification for incident {incident_id}")
             return {'success': resp.ok, 'status_code': resp.status_code}
@@ -596,13 +709,12 @@ class SlackClient:
         self.default_channel = default_channel or os.environ.get('SLACK_CHANNEL', '')
         self.team_id = os.environ.get('SLACK_TEAM_ID', SLACK_WORKSPACE_ID)
         self.api_base = 'https://slack.com/api'
-        self._profile_cache = {}
 
     def verify_token(self) -> Dict[str, Any]:
         if not self.token:
             return {'ok': False, 'error': 'no_token'}
         try:
-            resp = requests.get(
+            resp = http_session().get(
                 f'{self.api_base}/auth.test',
                 headers=self._headers(),
                 timeout=10
@@ -617,11 +729,80 @@ class SlackClient:
             'Content-Type': 'application/json'
         }
 
+    @staticmethod
+    def _profile_from_user(user: Dict) -> Dict[str, str]:
+        profile = user.get('profile', {})
+        return {
+            'name': profile.get('display_name') or profile.get('real_name') or user.get('name', ''),
+            'icon_url': profile.get('image_72', '')
+        }
+
+    @staticmethod
+    def _cached_profile(slack_user_id: str) -> Optional[Dict[str, str]]:
+        cached = _profile_cache.get(slack_user_id)
+        if cached is None and _profile_backend is not None:
+            stored = _profile_backend.get(slack_user_id)
+            if stored is not MISSING:
+                _profile_cache.set(slack_user_id, stored)
+                cached = stored
+        return cached
+
+    @staticmethod
+    def _store_profile(slack_user_id: str, profile: Dict[str, str]):
+        _profile_cache.set(slack_user_id, profile)
+        if _profile_backend is not None:
+            _profile_backend.set(slack_user_id, profile, SLACK_PROFILE_CACHE_TTL)
+
+    def warm_profile_cache(self, slack_user_ids: List[str] = None) -> int:
+        global _profile_warmed_at
+        _profile_warmed_at = time.monotonic()
+        if not self.token:
+            return 0
+        wanted = set(slack_user_ids or _DEMO_SLACK_IDS)
+        warmed = 0
+        cursor = None
+        try:
+            while wanted:
+                params = {'limit': 200}
+                if self.team_id:
+                    params['team_id'] = self.team_id
+                if cursor:
+                    params['cursor'] = cursor
+                resp = http_session().get(
+                    f'{self.api_base}/users.list',
+                    headers=self._headers(),
+                    params=params,
+                    timeout=10
+                )
+                data = resp.json()
+                if not data.get('ok'):
+                    logger.warning(f"Failed to warm profile cache: {data.get('error')}")
+                    break
+                for member in data.get('members', []):
+                    if member.get('id') in wanted:
+                        self._store_profile(member['id'], self._profile_from_user(member))
+                        wanted.discard(member['id'])
+                        warmed += 1
+                cursor = data.get('response_metadata', {}).get('next_cursor')
+                if not cursor:
+                    break
+        except Exception as e:
+            logger.error(f"Error warming profile cache: {e}")
+        logger.info(f"Warmed Slack profile cache with {warmed} profiles")
+        return warmed
+
     def get_user_profile(self, slack_user_id: str) -> Dict[str, str]:
-        if slack_user_id in self._profile_cache:
-            return self._profile_cache[slack_user_id]
+        cached = self._cached_profile(slack_user_id)
+        if cached is not None:
+            return cached
+        warmup_due = _profile_warmed_at is None or time.monotonic() - _profile_warmed_at > SLACK_PROFILE_CACHE_TTL
+        if slack_user_id in _DEMO_SLACK_IDS and warmup_due:
+            self.warm_profile_cache()
+            cached = _profile_cache.get(slack_user_id)
+            if cached is not None:
+                return cached
         try:
-            resp = requests.get(
+            resp = http_session().get(
                 f'{self.api_base}/users.info',
                 headers=self._headers(),
                 params={'user': slack_user_id},
@@ -630,18 +811,16 @@ class SlackClient:
             if resp.ok:
                 data = resp.json()
                 if data.get('ok'):
-                    user = data.get('user', {})
-                    profile = user.get('profile', {})
-                    result = {
-                        'name': profile.get('display_name') or profile.get('real_name') or user.get('name', ''),
-                        'icon_url': profile.get('image_72', '')
-                    }
-                    self._profile_cache[slack_user_id] = result
+                    result = self._profile_from_user(data.get('user', {}))
+                    self._store_profile(slack_user_id, result)
                     return result
         except Exception as e:
             logger.error(f"Error getting user profile: {e}")
         return {'name': '', 'icon_url': ''}
 
+    def profile_cache_stats(self) -> Dict[str, Any]:
+        return _profile_cache.stats()
+
     def post_message(self, text: str, channel: str = None, blocks: List[Dict] = None,
                      username: str = None, icon_url: str = None) -> Dict[str, Any]:
         if not self.token:
@@ -660,16 +839,27 @@ class SlackClient:
             payload['icon_url'] = icon_url
 
         try:
-            resp = requests.post(
+            resp = http_session().post(
                 f'{self.api_base}/chat.postMessage',
                 headers=self._headers(),
                 json=payload,
                 timeout=10
             )
-            return resp.json()
+            return self._with_retry_after(resp)
         except Exception as e:
             return {'ok': False, 'error': str(e)}
 
+    @staticmethod
+    def _with_retry_after(resp) -> Dict[str, Any]:
+        data = resp.json()
+        if resp.status_code == 429 or data.get('error') == 'ratelimited':
+            data['error'] = 'ratelimited'
+            try:
+                data['retry_after'] = float(resp.headers.get('Retry-After', 1))
+            except (TypeError, ValueError):
+                data['retry_after'] = 1.0
+        return data
+
     def post_as_user(self, text: str, user: Dict, channel: str = None, blocks: List[Dict] = None) -> Dict[str, Any]:
         slack_id = user.get('slack_id', '')
         if slack_id:
@@ -678,13 +868,65 @@ class SlackClient:
                                      username=profile.get('name') or user.get('name'),
                                      icon_url=profile.get('icon_url'))
         return self.post_message(text, channel, blocks, username=user.get('name'))
-    
+
+    def schedule_message(self, text: str, post_at: int, channel: str = None, blocks: List[Dict] = None,
+                         username: str = None, icon_url: str = None) -> Dict[str, Any]:
+        if not self.token:
+            return {'ok': False, 'error': 'no_token'}
+
+        target_channel = channel or self.default_channel
+        if not target_channel:
+            return {'ok': False, 'error': 'no_channel'}
+
+        payload = {'channel': target_channel, 'text': text, 'post_at': int(post_at)}
+        if blocks:
+            payload['blocks'] = blocks
+        if username:
+            payload['username'] = username
+        if icon_url:
+            payload['icon_url'] = icon_url
+
+        try:
+            resp = http_session().post(
+                f'{self.api_base}/chat.scheduleMessage',
+                headers=self._headers(),
+                json=payload,
+                timeout=10
+            )
+            return self._with_retry_after(resp)
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
+    def schedule_as_user(self, text: str, user: Dict, post_at: int, channel: str = None,
+                         blocks: List[Dict] = None) -> Dict[str, Any]:
+        slack_id = user.get('slack_id', '')
+        if slack_id:
+            profile = self.get_user_profile(slack_id)
+            return self.schedule_message(text, post_at, channel, blocks,
+                                         username=profile.get('name') or user.get('name'),
+                                         icon_url=profile.get('icon_url'))
+        return self.schedule_message(text, post_at, channel, blocks, username=user.get('name'))
+
+    def delete_scheduled_message(self, channel: str, scheduled_message_id: str) -> Dict[str, Any]:
+        if not self.token:
+            return {'ok': False, 'error': 'no_token'}
+        try:
+            resp = http_session().post(
+                f'{self.api_base}/chat.deleteScheduledMessage',
+                headers=self._headers(),
+                json={'channel': channel, 'scheduled_message_id': scheduled_message_id},
+                timeout=10
+            )
+            return resp.json()
+        except Exception as e:
+            return {'ok': False, 'error': str(e)}
+
     def send_dm(self, user_id: str, text: str, blocks: List[Dict] = None) -> Dict[str, Any]:
         if not self.token:
             return {'ok': False, 'error': 'no_token'}
         
         try:
-            open_resp = requests.post(
+            open_resp = http_session().post(
                 f'{self.api_base}/conversations.open',
                 headers=self._headers(),
                 json={'users': user_id},
@@ -699,14 +941,14 @@ class SlackClient:
         except Exception as e:
             return {'ok': False, 'error': str(e)}
     
-    def get_recent_channels(self, minutes: int = 10) -> List[Dict]:
+    def list_channels(self, limit: int = 200) -> List[Dict]:
         if not self.token:
             return []
         try:
-            params = {'types': 'public_channel,private_channel', 'limit': 100}
+            params = {'types': 'public_channel,private_channel', 'limit': limit}
             if self.team_id:
                 params['team_id'] = self.team_id
-            response = requests.get(
+            response = http_session().get(
                 f'{self.api_base}/conversations.list',
                 headers=self._headers(),
                 params=params,
@@ -716,23 +958,31 @@ class SlackClient:
             if not data.get('ok'):
                 logger.error(f"Failed to list channels: {data.get('error')}")
                 return []
-
-            cutoff = datetime.now(timezone.utc) - timedelta(minutes=minutes)
-            recent = []
-            for ch in data.get('channels', []):
-                created = datetime.fromtimestamp(ch.get('created', 0), tz=timezone.utc)
-                if created > cutoff:
-                    recent.append(ch)
-            return recent
+            return data.get('channels', [])
         except Exception as e:
             logger.error(f"Error listing channels: {e}")
             return []
 
+    @staticmethod
+    def filter_recent_channels(channels: List[Dict], minutes: int = 10) -> List[Dict]:
+        cutoff = datetime.now(timezone.utc) - timedelta(minutes=minutes)
+        return [ch for ch in channels if datetime.fromtimestamp(ch.get('created', 0), tz=timezone.utc) > cutoff]
+
+    @staticmethod
+    def match_channel(channels: List[Dict], pattern: str) -> Optional[str]:
+        for channel in channels:
+            if re.search(pattern, channel.get('name', ''), re.IGNORECASE):
+                return channel['id']
+        return None
+
+    def get_recent_channels(self, minutes: int = 10) -> List[Dict]:
+        return self.filter_recent_channels(self.list_channels(), minutes)
+
     def get_channel_messages(self, channel_id: str, limit: int = 5) -> List[Dict]:
         if not self.token:
             return []
         try:
-            response = requests.get(
+            response = http_session().get(
                 f'{self.api_base}/conversations.history',
                 headers=self._headers(),
                 params={'channel': channel_id, 'limit': limit},
@@ -753,7 +1003,7 @@ class SlackClient:
             params = {'user': user_id, 'types': 'public_channel,private_channel', 'limit': 200}
             if self.team_id:
                 params['team_id'] = self.team_id
-            response = requests.get(
+            response = http_session().get(
                 f'{self.api_base}/users.conversations',
                 headers=self._headers(),
                 params=params,
@@ -766,7 +1016,7 @@ class SlackClient:
                     ch_id = channel.get('id')
                     if ch_name.startswith('demo-') and ch_id != keep_channel_id:
                         try:
-                            kick_resp = requests.post(
+                            kick_resp = http_session().post(
                                 f'{self.api_base}/conversations.kick',
                                 headers=self._headers(),
                                 json={'channel': ch_id, 'user': user_id},
@@ -788,7 +1038,7 @@ class SlackClient:
         if not self.token:
             return {'ok': False, 'error': 'no_token'}
         try:
-            response = requests.post(
+            response = http_session().post(
                 f'{self.api_base}/conversations.invite',
                 headers=self._headers(),
                 json={'channel': channel_id, 'users': user_id},
@@ -798,7 +1048,7 @@ class SlackClient:
             if data.get('error') == 'user_is_restricted':
                 logger.info(f"User {user_id} is restricted, removing from old demo channels...")
                 self.remove_user_from_old_demo_channels(user_id, keep_channel_id=channel_id)
-                response = requests.post(
+                response = http_session().post(
                     f'{self.api_base}/conversations.invite',
                     headers=self._headers(),
                     json={'channel': channel_id, 'users': user_id},
@@ -813,7 +1063,7 @@ class SlackClient:
         if not self.token:
             return {'ok': False, 'error': 'no_token'}
         try:
-            response = requests.post(
+            response = http_session().post(
                 f'{self.api_base}/conversations.create',
                 headers=self._headers(),
                 json={'name': name, 'is_private': is_private},
@@ -823,34 +1073,32 @@ class SlackClient:
         except Exception as e:
             return {'ok': False, 'error': str(e)}
 
-    def find_channel_by_pattern(self, pattern: str) -> Optional[str]:
+    def archive_channel(self, channel_id: str) -> Dict[str, Any]:
         if not self.token:
-            return None
+            return {'ok': False, 'error': 'no_token'}
         try:
-            params = {'types': 'public_channel,private_channel', 'limit': 200}
-            if self.team_id:
-                params['team_id'] = self.team_id
-            response = requests.get(
-                f'{self.api_base}/conversations.list',
+            response = http_session().post(
+                f'{self.api_base}/conversations.archive',
                 headers=self._headers(),
-                params=params,
+                json={'channel': channel_id},
                 timeout=10
             )
             data = response.json()
-            if data.get('ok'):
-                import re
-                for channel in data.get('channels', []):
-                    if re.search(pattern, channel.get('name', '')):
-                        return channel['id']
+            if not data.get('ok') and data.get('error') != 'already_archived':
+                logger.warning(f"Failed to archive channel {channel_id}: {data.get('error')}")
+            return data
         except Exception as e:
-            logger.error(f"Error finding channel: {e}")
-        return None
+            logger.error(f"Error archiving channel: {e}")
+            return {'ok': False, 'error': str(e)}
+
+    def find_channel_by_pattern(self, pattern: str) -> Optional[str]:
+        return self.match_channel(self.list_channels(), pattern)
 
     def join_channel(self, channel_id: str) -> Dict[str, Any]:
         if not self.token:
             return {'ok': False, 'error': 'no_token'}
         try:
-            response = requests.post(
+            response = http_session().post(
                 f'{self.api_base}/conversations.join',
                 headers=self._headers(),
                 json={'channel': channel_id},
@@ -870,7 +1118,7 @@ class SlackClient:
         if not self.token:
             return None
         try:
-            response = requests.get(
+            response = http_session().get(
                 f'{self.api_base}/conversations.info',
                 headers=self._headers(),
                 params={'channel': channel_id},
@@ -895,7 +1143,7 @@ class SlackClient:
             if not user_id:
                 continue
             try:
-                response = requests.post(
+                response = http_session().post(
                     f'{self.api_base}/conversations.invite',
                     headers=self._headers(),
                     json={'channel': channel_id, 'users': user_id},
@@ -0,0 +1,35 @@
+from .templates import Shuffler
+
+RESPONDER_CONVERSATIONS = {
+    'investigating': [
+        "Looking into this now, checking the logs...",
+        "I'm on it. Pulling up the monitoring dashboards.",
+        "Investigating the root cause, one moment.",
+        "Checking the recent deployments to see if anything changed.",
+    ],
+    'found_issue': [
+        "Found something - there's a spike in the error logs around the time this started.",
+        "I think I see the issue. The connection pool is exhausted.",
+        "Looks like a memory leak is causing the degradation.",
+        "Found it - there's a deadlock in the database queries.",
+    ],
+    'working_fix': [
+        "Working on a fix now, should have something shortly.",
+        "Deploying a hotfix to address this.",
+        "Running the remediation playbook.",
+        "Scaling up the instances to handle the load.",
+    ],
+    'resolved': [
+        "Fix deployed, monitoring for stability. Looks good so far.",
+        "Issue resolved. Root cause was identified and addressed.",
+        "All systems back to normal. Will follow up with a post-incident review.",
+        "Resolved! The automated remediation worked. Incident closed.",
+    ],
+}
+
+
+_POOLS = {category: Shuffler(messages) for category, messages in RESPONDER_CONVERSATIONS.items()}
+
+
+def get_conversation_message(category: str) -> str:
+    return _POOLS.get(category, _POOLS['investigating']).draw()
@@ -0,0 +1,75 @@
+import os
+import time
+import logging
+from typing import Any, Optional, Union
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_SAFETY_SECONDS = float(os.environ.get('DEADLINE_SAFETY_SECONDS', 3))
+DEADLINE_MIN_CALL_SECONDS = float(os.environ.get('DEADLINE_MIN_CALL_SECONDS', 1))
+
+Timeout = Union[None, float, tuple]
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    def __init__(self, remaining: float):
+        super().__init__(f"Invocation deadline reached ({max(remaining, 0):.1f}s left)")
+        self.remaining = remaining
+
+
+class Deadline:
+    __slots__ = ('expires_at',)
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    @classmethod
+    def from_context(cls, context: Any, safety: float = None) -> 'Deadline':
+        if context is None or not hasattr(context, 'get_remaining_time_in_millis'):
+            return cls()
+        safety = DEADLINE_SAFETY_SECONDS if safety is None else safety
+        return cls(context.get_remaining_time_in_millis() / 1000 - safety)
+
+    @property
+    def bounded(self) -> bool:
+        return self.expires_at is not None
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return float('inf')
+        return self.expires_at - time.monotonic()
+
+    def expired(self, reserve: float = 0) -> bool:
+        return self.remaining() <= reserve
+
+    def fits(self, seconds: float, reserve: float = 0) -> bool:
+        return self.remaining() - seconds > reserve
+
+    def clamp(self, timeout: Timeout) -> Timeout:
+        remaining = self.remaining()
+        if remaining == float('inf'):
+            return timeout
+        if remaining < DEADLINE_MIN_CALL_SECONDS:
+            raise DeadlineExceeded(remaining)
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+
+_current = Deadline()
+
+
+def current_deadline() -> Deadline:
+    return _current
+
+
+def set_deadline(deadline: Deadline = None) -> Deadline:
+    global _current
+    _current = deadline or Deadline()
+    if _current.bounded:
+        logger.info(f"Invocation deadline set: {_current.remaining():.1f}s")
+    return _current
@@ -0,0 +1,110 @@
+import os
+import time
+import logging
+import threading
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+PD_HEDGE_ENABLED = os.environ.get('PD_HEDGE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+HEDGE_PERCENTILE = float(os.environ.get('HEDGE_PERCENTILE', 0.95))
+HEDGE_MAX_RATE = float(os.environ.get('HEDGE_MAX_RATE', 0.05))
+HEDGE_MIN_SAMPLES = int(os.environ.get('HEDGE_MIN_SAMPLES', 20))
+HEDGE_WINDOW = int(os.environ.get('HEDGE_WINDOW', 200))
+HEDGE_MIN_DELAY_MS = float(os.environ.get('HEDGE_MIN_DELAY_MS', 50))
+HEDGE_WORKERS = int(os.environ.get('HEDGE_WORKERS', 16))
+
+
+@functools.lru_cache(maxsize=None)
+def _executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix='hedge')
+
+
+class RequestHedger:
+    def __init__(self, name: str, percentile: float = None, max_rate: float = None,
+                 min_samples: int = None, window: int = None):
+        self.name = name
+        self.percentile = HEDGE_PERCENTILE if percentile is None else percentile
+        self.max_rate = HEDGE_MAX_RATE if max_rate is None else max_rate
+        self.min_samples = HEDGE_MIN_SAMPLES if min_samples is None else min_samples
+        window = HEDGE_WINDOW if window is None else window
+        self._latencies: deque = deque(maxlen=window)
+        self._decisions: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'hedged': 0, 'hedge_wins': 0, 'capped': 0}
+
+    def threshold(self) -> Optional[float]:
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return max(ordered[index], HEDGE_MIN_DELAY_MS / 1000)
+
+    def _timed(self, fn: Callable[[], Any]) -> Any:
+        started = time.monotonic()
+        result = fn()
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+        return result
+
+    def _decide(self, wanted: bool) -> bool:
+        with self._lock:
+            allowed = wanted and sum(self._decisions) + 1 <= self.max_rate * len(self._decisions)
+            if wanted and not allowed:
+                self._stats['capped'] += 1
+            if allowed:
+                self._stats['hedged'] += 1
+            self._decisions.append(allowed)
+            return allowed
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._stats['requests'] += 1
+        delay = self.threshold()
+        if delay is None:
+            self._decide(False)
+            return self._timed(fn)
+
+        first = _executor().submit(self._timed, fn)
+        done, _ = wait([first], timeout=delay)
+        if not self._decide(not done):
+            return first.result()
+
+        logger.info(f"Hedging {self.name} after {delay * 1000:.0f}ms")
+        second = _executor().submit(self._timed, fn)
+        done, pending = wait([first, second], return_when=FIRST_COMPLETED)
+        winner = done.pop()
+        if winner.exception() is not None and pending:
+            winner = pending.pop()
+        if winner is second:
+            with self._lock:
+                self._stats['hedge_wins'] += 1
+        return winner.result()
+
+    def stats(self) -> Dict[str, Any]:
+        threshold = self.threshold()
+        with self._lock:
+            return {**self._stats, 'samples': len(self._latencies),
+                    'threshold_ms': round(threshold * 1000, 1) if threshold is not None else None}
+
+
+_hedgers: Dict[str, RequestHedger] = {}
+_hedgers_lock = threading.Lock()
+
+
+def request_hedger(name: str) -> RequestHedger:
+    hedger = _hedgers.get(name)
+    if hedger is None:
+        with _hedgers_lock:
+            hedger = _hedgers.get(name)
+            if hedger is None:
+                hedger = _hedgers[name] = RequestHedger(name)
+    return hedger
+
+
+def hedge_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: hedger.stats() for name, hedger in list(_hedgers.items())}
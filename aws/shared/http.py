@@ -0,0 +1,83 @@
+import os
+import threading
+import functools
+from typing import Dict, Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .breaker import CIRCUIT_BREAKER_ENABLED, CircuitOpenError, circuit_breaker, dependency_for_host
+from .deadline import current_deadline
+
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 16))
+
+_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def _record_response(response, *args, **kwargs):
+    host = urlsplit(response.url).netloc
+    elapsed_ms = response.elapsed.total_seconds() * 1000
+    with _stats_lock:
+        entry = _stats.setdefault(host, {'requests': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+        entry['requests'] += 1
+        entry['total_ms'] += elapsed_ms
+        entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+        if not response.ok:
+            entry['errors'] += 1
+
+
+def _clamp_timeout(kwargs: Dict[str, Any]) -> bool:
+    requested = kwargs.get('timeout')
+    kwargs['timeout'] = current_deadline().clamp(requested)
+    return kwargs['timeout'] != requested
+
+
+class DeadlineAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        _clamp_timeout(kwargs)
+        return super().send(request, **kwargs)
+
+
+class CircuitBreakerAdapter(HTTPAdapter):
+    def send(self, request, **kwargs):
+        clamped = _clamp_timeout(kwargs)
+        dependency = dependency_for_host(urlsplit(request.url).netloc)
+        if dependency is None:
+            return super().send(request, **kwargs)
+        breaker = circuit_breaker(dependency)
+        if not breaker.allow():
+            raise CircuitOpenError(dependency, breaker.retry_in())
+        try:
+            response = super().send(request, **kwargs)
+        except requests.exceptions.Timeout:
+            if clamped:
+                breaker.release()
+            else:
+                breaker.record(False)
+            raise
+        except Exception:
+            breaker.record(False)
+            raise
+        breaker.record(response.status_code < 500)
+        return response
+
+
+@functools.lru_cache(maxsize=None)
+def http_session() -> requests.Session:
+    session = requests.Session()
+    adapter_class = CircuitBreakerAdapter if CIRCUIT_BREAKER_ENABLED else DeadlineAdapter
+    adapter = adapter_class(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.hooks['response'].append(_record_response)
+    return session
+
+
+def http_stats() -> Dict[str, Dict[str, Any]]:
+    with _stats_lock:
+        return {
+            host: {**entry, 'avg_ms': round(entry['total_ms'] / entry['requests'], 1) if entry['requests'] else 0.0}
+            for host, entry in _stats.items()
+        }
@@ -0,0 +1,291 @@
+import os
+import json
+import time
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from typing import Dict, Any, List, Optional
+
+from .aws import aws_resource
+from .snapshot import OPEN_STATUSES, is_demo_incident
+
+logger = logging.getLogger(__name__)
+
+INCIDENT_MIRROR_TABLE = os.environ.get('INCIDENT_MIRROR_TABLE', '')
+INCIDENT_MIRROR_MAX_AGE = int(os.environ.get('INCIDENT_MIRROR_MAX_AGE', 900))
+INCIDENT_MIRROR_LOOKUPS = int(os.environ.get('INCIDENT_MIRROR_LOOKUPS', 100))
+
+STATUS_INDEX = 'status-index'
+DEMO_INDEX = 'demo-status-index'
+META_KEY = '__mirror__'
+FRESHNESS_CHECK_SECONDS = 60
+OPEN_TTL = timedelta(days=7)
+RESOLVED_TTL = timedelta(days=1)
+
+EVENT_STATUS = {
+    'incident.triggered': 'triggered',
+    'incident.acknowledged': 'acknowledged',
+    'incident.unacknowledged': 'triggered',
+    'incident.reopened': 'triggered',
+    'incident.resolved': 'resolved',
+}
+MIRRORED_EVENTS = set(EVENT_STATUS) | {
+    'incident.escalated',
+    'incident.reassigned',
+    'incident.priority_updated',
+}
+MIRROR_FIELDS = [
+    'title', 'status', 'incident_number', 'incident_key', 'urgency', 'created_at', 'html_url',
+    'service', 'escalation_policy', 'priority', 'assignments', 'last_status_change_at',
+]
+WEBHOOK_FIELDS = [
+    ('title', 'title'),
+    ('status', 'status'),
+    ('number', 'incident_number'),
+    ('incident_key', 'incident_key'),
+    ('urgency', 'urgency'),
+    ('created_at', 'created_at'),
+    ('html_url', 'html_url'),
+    ('service', 'service'),
+    ('escalation_policy', 'escalation_policy'),
+    ('priority', 'priority'),
+]
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _timestamp(value: Any = None) -> str:
+    moment = datetime.fromisoformat(value.replace('Z', '+00:00')) if value else datetime.now(timezone.utc)
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+def incident_from_webhook(event_data: Dict) -> Dict:
+    data = event_data.get('data', {})
+    if data.get('type') != 'incident':
+        data = data.get('incident', {})
+    incident = {'id': data.get('id', '')}
+    for source, target in WEBHOOK_FIELDS:
+        if source in data:
+            incident[target] = data[source]
+    if 'assignees' in data:
+        incident['assignments'] = [{'assignee': assignee} for assignee in data['assignees'] or []]
+    status = EVENT_STATUS.get(event_data.get('event_type', ''))
+    if status:
+        incident['status'] = status
+    return incident
+
+
+class IncidentMirror:
+    def __init__(self, table_name: str = None, max_age: int = None):
+        self.table_name = INCIDENT_MIRROR_TABLE if table_name is None else table_name
+        self.max_age = INCIDENT_MIRROR_MAX_AGE if max_age is None else max_age
+        self._table = None
+        self._fresh = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.table_name)
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = aws_resource('dynamodb').Table(self.table_name)
+        return self._table
+
+    def upsert(self, incident: Dict, observed_at: str = None) -> bool:
+        incident_id = incident.get('id')
+        if not self.enabled or not incident_id:
+            return False
+        values = {field: incident[field] for field in MIRROR_FIELDS if field in incident}
+        for key in ('status', 'created_at'):
+            if not values.get(key):
+                values.pop(key, None)
+        status = values.get('status')
+        if status and 'title' not in values:
+            logger.warning(f"Dropping status of {incident_id}: no title to index it by")
+            values.pop('status')
+            status = None
+        ttl = datetime.now(timezone.utc) + (RESOLVED_TTL if status == 'resolved' else OPEN_TTL)
+        values.update({'observed_at': _timestamp(observed_at), 'ttl': int(ttl.timestamp())})
+
+        removes = []
+        if status and is_demo_incident(values):
+            values['demo_status'] = status
+        elif status:
+            removes.append('#demo_status')
+        names = {f'#{k}': k for k in values}
+        names.update({k: k[1:] for k in removes})
+        expression = 'SET ' + ', '.join(f'#{k} = :{k}' for k in values)
+        if removes:
+            expression += ' REMOVE ' + ', '.join(removes)
+        try:
+            self.table.update_item(
+                Key={'incident_id': incident_id},
+                UpdateExpression=expression,
+                ConditionExpression='attribute_not_exists(#observed_at) OR #observed_at <= :observed_at',
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=json.loads(
+                    json.dumps({f':{k}': v for k, v in values.items()}), parse_float=Decimal),
+            )
+            return True
+        except Exception as e:
+            if 'ConditionalCheckFailed' in type(e).__name__ or 'ConditionalCheckFailed' in str(e):
+                logger.info(f"Skipping out-of-order mirror update for {incident_id} observed at {values['observed_at']}")
+            else:
+                logger.error(f"Error mirroring incident {incident_id}: {e}")
+            return False
+
+    def apply_webhook(self, event_data: Dict) -> bool:
+        event_type = event_data.get('event_type', '')
+        if not self.enabled or event_type not in MIRRORED_EVENTS:
+            return False
+        return self.upsert(incident_from_webhook(event_data), event_data.get('occurred_at'))
+
+    def remove(self, incident_id: str, observed_at: str = None) -> bool:
+        if not self.enabled or not incident_id:
+            return False
+        try:
+            self.table.delete_item(
+                Key={'incident_id': incident_id},
+                ConditionExpression='attribute_not_exists(#observed_at) OR #observed_at <= :observed_at',
+                ExpressionAttributeNames={'#observed_at': 'observed_at'},
+                ExpressionAttributeValues={':observed_at': _timestamp(observed_at)},
+            )
+            return True
+        except Exception as e:
+            if 'ConditionalCheckFailed' in type(e).__name__ or 'ConditionalCheckFailed' in str(e):
+                logger.info(f"Keeping mirror row for {incident_id}: updated after {observed_at}")
+            else:
+                logger.error(f"Error removing mirrored incident {incident_id}: {e}")
+            return False
+
+    def _query(self, index: str, status: str, since: str = None) -> List[Dict]:
+        key = 'demo_status' if index == DEMO_INDEX else 'status'
+        kwargs = {
+            'IndexName': index,
+            'KeyConditionExpression': '#key = :status' + (' AND #created_at >= :since' if since else ''),
+            'ExpressionAttributeNames': {'#key': key, **({'#created_at': 'created_at'} if since else {})},
+            'ExpressionAttributeValues': {':status': status, **({':since': since} if since else {})},
+        }
+        items = []
+        while True:
+            response = self.table.query(**kwargs)
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                return items
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def incidents(self, statuses: List[str] = None, demo_only: bool = False, since: str = None) -> List[Dict]:
+        index = DEMO_INDEX if demo_only else STATUS_INDEX
+        items = []
+        for status in statuses or OPEN_STATUSES:
+            items.extend(self._query(index, status, since))
+        items.sort(key=lambda item: item.get('created_at', ''))
+        return [self.to_incident(item) for item in items]
+
+    @staticmethod
+    def to_incident(item: Dict) -> Dict:
+        incident = {'id': item['incident_id']}
+        incident.update({field: _plain(item[field]) for field in MIRROR_FIELDS if field in item})
+        return incident
+
+    def fresh(self) -> bool:
+        if not self.enabled:
+            return False
+        if self._fresh and time.monotonic() - self._fresh[1] < FRESHNESS_CHECK_SECONDS:
+            return self._fresh[0]
+        try:
+            item = self.table.get_item(Key={'incident_id': META_KEY}).get('Item') or {}
+            reconciled_at = item.get('reconciled_at')
+            fresh = bool(reconciled_at) and (
+                datetime.now(timezone.utc) - datetime.fromisoformat(reconciled_at)
+            ).total_seconds() <= self.max_age
+        except Exception as e:
+            logger.error(f"Error checking incident mirror freshness: {e}")
+            fresh = False
+        self._fresh = (fresh, time.monotonic())
+        return fresh
+
+    def read(self, statuses: List[str] = None, demo_only: bool = False, since: str = None) -> Optional[List[Dict]]:
+        if not self.fresh():
+            return None
+        try:
+            return self.incidents(statuses, demo_only, since)
+        except Exception as e:
+            logger.error(f"Error reading incident mirror: {e}")
+            return None
+
+    def reconcile(self, pd_client) -> Dict[str, Any]:
+        if not self.enabled:
+            return {'enabled': False}
+        started = _timestamp()
+        incidents = pd_client.list_all_incidents(OPEN_STATUSES)
+        live = {incident['id'] for incident in incidents}
+        written = sum(self.upsert(incident, started) for incident in incidents)
+
+        try:
+            mirrored = self.incidents(OPEN_STATUSES)
+        except Exception as e:
+            logger.error(f"Error reading incident mirror for reconciliation: {e}")
+            return {'enabled': True, 'fetched': len(incidents), 'written': written, 'reconciled': False}
+        missing = [incident['id'] for incident in mirrored if incident['id'] not in live]
+        lookups = missing[:INCIDENT_MIRROR_LOOKUPS]
+        corrected = removed = 0
+        if lookups:
+            with ThreadPoolExecutor(max_workers=min(8, len(lookups))) as pool:
+                current = list(pool.map(pd_client.lookup_incident, lookups))
+            found = [result['incident'] for result in current if result['incident']]
+            gone = [incident_id for incident_id, result in zip(lookups, current)
+                    if result['success'] and not result['incident']]
+            corrected = sum(self.upsert(incident, started) for incident in found)
+            removed = sum(self.remove(incident_id, started) for incident_id in gone)
+            reconciled = all(result['success'] for result in current) and len(lookups) == len(missing)
+        else:
+            reconciled = True
+
+        if reconciled:
+            self.table.put_item(Item={'incident_id': META_KEY, 'reconciled_at': started})
+            self._fresh = (True, time.monotonic())
+        result = {
+            'enabled': True,
+            'fetched': len(incidents),
+            'written': written,
+            'drifted': len(missing),
+            'corrected': corrected,
+            'removed': removed,
+            'reconciled': reconciled,
+        }
+        logger.info(f"Reconciled incident mirror: {result}")
+        return result
+
+
+@functools.lru_cache(maxsize=None)
+def incident_mirror() -> IncidentMirror:
+    return IncidentMirror()
+
+
+def mirrored_incidents(pd_client, statuses: List[str] = None, demo_only: bool = False) -> List[Dict]:
+    incidents = incident_mirror().read(statuses, demo_only)
+    if incidents is not None:
+        return incidents
+    if demo_only:
+        return pd_client.get_demo_incidents(statuses)
+    return pd_client.list_all_incidents(statuses or OPEN_STATUSES)
+
+
+def mirrored_recent_incidents(pd_client, minutes: int = 15, statuses: List[str] = None) -> List[Dict]:
+    since = (datetime.now(timezone.utc) - timedelta(minutes=minutes)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    incidents = incident_mirror().read(statuses, since=since)
+    if incidents is not None:
+        return incidents
+    return pd_client.list_recent_incidents(minutes, statuses)
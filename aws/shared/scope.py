@@ -0,0 +1,69 @@
+import time
+import uuid
+import logging
+from typing import Dict, Any, Iterable, List
+
+from .mirror import incident_mirror
+
+logger = logging.getLogger(__name__)
+
+RUN_ID_FIELD = 'demo_run_id'
+OPEN_STATUSES = ['triggered', 'acknowledged']
+
+
+def new_run_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def scenario_dedup_prefix(scenario_id: str) -> str:
+    return f"demo-{scenario_id}-"
+
+
+def demo_dedup_key(scenario_id: str, run_id: str = None) -> str:
+    suffix = f"{run_id}-{int(time.time())}" if run_id else str(int(time.time()))
+    return f"{scenario_dedup_prefix(scenario_id or 'unknown')}{suffix}"
+
+
+def incident_in_scope(incident: Dict, run_id: str = None, scenario_id: str = None) -> bool:
+    key = incident.get('incident_key') or ''
+    if scenario_id and not key.startswith(scenario_dedup_prefix(scenario_id)):
+        return False
+    if run_id and f"-{run_id}-" not in key:
+        return False
+    return True
+
+
+def find_scoped_incidents(pd_client, run_id: str = None, scenario_id: str = None,
+                          statuses: List[str] = None, use_mirror: bool = False) -> List[Dict]:
+    incidents = incident_mirror().read(statuses, demo_only=True) if use_mirror else None
+    if incidents is not None and (run_id or scenario_id) and not all(i.get('incident_key') for i in incidents):
+        incidents = None
+    if incidents is None:
+        incidents = pd_client.get_demo_incidents(statuses or OPEN_STATUSES)
+    return [i for i in incidents if incident_in_scope(i, run_id, scenario_id)]
+
+
+def teardown(pd_client, incident_ids: Iterable[str], slack_client=None, channel_ids: Iterable[str] = (),
+             user_email: str = None, resolution: str = None) -> Dict[str, Any]:
+    incident_ids = list(dict.fromkeys(i for i in incident_ids if i))
+    if incident_ids:
+        result = pd_client.resolve_incidents(incident_ids, user_email, resolution)
+    else:
+        result = {'resolved': [], 'failed': []}
+
+    archived, archive_failed = [], []
+    for channel_id in dict.fromkeys(c for c in channel_ids if c):
+        data = slack_client.archive_channel(channel_id) if slack_client else {'ok': False, 'error': 'no_slack_client'}
+        if data.get('ok') or data.get('error') == 'already_archived':
+            archived.append(channel_id)
+        else:
+            archive_failed.append(channel_id)
+
+    logger.info(f"Teardown resolved {len(result['resolved'])}/{len(incident_ids)} incidents, "
+                f"archived {len(archived)} channels")
+    return {
+        'resolved': result['resolved'],
+        'failed': result['failed'],
+        'channels_archived': archived,
+        'channels_failed': archive_failed,
+    }
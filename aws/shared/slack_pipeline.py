@@ -0,0 +1,138 @@
+import os
+import time
+import heapq
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional
+
+from .deadline import DEADLINE_MIN_CALL_SECONDS, current_deadline
+
+logger = logging.getLogger(__name__)
+
+SLACK_CHANNEL_INTERVAL = float(os.environ.get('SLACK_CHANNEL_INTERVAL', 1.0))
+SLACK_PIPELINE_WORKERS = int(os.environ.get('SLACK_PIPELINE_WORKERS', 4))
+SLACK_RATELIMIT_RETRIES = int(os.environ.get('SLACK_RATELIMIT_RETRIES', 5))
+
+
+class _QueuedMessage:
+    __slots__ = ('text', 'kwargs', 'attempts')
+
+    def __init__(self, text: str, kwargs: Dict[str, Any]):
+        self.text = text
+        self.kwargs = kwargs
+        self.attempts = 0
+
+
+class SlackPostingPipeline:
+    def __init__(self, slack, interval: float = None, max_workers: int = None, max_retries: int = None):
+        self.slack = slack
+        self.interval = SLACK_CHANNEL_INTERVAL if interval is None else interval
+        self.max_workers = max(1, max_workers or SLACK_PIPELINE_WORKERS)
+        self.max_retries = SLACK_RATELIMIT_RETRIES if max_retries is None else max_retries
+        self._queues: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._stats = {'posted': 0, 'failed': 0, 'ratelimited': 0}
+        self._errors: List[Dict[str, Any]] = []
+
+    def post_message(self, text: str, channel: str = None, blocks: List[Dict] = None,
+                     username: str = None, icon_url: str = None) -> Dict[str, Any]:
+        target_channel = channel or self.slack.default_channel
+        if not target_channel:
+            return {'ok': False, 'error': 'no_channel'}
+        kwargs = {k: v for k, v in (('blocks', blocks), ('username', username), ('icon_url', icon_url)) if v}
+        with self._lock:
+            queue = self._queues.setdefault(target_channel, deque())
+            queue.append(_QueuedMessage(text, kwargs))
+            position = len(queue)
+        return {'ok': True, 'queued': True, 'channel': target_channel, 'position': position}
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(q) for q in self._queues.values())
+
+    def _send_next(self, channel: str) -> Optional[float]:
+        with self._lock:
+            queue = self._queues.get(channel)
+            if not queue:
+                return None
+            message = queue[0]
+
+        result = self.slack.post_message(message.text, channel, **message.kwargs)
+
+        with self._lock:
+            if result.get('error') == 'ratelimited' and message.attempts < self.max_retries:
+                message.attempts += 1
+                self._stats['ratelimited'] += 1
+                delay = max(result.get('retry_after', self.interval), self.interval)
+                logger.info(f"Slack rate limited channel {channel}, deferring it {delay:.1f}s")
+                return delay
+            queue.popleft()
+            if result.get('ok'):
+                self._stats['posted'] += 1
+            else:
+                self._stats['failed'] += 1
+                self._errors.append({'channel': channel, 'error': result.get('error')})
+                logger.warning(f"Failed to post to {channel}: {result.get('error')}")
+            return self.interval if queue else None
+
+    def flush(self) -> Dict[str, Any]:
+        with self._lock:
+            channels = [c for c, q in self._queues.items() if q]
+        if not channels:
+            return self.stats()
+
+        deadline = current_deadline()
+        started = time.monotonic()
+        ready = [(started, i, channel) for i, channel in enumerate(channels)]
+        sequence = len(ready)
+        stopped = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(channels))) as pool:
+            inflight = {}
+            while ready or inflight:
+                now = time.monotonic()
+                while ready and ready[0][0] <= now and len(inflight) < self.max_workers:
+                    _, _, channel = heapq.heappop(ready)
+                    if deadline.expired(DEADLINE_MIN_CALL_SECONDS):
+                        stopped.append(channel)
+                        continue
+                    inflight[pool.submit(self._send_next, channel)] = channel
+                if not inflight:
+                    if not ready:
+                        break
+                    time.sleep(max(0.0, ready[0][0] - now))
+                    continue
+                timeout = max(0.0, ready[0][0] - now) if ready and len(inflight) < self.max_workers else None
+                done, _ = wait(inflight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    channel = inflight.pop(future)
+                    try:
+                        delay = future.result()
+                    except Exception as e:
+                        logger.error(f"Slack posting pipeline error on {channel}: {e}")
+                        with self._lock:
+                            queue = self._queues.get(channel)
+                            if queue:
+                                queue.popleft()
+                                self._stats['failed'] += 1
+                                self._errors.append({'channel': channel, 'error': str(e)})
+                            delay = self.interval if queue else None
+                    if delay is not None and not deadline.fits(delay, DEADLINE_MIN_CALL_SECONDS):
+                        stopped.append(channel)
+                    elif delay is not None:
+                        sequence += 1
+                        heapq.heappush(ready, (time.monotonic() + delay, sequence, channel))
+
+        stats = self.stats()
+        if stopped:
+            logger.warning(f"Invocation deadline reached, leaving {stats['pending']} Slack messages queued "
+                           f"on {len(stopped)} channels")
+        logger.info(f"Flushed Slack pipeline: {stats['posted']} posted, {stats['failed']} failed, "
+                    f"{stats['ratelimited']} rate limited across {len(channels)} channels "
+                    f"in {time.monotonic() - started:.1f}s")
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, 'pending': sum(len(q) for q in self._queues.values()), 'errors': list(self._errors)}
@@ -0,0 +1,54 @@
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+OPEN_STATUSES = ['triggered', 'acknowledged']
+
+
+def is_demo_incident(incident: Dict) -> bool:
+    return '[DEMO]' in incident.get('title', '')
+
+
+class IncidentSnapshot:
+    def __init__(self, incidents: List[Dict]):
+        self.incidents = incidents
+        self._by_status = {status: [] for status in OPEN_STATUSES}
+        self._demo_by_status = {status: [] for status in OPEN_STATUSES}
+        self._non_demo = []
+        for incident in incidents:
+            status = incident.get('status')
+            demo = is_demo_incident(incident)
+            self._by_status.setdefault(status, []).append(incident)
+            if demo:
+                self._demo_by_status.setdefault(status, []).append(incident)
+            else:
+                self._non_demo.append(incident)
+
+    @classmethod
+    def fetch(cls, pd_client, statuses: List[str] = None) -> 'IncidentSnapshot':
+        incidents = pd_client.list_all_incidents(statuses or OPEN_STATUSES)
+        logger.info(f"Fetched incident snapshot: {len(incidents)} open incidents")
+        return cls(incidents)
+
+    def with_status(self, status: str) -> List[Dict]:
+        return self._by_status.get(status, [])
+
+    def demo(self, status: str = None) -> List[Dict]:
+        if status:
+            return self._demo_by_status.get(status, [])
+        return [i for i in self.incidents if is_demo_incident(i)]
+
+    def non_demo(self) -> List[Dict]:
+        return self._non_demo
+
+    @property
+    def triggered(self) -> List[Dict]:
+        return self.with_status('triggered')
+
+    @property
+    def acknowledged(self) -> List[Dict]:
+        return self.with_status('acknowledged')
+
+    def __len__(self) -> int:
+        return len(self.incidents)
@@ -0,0 +1,210 @@
+import os
+import json
+import sqlite3
+import logging
+import threading
+from decimal import Decimal
+from typing import Dict, Any, List, Optional
+
+from .aws import aws_resource
+
+logger = logging.getLogger(__name__)
+
+DEMO_STATE_BACKEND = os.environ.get('DEMO_STATE_BACKEND', 'dynamodb').lower()
+DEMO_STATE_SQLITE_PATH = os.environ.get('DEMO_STATE_SQLITE_PATH', '/tmp/demo-state.db')
+
+
+class _DecimalEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj) if obj % 1 else int(obj)
+        return super().default(obj)
+
+
+def _dynamo(value: Any) -> Any:
+    return json.loads(json.dumps(value, cls=_DecimalEncoder), parse_float=Decimal)
+
+
+def _copy(value: Any) -> Any:
+    return json.loads(json.dumps(value, cls=_DecimalEncoder))
+
+
+def _matches(item: Dict, where: Dict[str, Any] = None, exclude: Dict[str, Any] = None) -> bool:
+    for field, value in (where or {}).items():
+        if item.get(field) != value:
+            return False
+    for field, value in (exclude or {}).items():
+        if field not in item or item[field] == value:
+            return False
+    return True
+
+
+class DynamoDBStateBackend:
+    def __init__(self, table_name: str, key: str = 'incident_id'):
+        self.table_name = table_name
+        self.key = key
+        self._table = None
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = aws_resource('dynamodb').Table(self.table_name)
+        return self._table
+
+    def put(self, item: Dict):
+        self.table.put_item(Item=_dynamo(item))
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.table.get_item(Key={self.key: key}).get('Item')
+
+    def update(self, key: str, updates: Dict[str, Any]):
+        self.table.update_item(
+            Key={self.key: key},
+            UpdateExpression='SET ' + ', '.join(f'#{k} = :{k}' for k in updates),
+            ExpressionAttributeNames={f'#{k}': k for k in updates},
+            ExpressionAttributeValues=_dynamo({f':{k}': v for k, v in updates.items()}),
+        )
+
+    def append(self, key: str, field: str, values: List[Any]):
+        self.table.update_item(
+            Key={self.key: key},
+            UpdateExpression='SET #field = list_append(if_not_exists(#field, :empty), :values)',
+            ExpressionAttributeNames={'#field': field},
+            ExpressionAttributeValues={':empty': [], ':values': _dynamo(values)},
+        )
+
+    def set_in_list(self, key: str, field: str, index: int, updates: Dict[str, Any]):
+        self.table.update_item(
+            Key={self.key: key},
+            UpdateExpression='SET ' + ', '.join(f'#field[{int(index)}].#{k} = :{k}' for k in updates),
+            ExpressionAttributeNames={'#field': field, **{f'#{k}': k for k in updates}},
+            ExpressionAttributeValues=_dynamo({f':{k}': v for k, v in updates.items()}),
+        )
+
+    def delete(self, key: str):
+        self.table.delete_item(Key={self.key: key})
+
+    def scan(self, where: Dict[str, Any] = None, exclude: Dict[str, Any] = None) -> List[Dict]:
+        clauses = [f'#{k} = :{k}' for k in where or {}] + [f'#{k} <> :not_{k}' for k in exclude or {}]
+        kwargs = {}
+        if clauses:
+            kwargs = {
+                'FilterExpression': ' AND '.join(clauses),
+                'ExpressionAttributeNames': {f'#{k}': k for k in {**(where or {}), **(exclude or {})}},
+                'ExpressionAttributeValues': {
+                    **{f':{k}': v for k, v in (where or {}).items()},
+                    **{f':not_{k}': v for k, v in (exclude or {}).items()},
+                },
+            }
+        items = []
+        while True:
+            response = self.table.scan(**kwargs)
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                return items
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+class MemoryStateBackend:
+    def __init__(self, key: str = 'incident_id'):
+        self.key = key
+        self._items: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def put(self, item: Dict):
+        with self._lock:
+            self._items[item[self.key]] = _copy(item)
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            item = self._items.get(key)
+            return _copy(item) if item is not None else None
+
+    def update(self, key: str, updates: Dict[str, Any]):
+        with self._lock:
+            self._items.setdefault(key, {self.key: key}).update(_copy(updates))
+
+    def append(self, key: str, field: str, values: List[Any]):
+        with self._lock:
+            self._items.setdefault(key, {self.key: key}).setdefault(field, []).extend(_copy(values))
+
+    def set_in_list(self, key: str, field: str, index: int, updates: Dict[str, Any]):
+        with self._lock:
+            self._items[key][field][int(index)].update(_copy(updates))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def scan(self, where: Dict[str, Any] = None, exclude: Dict[str, Any] = None) -> List[Dict]:
+        with self._lock:
+            return [_copy(item) for item in self._items.values() if _matches(item, where, exclude)]
+
+
+class SQLiteStateBackend:
+    def __init__(self, path: str, key: str = 'incident_id'):
+        self.path = path
+        self.key = key
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS demo_state (key TEXT PRIMARY KEY, item TEXT NOT NULL)')
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def _modify(self, key: str, change, create: bool = True):
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT item FROM demo_state WHERE key = ?', (key,)).fetchone()
+            if row is None and not create:
+                raise KeyError(key)
+            item = json.loads(row[0]) if row else {self.key: key}
+            change(item)
+            conn.execute('INSERT OR REPLACE INTO demo_state (key, item) VALUES (?, ?)',
+                         (key, json.dumps(item, cls=_DecimalEncoder)))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def put(self, item: Dict):
+        self._connection().execute('INSERT OR REPLACE INTO demo_state (key, item) VALUES (?, ?)',
+                                   (item[self.key], json.dumps(item, cls=_DecimalEncoder)))
+
+    def get(self, key: str) -> Optional[Dict]:
+        row = self._connection().execute('SELECT item FROM demo_state WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def update(self, key: str, updates: Dict[str, Any]):
+        self._modify(key, lambda item: item.update(_copy(updates)))
+
+    def append(self, key: str, field: str, values: List[Any]):
+        self._modify(key, lambda item: item.setdefault(field, []).extend(_copy(values)))
+
+    def set_in_list(self, key: str, field: str, index: int, updates: Dict[str, Any]):
+        self._modify(key, lambda item: item[field][int(index)].update(_copy(updates)), create=False)
+
+    def delete(self, key: str):
+        self._connection().execute('DELETE FROM demo_state WHERE key = ?', (key,))
+
+    def scan(self, where: Dict[str, Any] = None, exclude: Dict[str, Any] = None) -> List[Dict]:
+        rows = self._connection().execute('SELECT item FROM demo_state').fetchall()
+        items = (json.loads(row[0]) for row in rows)
+        return [item for item in items if _matches(item, where, exclude)]
+
+
+def state_backend_from_env(table_name: str, key: str = 'incident_id', kind: str = None):
+    kind = (kind or DEMO_STATE_BACKEND).lower()
+    if kind == 'memory':
+        return MemoryStateBackend(key)
+    if kind == 'sqlite':
+        return SQLiteStateBackend(DEMO_STATE_SQLITE_PATH, key)
+    if kind != 'dynamodb':
+        logger.warning(f"Unknown demo state backend {kind!r} in DEMO_STATE_BACKEND, using dynamodb")
+    return DynamoDBStateBackend(table_name, key)
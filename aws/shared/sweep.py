@@ -0,0 +1,152 @@
+import os
+import time
+import logging
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, List, Optional
+
+from .breaker import breaker_stats
+from .deadline import Deadline, set_deadline
+from .hedge import hedge_stats
+from .mirror import mirrored_incidents
+from .slack_pipeline import SlackPostingPipeline
+from .snapshot import IncidentSnapshot
+from .users import get_user_directory
+
+logger = logging.getLogger(__name__)
+
+SWEEP_TICK_MINUTES = int(os.environ.get('SWEEP_TICK_MINUTES', 2))
+SWEEP_SAFETY_SECONDS = float(os.environ.get('SWEEP_SAFETY_SECONDS', 5))
+SWEEP_MIN_STAGE_SECONDS = float(os.environ.get('SWEEP_MIN_STAGE_SECONDS', 5))
+
+_MISSING = object()
+
+
+class SweepContext:
+    def __init__(self, pd, slack=None, event: Dict = None, deadline: float = None):
+        self.pd = pd
+        self.slack = slack
+        self.event = event or {}
+        self.deadline = deadline
+        self.stage_deadline = deadline
+        self.resolved = set()
+        self._memo: Dict[str, Any] = {}
+
+    @classmethod
+    def for_invocation(cls, pd, slack=None, event: Dict = None, context: Any = None) -> 'SweepContext':
+        deadline = set_deadline(Deadline.from_context(context, SWEEP_SAFETY_SECONDS))
+        return cls(pd, slack, event, deadline.expires_at)
+
+    def _memoize(self, key: str, loader: Callable[[], Any]) -> Any:
+        value = self._memo.get(key, _MISSING)
+        if value is _MISSING:
+            started = time.monotonic()
+            value = self._memo[key] = loader()
+            logger.info(f"Sweep loaded {key} in {(time.monotonic() - started) * 1000:.0f}ms")
+        return value
+
+    def invalidate(self, key: str = None):
+        if key is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(key, None)
+
+    @property
+    def snapshot(self) -> IncidentSnapshot:
+        return self._memoize('snapshot', lambda: IncidentSnapshot(mirrored_incidents(self.pd)))
+
+    @property
+    def users(self):
+        return self._memoize('users', lambda: get_user_directory(self.pd))
+
+    @property
+    def channels(self) -> List[Dict]:
+        return self._memoize('channels', self.slack.list_channels)
+
+    @property
+    def chat(self) -> SlackPostingPipeline:
+        return self._memoize('chat', lambda: SlackPostingPipeline(self.slack))
+
+    def find_channel(self, pattern: str) -> Optional[str]:
+        return self.slack.match_channel(self.channels, pattern)
+
+    def recent_channels(self, minutes: int = 10) -> List[Dict]:
+        return self.slack.filter_recent_channels(self.channels, minutes)
+
+    def time_left(self) -> float:
+        if self.stage_deadline is None:
+            return float('inf')
+        return self.stage_deadline - time.monotonic()
+
+    def out_of_time(self, reserve: float = 0) -> bool:
+        return self.time_left() <= reserve
+
+
+class SweepStage:
+    __slots__ = ('name', 'run', 'budget', 'every', 'window')
+
+    def __init__(self, name: str, run: Callable[[SweepContext], Any], budget: float,
+                 every: int = 1, window: Callable[[datetime], bool] = None):
+        self.name = name
+        self.run = run
+        self.budget = budget
+        self.every = every
+        self.window = window
+
+    def due(self, now: datetime, tick_minutes: int = None) -> bool:
+        tick = tick_minutes or SWEEP_TICK_MINUTES
+        if self.window and not self.window(now):
+            return False
+        return int(now.timestamp() // 60) % self.every < tick
+
+
+class SweepRunner:
+    def __init__(self, stages: List[SweepStage], tick_minutes: int = None):
+        self.stages = stages
+        self.tick_minutes = tick_minutes or SWEEP_TICK_MINUTES
+
+    def run(self, ctx: SweepContext, only: List[str] = None, now: datetime = None) -> Dict[str, Any]:
+        now = now or datetime.now(timezone.utc)
+        started = time.monotonic()
+        report = {'stages': {}, 'ran': [], 'skipped': []}
+        for stage in self.stages:
+            if only is not None:
+                if stage.name not in only:
+                    report['skipped'].append({'stage': stage.name, 'reason': 'not_requested'})
+                    continue
+            elif not stage.due(now, self.tick_minutes):
+                report['skipped'].append({'stage': stage.name, 'reason': 'not_due'})
+                continue
+
+            remaining = float('inf') if ctx.deadline is None else ctx.deadline - time.monotonic()
+            if remaining < min(stage.budget, SWEEP_MIN_STAGE_SECONDS):
+                report['skipped'].append({'stage': stage.name, 'reason': f'no_time ({remaining:.1f}s left)'})
+                logger.warning(f"Skipping sweep stage {stage.name}: {remaining:.1f}s left")
+                continue
+
+            ctx.stage_deadline = time.monotonic() + min(stage.budget, remaining)
+            stage_started = time.monotonic()
+            try:
+                result = stage.run(ctx)
+                status = 'ok'
+            except Exception as e:
+                logger.error(f"Sweep stage {stage.name} failed: {e}")
+                result = {'error': str(e)}
+                status = 'error'
+            elapsed = time.monotonic() - stage_started
+            report['stages'][stage.name] = {
+                'status': status,
+                'elapsed_seconds': round(elapsed, 2),
+                'budget_seconds': stage.budget,
+                'over_budget': elapsed > stage.budget,
+                'result': result,
+            }
+            report['ran'].append(stage.name)
+            logger.info(f"Sweep stage {stage.name} {status} in {elapsed:.1f}s (budget {stage.budget}s)")
+
+        ctx.stage_deadline = ctx.deadline
+        if 'chat' in ctx._memo and ctx.chat.pending():
+            report['slack_delivery'] = ctx.chat.flush()
+        report['circuit_breakers'] = breaker_stats()
+        report['hedging'] = hedge_stats()
+        report['elapsed_seconds'] = round(time.monotonic() - started, 2)
+        return report
@@ -0,0 +1,76 @@
+import random
+import re
+import threading
+from string import Formatter
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+_FIELD_ROOT = re.compile(r'[^.\[]*')
+_formatter = Formatter()
+
+
+class CompiledTemplate:
+    __slots__ = ('source', 'emoji', 'fields', 'text')
+
+    def __init__(self, source: str, emoji: Optional[str] = None):
+        self.source = source
+        self.emoji = emoji
+        fields = []
+        for _, field, _, _ in _formatter.parse(source):
+            if field is None:
+                continue
+            root = _FIELD_ROOT.match(field).group()
+            if not root or root.isdigit():
+                raise ValueError(f"Template fields must be named: {source!r}")
+            if root not in fields:
+                fields.append(root)
+        self.fields = tuple(fields)
+        self.text = None if fields else source.format()
+
+    def render(self, providers: Mapping[str, Callable[[Any], Any]] = None, context: Any = None, **values) -> str:
+        if self.text is not None:
+            return self.text
+        for field in self.fields:
+            if field not in values:
+                values[field] = providers[field](context)
+        return self.source.format_map(values)
+
+    def __repr__(self):
+        return f"CompiledTemplate({self.source!r}, fields={self.fields})"
+
+
+class Shuffler:
+    __slots__ = ('items', '_order', '_lock')
+
+    def __init__(self, items: Iterable[Any]):
+        self.items = tuple(items)
+        if not self.items:
+            raise ValueError("Shuffler needs at least one item")
+        self._order = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def draw(self) -> Any:
+        with self._lock:
+            if not self._order:
+                self._order = random.sample(range(len(self.items)), len(self.items))
+            return self.items[self._order.pop()]
+
+    def __call__(self, context: Any = None) -> Any:
+        return self.draw()
+
+
+def compile_template(entry) -> CompiledTemplate:
+    if isinstance(entry, CompiledTemplate):
+        return entry
+    if isinstance(entry, str):
+        return CompiledTemplate(entry)
+    return CompiledTemplate(*entry)
+
+
+def compile_pool(entries: Iterable[Any]) -> Shuffler:
+    return Shuffler(compile_template(entry) for entry in entries)
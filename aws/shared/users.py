@@ -0,0 +1,129 @@
+import os
+import time
+import logging
+from typing import Optional, Dict, Any, List, Iterable
+
+from .clients import DEMO_USERS
+
+logger = logging.getLogger(__name__)
+
+USER_DIRECTORY_TTL_SECONDS = int(os.environ.get('USER_DIRECTORY_TTL_SECONDS', 900))
+
+
+class UserRecord:
+    __slots__ = ('id', 'email', 'name', 'slack_id', 'role', 'job_title')
+
+    def __init__(self, id: str, email: str = '', name: str = '', slack_id: str = '',
+                 role: str = 'user', job_title: str = ''):
+        self.id = id
+        self.email = email
+        self.name = name
+        self.slack_id = slack_id
+        self.role = role
+        self.job_title = job_title
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, str]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"UserRecord(id={self.id!r}, name={self.name!r})"
+
+
+class UserDirectory:
+    def __init__(self, users: Iterable[Dict] = (), ttl_seconds: int = None):
+        self.ttl_seconds = USER_DIRECTORY_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.loaded_at = time.monotonic()
+        self._users: List[UserRecord] = []
+        self._by_id: Dict[str, UserRecord] = {}
+        self._by_email: Dict[str, UserRecord] = {}
+        self._by_slack_id: Dict[str, UserRecord] = {}
+
+        demo_by_email = {u['email']: u for u in DEMO_USERS}
+        for user in users:
+            demo = demo_by_email.get(user.get('email', ''), {})
+            self._add(UserRecord(
+                id=user.get('id'),
+                email=user.get('email', '') or '',
+                name=user.get('name', '') or demo.get('name', ''),
+                slack_id=user.get('slack_id') or demo.get('slack_id', ''),
+                role=user.get('role', 'user') or 'user',
+                job_title=user.get('job_title', '') or '',
+            ))
+        for user in DEMO_USERS:
+            if user['id'] not in self._by_id:
+                self._add(UserRecord(user['id'], user['email'], user['name'], user['slack_id']))
+
+    def _add(self, record: UserRecord):
+        if not record.id or record.id in self._by_id:
+            return
+        self._users.append(record)
+        self._by_id[record.id] = record
+        if record.email:
+            self._by_email.setdefault(record.email, record)
+        if record.slack_id:
+            self._by_slack_id.setdefault(record.slack_id, record)
+
+    def is_expired(self) -> bool:
+        return time.monotonic() - self.loaded_at > self.ttl_seconds
+
+    def all(self) -> List[UserRecord]:
+        return self._users
+
+    def demo_users(self) -> List[UserRecord]:
+        return [self._by_id[u['id']] for u in DEMO_USERS if u['id'] in self._by_id]
+
+    def by_id(self, user_id: str) -> Optional[UserRecord]:
+        return self._by_id.get(user_id)
+
+    def by_email(self, email: str) -> Optional[UserRecord]:
+        return self._by_email.get(email)
+
+    def by_slack_id(self, slack_id: str) -> Optional[UserRecord]:
+        return self._by_slack_id.get(slack_id)
+
+    def slack_id_for_email(self, email: str) -> str:
+        record = self._by_email.get(email)
+        return record.slack_id if record else ''
+
+    def others(self, exclude: Iterable, pool: List[UserRecord] = None) -> List[UserRecord]:
+        excluded = {u.get('id') if hasattr(u, 'get') else u for u in exclude}
+        return [u for u in (self._users if pool is None else pool) if u.id not in excluded]
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+
+_demo_directory = None
+_directory = None
+
+
+def demo_directory() -> UserDirectory:
+    global _demo_directory
+    if _demo_directory is None:
+        _demo_directory = UserDirectory(ttl_seconds=float('inf'))
+    return _demo_directory
+
+
+def get_user_directory(pd_client, ttl_seconds: int = None) -> UserDirectory:
+    global _directory
+    if _directory is not None and not _directory.is_expired():
+        return _directory
+    users = pd_client.list_users(refresh=_directory is not None)
+    directory = UserDirectory(users, ttl_seconds)
+    if users:
+        _directory = directory
+        logger.info(f"Built user directory with {len(directory)} users")
+    return directory
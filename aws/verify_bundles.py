@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+import io
+import os
+import re
+import sys
+import json
+import zipfile
+import argparse
+import subprocess
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LAYER_DIR = os.path.join(SCRIPT_DIR, 'build', 'shared-layer', 'python')
+REPORT_FILE = os.path.join(SCRIPT_DIR, 'build', 'bundle_report.json')
+LAMBDA_DIRS = [
+    "lambda-orchestrator", "lambda-lifecycle", "lambda-metrics", "lambda-notifier",
+    "lambda-reset", "lambda-user-activity", "lambda-health-check",
+    "lambda-demo-controller", "lambda-demo-orchestrator", "lambda-package", "lambda-sweep",
+]
+TOP_N = int(os.environ.get('IMPORT_PROFILE_TOP_N', 5))
+IMPORT_SAMPLES = int(os.environ.get('IMPORT_PROFILE_SAMPLES', 7))
+IMPORT_TIME_TOLERANCE = float(os.environ.get('IMPORT_TIME_TOLERANCE', 0.3))
+BUNDLE_SIZE_TOLERANCE = float(os.environ.get('BUNDLE_SIZE_TOLERANCE', 0.05))
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$')
+
+
+def zip_size(*paths):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for path in paths:
+            for root, dirs, files in os.walk(path):
+                dirs[:] = [d for d in dirs if d != '__pycache__']
+                for f in files:
+                    full = os.path.join(root, f)
+                    archive.write(full, os.path.relpath(full, path))
+    return buffer.tell()
+
+
+def median_profile(lambda_dir):
+    samples = []
+    for _ in range(max(1, IMPORT_SAMPLES)):
+        returncode, modules = profile_handler(lambda_dir)
+        times = dict((mod, us) for us, mod in modules)
+        if returncode != 0 or 'handler' not in times:
+            return returncode, modules, None, None
+        samples.append((times['handler'] / times.get('site', 1), times['handler'], modules))
+    samples.sort(key=lambda sample: sample[0])
+    ratio, handler, modules = samples[len(samples) // 2]
+    return 0, modules, handler, round(ratio, 3)
+
+
+def regressions(name, entry, baseline):
+    found = []
+    if baseline.get('bundle_bytes') and entry['bundle_bytes'] > baseline['bundle_bytes'] * (1 + BUNDLE_SIZE_TOLERANCE):
+        found.append(f"{name}: bundle grew from {baseline['bundle_bytes']} to {entry['bundle_bytes']} bytes "
+                     f"(tolerance {BUNDLE_SIZE_TOLERANCE:.0%})")
+    if baseline.get('import_ratio') and entry['import_ratio'] > baseline['import_ratio'] * (1 + IMPORT_TIME_TOLERANCE):
+        found.append(f"{name}: import time grew from {baseline['import_ratio']:.2f}x to {entry['import_ratio']:.2f}x "
+                     f"interpreter startup (tolerance {IMPORT_TIME_TOLERANCE:.0%})")
+    return found
+
+
+def profile_handler(lambda_dir):
+    env = {**os.environ, 'AWS_DEFAULT_REGION': os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')}
+    env['PYTHONPATH'] = os.pathsep.join(p for p in [LAYER_DIR, env.get('PYTHONPATH', '')] if p)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import handler'],
+        cwd=lambda_dir, capture_output=True, text=True, env=env,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            modules.append((int(match.group(2)), match.group(3).strip()))
+    return result.returncode, modules
+
+
+def load_previous_report():
+    try:
+        with open(REPORT_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify Lambda bundle sizes and handler import time against a recorded baseline")
+    parser.add_argument("functions", nargs="*", help="Lambda directories to verify (default: all)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Accept the current measurements as the new baseline")
+    args = parser.parse_args()
+
+    dirs = args.functions or LAMBDA_DIRS
+    previous = load_previous_report()
+    baselines = previous.get('baseline') or {
+        name: {'bundle_bytes': e.get('bundle_bytes'), 'import_ratio': e.get('import_ratio')}
+        for name, e in previous.get('functions', {}).items()
+    }
+    layers = [LAYER_DIR] if os.path.isdir(LAYER_DIR) else []
+    layer_size = zip_size(*layers)
+    report = {'layer_bytes': layer_size, 'functions': {}, 'baseline': dict(baselines)}
+    failures = []
+
+    print(f"Shared runtime layer: {layer_size / 1024:.0f}KB zipped")
+    print("Function bundles (zipped bundle vs. zipped bundle with vendored shared runtime, cumulative import time):")
+    for name in dirs:
+        lambda_dir = os.path.join(SCRIPT_DIR, name)
+        if not os.path.isfile(os.path.join(lambda_dir, 'handler.py')):
+            continue
+        bundle = zip_size(lambda_dir)
+        returncode, modules, handler, ratio = median_profile(lambda_dir)
+        entry = {'bundle_bytes': bundle, 'vendored_bytes': zip_size(lambda_dir, *layers),
+                 'import_us': handler, 'import_ratio': ratio}
+        report['functions'][name] = entry
+
+        if returncode != 0 or handler is None:
+            print(f"  {name}: {bundle / 1024:.0f}KB, import failed")
+            failures.append(f"{name}: handler import failed")
+            continue
+        top_level = sorted(((us, mod) for us, mod in modules if '.' not in mod and mod != 'handler'), reverse=True)
+        heaviest = ', '.join(f"{mod} {us / 1000:.1f}ms" for us, mod in top_level[:TOP_N])
+        print(f"  {name}: {bundle / 1024:.0f}KB vs {entry['vendored_bytes'] / 1024:.0f}KB, "
+              f"{handler / 1000:.1f}ms = {ratio:.2f}x startup ({heaviest})")
+
+        if os.path.isdir(os.path.join(lambda_dir, 'shared')):
+            failures.append(f"{name}: shared/ is vendored into the bundle instead of coming from the layer")
+        baseline = baselines.get(name, {})
+        if not args.update_baseline:
+            failures.extend(regressions(name, entry, baseline))
+        keep = not args.update_baseline and baseline.get('bundle_bytes') and baseline.get('import_ratio')
+        report['baseline'][name] = {
+            'bundle_bytes': min(baseline['bundle_bytes'], bundle) if keep else bundle,
+            'import_ratio': baseline['import_ratio'] if keep else ratio,
+        }
+
+    if failures:
+        print("Bundle verification failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        print("Re-run with --update-baseline to accept an intentional change")
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(REPORT_FILE), exist_ok=True)
+    with open(REPORT_FILE, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Bundle verification passed, report written to {REPORT_FILE}")
+
+
+if __name__ == '__main__':
+    main()
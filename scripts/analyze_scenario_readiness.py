@@ -1,19 +1,16 @@
 #!/usr/bin/env python3
+import argparse
+import hashlib
 import json
 import os
+import time
 
 SCENARIOS_FILE = "docs/demo-scenarios/src/data/scenarios.json"
 PD_ANALYSIS_FILE = "docs/pagerduty_analysis.json"
-
-with open(SCENARIOS_FILE) as f:
-    scenarios = json.load(f)['scenarios']
-
-with open(PD_ANALYSIS_FILE) as f:
-    pd_data = json.load(f)
-
-workflows = {w['name'].lower(): w for w in pd_data['workflows']}
-services = {s['name']: s for s in pd_data['services_list']}
-triggers = pd_data['triggers']
+ANALYSIS_OUTPUT_FILE = "docs/scenario_readiness_analysis.json"
+MATRIX_OUTPUT_FILE = "docs/scenario_readiness_matrix.json"
+CACHE_FILE = "docs/.scenario_readiness_cache.json"
+STATUSES = ['READY', 'PARTIAL', 'NEEDS_WORK']
 
 FEATURE_TO_WORKFLOW_MAP = {
     'slack_channel_creation': ['Demo Incident Channel Setup', 'Standard Incident Response', 'Major Incident Full Mobilization'],
@@ -104,168 +101,416 @@ SERVICE_MAPPING = {
     "Database - DBRE Team": "PPAQBDV",
 }
 
-def check_scenario_readiness(scenario):
-    scenario_id = scenario['id']
-    name = scenario['name']
-    features_required = scenario.get('required_features', [])
-    features_demonstrated = scenario.get('features_demonstrated', [])
-    target_service = scenario.get('target_service', '')
-    integration = scenario.get('tags', {}).get('integration', 'unknown')
-    
-    readiness = {
-        'id': scenario_id,
-        'name': name,
-        'target_service': target_service,
-        'integration': integration,
-        'status': 'UNKNOWN',
-        'missing': [],
-        'ready': [],
-        'notes': []
-    }
-    
-    int_status = INTEGRATION_STATUS.get(integration, {'status': 'UNKNOWN'})
-    if int_status['status'] == 'NOT_CONFIGURED':
-        readiness['missing'].append(f'Integration not configured: {integration}')
-    elif int_status['status'] == 'FALLBACK':
-        readiness['notes'].append(f'Integration uses fallback: {integration}')
-        readiness['ready'].append(f'Integration available (fallback): {integration}')
-    elif int_status['status'] in ['READY', 'OAUTH']:
-        readiness['ready'].append(f'Integration available: {integration}')
-    
-    if target_service:
-        if target_service in SERVICE_MAPPING or target_service in services:
-            readiness['ready'].append(f'Service exists: {target_service}')
-        else:
-            readiness['missing'].append(f'Service not found: {target_service}')
-    
-    all_features = set(features_required + features_demonstrated)
-    for feature in all_features:
-        feature_lower = feature.lower().replace(' ', '_').replace('-', '_')
-        
-        workflow_matches = FEATURE_TO_WORKFLOW_MAP.get(feature_lower, None)
-        
+FEATURE_KEYWORD_RULES = [
+    (['orchestration', 'grouping', 'suppression', 'auto_pause', 'correlation', 'service_rules', 'threshold_conditions', 'schedule_conditions'],
+     lambda f: ([f'Event Orchestration configured: Demo Global Event Orchestration'], [f'Feature requires AIOps/Event Intelligence: {f}'])),
+    (['task', 'role', 'type', 'custom_field'],
+     lambda f: ([], [f'Feature requires Enterprise features: {f}'])),
+    (['runbook', 'remediation', 'automation', 'rba_runner'],
+     lambda f: (['RBA runner deployed on EC2'], [f'RBA feature: {f}'])),
+    (['priority', 'priority_assignment', 'severity'],
+     lambda f: ([f'Priority configured: P1-P5 available'], [])),
+    (['service_graph', 'impact_metrics', 'business_services', 'related_incidents', 'past_incidents', 'change_events', 'outlier'],
+     lambda f: (['Service dependencies configured'], [f'Feature requires AIOps/Service Graph: {f}'])),
+    (['status_pages', 'status_update_templates', 'external_status'],
+     lambda f: (['StatusPage integration available'], [f'StatusPage feature: {f}'])),
+    (['slack_actions', 'slack_advanced'],
+     lambda f: (['Slack integration configured'], [])),
+    (['incident_workflows_advanced', 'advanced_workflow'],
+     lambda f: (['21 workflows configured'], [f'Advanced workflow feature: {f}'])),
+    (['basic', 'routing', 'escalation', 'on_call'],
+     lambda f: ([f'Basic PD feature: {f}'], [])),
+]
+
+
+def feature_key(feature):
+    return feature.lower().replace(' ', '_').replace('-', '_')
+
+
+def _digest(value):
+    return hashlib.sha1(json.dumps(value, sort_keys=True).encode()).hexdigest()
+
+
+def _rules_digest():
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+RULES_DIGEST = _rules_digest()
+
+
+def _scenario_features(scenario):
+    return list(dict.fromkeys(scenario.get('required_features', []) + scenario.get('features_demonstrated', [])))
+
+
+def _workflow_signatures(pd_data):
+    return {w['name'].lower(): len(w.get('steps', [])) for w in pd_data.get('workflows', [])}
+
+
+class FeatureResult:
+    __slots__ = ('ready', 'missing', 'notes')
+
+    def __init__(self, ready=(), missing=(), notes=()):
+        self.ready = list(ready)
+        self.missing = list(missing)
+        self.notes = list(notes)
+
+
+class ReadinessEngine:
+    def __init__(self, scenarios_file=SCENARIOS_FILE, pd_analysis_file=PD_ANALYSIS_FILE):
+        self.scenarios_file = scenarios_file
+        self.pd_analysis_file = pd_analysis_file
+        self.scenarios = {}
+        self.pd_data = {}
+        self.workflow_steps = {}
+        self.services = set()
+        self.input_digests = {'rules': RULES_DIGEST}
+        self.results = {}
+        self._scenario_digests = {}
+        self._feature_results = {}
+        self._features_by_workflow = {}
+        self._scenarios_by_feature = {}
+        self._scenarios_by_service = {}
+        self._scenarios_by_integration = {}
+        self._scenarios_by_status = {status: set() for status in STATUSES}
+        for feature, workflow_names in FEATURE_TO_WORKFLOW_MAP.items():
+            for name in workflow_names:
+                self._features_by_workflow.setdefault(name.lower(), set()).add(feature)
+        self.evaluations = 0
+
+    def _read(self, path):
+        with open(path, 'rb') as f:
+            raw = f.read()
+        return hashlib.sha1(raw).hexdigest(), json.loads(raw)
+
+    def load(self):
+        self.refresh()
+        return self
+
+    def refresh(self):
+        changed = set()
+        pd_digest, pd_data = self._read(self.pd_analysis_file)
+        if pd_digest != self.input_digests.get('pd_analysis'):
+            changed |= self._apply_pd_analysis(pd_data)
+            self.input_digests['pd_analysis'] = pd_digest
+        scenarios_digest, scenarios_data = self._read(self.scenarios_file)
+        if scenarios_digest != self.input_digests.get('scenarios'):
+            changed |= self._apply_scenarios(scenarios_data['scenarios'])
+            self.input_digests['scenarios'] = scenarios_digest
+        for scenario_id in changed:
+            if scenario_id in self.scenarios:
+                self._evaluate(scenario_id)
+        return changed
+
+    def _apply_pd_analysis(self, pd_data):
+        old_steps, old_services = self.workflow_steps, self.services
+        self.pd_data = pd_data
+        self.workflow_steps = _workflow_signatures(pd_data)
+        self.services = {s['name'] for s in pd_data.get('services_list', [])}
+
+        changed_workflows = {name for name in set(old_steps) | set(self.workflow_steps)
+                             if old_steps.get(name) != self.workflow_steps.get(name)}
+        changed_features = set()
+        for name in changed_workflows:
+            changed_features |= self._features_by_workflow.get(name, set())
+        for raw in [raw for raw in self._feature_results if feature_key(raw) in changed_features]:
+            del self._feature_results[raw]
+
+        affected = set()
+        for feature in changed_features:
+            affected |= self._scenarios_by_feature.get(feature, set())
+        for service in old_services ^ self.services:
+            affected |= self._scenarios_by_service.get(service, set())
+        return affected
+
+    def _apply_scenarios(self, scenarios):
+        incoming = {s['id']: s for s in scenarios}
+        changed = set()
+        for scenario_id in set(self.scenarios) - set(incoming):
+            self._unindex(scenario_id)
+            del self.scenarios[scenario_id]
+            changed.add(scenario_id)
+        for scenario_id, scenario in incoming.items():
+            digest = _digest(scenario)
+            if self._scenario_digests.get(scenario_id) == digest:
+                continue
+            if scenario_id in self.scenarios:
+                self._unindex(scenario_id)
+            self.scenarios[scenario_id] = scenario
+            self._scenario_digests[scenario_id] = digest
+            self._index(scenario_id, scenario)
+            changed.add(scenario_id)
+        order = {scenario_id: i for i, scenario_id in enumerate(incoming)}
+        self.scenarios = dict(sorted(self.scenarios.items(), key=lambda item: order[item[0]]))
+        return changed
+
+    def _index(self, scenario_id, scenario):
+        for feature in _scenario_features(scenario):
+            self._scenarios_by_feature.setdefault(feature_key(feature), set()).add(scenario_id)
+        self._scenarios_by_service.setdefault(scenario.get('target_service', ''), set()).add(scenario_id)
+        self._scenarios_by_integration.setdefault(scenario.get('tags', {}).get('integration', 'unknown'), set()).add(scenario_id)
+
+    def _unindex(self, scenario_id):
+        for index in (self._scenarios_by_feature, self._scenarios_by_service, self._scenarios_by_integration,
+                      self._scenarios_by_status):
+            for ids in index.values():
+                ids.discard(scenario_id)
+        self.results.pop(scenario_id, None)
+        self._scenario_digests.pop(scenario_id, None)
+
+    def feature_result(self, feature):
+        result = self._feature_results.get(feature)
+        if result is not None:
+            return result
+        key = feature_key(feature)
+        workflow_matches = FEATURE_TO_WORKFLOW_MAP.get(key)
         if workflow_matches is None:
-            if any(kw in feature_lower for kw in ['orchestration', 'grouping', 'suppression', 'auto_pause', 'correlation', 'service_rules', 'threshold_conditions', 'schedule_conditions']):
-                readiness['notes'].append(f'Feature requires AIOps/Event Intelligence: {feature}')
-                readiness['ready'].append(f'Event Orchestration configured: Demo Global Event Orchestration')
-            elif any(kw in feature_lower for kw in ['task', 'role', 'type', 'custom_field']):
-                readiness['notes'].append(f'Feature requires Enterprise features: {feature}')
-            elif any(kw in feature_lower for kw in ['runbook', 'remediation', 'automation', 'rba_runner']):
-                readiness['notes'].append(f'RBA feature: {feature}')
-                readiness['ready'].append('RBA runner deployed on EC2')
-            elif any(kw in feature_lower for kw in ['priority', 'priority_assignment', 'severity']):
-                readiness['ready'].append(f'Priority configured: P1-P5 available')
-            elif any(kw in feature_lower for kw in ['service_graph', 'impact_metrics', 'business_services', 'related_incidents', 'past_incidents', 'change_events', 'outlier']):
-                readiness['notes'].append(f'Feature requires AIOps/Service Graph: {feature}')
-                readiness['ready'].append('Service dependencies configured')
-            elif any(kw in feature_lower for kw in ['status_pages', 'status_update_templates', 'external_status']):
-                readiness['notes'].append(f'StatusPage feature: {feature}')
-                readiness['ready'].append('StatusPage integration available')
-            elif any(kw in feature_lower for kw in ['slack_actions', 'slack_advanced']):
-                readiness['ready'].append('Slack integration configured')
-            elif any(kw in feature_lower for kw in ['incident_workflows_advanced', 'advanced_workflow']):
-                readiness['notes'].append(f'Advanced workflow feature: {feature}')
-                readiness['ready'].append('21 workflows configured')
-            elif 'basic' in feature_lower or 'routing' in feature_lower or 'escalation' in feature_lower or 'on_call' in feature_lower:
-                readiness['ready'].append(f'Basic PD feature: {feature}')
-            else:
-                readiness['missing'].append(f'Feature mapping unknown: {feature}')
-        elif len(workflow_matches) == 0:
-            readiness['missing'].append(f'No workflow for feature: {feature}')
+            result = FeatureResult(missing=[f'Feature mapping unknown: {feature}'])
+            for keywords, outcome in FEATURE_KEYWORD_RULES:
+                if any(kw in key for kw in keywords):
+                    ready, notes = outcome(feature)
+                    result = FeatureResult(ready=ready, notes=notes)
+                    break
+        elif not workflow_matches:
+            result = FeatureResult(missing=[f'No workflow for feature: {feature}'])
         else:
-            found = False
+            result = FeatureResult()
             for wf_name in workflow_matches:
-                if wf_name.lower() in workflows:
-                    wf = workflows[wf_name.lower()]
-                    if len(wf['steps']) > 0:
-                        readiness['ready'].append(f'Workflow configured: {wf_name}')
-                        found = True
-                        break
-                    else:
-                        readiness['notes'].append(f'Workflow exists but empty: {wf_name}')
-            if not found and len(workflow_matches) > 0:
-                readiness['notes'].append(f'Workflow not fully configured: {workflow_matches[0]}')
-    
-    if not readiness['missing']:
-        if len(readiness['notes']) == 0:
-            readiness['status'] = 'READY'
-        else:
-            readiness['status'] = 'PARTIAL'
-    else:
-        if len(readiness['ready']) > len(readiness['missing']):
+                steps = self.workflow_steps.get(wf_name.lower())
+                if steps is None:
+                    continue
+                if steps > 0:
+                    result.ready.append(f'Workflow configured: {wf_name}')
+                    break
+                result.notes.append(f'Workflow exists but empty: {wf_name}')
+            if not result.ready:
+                result.notes.append(f'Workflow not fully configured: {workflow_matches[0]}')
+        self._feature_results[feature] = result
+        return result
+
+    def _evaluate(self, scenario_id):
+        scenario = self.scenarios[scenario_id]
+        target_service = scenario.get('target_service', '')
+        integration = scenario.get('tags', {}).get('integration', 'unknown')
+        readiness = {
+            'id': scenario_id,
+            'name': scenario['name'],
+            'target_service': target_service,
+            'integration': integration,
+            'status': 'UNKNOWN',
+            'missing': [],
+            'ready': [],
+            'notes': []
+        }
+
+        int_status = INTEGRATION_STATUS.get(integration, {'status': 'UNKNOWN'})['status']
+        if int_status == 'NOT_CONFIGURED':
+            readiness['missing'].append(f'Integration not configured: {integration}')
+        elif int_status == 'FALLBACK':
+            readiness['notes'].append(f'Integration uses fallback: {integration}')
+            readiness['ready'].append(f'Integration available (fallback): {integration}')
+        elif int_status in ('READY', 'OAUTH'):
+            readiness['ready'].append(f'Integration available: {integration}')
+
+        if target_service:
+            if target_service in SERVICE_MAPPING or target_service in self.services:
+                readiness['ready'].append(f'Service exists: {target_service}')
+            else:
+                readiness['missing'].append(f'Service not found: {target_service}')
+
+        for feature in _scenario_features(scenario):
+            result = self.feature_result(feature)
+            readiness['ready'].extend(result.ready)
+            readiness['missing'].extend(result.missing)
+            readiness['notes'].extend(result.notes)
+
+        if not readiness['missing']:
+            readiness['status'] = 'PARTIAL' if readiness['notes'] else 'READY'
+        elif len(readiness['ready']) > len(readiness['missing']):
             readiness['status'] = 'PARTIAL'
         else:
             readiness['status'] = 'NEEDS_WORK'
-    
-    return readiness
-
-results = []
-for scenario in scenarios:
-    result = check_scenario_readiness(scenario)
-    results.append(result)
-
-ready_count = sum(1 for r in results if r['status'] == 'READY')
-partial_count = sum(1 for r in results if r['status'] == 'PARTIAL')
-needs_work_count = sum(1 for r in results if r['status'] == 'NEEDS_WORK')
-
-summary = {
-    'total_scenarios': len(results),
-    'ready': ready_count,
-    'partial': partial_count,
-    'needs_work': needs_work_count,
-    'scenarios': results,
-    'infrastructure_summary': {
-        'event_orchestration_rules': pd_data['event_orchestration_rules'],
-        'incident_workflows': pd_data['incident_workflows'],
-        'workflow_triggers': pd_data['workflow_triggers'],
-        'services': pd_data['services'],
-        'integrations': INTEGRATION_STATUS
-    }
-}
 
-with open('docs/scenario_readiness_analysis.json', 'w') as f:
-    json.dump(summary, f, indent=2)
+        for ids in self._scenarios_by_status.values():
+            ids.discard(scenario_id)
+        self._scenarios_by_status[readiness['status']].add(scenario_id)
+        self.results[scenario_id] = readiness
+        self.evaluations += 1
+        return readiness
+
+    def readiness(self, scenario_id):
+        return self.results.get(scenario_id)
+
+    def all_results(self):
+        return [self.results[scenario_id] for scenario_id in self.scenarios]
+
+    def scenarios_with_status(self, status):
+        return sorted(self._scenarios_by_status.get(status, ()))
+
+    def scenarios_for_feature(self, feature):
+        return sorted(self._scenarios_by_feature.get(feature_key(feature), ()))
+
+    def scenarios_for_workflow(self, workflow_name):
+        ids = set()
+        for feature in self._features_by_workflow.get(workflow_name.lower(), ()):
+            ids |= self._scenarios_by_feature.get(feature, set())
+        return sorted(ids)
+
+    def scenarios_for_integration(self, integration):
+        return sorted(self._scenarios_by_integration.get(integration, ()))
 
-print("=" * 80)
-print("SCENARIO READINESS ANALYSIS")
-print("=" * 80)
-print(f"\nTotal Scenarios: {len(results)}")
-print(f"  READY: {ready_count}")
-print(f"  PARTIAL: {partial_count}")
-print(f"  NEEDS_WORK: {needs_work_count}")
+    def matrix(self):
+        features = sorted(self._scenarios_by_feature)
+        rows = {}
+        for scenario_id, scenario in self.scenarios.items():
+            cells = {}
+            for feature in _scenario_features(scenario):
+                result = self.feature_result(feature)
+                cells[feature_key(feature)] = 'missing' if result.missing else ('partial' if result.notes else 'ready')
+            rows[scenario_id] = {
+                'status': self.results[scenario_id]['status'],
+                'integration': self.results[scenario_id]['integration'],
+                'features': cells,
+            }
+        return {
+            'generated_at': int(time.time()),
+            'inputs': dict(self.input_digests),
+            'statuses': {status: self.scenarios_with_status(status) for status in STATUSES},
+            'features': {feature: self.scenarios_for_feature(feature) for feature in features},
+            'scenarios': rows,
+        }
 
-print("\n" + "=" * 80)
-print("SCENARIOS BY STATUS")
-print("=" * 80)
+    def summary(self):
+        results = self.all_results()
+        return {
+            'total_scenarios': len(results),
+            'ready': len(self._scenarios_by_status['READY']),
+            'partial': len(self._scenarios_by_status['PARTIAL']),
+            'needs_work': len(self._scenarios_by_status['NEEDS_WORK']),
+            'scenarios': results,
+            'infrastructure_summary': {
+                'event_orchestration_rules': self.pd_data.get('event_orchestration_rules'),
+                'incident_workflows': self.pd_data.get('incident_workflows'),
+                'workflow_triggers': self.pd_data.get('workflow_triggers'),
+                'services': self.pd_data.get('services'),
+                'integrations': INTEGRATION_STATUS
+            }
+        }
 
-for status in ['READY', 'PARTIAL', 'NEEDS_WORK']:
-    print(f"\n=== {status} ({sum(1 for r in results if r['status'] == status)}) ===")
+    def save_state(self, path=CACHE_FILE):
+        state = {
+            'input_digests': self.input_digests,
+            'workflow_steps': self.workflow_steps,
+            'services': sorted(self.services),
+            'scenario_digests': self._scenario_digests,
+            'results': self.results,
+        }
+        with open(path, 'w') as f:
+            json.dump(state, f)
+
+    def restore_state(self, path=CACHE_FILE):
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get('input_digests', {}).get('rules') != RULES_DIGEST:
+            return False
+        _, scenarios_data = self._read(self.scenarios_file)
+        scenarios = {s['id']: s for s in scenarios_data['scenarios']}
+        self.workflow_steps = state.get('workflow_steps', {})
+        self.services = set(state.get('services', []))
+        self.pd_data = {}
+        self.input_digests = {'rules': RULES_DIGEST, 'pd_analysis': state['input_digests'].get('pd_analysis')}
+        for scenario_id, digest in state.get('scenario_digests', {}).items():
+            if scenario_id in scenarios and scenario_id in state.get('results', {}):
+                self.scenarios[scenario_id] = scenarios[scenario_id]
+                self._scenario_digests[scenario_id] = digest
+                self._index(scenario_id, scenarios[scenario_id])
+                self.results[scenario_id] = state['results'][scenario_id]
+                self._scenarios_by_status[self.results[scenario_id]['status']].add(scenario_id)
+        if self.input_digests['pd_analysis']:
+            self.pd_data = self._read(self.pd_analysis_file)[1]
+        return True
+
+
+def print_report(engine):
+    results = engine.all_results()
+    print("=" * 80)
+    print("SCENARIO READINESS ANALYSIS")
+    print("=" * 80)
+    print(f"\nTotal Scenarios: {len(results)}")
+    for status in STATUSES:
+        print(f"  {status}: {len(engine.scenarios_with_status(status))}")
+
+    print("\n" + "=" * 80)
+    print("SCENARIOS BY STATUS")
+    print("=" * 80)
+
+    for status in STATUSES:
+        print(f"\n=== {status} ({len(engine.scenarios_with_status(status))}) ===")
+        for r in results:
+            if r['status'] == status:
+                print(f"\n{r['id']}: {r['name']}")
+                print(f"  Integration: {r['integration']}")
+                print(f"  Target Service: {r['target_service']}")
+                if r['ready']:
+                    print(f"  Ready: {', '.join(r['ready'][:3])}...")
+                if r['missing']:
+                    print(f"  Missing: {', '.join(r['missing'])}")
+                if r['notes']:
+                    print(f"  Notes: {', '.join(r['notes'][:2])}...")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY BY TIER")
+    print("=" * 80)
+
+    tiers = {}
     for r in results:
-        if r['status'] == status:
-            print(f"\n{r['id']}: {r['name']}")
-            print(f"  Integration: {r['integration']}")
-            print(f"  Target Service: {r['target_service']}")
-            if r['ready']:
-                print(f"  Ready: {', '.join(r['ready'][:3])}...")
-            if r['missing']:
-                print(f"  Missing: {', '.join(r['missing'])}")
-            if r['notes']:
-                print(f"  Notes: {', '.join(r['notes'][:2])}...")
-
-print("\n" + "=" * 80)
-print("SUMMARY BY TIER")
-print("=" * 80)
-
-tiers = {}
-for r in results:
-    tier = r['id'].split('-')[0]
-    if tier not in tiers:
-        tiers[tier] = {'READY': 0, 'PARTIAL': 0, 'NEEDS_WORK': 0}
-    tiers[tier][r['status']] += 1
-
-for tier, counts in sorted(tiers.items()):
-    total = sum(counts.values())
-    print(f"\n{tier} ({total} scenarios):")
-    print(f"  READY: {counts['READY']}, PARTIAL: {counts['PARTIAL']}, NEEDS_WORK: {counts['NEEDS_WORK']}")
-
-print(f"\nDetailed analysis saved to: docs/scenario_readiness_analysis.json")
+        tier = r['id'].split('-')[0]
+        if tier not in tiers:
+            tiers[tier] = {status: 0 for status in STATUSES}
+        tiers[tier][r['status']] += 1
+
+    for tier, counts in sorted(tiers.items()):
+        total = sum(counts.values())
+        print(f"\n{tier} ({total} scenarios):")
+        print(f"  READY: {counts['READY']}, PARTIAL: {counts['PARTIAL']}, NEEDS_WORK: {counts['NEEDS_WORK']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze demo scenario readiness against the PagerDuty configuration")
+    parser.add_argument("--scenarios", default=SCENARIOS_FILE)
+    parser.add_argument("--pd-analysis", default=PD_ANALYSIS_FILE)
+    parser.add_argument("--output", default=ANALYSIS_OUTPUT_FILE)
+    parser.add_argument("--matrix", nargs="?", const=MATRIX_OUTPUT_FILE, help="Write the machine-readable readiness matrix")
+    parser.add_argument("--cache", default=CACHE_FILE, help="State file used for incremental re-evaluation")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--quiet", action="store_true", help="Skip the per-scenario report")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    engine = ReadinessEngine(args.scenarios, args.pd_analysis)
+    if not args.no_cache:
+        engine.restore_state(args.cache)
+    engine.refresh()
+    elapsed_ms = (time.monotonic() - started) * 1000
+
+    with open(args.output, 'w') as f:
+        json.dump(engine.summary(), f, indent=2)
+    if args.matrix:
+        with open(args.matrix, 'w') as f:
+            json.dump(engine.matrix(), f, indent=2)
+    if not args.no_cache:
+        engine.save_state(args.cache)
+
+    if not args.quiet:
+        print_report(engine)
+    print(f"\nEvaluated {engine.evaluations}/{len(engine.scenarios)} scenarios in {elapsed_ms:.1f}ms")
+    print(f"Detailed analysis saved to: {args.output}")
+    if args.matrix:
+        print(f"Readiness matrix saved to: {args.matrix}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,10 @@ import os
 import requests
 import json
 import time
-import random
 import uuid
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 PD_ADMIN_TOKEN = os.environ.get("PD_ADMIN_TOKEN", "")
@@ -16,6 +18,13 @@ DATADOG_API_KEY = os.environ.get("DATADOG_API_KEY", "")
 DATADOG_APP_KEY = os.environ.get("DATADOG_APP_KEY", "")
 DATADOG_SITE = os.environ.get("DATADOG_SITE", "us5.datadoghq.com")
 
+INCIDENT_TIMEOUT = float(os.environ.get("E2E_INCIDENT_TIMEOUT", 120))
+CHANNEL_TIMEOUT = float(os.environ.get("E2E_CHANNEL_TIMEOUT", 120))
+RESOLVE_TIMEOUT = float(os.environ.get("E2E_RESOLVE_TIMEOUT", 60))
+POLL_INITIAL_INTERVAL = float(os.environ.get("E2E_POLL_INITIAL_INTERVAL", 1))
+POLL_MAX_INTERVAL = float(os.environ.get("E2E_POLL_MAX_INTERVAL", 10))
+MESSAGE_PACING = float(os.environ.get("E2E_MESSAGE_PACING", 1))
+
 PD_HEADERS = {
     "Authorization": f"Token token={PD_ADMIN_TOKEN}",
     "Content-Type": "application/json",
@@ -52,20 +61,69 @@ class E2ETest:
     def __init__(self):
         self.test_id = f"E2E-{datetime.now().strftime('%H%M%S')}"
         self.incidents = []
+        self.api_incident = None
         self.slack_channels = []
         self.results = {"passed": [], "failed": [], "skipped": []}
+        self.timings = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
     
     def log(self, msg, level="INFO"):
         timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] [{level}] {msg}")
+        stage = getattr(self._local, "stage", None)
+        prefix = f"[{stage}] " if stage else ""
+        print(f"[{timestamp}] [{level}] {prefix}{msg}", flush=True)
     
     def test_passed(self, name):
-        self.results["passed"].append(name)
+        with self._lock:
+            self.results["passed"].append(name)
         self.log(f"PASSED: {name}", "PASS")
     
     def test_failed(self, name, error):
-        self.results["failed"].append({"name": name, "error": str(error)})
+        with self._lock:
+            self.results["failed"].append({"name": name, "error": str(error)})
         self.log(f"FAILED: {name} - {error}", "FAIL")
+
+    def test_skipped(self, name):
+        with self._lock:
+            self.results["skipped"].append(name)
+        self.log(f"Skipping {name}", "WARN")
+
+    @contextmanager
+    def stage(self, name):
+        previous = getattr(self._local, "stage", None)
+        self._local.stage = name
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record_timing(name, "total", time.monotonic() - started)
+            self._local.stage = previous
+
+    def record_timing(self, stage, step, seconds):
+        with self._lock:
+            self.timings.setdefault(stage, {})[step] = round(seconds, 2)
+
+    def wait_for(self, description, condition, timeout, initial_interval=POLL_INITIAL_INTERVAL,
+                 max_interval=POLL_MAX_INTERVAL):
+        started = time.monotonic()
+        deadline = started + timeout
+        interval = initial_interval
+        attempts = 0
+        while True:
+            attempts += 1
+            result = condition()
+            now = time.monotonic()
+            if result:
+                self.log(f"{description}: ready after {now - started:.1f}s ({attempts} polls)")
+                self.record_timing(getattr(self._local, "stage", None) or "main", description, now - started)
+                return result
+            if now >= deadline:
+                self.log(f"{description}: gave up after {now - started:.1f}s ({attempts} polls)", "WARN")
+                self.record_timing(getattr(self._local, "stage", None) or "main", description, now - started)
+                return None
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * 2, max_interval)
     
     def test_1_trigger_events_api(self):
         self.log("=" * 60)
@@ -100,7 +158,9 @@ class E2ETest:
             if resp.status_code == 202:
                 data = resp.json()
                 self.log(f"Dedup key: {data.get('dedup_key')}")
-                self.incidents.append({"dedup_key": dedup_key, "source": "api"})
+                self.api_incident = {"dedup_key": dedup_key, "source": "api"}
+                with self._lock:
+                    self.incidents.append(self.api_incident)
                 self.test_passed("Trigger via Events API")
                 return True
             else:
@@ -115,10 +175,9 @@ class E2ETest:
         self.log("TEST 2: Verify incident created in PagerDuty")
         self.log("=" * 60)
         
-        self.log("Waiting 20s for incident to be created...")
-        time.sleep(20)
-        
-        try:
+        errors = []
+
+        def find_incident():
             resp = requests.get(
                 "https://api.pagerduty.com/incidents",
                 headers=PD_HEADERS,
@@ -129,25 +188,25 @@ class E2ETest:
                 },
                 timeout=30
             )
-            
-            if resp.status_code == 200:
-                incidents = resp.json().get("incidents", [])
-                demo_incidents = [i for i in incidents if "[DEMO]" in i.get("title", "") and self.test_id in i.get("title", "")]
-                
-                if demo_incidents:
-                    inc = demo_incidents[0]
-                    self.log(f"Found incident #{inc['incident_number']}: {inc['title']}")
-                    self.log(f"Status: {inc['status']}, Urgency: {inc['urgency']}")
-                    self.incidents[0]["id"] = inc["id"]
-                    self.incidents[0]["number"] = inc["incident_number"]
-                    self.test_passed("Verify incident created")
-                    return inc
-                else:
-                    self.test_failed("Verify incident created", "No matching incident found")
-                    return None
-            else:
-                self.test_failed("Verify incident created", f"API error: {resp.status_code}")
+            if resp.status_code != 200:
+                errors.append(f"API error: {resp.status_code}")
                 return None
+            incidents = resp.json().get("incidents", [])
+            demo_incidents = [i for i in incidents if "[DEMO]" in i.get("title", "") and self.test_id in i.get("title", "")]
+            return demo_incidents[0] if demo_incidents else None
+
+        try:
+            inc = self.wait_for("incident created", find_incident, INCIDENT_TIMEOUT)
+            if inc:
+                self.log(f"Found incident #{inc['incident_number']}: {inc['title']}")
+                self.log(f"Status: {inc['status']}, Urgency: {inc['urgency']}")
+                if self.api_incident is not None:
+                    self.api_incident["id"] = inc["id"]
+                    self.api_incident["number"] = inc["incident_number"]
+                self.test_passed("Verify incident created")
+                return inc
+            self.test_failed("Verify incident created", errors[-1] if errors else "No matching incident found")
+            return None
         except Exception as e:
             self.test_failed("Verify incident created", str(e))
             return None
@@ -158,14 +217,13 @@ class E2ETest:
         self.log("=" * 60)
 
         if not incident:
-            self.log("Skipping - no incident to check", "WARN")
-            self.results["skipped"].append("Verify Slack channel")
+            self.test_skipped("Verify Slack channel")
             return None
 
-        self.log("Waiting 25s for workflow to create Slack channel...")
-        time.sleep(25)
+        inc_num = str(incident.get("incident_number", ""))
+        listing = {"channels": [], "error": None, "match": None}
 
-        try:
+        def find_channel():
             resp = requests.get(
                 "https://slack.com/api/conversations.list",
                 headers={"Authorization": f"Bearer {SLACK_BOT_TOKEN}"},
@@ -174,55 +232,64 @@ class E2ETest:
                     "limit": "200",
                     "exclude_archived": "false",
                     "team_id": SLACK_TEAM_ID
-                }
+                },
+                timeout=30
             )
+            if resp.status_code != 200:
+                listing["error"] = f"HTTP error: {resp.status_code}"
+                return resp.status_code != 429 and resp.status_code < 500
+            data = resp.json()
+            if not data.get("ok"):
+                error = data.get("error", "unknown")
+                listing["error"] = f"Slack API error: {error}"
+                if error == "missing_scope":
+                    self.log("Bot needs channels:read and groups:read scopes", "WARN")
+                return error != "ratelimited"
+            listing["error"] = None
+            listing["channels"] = data.get("channels", [])
+            matching = [c for c in listing["channels"]
+                       if (f"demo-{inc_num}" in c.get("name", "").lower() or
+                           f"inc-{inc_num}" in c.get("name", "").lower())
+                       and not c.get("is_archived", False)]
+            listing["match"] = matching[0] if matching else None
+            return listing["match"]
 
-            if resp.status_code == 200:
-                data = resp.json()
-                if not data.get("ok"):
-                    error = data.get("error", "unknown")
-                    self.log(f"Slack API returned: {error}")
-                    if error == "missing_scope":
-                        self.log("Bot needs channels:read and groups:read scopes", "WARN")
-                    self.test_failed("Verify Slack channel", f"Slack API error: {error}")
-                    return None
-
-                channels = data.get("channels", [])
-                self.log(f"Found {len(channels)} channels in workspace")
-
-                inc_num = str(incident.get("incident_number", ""))
-                matching = [c for c in channels
-                           if (f"demo-{inc_num}" in c.get("name", "").lower() or
-                               f"inc-{inc_num}" in c.get("name", "").lower())
-                           and not c.get("is_archived", False)]
-
-                if matching:
-                    channel = matching[0]
-                    self.log(f"Found Slack channel: #{channel['name']} (ID: {channel['id']})")
-                    self.slack_channels.append(channel)
-                    self.test_passed("Verify Slack channel created")
-                    return channel
-                else:
-                    recent_demo = [c for c in channels
-                                  if (c.get("name", "").startswith("demo-") or
-                                      c.get("name", "").startswith("inc-"))
-                                  and not c.get("is_archived", False)]
-                    if recent_demo:
-                        self.log(f"Found {len(recent_demo)} demo/inc channels but none match incident #{inc_num}")
-                        most_recent = sorted(recent_demo, key=lambda x: x.get("created", 0), reverse=True)
-                        for c in most_recent[:5]:
-                            self.log(f"  - #{c['name']} (created: {c.get('created', 'unknown')})")
-                        if most_recent:
-                            channel = most_recent[0]
-                            self.log(f"Using most recent channel: #{channel['name']}")
-                            self.slack_channels.append(channel)
-                            self.test_passed("Verify Slack channel (used recent)")
-                            return channel
-                    self.test_failed("Verify Slack channel", f"No channel found for incident #{inc_num}")
-                    return None
-            else:
-                self.test_failed("Verify Slack channel", f"HTTP error: {resp.status_code}")
+        try:
+            self.wait_for("workflow Slack channel", find_channel, CHANNEL_TIMEOUT)
+
+            if listing["error"]:
+                self.log(listing["error"])
+                self.test_failed("Verify Slack channel", listing["error"])
                 return None
+
+            channels = listing["channels"]
+            self.log(f"Found {len(channels)} channels in workspace")
+
+            if listing["match"]:
+                channel = listing["match"]
+                self.log(f"Found Slack channel: #{channel['name']} (ID: {channel['id']})")
+                with self._lock:
+                    self.slack_channels.append(channel)
+                self.test_passed("Verify Slack channel created")
+                return channel
+
+            recent_demo = [c for c in channels
+                          if (c.get("name", "").startswith("demo-") or
+                              c.get("name", "").startswith("inc-"))
+                          and not c.get("is_archived", False)]
+            if recent_demo:
+                self.log(f"Found {len(recent_demo)} demo/inc channels but none match incident #{inc_num}")
+                most_recent = sorted(recent_demo, key=lambda x: x.get("created", 0), reverse=True)
+                for c in most_recent[:5]:
+                    self.log(f"  - #{c['name']} (created: {c.get('created', 'unknown')})")
+                channel = most_recent[0]
+                self.log(f"Using most recent channel: #{channel['name']}")
+                with self._lock:
+                    self.slack_channels.append(channel)
+                self.test_passed("Verify Slack channel (used recent)")
+                return channel
+            self.test_failed("Verify Slack channel", f"No channel found for incident #{inc_num}")
+            return None
         except Exception as e:
             self.test_failed("Verify Slack channel", str(e))
             return None
@@ -233,8 +300,7 @@ class E2ETest:
         self.log("=" * 60)
 
         if not channel:
-            self.log("Skipping - no channel available", "WARN")
-            self.results["skipped"].append("Slack conversation")
+            self.test_skipped("Slack conversation")
             return False
 
         channel_id = channel["id"]
@@ -259,9 +325,8 @@ class E2ETest:
                     self.log(f"Join channel failed: {join_data.get('error')}", "WARN")
 
             for i, msg in enumerate(RESPONDER_MESSAGES):
-                delay = random.uniform(2, 5)
-                self.log(f"Waiting {delay:.1f}s before message {i+1}...")
-                time.sleep(delay)
+                if i:
+                    time.sleep(MESSAGE_PACING)
 
                 resp = requests.post(
                     "https://slack.com/api/chat.postMessage",
@@ -294,8 +359,7 @@ class E2ETest:
         self.log("=" * 60)
 
         if not incident:
-            self.log("Skipping - no incident", "WARN")
-            self.results["skipped"].append("Responder actions")
+            self.test_skipped("Responder actions")
             return False
 
         incident_id = incident.get("id")
@@ -328,7 +392,6 @@ class E2ETest:
                 self.log(f"Using default email: {assignee_email}")
 
             self.log("Action 1: Acknowledge incident...")
-            time.sleep(random.uniform(3, 6))
 
             resp = requests.put(
                 f"https://api.pagerduty.com/incidents/{incident_id}",
@@ -351,7 +414,6 @@ class E2ETest:
                 self.log("Note: Acknowledge requires the 'From' user to be assigned to the incident")
 
             self.log("Action 2: Add investigation note...")
-            time.sleep(random.uniform(2, 4))
 
             resp = requests.post(
                 f"https://api.pagerduty.com/incidents/{incident_id}/notes",
@@ -370,7 +432,6 @@ class E2ETest:
                 self.log(f"Add note failed: {resp.status_code}", "WARN")
 
             self.log("Action 3: Add resolution note...")
-            time.sleep(random.uniform(3, 5))
 
             resp = requests.post(
                 f"https://api.pagerduty.com/incidents/{incident_id}/notes",
@@ -433,7 +494,8 @@ class E2ETest:
                 self.test_passed("Send metric to Datadog")
                 
                 self.log("Note: Datadog monitor may take 1-5 minutes to evaluate and trigger PagerDuty")
-                self.incidents.append({"source": "datadog", "metric": "demo.api.response_time"})
+                with self._lock:
+                    self.incidents.append({"source": "datadog", "metric": "demo.api.response_time"})
                 return True
             else:
                 self.test_failed("Send metric to Datadog", f"Status {resp.status_code}: {resp.text}")
@@ -453,7 +515,6 @@ class E2ETest:
             if inc.get("source") == "api" and inc.get("dedup_key"):
                 try:
                     self.log(f"Resolving incident via Events API...")
-                    time.sleep(2)
                     
                     payload = {
                         "routing_key": PD_ROUTING_KEY,
@@ -470,6 +531,9 @@ class E2ETest:
                     if resp.status_code == 202:
                         self.log(f"Incident resolved (dedup: {inc['dedup_key'][:20]}...)")
                         resolved += 1
+                        if inc.get("id"):
+                            self.wait_for("incident resolved", lambda: self.incident_status(inc["id"]) == "resolved",
+                                          RESOLVE_TIMEOUT)
                     else:
                         self.log(f"Resolve failed: {resp.status_code}", "WARN")
                 except Exception as e:
@@ -511,6 +575,27 @@ class E2ETest:
             self.test_failed("Resolve incidents", "No incidents resolved")
             return False
     
+    def incident_status(self, incident_id):
+        resp = requests.get(f"https://api.pagerduty.com/incidents/{incident_id}", headers=PD_HEADERS, timeout=30)
+        if resp.status_code == 200:
+            return resp.json().get("incident", {}).get("status")
+        return None
+
+    def run_events_api_path(self):
+        with self.stage("events-api"):
+            self.test_1_trigger_events_api()
+            incident = self.test_2_verify_incident_created()
+            channel = self.test_3_verify_slack_channel(incident)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                conversation = pool.submit(self.run_in_stage, "slack-conversation", self.test_4_slack_conversation, channel)
+                actions = pool.submit(self.run_in_stage, "responder-actions", self.test_5_responder_actions, incident)
+                conversation.result()
+                actions.result()
+
+    def run_in_stage(self, name, test, *args):
+        with self.stage(name):
+            return test(*args)
+
     def print_summary(self):
         self.log("=" * 60)
         self.log("E2E TEST SUMMARY")
@@ -541,6 +626,12 @@ class E2ETest:
         
         print(f"\nIncidents created: {len(self.incidents)}")
         print(f"Slack channels: {len(self.slack_channels)}")
+
+        if self.timings:
+            print("\nTIMINGS:")
+            for stage, steps in self.timings.items():
+                breakdown = ", ".join(f"{step}={seconds}s" for step, seconds in steps.items() if step != "total")
+                print(f"  {stage:20} {steps.get('total', 0):>7}s  {breakdown}")
         
         if len(self.results["failed"]) == 0 and len(self.results["passed"]) > 0:
             print(f"\n{'='*60}")
@@ -557,13 +648,13 @@ class E2ETest:
         self.log(f"Starting E2E Test Suite - {self.test_id}")
         self.log(f"Timestamp: {datetime.now().isoformat()}")
         
-        self.test_1_trigger_events_api()
-        incident = self.test_2_verify_incident_created()
-        channel = self.test_3_verify_slack_channel(incident)
-        self.test_4_slack_conversation(channel)
-        self.test_5_responder_actions(incident)
-        self.test_6_trigger_via_datadog()
-        self.test_7_resolve_incidents()
+        with self.stage("suite"):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                api_path = pool.submit(self.run_events_api_path)
+                datadog_path = pool.submit(self.run_in_stage, "datadog", self.test_6_trigger_via_datadog)
+                api_path.result()
+                datadog_path.result()
+            self.run_in_stage("resolve", self.test_7_resolve_incidents)
         
         return self.print_summary()
 
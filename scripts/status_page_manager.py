@@ -7,6 +7,7 @@ Status Pages are not yet supported by the Terraform provider, so we use the REST
 
 Usage:
     export PAGERDUTY_API_KEY="your-api-key"
+    export STATUS_PAGE_CACHE_TTL=3600          # Optional: seconds to reuse cached catalogs
     python3 status_page_manager.py create     # Create status page structure
     python3 status_page_manager.py update     # Update component statuses
     python3 status_page_manager.py incident   # Post an incident to the status page
@@ -19,13 +20,23 @@ Requirements:
 import os
 import sys
 import json
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime, timezone
 
 # Configuration
 API_KEY = os.environ.get("PAGERDUTY_API_KEY")
 BASE_URL = "https://api.pagerduty.com"
+REQUEST_TIMEOUT = float(os.environ.get("STATUS_PAGE_REQUEST_TIMEOUT", 15))
+CATALOG_CACHE_TTL = int(os.environ.get("STATUS_PAGE_CACHE_TTL", 3600))
+CATALOG_CACHE_DIR = os.environ.get(
+    "STATUS_PAGE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "status_page_manager")
+)
+
+_session: Optional[requests.Session] = None
 
 # Status Page Configuration
 STATUS_PAGE_CONFIG = {
@@ -86,22 +97,25 @@ def get_headers() -> Dict:
     }
 
 
+def get_session() -> requests.Session:
+    """Get the shared HTTP session so requests reuse pooled connections."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+        _session.headers.update(get_headers())
+    return _session
+
+
 def api_request(method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
     """Make an API request to PagerDuty."""
     url = f"{BASE_URL}{endpoint}"
-    headers = get_headers()
     
     try:
-        if method == "GET":
-            response = requests.get(url, headers=headers)
-        elif method == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers)
-        else:
+        if method not in ("GET", "POST", "PUT", "DELETE"):
             raise ValueError(f"Unsupported HTTP method: {method}")
+        json_body = data if method in ("POST", "PUT") else None
+        response = get_session().request(method, url, json=json_body, timeout=REQUEST_TIMEOUT)
         
         response.raise_for_status()
         return response.json() if response.text else {}
@@ -111,6 +125,114 @@ def api_request(method: str, endpoint: str, data: Optional[Dict] = None) -> Dict
         raise
 
 
+class StatusPageSession:
+    """Lookup tables for one status page, fetched once and indexed by name.
+
+    The statuses, severities, impacts, services and components catalogs are
+    fetched concurrently and cached on disk for CATALOG_CACHE_TTL seconds, so
+    repeated incident posts and updates only pay for the write requests.
+    """
+
+    CATALOGS = {
+        "statuses": "/status_pages/{page_id}/statuses",
+        "severities": "/status_pages/{page_id}/severities",
+        "impacts": "/status_pages/{page_id}/impacts",
+        "services": "/status_pages/{page_id}/services",
+        "components": "/status_pages/{page_id}/components",
+    }
+
+    def __init__(self, page_id: str, ttl: int = CATALOG_CACHE_TTL, cache_dir: Optional[str] = CATALOG_CACHE_DIR):
+        self.page_id = page_id
+        self.ttl = ttl
+        self.cache_path = os.path.join(cache_dir, f"{page_id}.json") if cache_dir else None
+        self.catalogs: Dict[str, List[Dict]] = {}
+        self._indexes: Dict[str, Dict[str, Dict]] = {}
+        self._from_disk = False
+
+    def _read_cache(self) -> Optional[Dict[str, List[Dict]]]:
+        if not self.cache_path or self.ttl <= 0:
+            return None
+        try:
+            with open(self.cache_path) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - cached.get("fetched_at", 0) > self.ttl:
+            return None
+        catalogs = cached.get("catalogs", {})
+        return catalogs if set(catalogs) >= set(self.CATALOGS) else None
+
+    def _write_cache(self):
+        if not self.cache_path or self.ttl <= 0:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, "w") as f:
+                json.dump({"fetched_at": time.time(), "catalogs": self.catalogs}, f)
+        except OSError as e:
+            print(f"Warning: could not write status page cache: {e}")
+
+    def invalidate(self):
+        """Drop the in-memory and on-disk catalogs so the next lookup refetches them."""
+        self.catalogs = {}
+        self._indexes = {}
+        self._from_disk = False
+        if self.cache_path:
+            try:
+                os.remove(self.cache_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Warning: could not remove status page cache: {e}")
+
+    def _fetch(self, catalog: str) -> List[Dict]:
+        result = api_request("GET", self.CATALOGS[catalog].format(page_id=self.page_id))
+        return result.get(catalog, [])
+
+    def load(self, refresh: bool = False) -> "StatusPageSession":
+        """Load the catalogs from the disk cache, or fetch them all concurrently."""
+        catalogs = None if refresh else self._read_cache()
+        self._from_disk = catalogs is not None
+        if catalogs is None:
+            with ThreadPoolExecutor(max_workers=len(self.CATALOGS)) as pool:
+                fetched = {name: pool.submit(self._fetch, name) for name in self.CATALOGS}
+                catalogs = {name: future.result() for name, future in fetched.items()}
+        self.catalogs = catalogs
+        self._indexes = {
+            name: {item.get("name", "").lower(): item for item in reversed(items)}
+            for name, items in catalogs.items()
+        }
+        if not self._from_disk:
+            self._write_cache()
+        return self
+
+    def get(self, catalog: str) -> List[Dict]:
+        """Get every item in a catalog, refetching once if a cached copy is empty."""
+        if not self.catalogs:
+            self.load()
+        if not self.catalogs.get(catalog) and self._from_disk:
+            self.load(refresh=True)
+        return self.catalogs.get(catalog, [])
+
+    def find(self, catalog: str, name: str) -> Optional[Dict]:
+        """Find a catalog item by name (case-insensitive), refetching once if a cached copy misses."""
+        if not self.catalogs:
+            self.load()
+        item = self._indexes.get(catalog, {}).get(name.lower())
+        if item is None and self._from_disk:
+            self.load(refresh=True)
+            item = self._indexes.get(catalog, {}).get(name.lower())
+        return item
+
+    def find_or_first(self, catalog: str, name: str) -> Optional[Dict]:
+        """Find a catalog item by name, falling back to the first item in the catalog."""
+        item = self.find(catalog, name)
+        if item is None:
+            items = self.get(catalog)
+            item = items[0] if items else None
+        return item
+
+
 def list_status_pages() -> List[Dict]:
     """List all status pages in the account."""
     print("\n=== Listing Status Pages ===\n")
@@ -186,25 +308,25 @@ def create_status_page() -> str:
             comp_result = api_request("POST", f"/status_pages/{page_id}/components", comp_data)
             print(f"    Created with ID: {comp_result['component']['id']}")
     
+    StatusPageSession(page_id).invalidate()
+
     print(f"\n✓ Status page created successfully!")
     print(f"  Public URL: https://{STATUS_PAGE_CONFIG['subdomain']}.pagerduty.io")
     
     return page_id
 
 
-def update_component_status(page_id: str, component_name: str, status: str, message: Optional[str] = None):
+def update_component_status(page_id: str, component_name: str, status: str, message: Optional[str] = None,
+                            session: Optional[StatusPageSession] = None):
     """Update a component's status.
     
     Status values: operational, degraded_performance, partial_outage, major_outage, under_maintenance
     """
     print(f"\n=== Updating Component Status ===\n")
     
-    # Get components
-    result = api_request("GET", f"/status_pages/{page_id}/components")
-    components = result.get("components", [])
-    
     # Find the component by name
-    component = next((c for c in components if c["name"] == component_name), None)
+    session = session or StatusPageSession(page_id)
+    component = session.find("components", component_name)
     if not component:
         print(f"Component '{component_name}' not found")
         return
@@ -237,36 +359,8 @@ def post_status_update(page_id: str, message: str):
     print(f"✓ Posted status update: {message}")
 
 
-def get_status_page_statuses(page_id: str) -> List[Dict]:
-    """Fetch available statuses from the status page API."""
-    result = api_request("GET", f"/status_pages/{page_id}/statuses")
-    return result.get("statuses", [])
-
-
-def get_status_page_severities(page_id: str) -> List[Dict]:
-    """Fetch available severities from the status page API."""
-    result = api_request("GET", f"/status_pages/{page_id}/severities")
-    return result.get("severities", [])
-
-
-def get_status_page_impacts(page_id: str) -> List[Dict]:
-    """Fetch available impacts from the status page API."""
-    result = api_request("GET", f"/status_pages/{page_id}/impacts")
-    return result.get("impacts", [])
-
-
-def get_status_page_services(page_id: str) -> List[Dict]:
-    """Fetch available services from the status page API."""
-    result = api_request("GET", f"/status_pages/{page_id}/services")
-    return result.get("services", [])
-
-
-def find_by_name(items: List[Dict], name: str) -> Optional[Dict]:
-    """Find an item in a list by name (case-insensitive)."""
-    return next((i for i in items if i.get("name", "").lower() == name.lower()), None)
-
-
-def create_incident(page_id: str, title: str, message: str, components: List[str], impact: str = "minor"):
+def create_incident(page_id: str, title: str, message: str, components: List[str], impact: str = "minor",
+                    session: Optional[StatusPageSession] = None):
     """Create an incident on the status page.
 
     Impact values: none, minor, major, critical
@@ -275,10 +369,11 @@ def create_incident(page_id: str, title: str, message: str, components: List[str
     """
     print(f"\n=== Creating Status Page Incident ===\n")
 
-    statuses = get_status_page_statuses(page_id)
-    severities = get_status_page_severities(page_id)
-    impacts = get_status_page_impacts(page_id)
-    services = get_status_page_services(page_id)
+    session = session or StatusPageSession(page_id)
+    statuses = session.get("statuses")
+    severities = session.get("severities")
+    impacts = session.get("impacts")
+    services = session.get("services")
 
     print(f"  Available statuses: {[s.get('name') for s in statuses]}")
     print(f"  Available severities: {[s.get('name') for s in severities]}")
@@ -292,27 +387,21 @@ def create_incident(page_id: str, title: str, message: str, components: List[str
             "'python3 scripts/status_page_manager.py create' before creating incidents."
         )
 
-    status_obj = find_by_name(statuses, "Investigating")
-    if not status_obj:
-        status_obj = statuses[0] if statuses else None
+    status_obj = session.find_or_first("statuses", "Investigating")
     if not status_obj:
         raise ValueError("No statuses available on this status page")
 
-    severity_obj = find_by_name(severities, impact)
-    if not severity_obj:
-        severity_obj = severities[0] if severities else None
+    severity_obj = session.find_or_first("severities", impact)
     if not severity_obj:
         raise ValueError("No severities available on this status page")
 
-    impact_obj = find_by_name(impacts, impact)
-    if not impact_obj:
-        impact_obj = impacts[0] if impacts else None
+    impact_obj = session.find_or_first("impacts", impact)
     if not impact_obj:
         raise ValueError("No impacts available on this status page")
 
     impacted_services = []
     for comp_name in components:
-        svc = find_by_name(services, comp_name)
+        svc = session.find("services", comp_name)
         if svc:
             impacted_services.append({
                 "id": svc["id"],
@@ -375,22 +464,20 @@ def create_incident(page_id: str, title: str, message: str, components: List[str
     return post_id
 
 
-def update_incident(page_id: str, post_id: str, status: str, message: str):
+def update_incident(page_id: str, post_id: str, status: str, message: str,
+                    session: Optional[StatusPageSession] = None):
     """Update an existing incident post.
 
     Status values: investigating, identified, monitoring, resolved
     """
     print(f"\n=== Updating Incident ===\n")
 
-    statuses = get_status_page_statuses(page_id)
-    severities = get_status_page_severities(page_id)
-
-    status_obj = find_by_name(statuses, status)
-    if not status_obj:
-        status_obj = statuses[0] if statuses else None
+    session = session or StatusPageSession(page_id)
+    status_obj = session.find_or_first("statuses", status)
     if not status_obj:
         raise ValueError(f"Status '{status}' not found on this status page")
 
+    severities = session.get("severities")
     severity_obj = severities[0] if severities else None
 
     now = datetime.now(timezone.utc).isoformat()
@@ -424,13 +511,17 @@ def demo_incident_flow(page_id: str):
     print("DEMO: Status Page Incident Flow")
     print("="*60)
     
+    # Fetch the status page catalogs once for the whole flow
+    session = StatusPageSession(page_id).load()
+    
     # 1. Create an incident
     incident_id = create_incident(
         page_id,
         title="Elevated Error Rates - Checkout Service",
         message="We are investigating elevated error rates affecting the checkout flow. Some users may experience failures when completing purchases.",
         components=["Checkout", "Payment Gateway"],
-        impact="major"
+        impact="major",
+        session=session
     )
     
     input("\nPress Enter to update incident to 'identified'...")
@@ -440,12 +531,13 @@ def demo_incident_flow(page_id: str):
         page_id,
         incident_id,
         status="identified",
-        message="We have identified the root cause as a connection pool exhaustion in the payment gateway. Our team is implementing a fix."
+        message="We have identified the root cause as a connection pool exhaustion in the payment gateway. Our team is implementing a fix.",
+        session=session
     )
     
     # Update component statuses
-    update_component_status(page_id, "Checkout", "degraded_performance")
-    update_component_status(page_id, "Payment Gateway", "partial_outage")
+    update_component_status(page_id, "Checkout", "degraded_performance", session=session)
+    update_component_status(page_id, "Payment Gateway", "partial_outage", session=session)
     
     input("\nPress Enter to update incident to 'monitoring'...")
     
@@ -454,10 +546,11 @@ def demo_incident_flow(page_id: str):
         page_id,
         incident_id,
         status="monitoring",
-        message="A fix has been deployed and we are monitoring the results. Error rates are returning to normal levels."
+        message="A fix has been deployed and we are monitoring the results. Error rates are returning to normal levels.",
+        session=session
     )
     
-    update_component_status(page_id, "Payment Gateway", "degraded_performance")
+    update_component_status(page_id, "Payment Gateway", "degraded_performance", session=session)
     
     input("\nPress Enter to resolve incident...")
     
@@ -466,11 +559,12 @@ def demo_incident_flow(page_id: str):
         page_id,
         incident_id,
         status="resolved",
-        message="The incident has been resolved. All services are operating normally. A post-incident review will be conducted."
+        message="The incident has been resolved. All services are operating normally. A post-incident review will be conducted.",
+        session=session
     )
     
-    update_component_status(page_id, "Checkout", "operational")
-    update_component_status(page_id, "Payment Gateway", "operational")
+    update_component_status(page_id, "Checkout", "operational", session=session)
+    update_component_status(page_id, "Payment Gateway", "operational", session=session)
     
     print("\n✓ Demo incident flow completed!")
 
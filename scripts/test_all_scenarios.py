@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
-import subprocess
+import argparse
 import json
 import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 FUNCTION_NAME = "demo-simulator-controller"
 REGION = "us-east-1"
 ACTION_DELAY = 15
-RESULTS_FILE = "/Users/conalllynch/TFTest/scripts/test_results.json"
+INVOKE_TIMEOUT = 900
+DEFAULT_WORKERS = int(os.environ.get("SCENARIO_TEST_WORKERS", 4))
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_FILE = os.environ.get("SCENARIO_RESULTS_FILE", os.path.join(SCRIPT_DIR, "test_results.jsonl"))
+CONTROLLER_DIR = os.path.join(SCRIPT_DIR, "..", "aws", "lambda-demo-controller")
+HISTOGRAM_BUCKETS = [30, 60, 120, 300, 600, 900]
 
 SCENARIOS = [
     "AUTO-003", "BUS-001", "BUS-003", "CSO-001",
@@ -29,93 +35,181 @@ SCENARIOS = [
     "WF-001",
 ]
 
-results = {}
-if os.path.exists(RESULTS_FILE):
-    with open(RESULTS_FILE) as f:
-        results = json.load(f)
 
-total = len(SCENARIOS)
-for i, sid in enumerate(SCENARIOS, 1):
-    if sid in results and results[sid].get("success"):
-        print(f"[{i}/{total}] SKIP {sid} (already passed)")
-        continue
+class LambdaInvoker:
+    def __init__(self, function_name, region, workers):
+        import boto3
+        from botocore.config import Config
+        config = Config(
+            read_timeout=INVOKE_TIMEOUT,
+            connect_timeout=10,
+            retries={"max_attempts": 0},
+            max_pool_connections=workers,
+        )
+        self.client = boto3.client("lambda", region_name=region, config=config)
+        self.function_name = function_name
+
+    def __call__(self, event):
+        resp = self.client.invoke(
+            FunctionName=self.function_name,
+            InvocationType="RequestResponse",
+            Payload=json.dumps(event).encode(),
+        )
+        payload = json.loads(resp["Payload"].read() or b"{}")
+        if resp.get("FunctionError"):
+            raise RuntimeError(f"{resp['FunctionError']}: {payload.get('errorMessage', '')[:200]}")
+        return payload
+
+
+class LocalInvoker:
+    def __init__(self):
+        sys.path.insert(0, os.path.join(CONTROLLER_DIR, ".."))
+        sys.path.insert(0, CONTROLLER_DIR)
+        import handler
+        self.handler = handler
+
+    def __call__(self, event):
+        return self.handler.lambda_handler(event, None)
 
-    print(f"\n[{i}/{total}] Testing {sid}...", flush=True)
-    payload = json.dumps({"action": "run", "scenario_id": sid, "action_delay": ACTION_DELAY})
-    outfile = f"/tmp/test_{sid}.json"
 
-    if os.path.exists(outfile):
-        os.remove(outfile)
+def load_results(path):
+    results = {}
+    if not os.path.exists(path):
+        return results
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            results[record["scenario_id"]] = record
+    return results
 
+
+def outcome(record):
+    return record.get("outcome") or ("pass" if record.get("success") else "fail")
+
+
+def run_scenario(invoke, sid, action_delay):
+    event = {"action": "run", "scenario_id": sid, "action_delay": action_delay}
     start = time.time()
     try:
-        proc = subprocess.run(
-            [
-                "aws", "lambda", "invoke",
-                "--function-name", FUNCTION_NAME,
-                "--payload", payload,
-                "--cli-binary-format", "raw-in-base64-out",
-                "--cli-read-timeout", "900",
-                "--region", REGION,
-                outfile,
-            ],
-            capture_output=True, text=True, timeout=920,
-        )
-        elapsed = int(time.time() - start)
-
-        if proc.returncode != 0:
-            results[sid] = {"success": False, "elapsed": elapsed, "error": f"aws cli exit {proc.returncode}: {proc.stderr[:200]}"}
-            print(f"  [FAIL] {sid}: aws cli error: {proc.stderr[:200]}", flush=True)
-        elif not os.path.exists(outfile):
-            results[sid] = {"success": False, "elapsed": elapsed, "error": f"No output file. stdout={proc.stdout[:200]} stderr={proc.stderr[:200]}"}
-            print(f"  [FAIL] {sid}: No output file created", flush=True)
-        else:
-            with open(outfile) as f:
-                resp = json.load(f)
-
-            status_code = resp.get("statusCode", 0)
-            body = json.loads(resp.get("body", "{}"))
-            success = status_code == 200 and body.get("success", False)
-            triggered_via = body.get("trigger_result", {}).get("triggered_via", "unknown")
-            incident_id = body.get("incident_id", "none")
-            actions_taken = body.get("responder_result", {}).get("actions_taken", 0)
-
-            results[sid] = {
-                "success": success,
-                "status_code": status_code,
-                "elapsed": elapsed,
-                "triggered_via": triggered_via,
-                "incident_id": incident_id,
-                "actions_taken": actions_taken,
-                "error": body.get("error", "") if not success else "",
-            }
-
-            status = "PASS" if success else "FAIL"
-            print(f"  [{status}] {sid}: {elapsed}s, via={triggered_via}, incident={incident_id}, actions={actions_taken}", flush=True)
-            if not success:
-                err_detail = body.get("error", "")
-                steps = body.get("steps", [])
-                last_step = steps[-1] if steps else {}
-                print(f"  ERROR: {err_detail or json.dumps(last_step)[:200]}", flush=True)
-
-    except subprocess.TimeoutExpired:
-        elapsed = int(time.time() - start)
-        results[sid] = {"success": False, "elapsed": elapsed, "error": "TIMEOUT"}
-        print(f"  [FAIL] {sid}: TIMEOUT after {elapsed}s", flush=True)
+        resp = invoke(event)
+        elapsed = round(time.time() - start, 1)
+        status_code = resp.get("statusCode", 0)
+        body = json.loads(resp.get("body", "{}"))
+        success = status_code == 200 and body.get("success", False)
+        checkpointed = status_code == 202 and body.get("status") == "checkpointed"
+        error = ""
+        if not success and not checkpointed:
+            steps = body.get("steps", [])
+            error = body.get("error", "") or json.dumps(steps[-1] if steps else {})[:200]
+        return {
+            "scenario_id": sid,
+            "success": success,
+            "outcome": "pass" if success else "pending" if checkpointed else "fail",
+            "status_code": status_code,
+            "checkpoint": body.get("checkpoint"),
+            "elapsed": elapsed,
+            "triggered_via": body.get("trigger_result", {}).get("triggered_via", "unknown"),
+            "incident_id": body.get("incident_id", "none"),
+            "actions_taken": body.get("responder_result", {}).get("actions_taken", 0),
+            "error": error,
+        }
     except Exception as e:
-        elapsed = int(time.time() - start)
-        results[sid] = {"success": False, "elapsed": elapsed, "error": str(e)}
-        print(f"  [FAIL] {sid}: {e}", flush=True)
-
-    with open(RESULTS_FILE, "w") as f:
-        json.dump(results, f, indent=2)
-
-    passed = sum(1 for r in results.values() if r.get("success"))
-    failed = sum(1 for r in results.values() if not r.get("success"))
-    print(f"  Progress: {passed} passed, {failed} failed, {total - len(results)} remaining", flush=True)
-
-print(f"\n{'='*60}")
-print(f"FINAL: {sum(1 for r in results.values() if r.get('success'))}/{len(results)} passed")
-for sid, r in sorted(results.items()):
-    status = "PASS" if r.get("success") else "FAIL"
-    print(f"  {status} {sid:12} {r.get('elapsed',0):>4}s {r.get('triggered_via',''):22} {r.get('error','')}")
+        return {"scenario_id": sid, "success": False, "outcome": "fail", "elapsed": round(time.time() - start, 1), "error": str(e)[:200]}
+
+
+def percentile(values, pct):
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def print_histogram(results):
+    latencies = [r.get("elapsed", 0) for r in results]
+    if not latencies:
+        return
+    counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    for latency in latencies:
+        index = next((i for i, bound in enumerate(HISTOGRAM_BUCKETS) if latency < bound), len(HISTOGRAM_BUCKETS))
+        counts[index] += 1
+    widest = max(counts)
+    print("\nLatency histogram:")
+    lower = 0
+    for i, count in enumerate(counts):
+        label = f"{lower}-{HISTOGRAM_BUCKETS[i]}s" if i < len(HISTOGRAM_BUCKETS) else f"{lower}s+"
+        bar = "#" * (round(40 * count / widest) if widest else 0)
+        print(f"  {label:>10} {count:>4} {bar}")
+        if i < len(HISTOGRAM_BUCKETS):
+            lower = HISTOGRAM_BUCKETS[i]
+    print(f"  p50={percentile(latencies, 50)}s p90={percentile(latencies, 90)}s max={max(latencies)}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run demo scenarios against the demo controller in parallel")
+    parser.add_argument("scenarios", nargs="*", help="Scenario ids to run (default: full catalog)")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--mode", choices=["lambda", "local"], default="lambda",
+                        help="Invoke the deployed Lambda or the handler in-process")
+    parser.add_argument("--function-name", default=FUNCTION_NAME)
+    parser.add_argument("--region", default=REGION)
+    parser.add_argument("--action-delay", type=int, default=ACTION_DELAY)
+    parser.add_argument("--results", default=RESULTS_FILE)
+    parser.add_argument("--fresh", action="store_true", help="Ignore previous results instead of resuming")
+    parser.add_argument("--retry-failed-only", action="store_true", help="Only run scenarios that previously failed")
+    args = parser.parse_args()
+
+    scenarios = args.scenarios or SCENARIOS
+    if args.fresh and os.path.exists(args.results):
+        os.remove(args.results)
+    previous = load_results(args.results)
+
+    if args.retry_failed_only:
+        pending = [sid for sid in scenarios if sid in previous and outcome(previous[sid]) == "fail"]
+    else:
+        pending = [sid for sid in scenarios if sid not in previous or outcome(previous[sid]) == "fail"]
+    skipped = len(scenarios) - len(pending)
+    print(f"Running {len(pending)} scenarios with {args.workers} workers ({args.mode}), "
+          f"{skipped} skipped from {args.results}", flush=True)
+
+    invoke = LocalInvoker() if args.mode == "local" else LambdaInvoker(args.function_name, args.region, args.workers)
+    results = dict(previous)
+    started = time.time()
+
+    with open(args.results, "a") as out, ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(run_scenario, invoke, sid, args.action_delay): sid for sid in pending}
+        for done, future in enumerate(as_completed(futures), 1):
+            r = future.result()
+            out.write(json.dumps(r) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+            results[r["scenario_id"]] = r
+            status = outcome(r).upper()
+            print(f"[{done}/{len(pending)}] [{status}] {r['scenario_id']}: {r['elapsed']}s, "
+                  f"via={r.get('triggered_via', '')}, incident={r.get('incident_id', '')}, "
+                  f"actions={r.get('actions_taken', 0)}", flush=True)
+            if status == "PENDING":
+                print(f"  CHECKPOINTED at {r.get('checkpoint')}, the controller resumes it asynchronously", flush=True)
+            elif status == "FAIL":
+                print(f"  ERROR: {r.get('error', '')}", flush=True)
+
+    wall = int(time.time() - started)
+    selected = [results[sid] for sid in scenarios if sid in results]
+    print(f"\n{'='*60}")
+    counts = {o: sum(1 for r in selected if outcome(r) == o) for o in ("pass", "pending", "fail")}
+    print(f"FINAL: {counts['pass']}/{len(selected)} passed, {counts['pending']} pending (checkpointed), "
+          f"{counts['fail']} failed in {wall}s wall time")
+    for r in sorted(selected, key=lambda r: r["scenario_id"]):
+        status = outcome(r).upper()
+        print(f"  {status:7} {r['scenario_id']:12} {r.get('elapsed', 0):>6}s {r.get('triggered_via', ''):22} {r.get('error', '')}")
+    print_histogram([results[sid] for sid in pending if sid in results])
+    sys.exit(1 if counts["fail"] else 2 if counts["pending"] else 0)
+
+
+if __name__ == "__main__":
+    main()